@@ -14,6 +14,7 @@ from flask import Blueprint, Flask
 from flask_cors import CORS
 from flask_restful import Api
 
+from metadata_service import metrics
 from metadata_service.api.badge import BadgeAPI
 from metadata_service.api.column import (ColumnBadgeAPI, ColumnDescriptionAPI,
                                          ColumnLineageAPI)
@@ -21,14 +22,18 @@ from metadata_service.api.dashboard import (DashboardBadgeAPI,
                                             DashboardDescriptionAPI,
                                             DashboardDetailAPI,
                                             DashboardTagAPI)
+from metadata_service.api.export import CatalogExportAPI
 from metadata_service.api.healthcheck import healthcheck
+from metadata_service.api.mutation import MutationAPI
 from metadata_service.api.popular_tables import PopularTablesAPI
-from metadata_service.api.system import Neo4jDetailAPI, StatisticsMetricsAPI
-from metadata_service.api.table import (TableBadgeAPI, TableDashboardAPI,
-                                        TableDescriptionAPI, TableDetailAPI,
-                                        TableLineageAPI, TableOwnerAPI,
-                                        TableTagAPI)
+from metadata_service.api.system import (Neo4jDetailAPI, QueryProfileAPI,
+                                         StatisticsMetricsAPI)
+from metadata_service.api.table import (TableBadgeAPI, TableBatchAPI,
+                                        TableDashboardAPI, TableDescriptionAPI,
+                                        TableDetailAPI, TableLineageAPI,
+                                        TableOwnerAPI, TableTagAPI)
 from metadata_service.api.tag import TagAPI
+from metadata_service.api.usage import UsageDeltaAPI
 from metadata_service.api.user import (UserDetailAPI, UserFollowAPI,
                                        UserFollowsAPI, UserOwnAPI, UserOwnsAPI,
                                        UserReadsAPI)
@@ -97,6 +102,7 @@ def create_app(*, config_module_class: str) -> Flask:
                      '/popular_tables/',
                      '/popular_tables/<path:user_id>')
     api.add_resource(TableDetailAPI, '/table/<path:table_uri>')
+    api.add_resource(TableBatchAPI, '/tables/batch')
     api.add_resource(TableDescriptionAPI,
                      '/table/<path:id>/description')
     api.add_resource(TableTagAPI,
@@ -119,6 +125,8 @@ def create_app(*, config_module_class: str) -> Flask:
                      '/latest_updated_ts')
     api.add_resource(StatisticsMetricsAPI,
                      '/system/statistics')
+    api.add_resource(QueryProfileAPI,
+                     '/system/profile/<operation>')
     api.add_resource(TagAPI,
                      '/tags/')
     api.add_resource(BadgeAPI,
@@ -144,8 +152,17 @@ def create_app(*, config_module_class: str) -> Flask:
                      '/dashboard/<path:id>/tag/<tag>')
     api.add_resource(DashboardBadgeAPI,
                      '/dashboard/<path:id>/badge/<badge>')
+    api.add_resource(UsageDeltaAPI,
+                     '/usage/delta')
+    api.add_resource(MutationAPI,
+                     '/mutations')
+    api.add_resource(CatalogExportAPI,
+                     '/export/<resource_type>')
     app.register_blueprint(api_bp)
 
+    if app.config.get('PROMETHEUS_METRICS_ENABLED'):
+        metrics.init_app(app)
+
     if app.config.get('SWAGGER_ENABLED'):
         Swagger(app, template_file=os.path.join(ROOT_DIR, app.config.get('SWAGGER_TEMPLATE_PATH')), parse=True)
     return app
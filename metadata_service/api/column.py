@@ -5,12 +5,12 @@ import json
 from http import HTTPStatus
 from typing import Iterable, Mapping, Union
 
-from amundsen_common.models.lineage import LineageSchema
 from flasgger import swag_from
 from flask import request
 from flask_restful import Resource, reqparse
 
 from metadata_service.api.badge import BadgeCommon
+from metadata_service.entity.lineage import BoundedLineageSchema
 from metadata_service.entity.resource_type import ResourceType
 from metadata_service.exception import NotFoundException
 from metadata_service.proxy import get_proxy_client
@@ -38,7 +38,7 @@ class ColumnLineageAPI(Resource):
                                               resource_type=ResourceType.Column,
                                               direction=direction,
                                               depth=depth)
-            schema = LineageSchema()
+            schema = BoundedLineageSchema()
             return schema.dump(lineage), HTTPStatus.OK
         except Exception as e:
             return {'message': f'Exception raised when getting lineage: {e}'}, HTTPStatus.NOT_FOUND
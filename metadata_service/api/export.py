@@ -0,0 +1,56 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Iterator, Mapping, Union
+
+from amundsen_common.models.dashboard import DashboardSummarySchema
+from flasgger import swag_from
+from flask import Response, stream_with_context
+from flask_restful import Resource, reqparse
+
+from metadata_service.entity.column_stats import dump_table
+from metadata_service.entity.resource_type import ResourceType
+from metadata_service.proxy import get_proxy_client
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+
+
+class CatalogExportAPI(Resource):
+    """
+    CatalogExportAPI streams all tables or dashboards as newline delimited json
+    """
+
+    def __init__(self) -> None:
+        self.client = get_proxy_client()
+        self.parser = reqparse.RequestParser()
+        self.parser.add_argument('page_size', type=int, required=False, default=DEFAULT_PAGE_SIZE)
+        super(CatalogExportAPI, self).__init__()
+
+    @swag_from('swagger_doc/export/export_get.yml')
+    def get(self, resource_type: str) -> Union[Response, Iterable[Union[Mapping, int, None]]]:
+        page_size = self.parser.parse_args().get('page_size')
+        if not 0 < page_size <= MAX_PAGE_SIZE:
+            return {'message': f'page_size should be between 1 and {MAX_PAGE_SIZE}'}, HTTPStatus.BAD_REQUEST
+
+        try:
+            if resource_type == ResourceType.Table.name.lower():
+                records = self.client.iter_tables(page_size=page_size)  # type: Iterator[Any]
+                dump = dump_table  # type: Callable[[Any], Mapping]
+            elif resource_type == ResourceType.Dashboard.name.lower():
+                records = self.client.iter_dashboards(page_size=page_size)
+                dump = DashboardSummarySchema().dump
+            else:
+                return {'message': f'resource_type {resource_type} can not be exported'}, HTTPStatus.NOT_FOUND
+        except NotImplementedError:
+            return {'message': f'Exporting {resource_type} is not supported by this proxy'}, \
+                HTTPStatus.NOT_IMPLEMENTED
+
+        def generate() -> Iterator[str]:
+            # records are serialized one at a time as the proxy pages through them
+            for record in records:
+                yield json.dumps(dump(record)) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
@@ -0,0 +1,77 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from http import HTTPStatus
+from typing import Iterable, List, Mapping, Optional, Union
+
+from flasgger import swag_from
+from flask import current_app as app
+from flask import request
+from flask_restful import Resource
+from marshmallow.exceptions import ValidationError as SchemaValidationError
+
+from metadata_service.entity.mutation import (Mutation, MutationResult,
+                                              MutationResultSchema,
+                                              MutationSchema, MutationType)
+from metadata_service.proxy import get_proxy_client
+
+LOGGER = logging.getLogger(__name__)
+
+_MUTATION_TYPES = {mutation_type.value for mutation_type in MutationType}
+
+
+class MutationAPI(Resource):
+    """
+    MutationAPI supports POST operation to apply table metadata edits in bulk
+    """
+
+    def __init__(self) -> None:
+        self.client = get_proxy_client()
+
+    @swag_from('swagger_doc/mutation/mutations_post.yml')
+    def post(self) -> Iterable[Union[Mapping, int, None]]:
+        """
+        Applies the mutations in the request body, a json list of mutations, and reports the result of each of them
+        """
+        try:
+            mutations = MutationSchema().load(json.loads(request.data), many=True)
+        except (SchemaValidationError, ValueError) as e:
+            return {'message': 'Mutations provided are not valid: {}'.format(e)}, HTTPStatus.BAD_REQUEST
+
+        # invalid mutations are reported without being sent to the proxy
+        results = [self._validate(mutation) for mutation in mutations]  # type: List[Optional[MutationResult]]
+        valid_indexes = [index for index, result in enumerate(results) if result is None]
+
+        try:
+            applied_results = self.client.apply_mutations(mutations=[mutations[index] for index in valid_indexes])
+        except NotImplementedError:
+            return {'message': 'Mutations are not supported by this proxy'}, HTTPStatus.NOT_IMPLEMENTED
+        except Exception:
+            LOGGER.exception('MutationAPI POST Failed')
+            return {'message': 'Internal server error!'}, HTTPStatus.INTERNAL_SERVER_ERROR
+
+        for index, result in zip(valid_indexes, applied_results):
+            results[index] = result
+        return {'results': MutationResultSchema().dump(results, many=True)}, HTTPStatus.OK
+
+    @staticmethod
+    def _validate(mutation: Mutation) -> Optional[MutationResult]:
+        if mutation.mutation_type not in _MUTATION_TYPES:
+            return MutationResult(success=False,
+                                  message=f'mutation_type should be one of {", ".join(sorted(_MUTATION_TYPES))}')
+
+        if mutation.mutation_type == MutationType.COLUMN_DESCRIPTION.value and not mutation.column_name:
+            return MutationResult(success=False, message='column_name is required for column descriptions')
+
+        if mutation.mutation_type == MutationType.BADGE.value:
+            # same whitelist as the badge API
+            whitelist_badges = app.config.get('WHITELIST_BADGES', [])
+            if not any(badge.badge_name == mutation.value and badge.category == mutation.category
+                       for badge in whitelist_badges):
+                return MutationResult(success=False,
+                                      message=f'The badge {mutation.value} with category {mutation.category} '
+                                              'is not part of the whitelist')
+
+        return None
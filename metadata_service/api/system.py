@@ -1,13 +1,45 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import hmac
+import inspect
+import json
+import logging
+import time
 from http import HTTPStatus
-from typing import Iterable, Mapping, Union
+from typing import (Any, Callable, Dict, Iterable, Mapping,  # noqa: F401
+                    Optional, Tuple, Union)
 
+import attr
+from amundsen_common.models.popular_table import PopularTableSchema
+from amundsen_common.models.user import UserSchema
 from flasgger import swag_from
-from flask_restful import Resource
+from flask import current_app as app
+from flask import request
+from flask_restful import Resource, marshal
 
+from metadata_service import config
+from metadata_service.api.tag import tag_usage_fields
+from metadata_service.entity.column_stats import dump_table
+from metadata_service.entity.dashboard_detail import DashboardSchema
+from metadata_service.exception import NotFoundException
 from metadata_service.proxy import get_proxy_client
+from metadata_service.proxy.caching_proxy import CachingProxy
+from metadata_service.proxy.query_profiler import profiling
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILING_TOKEN_HEADER = 'X-Profiling-Token'
+
+# The read operations that can be profiled, with how their API serializes their result
+_PROFILED_OPERATIONS = {
+    'get_table': dump_table,
+    'get_user': lambda user: UserSchema().dump(user),
+    'get_dashboard': lambda dashboard: DashboardSchema().dump(dashboard),
+    'get_popular_tables': lambda popular_tables: PopularTableSchema().dump(popular_tables, many=True),
+    'get_tags': lambda tag_usages: marshal({'tag_usages': tag_usages}, tag_usage_fields),
+    'get_statistics': lambda statistics: statistics,
+}  # type: Dict[str, Callable[[Any], Any]]
 
 
 class Neo4jDetailAPI(Resource):
@@ -42,3 +74,72 @@ class StatisticsMetricsAPI(Resource):
             return {'Statistics': statistics}, HTTPStatus.OK
         else:
             return {'message': 'There was an error with retreiving the metrics of Neo4j'}, HTTPStatus.NO_CONTENT
+
+
+class QueryProfileAPI(Resource):
+    """
+    Admin API to re-run a read operation of the proxy with the profiling of the backend on (Neo4j PROFILE, Neptune
+    /gremlin/profile), to find out why it is slow. It is disabled unless config.QUERY_PROFILING_TOKEN is set.
+    """
+
+    def __init__(self) -> None:
+        client = get_proxy_client()
+        # the cached results would not run any query
+        self.client = client.client if isinstance(client, CachingProxy) else client
+
+    @swag_from('swagger_doc/system/profile_post.yml')
+    def post(self, operation: str) -> Iterable[Union[Mapping, int, None]]:
+        """
+        Runs the operation with the keyword arguments in the request body, a json object, and returns its backend
+        queries with their profile, the time of the operation, and the time to serialize its result
+        """
+        error = self._authorize()
+        if error is not None:
+            return error
+
+        serialize = _PROFILED_OPERATIONS.get(operation)
+        if serialize is None:
+            return {'message': f'Operation {operation} can not be profiled, expected one of '
+                               f'{sorted(_PROFILED_OPERATIONS)}'}, HTTPStatus.BAD_REQUEST
+        method = getattr(self.client, operation)
+        try:
+            kwargs = json.loads(request.data) if request.data else {}
+            if not isinstance(kwargs, dict):
+                raise ValueError('expected a json object')
+            inspect.signature(method).bind(**kwargs)
+        except (TypeError, ValueError) as e:
+            return {'message': f'Arguments of {operation} are not valid: {e}'}, HTTPStatus.BAD_REQUEST
+
+        with profiling() as profiler:
+            start = time.time()
+            try:
+                result = method(**kwargs)
+            except NotImplementedError:
+                return {'message': f'{operation} is not supported by this proxy'}, HTTPStatus.NOT_IMPLEMENTED
+            except NotFoundException as e:
+                return {'message': f'{operation}({kwargs}) found nothing: {e}'}, HTTPStatus.NOT_FOUND
+            operation_ms = (time.time() - start) * 1000
+
+        start = time.time()
+        serialize(result)
+        serialization_ms = (time.time() - start) * 1000
+
+        queries = [attr.asdict(query) for query in profiler.queries]
+        LOGGER.info(f'Profiled {operation}({kwargs}): {len(queries)} queries in {operation_ms:.1f} ms')
+        return {'operation': operation,
+                'operation_ms': operation_ms,
+                'serialization_ms': serialization_ms,
+                'db_hits': sum(query['db_hits'] or 0 for query in queries),
+                'queries': queries}, HTTPStatus.OK
+
+    @staticmethod
+    def _authorize() -> Optional[Tuple[Mapping, HTTPStatus]]:
+        """
+        :return: the error response when profiling is disabled or the request does not carry the token
+        """
+        token = app.config.get(config.QUERY_PROFILING_TOKEN)
+        if not token:
+            return {'message': 'Query profiling is disabled'}, HTTPStatus.NOT_FOUND
+        if not hmac.compare_digest(request.headers.get(PROFILING_TOKEN_HEADER, ''), token):
+            return {'message': f'A valid {PROFILING_TOKEN_HEADER} header is required'}, HTTPStatus.FORBIDDEN
+        return None
@@ -5,17 +5,19 @@ import json
 from http import HTTPStatus
 from typing import Any, Iterable, Mapping, Optional, Union
 
-from amundsen_common.models.lineage import LineageSchema
-from amundsen_common.models.table import TableSchema
 from flasgger import swag_from
+from flask import current_app as app
 from flask import request
-from flask_restful import Resource, reqparse
+from flask_restful import Resource, inputs, reqparse
 
 from metadata_service.api import BaseAPI
 from metadata_service.api.badge import BadgeCommon
 from metadata_service.api.tag import TagCommon
+from metadata_service.entity.column_stats import dump_table
 from metadata_service.entity.dashboard_summary import DashboardSummarySchema
+from metadata_service.entity.lineage import BoundedLineageSchema
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.exception import NotFoundException
 from metadata_service.proxy import get_proxy_client
 
@@ -27,18 +29,60 @@ class TableDetailAPI(Resource):
 
     def __init__(self) -> None:
         self.client = get_proxy_client()
+        self.parser = reqparse.RequestParser()
+        self.parser.add_argument('fields', type=str, required=False, location='args')
+        self.parser.add_argument('column_offset', type=inputs.natural, required=False, default=0, location='args')
+        self.parser.add_argument('column_limit', type=inputs.positive, required=False, location='args')
+        super(TableDetailAPI, self).__init__()
 
     @swag_from('swagger_doc/table/detail_get.yml')
     def get(self, table_uri: str) -> Iterable[Union[Mapping, int, None]]:
+        args = self.parser.parse_args()
+        # comma separated optional parts of the table, all of them when not given
+        fields = args.get('fields')
+        try:
+            projection = TableProjection.from_fields(
+                None if fields is None else [field.strip() for field in fields.split(',') if field.strip()],
+                column_offset=args.get('column_offset'),
+                column_limit=args.get('column_limit'))
+        except ValueError as e:
+            return {'message': str(e)}, HTTPStatus.BAD_REQUEST
+
         try:
-            table = self.client.get_table(table_uri=table_uri)
-            schema = TableSchema()
-            return schema.dump(table), HTTPStatus.OK
+            table = self.client.get_table(table_uri=table_uri, projection=projection)
+            return dump_table(table, exclude=projection.excluded_fields()), HTTPStatus.OK
 
         except NotFoundException:
             return {'message': 'table_uri {} does not exist'.format(table_uri)}, HTTPStatus.NOT_FOUND
 
 
+class TableBatchAPI(Resource):
+    """
+    TableBatch API to get the details of many tables in one request
+    """
+
+    def __init__(self) -> None:
+        self.client = get_proxy_client()
+
+    @swag_from('swagger_doc/table/batch_post.yml')
+    def post(self) -> Iterable[Union[Mapping, int, None]]:
+        try:
+            table_uris = json.loads(request.data).get('table_uris')
+        except (ValueError, AttributeError):
+            table_uris = None
+        if not isinstance(table_uris, list) or not all(isinstance(table_uri, str) for table_uri in table_uris):
+            return {'message': 'table_uris should be a list of table URIs'}, HTTPStatus.BAD_REQUEST
+
+        # duplicates are fetched once, the order of the request is kept for not_found
+        table_uris = list(dict.fromkeys(table_uris))
+        max_size = app.config['TABLE_BATCH_MAX_SIZE']
+        if len(table_uris) > max_size:
+            return {'message': f'table_uris should have at most {max_size} table URIs'}, HTTPStatus.BAD_REQUEST
+        tables = self.client.get_tables(table_uris=table_uris)
+        return {'tables': {table_uri: dump_table(table) for table_uri, table in tables.items()},
+                'not_found': [table_uri for table_uri in table_uris if table_uri not in tables]}, HTTPStatus.OK
+
+
 class TableLineageAPI(Resource):
     def __init__(self) -> None:
         self.client = get_proxy_client()
@@ -57,7 +101,7 @@ class TableLineageAPI(Resource):
                                               resource_type=ResourceType.Table,
                                               direction=direction,
                                               depth=depth)
-            schema = LineageSchema()
+            schema = BoundedLineageSchema()
             return schema.dump(lineage), HTTPStatus.OK
         except Exception as e:
             return {'message': f'Exception raised when getting lineage: {e}'}, HTTPStatus.NOT_FOUND
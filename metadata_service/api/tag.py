@@ -6,7 +6,7 @@ from typing import Any, Iterable, Mapping, Tuple, Union
 
 from flasgger import swag_from
 from flask import current_app as app
-from flask_restful import Resource, fields, marshal
+from flask_restful import Resource, fields, inputs, marshal, reqparse
 
 from metadata_service.entity.resource_type import ResourceType
 from metadata_service.exception import NotFoundException
@@ -29,14 +29,19 @@ BADGE_TYPE = 'badge'
 class TagAPI(Resource):
     def __init__(self) -> None:
         self.client = get_proxy_client()
+        self.parser = reqparse.RequestParser()
+        self.parser.add_argument('prefix', type=str, required=False, location='args')
+        self.parser.add_argument('limit', type=inputs.positive, required=False, location='args')
         super(TagAPI, self).__init__()
 
     @swag_from('swagger_doc/tag/tag_get.yml')
     def get(self) -> Iterable[Union[Mapping, int, None]]:
         """
-        API to fetch all the existing tags with usage.
+        API to fetch the existing tags with usage, optionally only the ones starting with prefix and
+        the limit most used ones.
         """
-        tag_usages = self.client.get_tags()
+        args = self.parser.parse_args()
+        tag_usages = self.client.get_tags(prefix=args.get('prefix'), limit=args.get('limit'))
         return marshal({'tag_usages': tag_usages}, tag_usage_fields), HTTPStatus.OK
 
 
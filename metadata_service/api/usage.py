@@ -0,0 +1,45 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from http import HTTPStatus
+from typing import Iterable, Mapping, Union
+
+from flasgger import swag_from
+from flask import request
+from flask_restful import Resource
+from marshmallow.exceptions import ValidationError as SchemaValidationError
+
+from metadata_service.entity.usage import UsageDeltaSchema
+from metadata_service.proxy import get_proxy_client
+
+LOGGER = logging.getLogger(__name__)
+
+
+class UsageDeltaAPI(Resource):
+    """
+    UsageDeltaAPI supports POST operation to add table usage in bulk
+    """
+
+    def __init__(self) -> None:
+        self.client = get_proxy_client()
+
+    @swag_from('swagger_doc/usage/delta_post.yml')
+    def post(self) -> Iterable[Union[Mapping, int, None]]:
+        """
+        Adds the reads in the request body, a json list of usage deltas, to the existing usage of the tables
+        """
+        try:
+            deltas = UsageDeltaSchema().load(json.loads(request.data), many=True)
+        except (SchemaValidationError, ValueError) as e:
+            return {'message': 'Usage deltas provided are not valid: {}'.format(e)}, HTTPStatus.BAD_REQUEST
+
+        try:
+            self.client.apply_usage_deltas(deltas=deltas)
+            return {'message': '{} usage deltas are applied successfully'.format(len(deltas))}, HTTPStatus.OK
+        except NotImplementedError:
+            return {'message': 'Usage deltas are not supported by this proxy'}, HTTPStatus.NOT_IMPLEMENTED
+        except Exception:
+            LOGGER.exception('UsageDeltaAPI POST Failed')
+            return {'message': 'Internal server error!'}, HTTPStatus.INTERNAL_SERVER_ERROR
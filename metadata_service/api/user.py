@@ -1,11 +1,13 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
+import binascii
 import json
 import logging
 from http import HTTPStatus
 from typing import (Any, Dict, Iterable, List, Mapping, Optional,  # noqa: F401
-                    Union)
+                    Tuple, Union)
 
 from amundsen_common.models.dashboard import DashboardSummarySchema
 from amundsen_common.models.popular_table import PopularTableSchema
@@ -13,7 +15,7 @@ from amundsen_common.models.user import UserSchema
 from flasgger import swag_from
 from flask import current_app as app
 from flask import request
-from flask_restful import Resource
+from flask_restful import Resource, reqparse
 from marshmallow.exceptions import ValidationError as SchemaValidationError
 
 from metadata_service.api import BaseAPI
@@ -26,6 +28,102 @@ from metadata_service.util import UserResourceRel
 LOGGER = logging.getLogger(__name__)
 
 
+def _encode_cursor(last_keys: Dict[str, str]) -> Optional[str]:
+    """
+    Encodes the last key returned per resource type into an opaque cursor. Resource types that are exhausted
+    are left out, and no cursor is returned once all of them are.
+    """
+    if not last_keys:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(last_keys).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> Dict[str, str]:
+    """
+    Decodes a cursor created by _encode_cursor, raising ValueError when it is malformed
+    """
+    try:
+        last_keys = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f'Invalid cursor {cursor}') from e
+    if not isinstance(last_keys, dict) or not all(isinstance(v, str) for v in last_keys.values()):
+        raise ValueError(f'Invalid cursor {cursor}')
+    return last_keys
+
+
+def _get_page_args(parser: reqparse.RequestParser) -> Optional[Tuple[int, Optional[Dict[str, str]]]]:
+    """
+    Returns the limit and the decoded cursor of a paginated request, or None when neither limit nor cursor is given.
+    Raises ValueError when the limit is out of bounds or the cursor is malformed.
+    """
+    args = parser.parse_args()
+    limit, cursor = args.get('limit'), args.get('cursor')
+    if limit is None and cursor is None:
+        return None
+
+    max_page_size = app.config['USER_RELATION_MAX_PAGE_SIZE']
+    if limit is None:
+        limit = app.config['USER_RELATION_PAGE_SIZE']
+    if not 0 < limit <= max_page_size:
+        raise ValueError(f'limit should be between 1 and {max_page_size}')
+    return limit, _decode_cursor(cursor) if cursor else None
+
+
+def _get_resource_page_args(page: Optional[Tuple[int, Optional[Dict[str, str]]]],
+                            resource_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the pagination arguments of the proxy call for a resource type, or None when the resource type was
+    exhausted on a previous page and is not in the cursor anymore
+    """
+    if page is None:
+        return {}
+    limit, last_keys = page
+    if last_keys is None:
+        return {'limit': limit, 'cursor': None}
+    if resource_key not in last_keys:
+        return None
+    return {'limit': limit, 'cursor': last_keys[resource_key]}
+
+
+def _get_resources_by_user_relation(client: Any,
+                                    parser: reqparse.RequestParser,
+                                    user_id: str,
+                                    relation_type: UserResourceRel) -> Iterable[Union[Mapping, int, None]]:
+    """
+    Returns the tables and dashboards related to the user. Without limit and cursor every resource is returned
+    as before. Otherwise up to limit tables and limit dashboards are returned along with a next_cursor,
+    which is null on the last page.
+    """
+    try:
+        page = _get_page_args(parser)
+    except ValueError as e:
+        return {'message': str(e)}, HTTPStatus.BAD_REQUEST
+
+    try:
+        result = {}  # type: Dict[str, Any]
+        next_keys = {}  # type: Dict[str, str]
+        for resource_key, get_resources, schema in [
+                (ResourceType.Table.name.lower(), client.get_table_by_user_relation, PopularTableSchema()),
+                (ResourceType.Dashboard.name.lower(), client.get_dashboard_by_user_relation, DashboardSummarySchema())]:
+            result[resource_key] = []
+            page_args = _get_resource_page_args(page, resource_key)
+            if page_args is None:
+                continue
+
+            resources = get_resources(user_email=user_id, relation_type=relation_type, **page_args) or {}
+            if resources.get(resource_key):
+                result[resource_key] = schema.dump(resources[resource_key], many=True)
+            if resources.get('next_cursor'):
+                next_keys[resource_key] = resources['next_cursor']
+
+        if page is not None:
+            result['next_cursor'] = _encode_cursor(next_keys)
+        return result, HTTPStatus.OK
+
+    except NotFoundException:
+        return {'message': 'user_id {} does not exist'.format(user_id)}, HTTPStatus.NOT_FOUND
+
+
 class UserDetailAPI(BaseAPI):
     """
     User detail API for people resources
@@ -83,6 +181,9 @@ class UserFollowsAPI(Resource):
 
     def __init__(self) -> None:
         self.client = get_proxy_client()
+        self.parser = reqparse.RequestParser()
+        self.parser.add_argument('limit', type=int, required=False, location='args')
+        self.parser.add_argument('cursor', type=str, required=False, location='args')
 
     @swag_from('swagger_doc/user/follow_get.yml')
     def get(self, user_id: str) -> Iterable[Union[Mapping, int, None]]:
@@ -93,29 +194,7 @@ class UserFollowsAPI(Resource):
         :return:
         """
         try:
-            resources = self.client.get_table_by_user_relation(user_email=user_id,
-                                                               relation_type=UserResourceRel.follow)
-
-            table_key = ResourceType.Table.name.lower()
-            dashboard_key = ResourceType.Dashboard.name.lower()
-            result = {
-                table_key: [],
-                dashboard_key: []
-            }  # type: Dict[str, List[Any]]
-
-            if resources and table_key in resources and len(resources[table_key]) > 0:
-                result[table_key] = PopularTableSchema().dump(resources[table_key], many=True)
-
-            resources = self.client.get_dashboard_by_user_relation(user_email=user_id,
-                                                                   relation_type=UserResourceRel.follow)
-
-            if resources and dashboard_key in resources and len(resources[dashboard_key]) > 0:
-                result[dashboard_key] = DashboardSummarySchema().dump(resources[dashboard_key], many=True)
-
-            return result, HTTPStatus.OK
-
-        except NotFoundException:
-            return {'message': 'user_id {} does not exist'.format(user_id)}, HTTPStatus.NOT_FOUND
+            return _get_resources_by_user_relation(self.client, self.parser, user_id, UserResourceRel.follow)
 
         except Exception:
             LOGGER.exception('UserFollowAPI GET Failed')
@@ -190,6 +269,9 @@ class UserOwnsAPI(Resource):
 
     def __init__(self) -> None:
         self.client = get_proxy_client()
+        self.parser = reqparse.RequestParser()
+        self.parser.add_argument('limit', type=int, required=False, location='args')
+        self.parser.add_argument('cursor', type=str, required=False, location='args')
 
     @swag_from('swagger_doc/user/own_get.yml')
     def get(self, user_id: str) -> Iterable[Union[Mapping, int, None]]:
@@ -200,28 +282,7 @@ class UserOwnsAPI(Resource):
         :return:
         """
         try:
-            table_key = ResourceType.Table.name.lower()
-            dashboard_key = ResourceType.Dashboard.name.lower()
-            result = {
-                table_key: [],
-                dashboard_key: []
-            }  # type: Dict[str, List[Any]]
-
-            resources = self.client.get_table_by_user_relation(user_email=user_id,
-                                                               relation_type=UserResourceRel.own)
-            if resources and table_key in resources and len(resources[table_key]) > 0:
-                result[table_key] = PopularTableSchema().dump(resources[table_key], many=True)
-
-            resources = self.client.get_dashboard_by_user_relation(user_email=user_id,
-                                                                   relation_type=UserResourceRel.own)
-
-            if resources and dashboard_key in resources and len(resources[dashboard_key]) > 0:
-                result[dashboard_key] = DashboardSummarySchema().dump(resources[dashboard_key], many=True)
-
-            return result, HTTPStatus.OK
-
-        except NotFoundException:
-            return {'message': 'user_id {} does not exist'.format(user_id)}, HTTPStatus.NOT_FOUND
+            return _get_resources_by_user_relation(self.client, self.parser, user_id, UserResourceRel.own)
 
         except Exception:
             LOGGER.exception('UserOwnAPI GET Failed')
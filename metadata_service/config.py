@@ -27,7 +27,46 @@ PROXY_CLIENTS = {
 }
 
 IS_STATSD_ON = 'IS_STATSD_ON'
+PROMETHEUS_METRICS_ENABLED = 'PROMETHEUS_METRICS_ENABLED'
+PROMETHEUS_MAX_STATSD_NAMES = 'PROMETHEUS_MAX_STATSD_NAMES'
 USER_OTHER_KEYS = 'USER_OTHER_KEYS'
+NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION = 'NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION'
+PROXY_CONCURRENT_SUB_QUERIES = 'PROXY_CONCURRENT_SUB_QUERIES'
+PROXY_SUB_QUERY_MAX_WORKERS = 'PROXY_SUB_QUERY_MAX_WORKERS'
+PROXY_CACHE_ENABLED = 'PROXY_CACHE_ENABLED'
+PROXY_CACHE_MAX_SIZE = 'PROXY_CACHE_MAX_SIZE'
+PROXY_CACHE_TTL_SEC = 'PROXY_CACHE_TTL_SEC'
+BEAKER_CACHE_TYPE = 'BEAKER_CACHE_TYPE'
+BEAKER_CACHE_URL = 'BEAKER_CACHE_URL'
+POPULAR_TABLES_REFRESH_ENABLED = 'POPULAR_TABLES_REFRESH_ENABLED'
+POPULAR_TABLES_REFRESH_INTERVAL_SEC = 'POPULAR_TABLES_REFRESH_INTERVAL_SEC'
+POPULAR_TABLES_ACTIVE_USER_SEC = 'POPULAR_TABLES_ACTIVE_USER_SEC'
+POPULAR_TABLES_REFRESH_NUM_ENTRIES = 'POPULAR_TABLES_REFRESH_NUM_ENTRIES'
+POPULARITY_INDEX_ENABLED = 'POPULARITY_INDEX_ENABLED'
+POPULARITY_INDEX_REBUILD_INTERVAL_SEC = 'POPULARITY_INDEX_REBUILD_INTERVAL_SEC'
+PROXY_MUTATION_BATCH_SIZE = 'PROXY_MUTATION_BATCH_SIZE'
+GREMLIN_CLIENT_POOL_SIZE = 'GREMLIN_CLIENT_POOL_SIZE'
+GREMLIN_CLIENT_MAX_AGE_SEC = 'GREMLIN_CLIENT_MAX_AGE_SEC'
+GREMLIN_CLIENT_IDLE_CHECK_SEC = 'GREMLIN_CLIENT_IDLE_CHECK_SEC'
+GREMLIN_SINGLE_TRAVERSAL_WRITES = 'GREMLIN_SINGLE_TRAVERSAL_WRITES'
+GREMLIN_WRITE_BATCH_SIZE = 'GREMLIN_WRITE_BATCH_SIZE'
+USER_RELATION_PAGE_SIZE = 'USER_RELATION_PAGE_SIZE'
+USER_RELATION_MAX_PAGE_SIZE = 'USER_RELATION_MAX_PAGE_SIZE'
+GEVENT_MAX_CONCURRENT_REQUESTS = 'GEVENT_MAX_CONCURRENT_REQUESTS'
+TABLE_BATCH_MAX_SIZE = 'TABLE_BATCH_MAX_SIZE'
+LINEAGE_MAX_DEPTH = 'LINEAGE_MAX_DEPTH'
+LINEAGE_MAX_NODES = 'LINEAGE_MAX_NODES'
+LINEAGE_INDEX_ENABLED = 'LINEAGE_INDEX_ENABLED'
+LINEAGE_INDEX_REFRESH_INTERVAL_SEC = 'LINEAGE_INDEX_REFRESH_INTERVAL_SEC'
+STATISTICS_SNAPSHOT_ENABLED = 'STATISTICS_SNAPSHOT_ENABLED'
+STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC = 'STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC'
+STATISTICS_SNAPSHOT_MAX_AGE_SEC = 'STATISTICS_SNAPSHOT_MAX_AGE_SEC'
+STATISTICS_SNAPSHOT_REFRESH_ON_WRITE = 'STATISTICS_SNAPSHOT_REFRESH_ON_WRITE'
+TAG_INDEX_ENABLED = 'TAG_INDEX_ENABLED'
+TAG_INDEX_REBUILD_INTERVAL_SEC = 'TAG_INDEX_REBUILD_INTERVAL_SEC'
+QUERY_PROFILING_TOKEN = 'QUERY_PROFILING_TOKEN'
+SLOW_QUERY_THRESHOLD_MS = 'SLOW_QUERY_THRESHOLD_MS'
+SLOW_QUERY_REDACTED_PARAMS = 'SLOW_QUERY_REDACTED_PARAMS'
 
 
 class Config:
@@ -54,6 +93,13 @@ class Config:
 
     IS_STATSD_ON = False
 
+    # Serve the metrics in the Prometheus format at /metrics. They are recorded along with the statsd ones, and the
+    # ones of the requests. See metadata_service.metrics to run several worker processes.
+    PROMETHEUS_METRICS_ENABLED = bool(distutils.util.strtobool(os.environ.get(PROMETHEUS_METRICS_ENABLED, 'False')))
+    # Distinct statsd prefix and name pairs recorded as Prometheus labels, e.g. one per backend query fingerprint.
+    # The ones beyond it are recorded under the name 'other', so that the number of time series stays bounded.
+    PROMETHEUS_MAX_STATSD_NAMES = int(os.environ.get(PROMETHEUS_MAX_STATSD_NAMES, 1000))  # type: int
+
     # Configurable dictionary to influence format of column statistics displayed in UI
     STATISTICS_FORMAT_SPEC: Dict[str, Dict] = {}
 
@@ -72,6 +118,94 @@ class Config:
     # Number of minimum reader count to qualify for popular table
     POPULAR_TABLE_MINIMUM_READER_COUNT = 10  # type: int
 
+    # Recompute the cached popular tables rankings in a background thread ahead of their expiry, instead of on the
+    # first request after they expired. Personal rankings are only kept warm for users who requested them within
+    # POPULAR_TABLES_ACTIVE_USER_SEC.
+    POPULAR_TABLES_REFRESH_ENABLED = bool(distutils.util.strtobool(
+        os.environ.get(POPULAR_TABLES_REFRESH_ENABLED, 'False')))
+    POPULAR_TABLES_REFRESH_INTERVAL_SEC = int(os.environ.get(POPULAR_TABLES_REFRESH_INTERVAL_SEC, 60 * 60))  # type: int
+    POPULAR_TABLES_ACTIVE_USER_SEC = int(os.environ.get(POPULAR_TABLES_ACTIVE_USER_SEC, 24 * 60 * 60))  # type: int
+    # Global rankings computed when the service starts and then kept warm, before any request for them, e.g. the
+    # default limit of the popular tables API. A comma separated list of num_entries in the environment.
+    POPULAR_TABLES_REFRESH_NUM_ENTRIES = [int(num_entries) for num_entries in os.environ.get(
+        POPULAR_TABLES_REFRESH_NUM_ENTRIES, '10').split(',') if num_entries.strip()]  # type: List[int]
+
+    # Serve the global popular tables from an in memory popularity index, built once from the graph and updated
+    # by the usage delta API, instead of aggregating every READ_BY relationship. The index is rebuilt every
+    # POPULARITY_INDEX_REBUILD_INTERVAL_SEC (0 disables it) to pick up usage loaded by other means.
+    POPULARITY_INDEX_ENABLED = bool(distutils.util.strtobool(os.environ.get(POPULARITY_INDEX_ENABLED, 'False')))
+    POPULARITY_INDEX_REBUILD_INTERVAL_SEC = int(os.environ.get(POPULARITY_INDEX_REBUILD_INTERVAL_SEC,
+                                                               6 * 60 * 60))  # type: int
+
+    # Number of mutations of the bulk mutation API applied per transaction (Neo4j) or per connection (Gremlin)
+    PROXY_MUTATION_BATCH_SIZE = int(os.environ.get(PROXY_MUTATION_BATCH_SIZE, 1000))  # type: int
+
+    # Gremlin proxies keep up to GREMLIN_CLIENT_POOL_SIZE clients open and reuse them across requests. Clients are
+    # replaced after GREMLIN_CLIENT_MAX_AGE_SEC, which needs to be shorter than the validity of signed Neptune urls,
+    # and checked before reuse when they have been idle for more than GREMLIN_CLIENT_IDLE_CHECK_SEC
+    GREMLIN_CLIENT_POOL_SIZE = int(os.environ.get(GREMLIN_CLIENT_POOL_SIZE, 8))  # type: int
+    GREMLIN_CLIENT_MAX_AGE_SEC = int(os.environ.get(GREMLIN_CLIENT_MAX_AGE_SEC, 10 * 60))  # type: int
+    GREMLIN_CLIENT_IDLE_CHECK_SEC = int(os.environ.get(GREMLIN_CLIENT_IDLE_CHECK_SEC, 60))  # type: int
+
+    # Gremlin proxies upsert vertices, link them and expire links in one traversal each instead of reading the
+    # vertices and edges before writing them, which saves up to three round trips per edge
+    GREMLIN_SINGLE_TRAVERSAL_WRITES = bool(distutils.util.strtobool(
+        os.environ.get(GREMLIN_SINGLE_TRAVERSAL_WRITES, 'False')))
+
+    # Number of mutations of the bulk mutation API that Gremlin proxies chain into one traversal, 0 to write them one
+    # by one. The mutations of a failed traversal are written again one by one to attribute the errors to them.
+    GREMLIN_WRITE_BATCH_SIZE = int(os.environ.get(GREMLIN_WRITE_BATCH_SIZE, 0))  # type: int
+
+    # Page size of the user follow / own endpoints when a cursor is passed without a limit,
+    # and the largest limit a client can ask for
+    USER_RELATION_PAGE_SIZE = int(os.environ.get(USER_RELATION_PAGE_SIZE, 100))  # type: int
+    USER_RELATION_MAX_PAGE_SIZE = int(os.environ.get(USER_RELATION_MAX_PAGE_SIZE, 1000))  # type: int
+
+    # Largest number of table URIs of a table batch request, larger requests are rejected
+    TABLE_BATCH_MAX_SIZE = int(os.environ.get(TABLE_BATCH_MAX_SIZE, 100))  # type: int
+
+    # Requests served at the same time by one process of metadata_gevent. Requests beyond the proxy's connection
+    # pool size wait for a connection without holding a thread
+    GEVENT_MAX_CONCURRENT_REQUESTS = int(os.environ.get(GEVENT_MAX_CONCURRENT_REQUESTS, 1000))  # type: int
+
+    # Lineage requests deeper than LINEAGE_MAX_DEPTH levels are cut to it, and at most LINEAGE_MAX_NODES entities
+    # are returned per direction. Lineage cut by either limit is flagged as truncated
+    LINEAGE_MAX_DEPTH = int(os.environ.get(LINEAGE_MAX_DEPTH, 5))  # type: int
+    LINEAGE_MAX_NODES = int(os.environ.get(LINEAGE_MAX_NODES, 500))  # type: int
+
+    # Expand table and column lineage from an in memory index of the lineage relationships, loaded on start up, and
+    # only query the graph for the badges and usage of the returned entities. Every
+    # LINEAGE_INDEX_REFRESH_INTERVAL_SEC the index is reloaded if the graph was published to since it was built.
+    LINEAGE_INDEX_ENABLED = bool(distutils.util.strtobool(os.environ.get(LINEAGE_INDEX_ENABLED, 'False')))
+    LINEAGE_INDEX_REFRESH_INTERVAL_SEC = int(os.environ.get(LINEAGE_INDEX_REFRESH_INTERVAL_SEC, 60))  # type: int
+
+    # Serve the catalog statistics from a snapshot computed in the background, instead of scanning the catalog on
+    # every request. Every STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC the snapshot is recomputed if it is older than
+    # STATISTICS_SNAPSHOT_MAX_AGE_SEC or, with STATISTICS_SNAPSHOT_REFRESH_ON_WRITE, if descriptions or owners were
+    # changed through this service since it was computed.
+    STATISTICS_SNAPSHOT_ENABLED = bool(distutils.util.strtobool(os.environ.get(STATISTICS_SNAPSHOT_ENABLED, 'False')))
+    STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC = int(os.environ.get(STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC,
+                                                                  60))  # type: int
+    STATISTICS_SNAPSHOT_MAX_AGE_SEC = int(os.environ.get(STATISTICS_SNAPSHOT_MAX_AGE_SEC, 6 * 60 * 60))  # type: int
+    STATISTICS_SNAPSHOT_REFRESH_ON_WRITE = bool(distutils.util.strtobool(
+        os.environ.get(STATISTICS_SNAPSHOT_REFRESH_ON_WRITE, 'False')))
+
+    # Serve the tags from an in memory index of the number of resources per tag, loaded on first use and updated
+    # by the tags added and removed through this service. The index is rebuilt every TAG_INDEX_REBUILD_INTERVAL_SEC
+    # (0 disables it) to pick up tags written by other means.
+    TAG_INDEX_ENABLED = bool(distutils.util.strtobool(os.environ.get(TAG_INDEX_ENABLED, 'False')))
+    TAG_INDEX_REBUILD_INTERVAL_SEC = int(os.environ.get(TAG_INDEX_REBUILD_INTERVAL_SEC, 60 * 60))  # type: int
+
+    # Admin token of the query profiling API, which re-runs proxy operations with backend profiling on. The API is
+    # disabled without a token, and requests need to pass it in the X-Profiling-Token header.
+    QUERY_PROFILING_TOKEN = os.environ.get(QUERY_PROFILING_TOKEN)  # type: Optional[str]
+
+    # Backend queries taking at least SLOW_QUERY_THRESHOLD_MS (0 disables it) are logged as warnings, with their
+    # parameters. The values of the parameters whose name matches the SLOW_QUERY_REDACTED_PARAMS regex are redacted.
+    SLOW_QUERY_THRESHOLD_MS = int(os.environ.get(SLOW_QUERY_THRESHOLD_MS, 1000))  # type: int
+    SLOW_QUERY_REDACTED_PARAMS = os.environ.get(SLOW_QUERY_REDACTED_PARAMS,
+                                                'user|email|password|token|secret')  # type: Optional[str]
+
     # List of regexes which will exclude certain parameters from appearing as Programmatic Descriptions
     PROGRAMMATIC_DESCRIPTIONS_EXCLUDE_FILTERS = []  # type: list
 
@@ -79,6 +213,31 @@ class Config:
     # or num of retries
     PROXY_CLIENT_KWARGS: Dict = dict()
 
+    # Fetch the column, usage and table level data of Neo4jProxy.get_table in one read transaction
+    # instead of one session per query
+    NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION = bool(distutils.util.strtobool(
+        os.environ.get(NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION, 'False')))
+
+    # Run the independent sub queries of get_table (e.g. columns, readers, reports) concurrently on a shared,
+    # bounded executor instead of one after another
+    PROXY_CONCURRENT_SUB_QUERIES = bool(distutils.util.strtobool(
+        os.environ.get(PROXY_CONCURRENT_SUB_QUERIES, 'False')))
+    PROXY_SUB_QUERY_MAX_WORKERS = int(os.environ.get(PROXY_SUB_QUERY_MAX_WORKERS, 10))  # type: int
+
+    # Wrap the proxy client with metadata_service.proxy.caching_proxy.CachingProxy, an in process read through cache
+    PROXY_CACHE_ENABLED = bool(distutils.util.strtobool(os.environ.get(PROXY_CACHE_ENABLED, 'False')))
+    # Maximum number of cached results, least recently used ones are evicted first
+    PROXY_CACHE_MAX_SIZE = int(os.environ.get(PROXY_CACHE_MAX_SIZE, 10000))  # type: int
+    # Time to live per cached proxy method, methods missing here are not cached. None uses the defaults of
+    # metadata_service.proxy.caching_proxy.DEFAULT_TTL_SEC
+    PROXY_CACHE_TTL_SEC = None  # type: Optional[Dict[str, int]]
+
+    # Backend of the beaker caches used by the proxies (e.g. popular tables). 'memory' keeps one copy per worker,
+    # 'ext:redis' shares them across all workers and nodes through a Redis protocol compatible server at
+    # BEAKER_CACHE_URL, e.g. redis://localhost:6379/0. Requires the redis extra.
+    BEAKER_CACHE_TYPE = os.environ.get(BEAKER_CACHE_TYPE, 'memory')
+    BEAKER_CACHE_URL = os.environ.get(BEAKER_CACHE_URL)  # type: Optional[str]
+
     SWAGGER_TEMPLATE_PATH = os.path.join('api', 'swagger_doc', 'template.yml')
     SWAGGER = {
         'openapi': '3.0.2',
@@ -93,6 +252,7 @@ class LocalConfig(Config):
     LOG_LEVEL = 'DEBUG'
     LOCAL_HOST = '0.0.0.0'
 
+    # Use bolt+routing://<host> with a Neo4j causal cluster to send reads to followers and read replicas
     PROXY_HOST = os.environ.get('PROXY_HOST', f'bolt://{LOCAL_HOST}')
     PROXY_PORT = os.environ.get('PROXY_PORT', 7687)
     PROXY_CLIENT = PROXY_CLIENTS[os.environ.get('PROXY_CLIENT', 'NEO4J')]
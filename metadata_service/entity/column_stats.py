@@ -0,0 +1,120 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from array import array
+from operator import itemgetter
+from typing import (Any, Dict, Iterable, List, Mapping, Optional, Sequence,
+                    Union, cast, overload)
+
+import attr
+from amundsen_common.models.table import Stat, Table, TableSchema
+
+from metadata_service.entity.table_projection import COLUMN_STATS, COLUMNS
+
+_STAT_TYPE = itemgetter('stat_type')
+_STAT_VAL = itemgetter('stat_val')
+_START_EPOCH = itemgetter('start_epoch')
+_END_EPOCH = itemgetter('end_epoch')
+
+
+def _epochs(values: Iterable[Any]) -> array:
+    # epochs are stored as strings or floats in the graph
+    return array('q', map(int, map(float, values)))
+
+
+class ColumnStats(Sequence[Stat]):
+    """
+    Statistics of one column kept as parallel arrays of stat type, value and start and end epochs, built in bulk
+    from the records instead of one Stat per statistic. It reads as a sequence of Stat for the code that uses
+    Column.stats, and dump_table serializes it from the arrays without materializing them.
+    """
+    __slots__ = ('stat_types', 'stat_vals', 'start_epochs', 'end_epochs')
+
+    def __init__(self, *,
+                 stat_types: List[str],
+                 stat_vals: List[Optional[str]],
+                 start_epochs: array,
+                 end_epochs: array) -> None:
+        self.stat_types = stat_types
+        self.stat_vals = stat_vals
+        self.start_epochs = start_epochs
+        self.end_epochs = end_epochs
+
+    @classmethod
+    def from_records(cls, stats: Iterable[Mapping[str, Any]]) -> 'ColumnStats':
+        """
+        :param stats: stat_type, stat_val, start_epoch and end_epoch per statistic
+        """
+        stats = list(stats)
+        return cls(stat_types=list(map(_STAT_TYPE, stats)),
+                   stat_vals=list(map(_STAT_VAL, stats)),
+                   start_epochs=_epochs(map(_START_EPOCH, stats)),
+                   end_epochs=_epochs(map(_END_EPOCH, stats)))
+
+    def dump(self) -> List[Dict[str, Any]]:
+        """
+        :return: the statistics in the shape of StatSchema().dump(stats, many=True)
+        """
+        return [{'stat_type': stat_type, 'stat_val': stat_val, 'start_epoch': start_epoch, 'end_epoch': end_epoch}
+                for stat_type, stat_val, start_epoch, end_epoch
+                in zip(self.stat_types, self.stat_vals, self.start_epochs, self.end_epochs)]
+
+    def as_stats(self) -> List[Stat]:
+        """
+        :return: the statistics typed as Column.stats. amundsen_common annotates it as a list, but the service only
+        reads it as a sequence of Stat, which ColumnStats is, and dump_table serializes it.
+        """
+        return cast(List[Stat], self)
+
+    @overload
+    def __getitem__(self, index: int) -> Stat:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Stat]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Stat, List[Stat]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Stat(stat_type=self.stat_types[index],
+                    stat_val=self.stat_vals[index],
+                    start_epoch=self.start_epochs[index],
+                    end_epoch=self.end_epochs[index])
+
+    def __len__(self) -> int:
+        return len(self.stat_types)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnStats):
+            return self.dump() == other.dump()
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def dump_table(table: Table, *, exclude: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    TableSchema(exclude=exclude).dump(table), with the ColumnStats of the columns serialized straight from their
+    arrays. The table is not modified, it may be shared through the cache.
+    """
+    schema = TableSchema(exclude=exclude)
+    if not isinstance(table, Table) or COLUMNS in exclude or COLUMN_STATS in exclude:
+        return schema.dump(table)
+
+    compact_stats = {}  # type: Dict[int, ColumnStats]
+    for i, column in enumerate(table.columns):
+        if isinstance(column.stats, ColumnStats):
+            compact_stats[i] = column.stats
+    if not compact_stats:
+        return schema.dump(table)
+
+    columns = [attr.evolve(column, stats=[]) if i in compact_stats else column
+               for i, column in enumerate(table.columns)]
+    result = schema.dump(attr.evolve(table, columns=columns))
+    for i, stats in compact_stats.items():
+        result['columns'][i]['stats'] = stats.dump()
+    return result
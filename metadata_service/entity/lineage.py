@@ -0,0 +1,26 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List
+
+import attr
+from amundsen_common.models.lineage import Lineage, LineageItem
+from marshmallow3_annotations.ext.attrs import AttrsSchema
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class BoundedLineage(Lineage):
+    # the fields of Lineage, declared again so that they are type checked without amundsen_common
+    key: str
+    direction: str
+    depth: int
+    upstream_entities: List[LineageItem]
+    downstream_entities: List[LineageItem]
+    # whether entities were left out because of the server side depth or entity limits
+    truncated: bool = False
+
+
+class BoundedLineageSchema(AttrsSchema):
+    class Meta:
+        target = BoundedLineage
+        register_as_scheme = True
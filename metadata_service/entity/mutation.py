@@ -0,0 +1,51 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from enum import Enum
+from typing import Optional
+
+import attr
+from marshmallow3_annotations.ext.attrs import AttrsSchema
+
+
+class MutationType(Enum):
+    TABLE_DESCRIPTION = 'table_description'
+    COLUMN_DESCRIPTION = 'column_description'
+    TAG = 'tag'
+    OWNER = 'owner'
+    BADGE = 'badge'
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class Mutation:
+    """
+    One metadata edit of a table or of one of its columns, applied in bulk by BaseProxy.apply_mutations.
+    value is the description, the tag name, the owner or the badge name depending on the mutation_type.
+    """
+    mutation_type: str = attr.ib()
+    table_uri: str = attr.ib()
+    value: str = attr.ib()
+    column_name: Optional[str] = attr.ib(default=None)
+    tag_type: str = attr.ib(default='default')
+    category: Optional[str] = attr.ib(default=None)
+
+
+class MutationSchema(AttrsSchema):
+    class Meta:
+        target = Mutation
+        register_as_scheme = True
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class MutationResult:
+    """
+    Outcome of the mutation at the same position in the request
+    """
+    success: bool = attr.ib()
+    message: Optional[str] = attr.ib(default=None)
+
+
+class MutationResultSchema(AttrsSchema):
+    class Meta:
+        target = MutationResult
+        register_as_scheme = True
@@ -0,0 +1,80 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Iterable, List, Optional
+
+import attr
+
+# Optional parts of a table detail, named after the TableSchema fields they fill
+COLUMNS = 'columns'
+COLUMN_STATS = 'columns.stats'
+COLUMN_BADGES = 'columns.badges'
+TABLE_READERS = 'table_readers'
+TABLE_FIELDS = (COLUMNS, COLUMN_STATS, COLUMN_BADGES, TABLE_READERS)
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class TableProjection:
+    """
+    Parts of a table detail for a proxy to fetch. The table level fields are always fetched. Columns, their stats
+    and badges, and table readers are only fetched when requested, and only the columns from column_offset up to
+    column_limit of them in sort order.
+    """
+    columns: bool = True
+    column_stats: bool = True
+    column_badges: bool = True
+    table_readers: bool = True
+    column_offset: int = 0
+    column_limit: Optional[int] = None
+
+    @classmethod
+    def from_fields(cls, fields: Optional[Iterable[str]], *,
+                    column_offset: int = 0, column_limit: Optional[int] = None) -> 'TableProjection':
+        """
+        :param fields: the optional parts to fetch out of TABLE_FIELDS, all of them when None. Column stats or
+        badges imply the columns.
+        :raises ValueError: for a field not in TABLE_FIELDS
+        """
+        if fields is None:
+            fields = TABLE_FIELDS
+        fields = set(fields)
+        unknown = fields.difference(TABLE_FIELDS)
+        if unknown:
+            raise ValueError(f'Unknown table fields {sorted(unknown)}, expected some of {list(TABLE_FIELDS)}')
+
+        return cls(columns=bool(fields.intersection((COLUMNS, COLUMN_STATS, COLUMN_BADGES))),
+                   column_stats=COLUMN_STATS in fields,
+                   column_badges=COLUMN_BADGES in fields,
+                   table_readers=TABLE_READERS in fields,
+                   column_offset=column_offset,
+                   column_limit=column_limit)
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Whether the whole table detail is fetched, as without projection
+        """
+        return self == TableProjection()
+
+    @property
+    def column_end(self) -> Optional[int]:
+        """
+        :return: the exclusive end of the column page, None without limit
+        """
+        return None if self.column_limit is None else self.column_offset + self.column_limit
+
+    def excluded_fields(self) -> List[str]:
+        """
+        :return: the TableSchema fields left out, for TableSchema(exclude=...)
+        """
+        excluded = []  # type: List[str]
+        if not self.columns:
+            excluded.append(COLUMNS)
+        else:
+            if not self.column_stats:
+                excluded.append(COLUMN_STATS)
+            if not self.column_badges:
+                excluded.append(COLUMN_BADGES)
+        if not self.table_readers:
+            excluded.append(TABLE_READERS)
+        return excluded
@@ -0,0 +1,41 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Dict, List, Tuple  # noqa: F401
+
+import attr
+from marshmallow3_annotations.ext.attrs import AttrsSchema
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class UsageDelta:
+    """
+    Reads of a table by a user to be added to the existing usage
+    """
+    table_uri: str = attr.ib()
+    user_email: str = attr.ib()
+    read_count: int = attr.ib()
+
+
+class UsageDeltaSchema(AttrsSchema):
+    class Meta:
+        target = UsageDelta
+        register_as_scheme = True
+
+
+def merge_usage_deltas(deltas: List[UsageDelta]) -> List[UsageDelta]:
+    """
+    Merges the deltas of the same table and user by adding up their reads, in the order of their first delta
+
+    >>> merge_usage_deltas([UsageDelta(table_uri='t', user_email='u', read_count=1),
+    ...                     UsageDelta(table_uri='t', user_email='u', read_count=2)])
+    [UsageDelta(table_uri='t', user_email='u', read_count=3)]
+    """
+    merged = {}  # type: Dict[Tuple[str, str], UsageDelta]
+    for delta in deltas:
+        key = (delta.table_uri, delta.user_email)
+        if key in merged:
+            merged[key] = attr.evolve(merged[key], read_count=merged[key].read_count + delta.read_count)
+        else:
+            merged[key] = delta
+    return list(merged.values())
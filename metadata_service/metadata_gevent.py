@@ -0,0 +1,30 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+# Sockets, ssl, threads and locks have to be patched before anything imports them
+from gevent import monkey  # isort:skip
+monkey.patch_all()  # isort:skip
+
+import os  # noqa: E402
+
+from gevent.pool import Pool  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+
+from metadata_service import config, create_app  # noqa: E402
+
+'''
+  Entry point to flask, serving requests cooperatively with gevent.
+
+  Every request runs in its own greenlet. The Neo4j, Gremlin and Atlas clients are left unchanged, but as their
+  network calls yield to other greenlets while they wait, a single process keeps up to
+  GEVENT_MAX_CONCURRENT_REQUESTS requests in flight instead of one per thread.
+  Requires the gevent extra: pip install amundsen-metadata[gevent]
+'''
+
+application = create_app(
+    config_module_class=os.getenv('METADATA_SVC_CONFIG_MODULE_CLASS')
+    or 'metadata_service.config.LocalConfig')
+
+if __name__ == '__main__':
+    pool = Pool(application.config[config.GEVENT_MAX_CONCURRENT_REQUESTS])
+    WSGIServer(('0.0.0.0', 5002), application, spawn=pool).serve_forever()
@@ -0,0 +1,177 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+In process registry of the Prometheus metrics of the service, served at /metrics when
+config.PROMETHEUS_METRICS_ENABLED is True. The statsd utilities record their metrics here as well, see
+metadata_service.proxy.statsd_utilities, so that everything instrumented for statsd is also scraped:
+  - metadata_service_function_duration_seconds / metadata_service_function_calls_total by module, function and
+    outcome (success or fail): the functions decorated with timer_with_counter, e.g. the proxy methods
+  - metadata_service_timing, metadata_service_count, metadata_service_counter_total and metadata_service_gauge by
+    statsd prefix and name: the timing, count, incr and gauge calls, e.g. the backend query metrics, the cache hits
+    and misses and the occupancy of the gremlin client pool. Past config.PROMETHEUS_MAX_STATSD_NAMES distinct
+    prefix and name pairs in a process, the new names are recorded as 'other'
+
+along with the metrics of the requests:
+  - metadata_service_http_request_duration_seconds by method, route and status
+  - metadata_service_http_requests_in_progress
+
+With several worker processes, e.g. under gunicorn, the PROMETHEUS_MULTIPROC_DIR environment variable needs to point
+to an empty directory before the service starts: every process writes its metrics there and /metrics aggregates
+them. The gunicorn config then needs to call child_exit from its child_exit hook.
+"""
+
+import os
+import time
+from threading import Lock
+from typing import Any, Set, Tuple
+
+from flasgger import swag_from
+from flask import Flask, Response, current_app, g, has_app_context, request
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY,
+                               CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess)
+
+from metadata_service import config
+
+_DURATION_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30)
+# statsd timings, in milliseconds
+_TIMING_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# numbers of items per event, e.g. the records of a query
+_COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000)
+
+HTTP_REQUEST_DURATION = Histogram('metadata_service_http_request_duration_seconds',
+                                  'Duration of the requests', ['method', 'route', 'status'],
+                                  buckets=_DURATION_BUCKETS)
+HTTP_REQUESTS_IN_PROGRESS = Gauge('metadata_service_http_requests_in_progress',
+                                  'Requests being served', multiprocess_mode='livesum')
+FUNCTION_DURATION = Histogram('metadata_service_function_duration_seconds',
+                              'Duration of the calls of the instrumented functions, e.g. proxy methods',
+                              ['module', 'function'], buckets=_DURATION_BUCKETS)
+FUNCTION_CALLS = Counter('metadata_service_function_calls',
+                         'Calls of the instrumented functions, by outcome', ['module', 'function', 'outcome'])
+TIMING = Histogram('metadata_service_timing', 'statsd timings, in milliseconds', ['prefix', 'name'],
+                   buckets=_TIMING_BUCKETS)
+COUNT = Histogram('metadata_service_count', 'Numbers of items per event, e.g. the records of a query',
+                  ['prefix', 'name'], buckets=_COUNT_BUCKETS)
+COUNTER = Counter('metadata_service_counter', 'statsd counters', ['prefix', 'name'])
+GAUGE = Gauge('metadata_service_gauge', 'statsd gauges, summed across the live processes', ['prefix', 'name'],
+              multiprocess_mode='livesum')
+
+_REQUEST_START_ATTRIBUTE = 'metrics_request_start'
+_IN_PROGRESS_ATTRIBUTE = 'metrics_request_in_progress'
+
+OTHER_NAME = 'other'
+_statsd_names = set()  # type: Set[Tuple[str, str]]
+_statsd_names_lock = Lock()
+
+
+def is_enabled() -> bool:
+    return has_app_context() and bool(current_app.config.get(config.PROMETHEUS_METRICS_ENABLED))
+
+
+def observe_call(*, module: str, function: str, seconds: float, outcome: str) -> None:
+    if is_enabled():
+        FUNCTION_DURATION.labels(module, function).observe(seconds)
+        FUNCTION_CALLS.labels(module, function, outcome).inc()
+
+
+def observe_timing(*, prefix: str, name: str, ms: float) -> None:
+    if is_enabled():
+        TIMING.labels(*_statsd_labels(prefix=prefix, name=name)).observe(ms)
+
+
+def observe_count(*, prefix: str, name: str, value: int) -> None:
+    if is_enabled():
+        COUNT.labels(*_statsd_labels(prefix=prefix, name=name)).observe(value)
+
+
+def inc_counter(*, prefix: str, name: str, count: int = 1) -> None:
+    if is_enabled():
+        COUNTER.labels(*_statsd_labels(prefix=prefix, name=name)).inc(count)
+
+
+def set_gauge(*, prefix: str, name: str, value: float) -> None:
+    if is_enabled():
+        GAUGE.labels(*_statsd_labels(prefix=prefix, name=name)).set(value)
+
+
+def _statsd_labels(*, prefix: str, name: str) -> Tuple[str, str]:
+    """
+    :return: the labels of a statsd metric, with the name replaced by OTHER_NAME once
+    config.PROMETHEUS_MAX_STATSD_NAMES pairs of labels are in use: the names include the fingerprints of the backend
+    queries, and every pair is a time series of each statsd metric
+    """
+    labels = (prefix, name)
+    if labels in _statsd_names:
+        return labels
+    with _statsd_names_lock:
+        if labels not in _statsd_names:
+            if len(_statsd_names) >= current_app.config.get(config.PROMETHEUS_MAX_STATSD_NAMES, 1000):
+                return prefix, OTHER_NAME
+            _statsd_names.add(labels)
+    return labels
+
+
+def init_app(app: Flask) -> None:
+    """
+    Serves the metrics at /metrics and records the duration of the requests
+    """
+    app.add_url_rule('/metrics', 'metrics', metrics)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+
+
+@swag_from('api/swagger_doc/metrics_get.yml')
+def metrics() -> Tuple[bytes, int, dict]:
+    return generate_latest(_get_registry()), 200, {'Content-Type': CONTENT_TYPE_LATEST}
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """
+    gunicorn child_exit hook, to drop the gauges of the worker that exited, e.g. in gunicorn.conf.py:
+    from metadata_service.metrics import child_exit  # noqa: F401
+    """
+    if _is_multiprocess():
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def _is_multiprocess() -> bool:
+    return 'PROMETHEUS_MULTIPROC_DIR' in os.environ or 'prometheus_multiproc_dir' in os.environ
+
+
+def _get_registry() -> CollectorRegistry:
+    if not _is_multiprocess():
+        return REGISTRY
+    # aggregates the metrics every process writes in the directory
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def _before_request() -> None:
+    HTTP_REQUESTS_IN_PROGRESS.inc()
+    setattr(g, _IN_PROGRESS_ATTRIBUTE, True)
+    setattr(g, _REQUEST_START_ATTRIBUTE, time.time())
+
+
+def _after_request(response: Response) -> Response:
+    _observe_request(response.status_code)
+    return response
+
+
+def _teardown_request(exception: Any) -> None:
+    # still there when the request failed before its response was made
+    _observe_request(500)
+    if g.pop(_IN_PROGRESS_ATTRIBUTE, False):
+        HTTP_REQUESTS_IN_PROGRESS.dec()
+
+
+def _observe_request(status: int) -> None:
+    start = g.pop(_REQUEST_START_ATTRIBUTE, None)
+    if start is None:
+        return
+    # routes rather than paths, which would be a label value per resource
+    route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    HTTP_REQUEST_DURATION.labels(request.method, route, status).observe(time.time() - start)
@@ -8,6 +8,7 @@ from werkzeug.utils import import_string
 
 from metadata_service import config
 from metadata_service.proxy.base_proxy import BaseProxy
+from metadata_service.proxy.caching_proxy import CachingProxy
 
 _proxy_client = None
 _proxy_client_lock = Lock()
@@ -46,4 +47,9 @@ def get_proxy_client() -> BaseProxy:
                                    validate_ssl=validate_ssl,
                                    client_kwargs=client_kwargs)
 
+            if current_app.config.get(config.PROXY_CACHE_ENABLED):
+                _proxy_client = CachingProxy(client=_proxy_client,
+                                             max_size=current_app.config[config.PROXY_CACHE_MAX_SIZE],
+                                             ttl_sec=current_app.config[config.PROXY_CACHE_TTL_SEC])
+
     return _proxy_client
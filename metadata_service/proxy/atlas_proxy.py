@@ -4,9 +4,11 @@
 import datetime
 import logging
 import re
+import time
 from operator import attrgetter
 from random import randint
-from typing import Any, Dict, Generator, List, Optional, Pattern, Tuple, Union
+from typing import (Any, Callable, Dict, Generator, Iterator, List, Optional,
+                    Pattern, Tuple, Union)
 
 from amundsen_common.models.dashboard import DashboardSummary
 from amundsen_common.models.lineage import Lineage
@@ -17,14 +19,16 @@ from amundsen_common.models.table import (Badge, Column,
                                           User, Watermark)
 from amundsen_common.models.user import User as UserEntity
 from apache_atlas.client.base_client import AtlasClient
+from apache_atlas.client.entity import EntityClient
+from apache_atlas.exceptions import AtlasServiceException
 from apache_atlas.model.glossary import (AtlasGlossary, AtlasGlossaryHeader,
                                          AtlasGlossaryTerm)
-from apache_atlas.model.instance import (AtlasEntityHeader,
+from apache_atlas.model.instance import (AtlasEntitiesWithExtInfo,
+                                         AtlasEntityHeader,
                                          AtlasEntityWithExtInfo,
                                          AtlasRelatedObjectId)
 from apache_atlas.model.relationship import AtlasRelationship
 from apache_atlas.utils import type_coerce
-from beaker.cache import CacheManager
 from beaker.util import parse_cache_config_options
 from flask import current_app as app
 from werkzeug.exceptions import BadRequest
@@ -32,10 +36,22 @@ from werkzeug.exceptions import BadRequest
 from metadata_service.entity.dashboard_detail import \
     DashboardDetail as DashboardDetailEntity
 from metadata_service.entity.description import Description
+from metadata_service.entity.mutation import (Mutation, MutationResult,
+                                              MutationType)
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.entity.tag_detail import TagDetail
+from metadata_service.entity.usage import UsageDelta
 from metadata_service.exception import NotFoundException
 from metadata_service.proxy import BaseProxy
+from metadata_service.proxy.cache_utilities import ConfigurableCacheManager
+from metadata_service.proxy.query_metrics import count_records, record_query
+from metadata_service.proxy.shared import run_concurrently
+from metadata_service.proxy.statistics_snapshot import (
+    StatisticsSnapshot, create_statistics_snapshot)
+from metadata_service.proxy.statsd_utilities import timer_with_counter
+from metadata_service.proxy.tag_index import (TagIndex, create_tag_index,
+                                              search_tags)
 from metadata_service.util import UserResourceRel
 
 LOGGER = logging.getLogger(__name__)
@@ -43,6 +59,9 @@ LOGGER = logging.getLogger(__name__)
 # Expire cache every 11 hours + jitter
 _ATLAS_PROXY_CACHE_EXPIRY_SEC = 11 * 60 * 60 + randint(0, 3600)
 
+# the atlas client only keeps the status of a failed call in the message of its exception
+_NOT_FOUND_STATUS = re.compile(r'failed with status 404\b')
+
 
 class Status:
     ACTIVE = "ACTIVE"
@@ -146,9 +165,10 @@ class AtlasProxy(BaseProxy):
     # Qualified Name of the Glossary, that holds the user defined terms.
     # For Amundsen, we are using Glossary Terms as the Tags.
     AMUNDSEN_USER_TAGS = 'amundsen_user_tags'
-    _CACHE = CacheManager(**parse_cache_config_options({'cache.regions': 'atlas_proxy',
-                                                        'cache.atlas_proxy.type': 'memory',
-                                                        'cache.atlas_proxy.expire': _ATLAS_PROXY_CACHE_EXPIRY_SEC}))
+    _CACHE = ConfigurableCacheManager(**parse_cache_config_options({'cache.regions': 'atlas_proxy',
+                                                                    'cache.atlas_proxy.type': 'memory',
+                                                                    'cache.atlas_proxy.expire':
+                                                                        _ATLAS_PROXY_CACHE_EXPIRY_SEC}))
 
     def __init__(self, *,
                  host: str,
@@ -164,6 +184,38 @@ class AtlasProxy(BaseProxy):
         protocol = 'https' if encrypted else 'http'
         self.client = AtlasClient(f'{protocol}://{host}:{port}', (user, password))
         self.client.session.verify = validate_ssl
+        # the sub clients (entity, discovery, glossary...) all call the api through the client
+        self.client.call_api = self._timed_call_api(self.client.call_api)
+        self._statistics_snapshot = \
+            create_statistics_snapshot(self._query_statistics)  # type: Optional[StatisticsSnapshot]
+        self._tag_index = create_tag_index(self._query_tag_counts)  # type: Optional[TagIndex]
+
+    @staticmethod
+    def _timed_call_api(call_api: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Records the metrics of the Atlas api calls like the ones of the other backend queries, see record_query.
+        A call is named after its method and path, and the DSL query of searches. The response is parsed in the call
+        so its time is not split from the request's, and the records are the entities of search results.
+        """
+        def timed_call_api(api: Any, response_type: Any = None, query_params: Optional[Dict[str, Any]] = None,
+                           request_obj: Any = None) -> Any:
+            query = f'{getattr(api.method, "value", api.method)} {api.path}'
+            if query_params and isinstance(query_params.get('query'), str):
+                query += f' {query_params["query"]}'
+            start = time.time()
+            try:
+                response = call_api(api, response_type, query_params, request_obj)
+            except Exception:
+                record_query(backend='atlas', query=query, params=query_params,
+                             execute_ms=(time.time() - start) * 1000, success=False)
+                raise
+            entities = getattr(response, 'entities', None)
+            record_query(backend='atlas', query=query, params=query_params,
+                         execute_ms=(time.time() - start) * 1000,
+                         records=count_records(entities if entities is not None else response))
+            return response
+
+        return timed_call_api
 
     def _extract_info_from_uri(self, *, table_uri: str) -> Dict:
         """
@@ -226,10 +278,11 @@ class AtlasProxy(BaseProxy):
 
         return user_details
 
-    def _get_table_entity(self, *, table_uri: str) -> AtlasEntityWithExtInfo:
+    def _get_table_entity(self, *, table_uri: str, min_ext_info: bool = False) -> AtlasEntityWithExtInfo:
         """
         Fetch information from table_uri and then find the appropriate entity
         :param table_uri: The table URI coming from Amundsen Frontend
+        :param min_ext_info: Leave the referred entities, e.g. the columns, out of the response
         :return: A table entity matching the Qualified Name derived from table_uri
         """
         table_info = self._extract_info_from_uri(table_uri=table_uri)
@@ -240,7 +293,8 @@ class AtlasProxy(BaseProxy):
 
         try:
             return self.client.entity.get_entity_by_attribute(type_name=table_info['entity'],
-                                                              uniq_attributes=[(self.QN_KEY, table_qn)])
+                                                              uniq_attributes=[(self.QN_KEY, table_qn)],
+                                                              min_ext_info=min_ext_info)
         except Exception as ex:
             LOGGER.exception(f'Table not found. {str(ex)}')
             raise NotFoundException('Table URI( {table_uri} ) does not exist'
@@ -336,77 +390,95 @@ class AtlasProxy(BaseProxy):
             LOGGER.exception(f'Column not found: {str(ex)}')
             raise NotFoundException(f'Column not found: {column_name}')
 
-    def _serialize_columns(self, *, entity: AtlasEntityWithExtInfo) -> \
+    def _serialize_columns(self, *, entity: AtlasEntityWithExtInfo,
+                           projection: Optional[TableProjection] = None) -> \
             Union[List[Column], List]:
         """
         Helper function to fetch the columns from entity and serialize them
         using Column and Stat model.
         :param entity: AtlasEntityWithExtInfo object,
         along with relationshipAttributes
+        :param projection: Only the page of columns is serialized, with stats and badges when requested
         :return: A list of Column objects, if there are any columns available,
         else an empty list.
         """
-        columns = list()
+        col_entities = list()
         for column in entity.entity[self.REL_ATTRS_KEY].get('columns') or list():
             column_status = column.get('entityStatus', 'inactive').lower()
 
             if column_status != 'active':
                 continue
 
-            col_entity = entity.referredEntities[column[self.GUID_KEY]]
+            col_entities.append(entity.referredEntities[column[self.GUID_KEY]])
+
+        col_entities.sort(key=lambda item: item[self.ATTRS_KEY].get('position') or 9999)
+        if projection is not None:
+            col_entities = col_entities[projection.column_offset:projection.column_end]
+
+        columns = list()
+        for col_entity in col_entities:
             col_attrs = col_entity[self.ATTRS_KEY]
-            statistics = list()
+            statistics = self._serialize_column_stats(col_attrs) \
+                if projection is None or projection.column_stats else list()
+            badges = self._serialize_column_badges(col_entity) \
+                if projection is None or projection.column_badges else list()
 
-            badges = list()
-            for column_classification in col_entity.get('classifications') or list():
-                if column_classification.get('entityStatus') == Status.ACTIVE:
-                    name = column_classification.get('typeName')
+            columns.append(
+                Column(
+                    name=col_attrs.get('name'),
+                    description=col_attrs.get('description') or col_attrs.get('comment'),
+                    col_type=col_attrs.get('type') or col_attrs.get('dataType') or col_attrs.get('data_type'),
+                    sort_order=col_attrs.get('position') or 9999,
+                    stats=statistics,
+                    badges=badges
+                )
+            )
+        return columns
 
-                    badges.append(Badge(badge_name=name, category='default'))
+    def _serialize_column_badges(self, col_entity: Dict) -> List[Badge]:
+        badges = list()
+        for column_classification in col_entity.get('classifications') or list():
+            if column_classification.get('entityStatus') == Status.ACTIVE:
+                name = column_classification.get('typeName')
 
-            for stats in col_attrs.get('statistics') or list():
-                stats_attrs = stats['attributes']
+                badges.append(Badge(badge_name=name, category='default'))
+        return badges
 
-                stat_type = stats_attrs.get('stat_name')
+    def _serialize_column_stats(self, col_attrs: Dict) -> List[Stat]:
+        statistics = list()
+        for stats in col_attrs.get('statistics') or list():
+            stats_attrs = stats['attributes']
 
-                stat_format = self.STATISTICS_FORMAT_SPEC.get(stat_type, dict())
+            stat_type = stats_attrs.get('stat_name')
 
-                if not stat_format.get('drop', False):
-                    stat_type = stat_format.get('new_name', stat_type)
+            stat_format = self.STATISTICS_FORMAT_SPEC.get(stat_type, dict())
 
-                    stat_val = stats_attrs.get('stat_val')
+            if not stat_format.get('drop', False):
+                stat_type = stat_format.get('new_name', stat_type)
 
-                    format_val = stat_format.get('format')
+                stat_val = stats_attrs.get('stat_val')
 
-                    if format_val:
-                        stat_val = format_val.format(stat_val)
-                    else:
-                        stat_val = str(stat_val)
+                format_val = stat_format.get('format')
 
-                    start_epoch = stats_attrs.get('start_epoch')
-                    end_epoch = stats_attrs.get('end_epoch')
+                if format_val:
+                    stat_val = format_val.format(stat_val)
+                else:
+                    stat_val = str(stat_val)
 
-                    statistics.append(
-                        Stat(
-                            stat_type=stat_type,
-                            stat_val=stat_val,
-                            start_epoch=start_epoch,
-                            end_epoch=end_epoch,
-                        )
-                    )
+                start_epoch = stats_attrs.get('start_epoch')
+                end_epoch = stats_attrs.get('end_epoch')
 
-            columns.append(
-                Column(
-                    name=col_attrs.get('name'),
-                    description=col_attrs.get('description') or col_attrs.get('comment'),
-                    col_type=col_attrs.get('type') or col_attrs.get('dataType') or col_attrs.get('data_type'),
-                    sort_order=col_attrs.get('position') or 9999,
-                    stats=statistics,
-                    badges=badges
+                statistics.append(
+                    Stat(
+                        stat_type=stat_type,
+                        stat_val=stat_val,
+                        start_epoch=start_epoch,
+                        end_epoch=end_epoch,
+                    )
                 )
-            )
-        return sorted(columns, key=lambda item: item.sort_order)
+        return statistics
 
+    @timer_with_counter
     def _get_reports(self, guids: List[str]) -> List[ResourceReport]:
         reports = []
         if guids:
@@ -460,14 +532,111 @@ class AtlasProxy(BaseProxy):
     def get_users(self) -> List[UserEntity]:
         pass
 
-    def get_table(self, *, table_uri: str) -> Table:
+    def get_table(self, *, table_uri: str, projection: Optional[TableProjection] = None) -> Table:
         """
         Gathers all the information needed for the Table Detail Page.
         :param table_uri:
+        :param projection: Parts of the table to fetch, all of them by default. The column entities are left out
+        of the Atlas response without columns, and the readers are not fetched without table readers.
         :return: A Table object with all the information available
         or gathered from different entities.
         """
-        entity = self._get_table_entity(table_uri=table_uri)
+        if projection is not None and projection.is_full:
+            projection = None
+        entity = self._get_table_entity(table_uri=table_uri,
+                                        min_ext_info=projection is not None and not projection.columns)
+        return self._get_table_from_entity(table_uri=table_uri, entity=entity, projection=projection)
+
+    @timer_with_counter
+    def get_tables(self, *, table_uris: List[str]) -> Dict[str, Table]:
+        """
+        Fetches the entities of many tables with one bulk request per table type instead of one request per table.
+        :param table_uris: Table URIs
+        :return: Table per table URI, tables that don't exist are left out
+        """
+        table_uris_by_qn = dict()  # type: Dict[Tuple[str, str], str]
+        for table_uri in table_uris:
+            table_info = self._extract_info_from_uri(table_uri=table_uri)
+            if not table_info:
+                continue
+            table_qn = make_table_qualified_name(table_info.get('name', ''),
+                                                 table_info.get('cluster'),
+                                                 table_info.get('db'))
+            table_uris_by_qn[(table_info['entity'], table_qn)] = table_uri
+
+        tables = dict()
+        for entity_type in {entity_type for entity_type, _ in table_uris_by_qn}:
+            table_qns = [table_qn for (type_name, table_qn) in table_uris_by_qn if type_name == entity_type]
+            bulk_entity = self._get_table_entities(entity_type=entity_type, table_qns=table_qns)
+            for table_entity in bulk_entity.entities or list():
+                entity_table_uri = table_uris_by_qn.get((entity_type, table_entity[self.ATTRS_KEY].get(self.QN_KEY)))
+                if entity_table_uri is None:
+                    continue
+                entity = AtlasEntityWithExtInfo({'entity': table_entity,
+                                                 'referredEntities': bulk_entity.referredEntities})
+                tables[entity_table_uri] = self._get_table_from_entity(table_uri=entity_table_uri, entity=entity)
+
+        return tables
+
+    def iter_tables(self, *, page_size: int) -> Iterator[Table]:
+        """
+        Iterates over all tables, paging through the table entities with a faceted search ordered by qualified name
+        and fetching the details of each page with get_tables.
+        :param page_size: Number of tables fetched at a time
+        :return:
+        """
+        offset = 0
+        while True:
+            params = {'typeName': self.TABLE_ENTITY,
+                      'includeSubTypes': True,
+                      'excludeDeletedEntities': True,
+                      'sortBy': self.QN_KEY,
+                      'sortOrder': 'ASCENDING',
+                      'offset': offset,
+                      'limit': page_size,
+                      'attributes': [self.QN_KEY]}
+            search_results = self.client.discovery.faceted_search(search_parameters=params)
+            entities = search_results.entities or list()
+
+            table_uris = list()
+            for entity in entities:
+                table_qn = parse_table_qualified_name(qualified_name=entity.attributes.get(self.QN_KEY))
+                table_uris.append(f'{entity.typeName}://{table_qn.get("cluster_name", "")}.'
+                                  f'{table_qn.get("db_name", "")}/{table_qn.get("table_name", "")}')
+
+            tables = self.get_tables(table_uris=table_uris)
+            for table_uri in table_uris:
+                if table_uri in tables:
+                    yield tables[table_uri]
+
+            if len(entities) < page_size:
+                return
+            offset += page_size
+
+    def _get_table_entities(self, *, entity_type: str, table_qns: List[str]) -> AtlasEntitiesWithExtInfo:
+        """
+        Bulk fetches table entities of one type by qualified name. Entities that don't exist are left out,
+        other failures of Atlas are raised.
+        EntityClient.get_entities_by_attribute is not used as it fails to build the attr_<index> parameters
+        in the pinned client version.
+        """
+        query_params = {f'attr_{index}:{self.QN_KEY}': table_qn
+                        for index, table_qn in enumerate(table_qns)}  # type: Dict[str, Any]
+        query_params['minExtInfo'] = False
+        query_params['ignoreRelationships'] = False
+
+        try:
+            return self.client.call_api(
+                EntityClient.GET_ENTITIES_BY_UNIQUE_ATTRIBUTE.format_path_with_params(entity_type),
+                AtlasEntitiesWithExtInfo, query_params)
+        except AtlasServiceException as ex:
+            if not _NOT_FOUND_STATUS.search(str(ex)):
+                raise
+            LOGGER.info(f'Tables not found. {str(ex)}')
+            return AtlasEntitiesWithExtInfo()
+
+    def _get_table_from_entity(self, *, table_uri: str, entity: AtlasEntityWithExtInfo,
+                               projection: Optional[TableProjection] = None) -> Table:
         table_details = entity.entity
 
         try:
@@ -500,14 +669,17 @@ class AtlasProxy(BaseProxy):
                         )
                     )
 
-            columns = self._serialize_columns(entity=entity)
+            columns = self._serialize_columns(entity=entity, projection=projection) \
+                if projection is None or projection.columns else []
 
             reports_guids = [report.get("guid") for report in attrs.get("reports") or list()]
 
             table_type = attrs.get('tableType') or 'table'
             is_view = 'view' in table_type.lower()
 
-            readers = self._get_readers(table_details)
+            readers, reports = run_concurrently(lambda: self._get_readers(table_details)
+                                                if projection is None or projection.table_readers else [],
+                                                lambda: self._get_reports(guids=reports_guids))
 
             table = Table(
                 database=table_details.get('typeName'),
@@ -519,7 +691,7 @@ class AtlasProxy(BaseProxy):
                 description=attrs.get('description') or attrs.get('comment'),
                 owners=self._get_owners(
                     table_details[self.REL_ATTRS_KEY].get('ownedBy', []), attrs.get('owner')),
-                resource_reports=self._get_reports(guids=reports_guids),
+                resource_reports=reports,
                 columns=columns,
                 is_view=is_view,
                 table_readers=readers,
@@ -770,12 +942,17 @@ class AtlasProxy(BaseProxy):
         :return: None
         """
         entity = self._get_table_entity(table_uri=id)
+        tagged = any(term.get('displayText') == tag and term.get('relationshipStatus') == Status.ACTIVE
+                     for term in entity.entity.get(self.REL_ATTRS_KEY, {}).get("meanings") or list())
 
         term = self._get_create_glossary_term(tag)
         related_entity = AtlasRelatedObjectId({self.GUID_KEY: entity.entity[self.GUID_KEY],
                                                "typeName": resource_type.name})
         self.client.glossary.assign_term_to_entities(term.guid, [related_entity])
 
+        if self._tag_index is not None and not tagged:
+            self._tag_index.apply(tag=tag, delta=1)
+
     def add_badge(self, *, id: str, badge_name: str, category: str = '',
                   resource_type: ResourceType) -> None:
         # Not implemented
@@ -800,7 +977,10 @@ class AtlasProxy(BaseProxy):
         for item in assigned_entities or list():
             if item.get(self.GUID_KEY) == entity.entity[self.GUID_KEY]:
                 related_entity = AtlasRelatedObjectId(item)
-                return self.client.glossary.disassociate_term_from_entities(term.guid, [related_entity])
+                self.client.glossary.disassociate_term_from_entities(term.guid, [related_entity])
+                if self._tag_index is not None:
+                    self._tag_index.apply(tag=tag, delta=-1)
+                return
 
     def delete_badge(self, *, id: str, badge_name: str, category: str,
                      resource_type: ResourceType) -> None:
@@ -896,16 +1076,47 @@ class AtlasProxy(BaseProxy):
         return date or 0
 
     def get_statistics(self) -> Dict[str, Any]:
-        # Not implemented
-        pass
+        """
+        Statistics of the catalog, from the statistics snapshot when config.STATISTICS_SNAPSHOT_ENABLED
+        :return: dictionary of statistics
+        """
+        if self._statistics_snapshot is not None:
+            return self._statistics_snapshot.get()
+        return self._query_statistics()
+
+    def _query_statistics(self) -> Dict[str, Any]:
+        """
+        Atlas metrics only count the active entities per type, and not the documented or owned ones, hence the
+        statistics are limited to the number of tables.
+        """
+        statistics = dict()  # type: Dict[str, Any]
 
-    def get_tags(self) -> List:
+        metrics = self.client.admin.get_metrics()
+        try:
+            active_entities = metrics.entity.get('entityActive', {})
+            statistics['number_of_tables'] = active_entities.get(self.TABLE_TYPE, 0)
+        except AttributeError:
+            LOGGER.info('No entity metrics available in the system.')
+
+        return statistics
+
+    def get_tags(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List:
         """
-        Fetch all the glossary terms from atlas, along with their assigned entities as this
-        will be used to generate the autocomplete on the table detail page
+        Fetch the glossary terms starting with prefix from atlas, or from the tag index when config.TAG_INDEX_ENABLED,
+        along with their number of assigned entities as this will be used to generate the autocomplete on the
+        table detail page
+        :param prefix: only the terms starting with prefix
+        :param limit: only the limit terms with the most assigned entities, most assigned entities first
         :return: A list of TagDetail Objects
         """
-        tags = []
+        if self._tag_index is not None:
+            tag_counts = self._tag_index.search(prefix=prefix, limit=limit)
+        else:
+            tag_counts = search_tags(self._query_tag_counts(), prefix=prefix, limit=limit)
+        return [TagDetail(tag_name=tag_name, tag_count=tag_count) for tag_name, tag_count in tag_counts]
+
+    def _query_tag_counts(self) -> List[Tuple[str, int]]:
+        tag_counts = []  # type: List[Tuple[str, int]]
         params = {
             'typeName': "AtlasGlossaryTerm",
             'limit': 1000,
@@ -916,13 +1127,8 @@ class AtlasProxy(BaseProxy):
         }
         glossary_terms = self.client.discovery.faceted_search(search_parameters=params)
         for item in glossary_terms.entities or list():
-            tags.append(
-                TagDetail(
-                    tag_name=item.attributes.get("name"),
-                    tag_count=len(item.attributes.get("assignedEntities"))
-                )
-            )
-        return tags
+            tag_counts.append((item.attributes.get("name"), len(item.attributes.get("assignedEntities"))))
+        return tag_counts
 
     def get_badges(self) -> List:
         badges = list()
@@ -940,15 +1146,31 @@ class AtlasProxy(BaseProxy):
 
         return badges
 
-    def _get_resources_followed_by_user(self, user_id: str, resource_type: str) \
-            -> List[Union[PopularTable, DashboardSummary]]:
+    def _get_resources_followed_by_user(self, user_id: str, resource_type: str,
+                                        limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Tuple[List[Union[PopularTable, DashboardSummary]], Optional[str]]:
         """
         ToDo (Verdan): Dashboard still needs to be implemented.
         Helper function to get the resource, table, dashboard etc followed by a user.
+        When paginated, bookmarks are ordered by qualified name and the cursor is the last qualified name returned.
         :param user_id: User ID of a user
         :param resource_type: Type of a resource that returns, could be table, dashboard etc.
-        :return: A list of PopularTable, DashboardSummary or any other resource.
+        :param limit: Maximum number of resources returned
+        :param cursor: Qualified name of the last bookmark of the previous page
+        :return: A list of PopularTable, DashboardSummary or any other resource and the cursor of the next page.
         """
+        criterion = [
+            {
+                'attributeName': self.QN_KEY,
+                'operator': 'contains',
+                'attributeValue': f'.{user_id}.bookmark'
+            },
+            {
+                'attributeName': self.BOOKMARK_ACTIVE_KEY,
+                'operator': 'eq',
+                'attributeValue': 'true'
+            }
+        ]
         params = {
             'typeName': self.BOOKMARK_TYPE,
             'offset': '0',
@@ -956,26 +1178,30 @@ class AtlasProxy(BaseProxy):
             'excludeDeletedEntities': True,
             'entityFilters': {
                 'condition': 'AND',
-                'criterion': [
-                    {
-                        'attributeName': self.QN_KEY,
-                        'operator': 'contains',
-                        'attributeValue': f'.{user_id}.bookmark'
-                    },
-                    {
-                        'attributeName': self.BOOKMARK_ACTIVE_KEY,
-                        'operator': 'eq',
-                        'attributeValue': 'true'
-                    }
-                ]
+                'criterion': criterion
             },
             'attributes': ['count', self.QN_KEY, self.ENTITY_URI_KEY]
         }
+        if limit is not None or cursor is not None:
+            params['sortBy'] = self.QN_KEY
+            params['sortOrder'] = 'ASCENDING'
+        if limit is not None:
+            # one more than the limit tells whether there is a next page
+            params['limit'] = str(limit + 1)
+        if cursor is not None:
+            criterion.append({'attributeName': self.QN_KEY, 'operator': 'gt', 'attributeValue': cursor})
+
         # Fetches the bookmark entities based on filters
         search_results = self.client.discovery.faceted_search(search_parameters=params)
 
+        records = search_results.entities or list()
+        next_cursor = None
+        if limit is not None and len(records) > limit:
+            records = records[:limit]
+            next_cursor = records[-1].attributes[self.QN_KEY]
+
         resources = []
-        for record in search_results.entities:
+        for record in records:
             table_info = self._extract_info_from_uri(table_uri=record.attributes[self.ENTITY_URI_KEY])
             res = self._parse_bookmark_qn(record.attributes[self.QN_KEY])
             resources.append(PopularTable(
@@ -983,16 +1209,21 @@ class AtlasProxy(BaseProxy):
                 cluster=res['cluster'],
                 schema=res['db'],
                 name=res['table']))
-        return resources
+        return resources, next_cursor
 
-    def _get_resources_owned_by_user(self, user_id: str, resource_type: str) \
-            -> List[Union[PopularTable, DashboardSummary, Any]]:
+    def _get_resources_owned_by_user(self, user_id: str, resource_type: str,
+                                     limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Tuple[List[Union[PopularTable, DashboardSummary, Any]], Optional[str]]:
         """
         ToDo (Verdan): Dashboard still needs to be implemented.
         Helper function to get the resource, table, dashboard etc owned by a user.
+        When paginated, resources are ordered by guid and the cursor is the last guid returned, so that only the
+        entities of the requested page are fetched.
         :param user_id: User ID of a user
         :param resource_type: Type of a resource that returns, could be table, dashboard etc.
-        :return: A list of PopularTable, DashboardSummary or any other resource.
+        :param limit: Maximum number of resources returned
+        :param cursor: Guid of the last resource of the previous page
+        :return: A list of PopularTable, DashboardSummary or any other resource and the cursor of the next page.
         """
         resources = list()
 
@@ -1026,8 +1257,9 @@ class AtlasProxy(BaseProxy):
         for table in table_entities.entities or list():
             resource_guids.add(table.guid)
 
-        if resource_guids:
-            resource_guids_chunks = AtlasProxy.split_list_to_chunks(list(resource_guids), 100)
+        guids, next_cursor = self._page_guids(list(resource_guids), limit=limit, cursor=cursor)
+        if guids:
+            resource_guids_chunks = AtlasProxy.split_list_to_chunks(guids, 100)
 
             for chunk in resource_guids_chunks:
                 entities = self.client.entity.get_entities_by_guids(guids=list(chunk), ignore_relationships=True)
@@ -1036,7 +1268,22 @@ class AtlasProxy(BaseProxy):
         else:
             LOGGER.info(f'User ({user_id}) does not own any "{resource_type}"')
 
-        return resources
+        return resources, next_cursor
+
+    @staticmethod
+    def _page_guids(guids: List[str], *, limit: Optional[int], cursor: Optional[str]) \
+            -> Tuple[List[str], Optional[str]]:
+        """
+        Returns up to limit guids following the cursor in guid order and the cursor of the next page.
+        Guids are returned as they are when neither limit nor cursor is given.
+        """
+        if limit is None and cursor is None:
+            return guids, None
+
+        guids = sorted(guid for guid in guids if cursor is None or guid > cursor)
+        if limit is None or len(guids) <= limit:
+            return guids, None
+        return guids[:limit], guids[limit - 1]
 
     @staticmethod
     def split_list_to_chunks(input_list: List[Any], n: int) -> Generator:
@@ -1044,20 +1291,31 @@ class AtlasProxy(BaseProxy):
         for i in range(0, len(input_list), n):
             yield input_list[i:i + n]
 
-    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) \
-            -> Dict[str, List[DashboardSummary]]:
+    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                       limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Dict[str, Any]:
         pass
 
-    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) -> Dict[str, Any]:
-        tables = list()
+    def iter_dashboards(self, *, page_size: int) -> Iterator[DashboardSummary]:
+        # Not implemented
+        raise NotImplementedError
+
+    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        tables = list()  # type: List[Union[PopularTable, DashboardSummary]]
+        next_cursor = None
         if relation_type == UserResourceRel.follow:
-            tables = self._get_resources_followed_by_user(user_id=user_email,
-                                                          resource_type=ResourceType.Table.name)
+            tables, next_cursor = self._get_resources_followed_by_user(user_id=user_email,
+                                                                       resource_type=ResourceType.Table.name,
+                                                                       limit=limit, cursor=cursor)
         elif relation_type == UserResourceRel.own:
-            tables = self._get_resources_owned_by_user(user_id=user_email,
-                                                       resource_type=ResourceType.Table.name)
+            tables, next_cursor = self._get_resources_owned_by_user(user_id=user_email,
+                                                                    resource_type=ResourceType.Table.name,
+                                                                    limit=limit, cursor=cursor)
 
-        return {'table': tables}
+        if limit is None and cursor is None:
+            return {'table': tables}
+        return {'table': tables, 'next_cursor': next_cursor}
 
     def get_frequently_used_tables(self, *, user_email: str) -> Dict[str, List[PopularTable]]:
         user = self.client.entity.get_entity_by_attribute(type_name=self.USER_TYPE,
@@ -1133,6 +1391,7 @@ class AtlasProxy(BaseProxy):
         except Exception:
             return None
 
+    @timer_with_counter
     def _get_readers(self, entity: AtlasEntityWithExtInfo, top: Optional[int] = 15) -> List[Reader]:
         _readers = entity.get('relationshipAttributes', dict()).get('readers', list())
 
@@ -1204,3 +1463,42 @@ class AtlasProxy(BaseProxy):
     def get_lineage(self, *,
                     id: str, resource_type: ResourceType, direction: str, depth: int) -> Lineage:
         pass
+
+    def apply_usage_deltas(self, *, deltas: List[UsageDelta]) -> None:
+        # Not implemented
+        raise NotImplementedError
+
+    @timer_with_counter
+    def apply_mutations(self, *, mutations: List[Mutation]) -> List[MutationResult]:
+        """
+        Applies the mutations one by one with the single edit methods, Atlas has no bulk equivalent of them.
+        :param mutations:
+        :return: Result per mutation, in the order of the mutations
+        """
+        results = []
+        for mutation in mutations:
+            try:
+                self._apply_mutation(mutation)
+                results.append(MutationResult(success=True))
+            except NotImplementedError:
+                results.append(MutationResult(success=False,
+                                              message=f'{mutation.mutation_type} mutations are not supported'))
+            except Exception as ex:
+                LOGGER.exception(f'Failed to apply {mutation}. {str(ex)}')
+                results.append(MutationResult(success=False, message=str(ex)))
+        return results
+
+    def _apply_mutation(self, mutation: Mutation) -> None:
+        mutation_type = MutationType(mutation.mutation_type)
+        if mutation_type == MutationType.TABLE_DESCRIPTION:
+            self.put_table_description(table_uri=mutation.table_uri, description=mutation.value)
+        elif mutation_type == MutationType.COLUMN_DESCRIPTION:
+            self.put_column_description(table_uri=mutation.table_uri, column_name=mutation.column_name or '',
+                                        description=mutation.value)
+        elif mutation_type == MutationType.TAG:
+            self.add_tag(id=mutation.table_uri, tag=mutation.value, tag_type=mutation.tag_type)
+        elif mutation_type == MutationType.OWNER:
+            self.add_owner(table_uri=mutation.table_uri, owner=mutation.value)
+        else:
+            self.add_badge(id=mutation.table_uri, badge_name=mutation.value, category=mutation.category or '',
+                           resource_type=ResourceType.Table)
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from amundsen_common.models.dashboard import DashboardSummary
 from amundsen_common.models.lineage import Lineage
@@ -13,7 +13,10 @@ from amundsen_common.models.user import User
 from metadata_service.entity.dashboard_detail import \
     DashboardDetail as DashboardDetailEntity
 from metadata_service.entity.description import Description
+from metadata_service.entity.mutation import Mutation, MutationResult
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
+from metadata_service.entity.usage import UsageDelta
 from metadata_service.util import UserResourceRel
 
 
@@ -44,7 +47,26 @@ class BaseProxy(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def get_table(self, *, table_uri: str) -> Table:
+    def get_table(self, *, table_uri: str, projection: Optional[TableProjection] = None) -> Table:
+        """
+        :param projection: parts of the table to fetch, all of them by default. Proxies should leave the parts that
+        are not requested out of their queries, not only out of the result.
+        """
+        pass
+
+    @abstractmethod
+    def get_tables(self, *, table_uris: List[str]) -> Dict[str, Table]:
+        """
+        :return: Table per table URI, tables that don't exist are left out
+        """
+        pass
+
+    @abstractmethod
+    def iter_tables(self, *, page_size: int) -> Iterator[Table]:
+        """
+        Iterates over all tables, fetching them page_size tables at a time so that memory doesn't grow with the size
+        of the catalog
+        """
         pass
 
     @abstractmethod
@@ -112,7 +134,11 @@ class BaseProxy(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def get_tags(self) -> List:
+    def get_tags(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List:
+        """
+        Returns the tags starting with prefix and their number of resources. When limit is given, only the limit
+        tags with the most resources are returned, most resources first.
+        """
         pass
 
     @abstractmethod
@@ -120,13 +146,22 @@ class BaseProxy(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) \
-            -> Dict[str, List[DashboardSummary]]:
+    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                       limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Dict[str, Any]:
+        """
+        Returns the dashboards related to the user. When limit or cursor is given, at most limit dashboards
+        after the cursor are returned in a stable order, along with a next_cursor that is None on the last page.
+        """
         pass
 
     @abstractmethod
-    def get_table_by_user_relation(self, *, user_email: str,
-                                   relation_type: UserResourceRel) -> Dict[str, Any]:
+    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Returns the tables related to the user. When limit or cursor is given, at most limit tables
+        after the cursor are returned in a stable order, along with a next_cursor that is None on the last page.
+        """
         pass
 
     @abstractmethod
@@ -155,6 +190,13 @@ class BaseProxy(metaclass=ABCMeta):
                       ) -> DashboardDetailEntity:
         pass
 
+    @abstractmethod
+    def iter_dashboards(self, *, page_size: int) -> Iterator[DashboardSummary]:
+        """
+        Iterates over the summaries of all dashboards, fetching them page_size dashboards at a time
+        """
+        pass
+
     @abstractmethod
     def get_dashboard_description(self, *,
                                   id: str) -> Description:
@@ -182,3 +224,21 @@ class BaseProxy(metaclass=ABCMeta):
         to the current id in whatever direction is specified)
         """
         pass
+
+    @abstractmethod
+    def apply_usage_deltas(self, *, deltas: List[UsageDelta]) -> None:
+        """
+        Adds the given reads of tables by users to the existing usage, and to anything derived from it like the
+        popularity of tables.
+        """
+        pass
+
+    @abstractmethod
+    def apply_mutations(self, *, mutations: List[Mutation]) -> List[MutationResult]:
+        """
+        Applies many table description, column description, tag, owner and badge edits at once, with the same
+        effect as the matching single edit methods. A failed mutation doesn't prevent the others from being applied.
+
+        :return: Result per mutation, in the order of the mutations
+        """
+        pass
@@ -0,0 +1,42 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from typing import Any, Dict  # noqa: F401
+
+from beaker.cache import Cache, CacheManager
+from flask import current_app, has_app_context
+
+from metadata_service import config
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConfigurableCacheManager(CacheManager):
+    """
+    Beaker CacheManager whose backend is taken from the application config when a cache is first used, instead of
+    when the module defining the cache is imported.
+
+    With config.BEAKER_CACHE_TYPE = 'ext:redis' and config.BEAKER_CACHE_URL pointing to a Redis protocol compatible
+    server (or being a redis.StrictRedis compatible client instance), every worker of every node shares the same
+    cached values. Beaker then also takes the creation lock in Redis (SET NX), so when a key expires only one worker
+    recomputes it while the others wait for the new value instead of running the same query concurrently.
+    Without an application context the options given to the constructor (usually a memory cache) are used.
+    """
+
+    def get_cache(self, name: str, **kwargs: Any) -> Cache:
+        options = _get_backend_options()
+        options.update(kwargs)
+        return super().get_cache(name, **options)
+
+
+def _get_backend_options() -> Dict[str, Any]:
+    if not has_app_context() or not current_app.config.get(config.BEAKER_CACHE_TYPE):
+        return {}
+
+    cache_type = current_app.config[config.BEAKER_CACHE_TYPE]
+    options = {'type': cache_type}  # type: Dict[str, Any]
+    if cache_type != 'memory':
+        options['url'] = current_app.config[config.BEAKER_CACHE_URL]
+    LOGGER.debug('Using {} beaker cache backend'.format(cache_type))
+    return options
@@ -0,0 +1,352 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import (Any, Callable, Dict, Hashable, Iterator,  # noqa: F401
+                    List, Mapping, Optional, Tuple, Union)
+
+from amundsen_common.models.dashboard import DashboardSummary
+from amundsen_common.models.lineage import Lineage
+from amundsen_common.models.popular_table import PopularTable
+from amundsen_common.models.table import Table
+from amundsen_common.models.user import User
+
+from metadata_service.entity.dashboard_detail import \
+    DashboardDetail as DashboardDetailEntity
+from metadata_service.entity.description import Description
+from metadata_service.entity.mutation import Mutation, MutationResult
+from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
+from metadata_service.entity.usage import UsageDelta
+from metadata_service.proxy.base_proxy import BaseProxy
+from metadata_service.proxy.statsd_utilities import incr
+from metadata_service.util import UserResourceRel
+
+LOGGER = logging.getLogger(__name__)
+
+# Methods whose results can be cached, with their default time to live in seconds
+DEFAULT_TTL_SEC = {
+    'get_table': 300,
+    'get_user': 300,
+    'get_dashboard': 300,
+    'get_lineage': 300,
+    'get_tags': 60,
+    'get_badges': 60,
+    'get_popular_tables': 300,
+}  # type: Dict[str, int]
+
+
+class LRUCache:
+    """
+    Thread safe, size bounded cache where every entry has its own expiry.
+    Keys are tuples of (method name, entity id, ...) so that entries can be invalidated per method or per entity.
+    """
+
+    def __init__(self, *, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        :return: Tuple of [bool (True = hit), cached value]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Tuple, value: Any, *, ttl_sec: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, method: str, entity_id: Optional[Hashable] = None) -> None:
+        """
+        Drops all entries of the method, or only the ones of the given entity when entity_id is provided
+        """
+        with self._lock:
+            stale_keys = [key for key in self._entries
+                          if key[0] == method and (entity_id is None or key[1] == entity_id)]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachingProxy(BaseProxy):
+    """
+    Read through cache in front of any proxy client. Reads listed in ttl_sec are served from an in process LRU
+    cache and write methods called through this proxy invalidate the entries they make stale. Writes that
+    bypass this process (e.g. databuilder) are only picked up once the entry expires, so TTLs should stay
+    short. Anything not part of BaseProxy is delegated to the wrapped client as is.
+    """
+
+    def __init__(self, *,
+                 client: BaseProxy,
+                 max_size: int = 10000,
+                 ttl_sec: Optional[Mapping[str, int]] = None) -> None:
+        self.client = client
+        self._ttl_sec = dict(DEFAULT_TTL_SEC if ttl_sec is None else ttl_sec)
+        self._cache = LRUCache(max_size=max_size)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found on CachingProxy, e.g. backend specific methods
+        return getattr(self.__dict__['client'], name)
+
+    def _cached(self, method: str, entity_id: Optional[Hashable], fetch: Callable[[], Any],
+                *key_args: Optional[Hashable]) -> Any:
+        ttl_sec = self._ttl_sec.get(method)
+        if not ttl_sec:
+            return fetch()
+
+        key = (method, entity_id) + key_args
+        hit, value = self._cache.get(key)
+        self._count_lookups(method, hits=int(hit), misses=int(not hit))
+        if hit:
+            return value
+
+        value = fetch()
+        self._cache.put(key, value, ttl_sec=ttl_sec)
+        return value
+
+    @staticmethod
+    def _count_lookups(method: str, *, hits: int, misses: int) -> None:
+        # counted per method, for the hit ratio of each
+        if hits:
+            incr(prefix=__name__, name=f'{method}.hit', count=hits)
+        if misses:
+            incr(prefix=__name__, name=f'{method}.miss', count=misses)
+
+    def _invalidate_resource(self, *, id: str, resource_type: ResourceType) -> None:
+        if resource_type == ResourceType.Dashboard:
+            self._cache.invalidate('get_dashboard', id)
+        elif resource_type == ResourceType.Column:
+            # the id of a column is {table_uri}/{column_name}, and its badges are served with the table
+            self._cache.invalidate('get_table', id.rsplit('/', 1)[0])
+        else:
+            self._cache.invalidate('get_table', id)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def get_user(self, *, id: str) -> Union[User, None]:
+        return self._cached('get_user', id, lambda: self.client.get_user(id=id))
+
+    def create_update_user(self, *, user: User) -> Tuple[User, bool]:
+        result = self.client.create_update_user(user=user)
+        # users can be looked up by either user id or email
+        self._cache.invalidate('get_user')
+        return result
+
+    def get_users(self) -> List[User]:
+        return self.client.get_users()
+
+    def get_table(self, *, table_uri: str, projection: Optional[TableProjection] = None) -> Table:
+        if projection is None or projection.is_full:
+            return self._cached('get_table', table_uri, lambda: self.client.get_table(table_uri=table_uri))
+        # projected tables are cached apart from the whole ones, which get_tables shares
+        return self._cached('get_table', table_uri,
+                            lambda: self.client.get_table(table_uri=table_uri, projection=projection), projection)
+
+    def get_tables(self, *, table_uris: List[str]) -> Dict[str, Table]:
+        # served per table from the get_table entries, only the tables not cached are fetched
+        ttl_sec = self._ttl_sec.get('get_table')
+        if not ttl_sec:
+            return self.client.get_tables(table_uris=table_uris)
+
+        tables = {}
+        missing_uris = []
+        for table_uri in table_uris:
+            hit, table = self._cache.get(('get_table', table_uri))
+            if hit:
+                tables[table_uri] = table
+            else:
+                missing_uris.append(table_uri)
+        self._count_lookups('get_table', hits=len(tables), misses=len(missing_uris))
+
+        if missing_uris:
+            fetched_tables = self.client.get_tables(table_uris=missing_uris)
+            for table_uri, table in fetched_tables.items():
+                self._cache.put(('get_table', table_uri), table, ttl_sec=ttl_sec)
+            tables.update(fetched_tables)
+        return tables
+
+    def iter_tables(self, *, page_size: int) -> Iterator[Table]:
+        # exports read the whole catalog once, caching them would only evict the entries of interactive requests
+        return self.client.iter_tables(page_size=page_size)
+
+    def delete_owner(self, *, table_uri: str, owner: str) -> None:
+        self.client.delete_owner(table_uri=table_uri, owner=owner)
+        self._cache.invalidate('get_table', table_uri)
+
+    def add_owner(self, *, table_uri: str, owner: str) -> None:
+        self.client.add_owner(table_uri=table_uri, owner=owner)
+        self._cache.invalidate('get_table', table_uri)
+
+    def get_table_description(self, *,
+                              table_uri: str) -> Union[str, None]:
+        return self.client.get_table_description(table_uri=table_uri)
+
+    def put_table_description(self, *,
+                              table_uri: str,
+                              description: str) -> None:
+        self.client.put_table_description(table_uri=table_uri, description=description)
+        self._cache.invalidate('get_table', table_uri)
+        # popular tables carry the table description as well
+        self._cache.invalidate('get_popular_tables')
+
+    def apply_mutations(self, *, mutations: List[Mutation]) -> List[MutationResult]:
+        # invalidated like the single edit methods, even the failed ones as their chunk may be partially applied
+        results = self.client.apply_mutations(mutations=mutations)
+        for table_uri in {mutation.table_uri for mutation in mutations}:
+            self._cache.invalidate('get_table', table_uri)
+        self._cache.invalidate('get_popular_tables')
+        self._cache.invalidate('get_tags')
+        self._cache.invalidate('get_badges')
+        return results
+
+    def add_tag(self, *, id: str, tag: str, tag_type: str = 'default',
+                resource_type: ResourceType = ResourceType.Table) -> None:
+        self.client.add_tag(id=id, tag=tag, tag_type=tag_type, resource_type=resource_type)
+        self._invalidate_resource(id=id, resource_type=resource_type)
+        self._cache.invalidate('get_tags')
+
+    def add_badge(self, *, id: str, badge_name: str, category: str = '',
+                  resource_type: ResourceType) -> None:
+        self.client.add_badge(id=id, badge_name=badge_name, category=category, resource_type=resource_type)
+        self._invalidate_resource(id=id, resource_type=resource_type)
+        self._cache.invalidate('get_badges')
+
+    def delete_tag(self, *, id: str, tag: str, tag_type: str = 'default',
+                   resource_type: ResourceType = ResourceType.Table) -> None:
+        self.client.delete_tag(id=id, tag=tag, tag_type=tag_type, resource_type=resource_type)
+        self._invalidate_resource(id=id, resource_type=resource_type)
+        self._cache.invalidate('get_tags')
+
+    def delete_badge(self, *, id: str, badge_name: str, category: str,
+                     resource_type: ResourceType) -> None:
+        self.client.delete_badge(id=id, badge_name=badge_name, category=category, resource_type=resource_type)
+        self._invalidate_resource(id=id, resource_type=resource_type)
+        self._cache.invalidate('get_badges')
+
+    def put_column_description(self, *,
+                               table_uri: str,
+                               column_name: str,
+                               description: str) -> None:
+        self.client.put_column_description(table_uri=table_uri, column_name=column_name, description=description)
+        self._cache.invalidate('get_table', table_uri)
+
+    def get_column_description(self, *,
+                               table_uri: str,
+                               column_name: str) -> Union[str, None]:
+        return self.client.get_column_description(table_uri=table_uri, column_name=column_name)
+
+    def get_popular_tables(self, *,
+                           num_entries: int,
+                           user_id: Optional[str] = None) -> List[PopularTable]:
+        return self._cached('get_popular_tables', user_id,
+                            lambda: self.client.get_popular_tables(num_entries=num_entries, user_id=user_id),
+                            num_entries)
+
+    def get_latest_updated_ts(self) -> int:
+        return self.client.get_latest_updated_ts()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.client.get_statistics()
+
+    def get_tags(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List:
+        return self._cached('get_tags', None, lambda: self.client.get_tags(prefix=prefix, limit=limit), prefix, limit)
+
+    def get_badges(self) -> List:
+        return self._cached('get_badges', None, lambda: self.client.get_badges())
+
+    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                       limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Dict[str, Any]:
+        return self.client.get_dashboard_by_user_relation(user_email=user_email, relation_type=relation_type,
+                                                          limit=limit, cursor=cursor)
+
+    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        return self.client.get_table_by_user_relation(user_email=user_email, relation_type=relation_type,
+                                                      limit=limit, cursor=cursor)
+
+    def get_frequently_used_tables(self, *, user_email: str) -> Dict[str, Any]:
+        return self.client.get_frequently_used_tables(user_email=user_email)
+
+    def add_resource_relation_by_user(self, *,
+                                      id: str,
+                                      user_id: str,
+                                      relation_type: UserResourceRel,
+                                      resource_type: ResourceType) -> None:
+        self.client.add_resource_relation_by_user(id=id, user_id=user_id, relation_type=relation_type,
+                                                  resource_type=resource_type)
+        if relation_type == UserResourceRel.own:
+            self._invalidate_resource(id=id, resource_type=resource_type)
+
+    def delete_resource_relation_by_user(self, *,
+                                         id: str,
+                                         user_id: str,
+                                         relation_type: UserResourceRel,
+                                         resource_type: ResourceType) -> None:
+        self.client.delete_resource_relation_by_user(id=id, user_id=user_id, relation_type=relation_type,
+                                                     resource_type=resource_type)
+        if relation_type == UserResourceRel.own:
+            self._invalidate_resource(id=id, resource_type=resource_type)
+
+    def get_dashboard(self,
+                      id: str,
+                      ) -> DashboardDetailEntity:
+        return self._cached('get_dashboard', id, lambda: self.client.get_dashboard(id))
+
+    def iter_dashboards(self, *, page_size: int) -> Iterator[DashboardSummary]:
+        return self.client.iter_dashboards(page_size=page_size)
+
+    def get_dashboard_description(self, *,
+                                  id: str) -> Description:
+        return self.client.get_dashboard_description(id=id)
+
+    def put_dashboard_description(self, *,
+                                  id: str,
+                                  description: str) -> None:
+        self.client.put_dashboard_description(id=id, description=description)
+        self._cache.invalidate('get_dashboard', id)
+
+    def get_resources_using_table(self, *,
+                                  id: str,
+                                  resource_type: ResourceType) -> Dict[str, List[DashboardSummary]]:
+        return self.client.get_resources_using_table(id=id, resource_type=resource_type)
+
+    def get_lineage(self, *,
+                    id: str, resource_type: ResourceType, direction: str, depth: int) -> Lineage:
+        return self._cached('get_lineage', id,
+                            lambda: self.client.get_lineage(id=id, resource_type=resource_type,
+                                                            direction=direction, depth=depth),
+                            resource_type, direction, depth)
+
+    def apply_usage_deltas(self, *, deltas: List[UsageDelta]) -> None:
+        self.client.apply_usage_deltas(deltas=deltas)
+        for table_uri in {delta.table_uri for delta in deltas}:
+            # table readers
+            self._cache.invalidate('get_table', table_uri)
+        self._cache.invalidate('get_popular_tables')
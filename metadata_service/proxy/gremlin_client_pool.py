@@ -0,0 +1,163 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from threading import Condition
+from typing import Callable, Deque, Iterator, Optional  # noqa: F401
+
+from gremlin_python.driver.client import Client
+from tornado.websocket import WebSocketClosedError
+
+from metadata_service.proxy.statsd_utilities import gauge
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _is_connection_error(exception: Exception) -> bool:
+    """
+    Whether the exception means that the connection of the client is broken. Errors returned by the server (e.g.
+    GremlinServerError) or raised while reading the results leave the connection usable.
+    """
+    return isinstance(exception, (OSError, WebSocketClosedError, FutureTimeoutError))
+
+
+class _PooledClient:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class GremlinClientPool:
+    """
+    Thread safe pool of long lived gremlin Clients, so that queries don't pay for a websocket handshake (and on
+    Neptune for signing the request) each. A client is used by one thread at a time. Clients are recycled once they
+    are older than max_age_sec, so that signed urls are renewed before they expire, checked with a trivial query
+    when they have been idle for more than idle_check_sec, and discarded after a connection error.
+    """
+
+    def __init__(self, *,
+                 factory: Callable[[], Client],
+                 max_size: int = 8,
+                 max_age_sec: float = 10 * 60,
+                 idle_check_sec: float = 60,
+                 acquire_timeout_sec: float = 30) -> None:
+        self._factory = factory
+        self._max_size = max_size
+        self._max_age_sec = max_age_sec
+        self._idle_check_sec = idle_check_sec
+        self._acquire_timeout_sec = acquire_timeout_sec
+        # most recently released last, so the warmest client is reused first and the others can age out
+        self._idle = deque()  # type: Deque[_PooledClient]
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = Condition()
+
+    @contextmanager
+    def lease(self) -> Iterator[Client]:
+        pooled = self._acquire()
+        healthy = True
+        try:
+            yield pooled.client
+        except Exception as e:
+            healthy = not _is_connection_error(e)
+            raise
+        finally:
+            self._release(pooled, healthy=healthy)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._close_client(pooled)
+
+    def _acquire(self) -> _PooledClient:
+        deadline = time.monotonic() + self._acquire_timeout_sec
+        while True:
+            pooled = None
+            with self._condition:
+                while not self._idle and self._size >= self._max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(f'No gremlin client available within {self._acquire_timeout_sec} seconds')
+                    self._condition.wait(remaining)
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    self._size += 1
+                self._in_use += 1
+
+            if pooled is None:
+                try:
+                    pooled = _PooledClient(self._factory())
+                except Exception:
+                    self._discard(None)
+                    raise
+                self._emit_gauges()
+                return pooled
+
+            if self._is_usable(pooled):
+                self._emit_gauges()
+                return pooled
+            self._discard(pooled)
+
+    def _release(self, pooled: _PooledClient, *, healthy: bool) -> None:
+        if not healthy or self._is_expired(pooled):
+            self._discard(pooled)
+            return
+
+        pooled.last_used = time.monotonic()
+        with self._condition:
+            returned = not self._closed
+            if returned:
+                self._in_use -= 1
+                self._idle.append(pooled)
+                self._condition.notify()
+        if not returned:
+            self._discard(pooled)
+            return
+        self._emit_gauges()
+
+    def _discard(self, pooled: Optional[_PooledClient]) -> None:
+        with self._condition:
+            self._size -= 1
+            self._in_use -= 1
+            self._condition.notify()
+        if pooled is not None:
+            self._close_client(pooled)
+        self._emit_gauges()
+
+    def _is_expired(self, pooled: _PooledClient) -> bool:
+        return time.monotonic() - pooled.created >= self._max_age_sec
+
+    def _is_usable(self, pooled: _PooledClient) -> bool:
+        if self._is_expired(pooled):
+            return False
+        if time.monotonic() - pooled.last_used < self._idle_check_sec:
+            return True
+        try:
+            pooled.client.submit('g.inject(0)').all().result()
+            return True
+        except Exception as e:
+            LOGGER.info(f'Discarding gremlin client that failed the health check: {e}')
+            return False
+
+    @staticmethod
+    def _close_client(pooled: _PooledClient) -> None:
+        try:
+            pooled.client.close()
+        except Exception:
+            LOGGER.warning('Failed to close gremlin client', exc_info=True)
+
+    def _emit_gauges(self) -> None:
+        gauge(prefix=__name__, name='size', value=self._size)
+        gauge(prefix=__name__, name='in_use', value=self._in_use)
+        gauge(prefix=__name__, name='idle', value=len(self._idle))
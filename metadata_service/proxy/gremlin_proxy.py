@@ -4,12 +4,13 @@
 import collections
 import json
 import logging
+import time
 from abc import abstractmethod
 from datetime import date, datetime, timedelta
 from operator import attrgetter
-from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional,
-                    Sequence, Set, Tuple, Type, TypeVar, Union, no_type_check,
-                    overload)
+from typing import (Any, Callable, ContextManager, Dict, Iterable, Iterator,
+                    List, Mapping, Optional, Sequence, Set, Tuple, Type,
+                    TypeVar, Union, no_type_check, overload)
 from urllib.parse import unquote
 
 import gremlin_python
@@ -31,6 +32,7 @@ from amundsen_gremlin.neptune_bulk_loader.gremlin_model_converter import \
 from amundsen_gremlin.script_translator import (
     ScriptTranslator, ScriptTranslatorTargetJanusgraph)
 from amundsen_gremlin.test_and_development_shard import get_shard
+from flask import current_app, has_app_context
 from gremlin_python.driver.client import Client
 from gremlin_python.driver.driver_remote_connection import \
     DriverRemoteConnection
@@ -45,24 +47,35 @@ from gremlin_python.process.graph_traversal import (GraphTraversal,
 from gremlin_python.process.traversal import Cardinality
 from gremlin_python.process.traversal import Column as MapColumn
 from gremlin_python.process.traversal import (Direction, Order, P, T, TextP,
-                                              Traversal, gte, not_, within,
+                                              Traversal, gt, gte, not_, within,
                                               without)
 from neptune_python_utils.gremlin_utils import ExtendedGraphSONSerializersV3d0
 from overrides import overrides
 from tornado import httpclient
 from typing_extensions import Protocol  # TODO: it's in typing 3.8
 
+from metadata_service import config
 from metadata_service.entity.dashboard_detail import \
     DashboardDetail as DashboardDetailEntity
 from metadata_service.entity.description import Description
+from metadata_service.entity.mutation import (Mutation, MutationResult,
+                                              MutationType)
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.entity.tag_detail import TagDetail
+from metadata_service.entity.usage import UsageDelta
 from metadata_service.exception import NotFoundException
-from metadata_service.proxy.statsd_utilities import timer_with_counter
+from metadata_service.proxy.gremlin_client_pool import GremlinClientPool
+from metadata_service.proxy.query_metrics import count_records, record_query
+from metadata_service.proxy.query_profiler import (ProfiledQuery,
+                                                   get_query_profiler)
+from metadata_service.proxy.statsd_utilities import incr, timer_with_counter
+from metadata_service.proxy.tag_index import search_tags
 from metadata_service.util import UserResourceRel
 
 from .base_proxy import BaseProxy
-from .shared import checkNotNone, retrying
+from .shared import (checkNotNone, chunks, get_mutation_batch_size, retrying,
+                     run_concurrently)
 
 # don't use statics.load_statics(globals()) it plays badly with mypy
 
@@ -186,9 +199,14 @@ class ExecuteQuery(Protocol):
 
 
 class ClientQueryExecutor(ExecuteQuery):
-    def __init__(self, *, client: Client, traversal_translator: Callable[[Traversal], str]) -> None:
+    def __init__(self, *, client: Client, traversal_translator: Callable[[Traversal], str],
+                 profile_query: Optional[Callable[[str], Any]] = None) -> None:
+        """
+        :param profile_query: returns the backend profile of a query, which is run again, while profiling
+        """
         self.client = client
         self.traversal_translator = traversal_translator
+        self.profile_query = profile_query
 
     def __call__(self, query: Union[str, Traversal], get: Callable[[ResultSet], V], *,  # noqa: F811
                  bindings: Optional[Mapping[str, Any]] = None) -> V:
@@ -201,14 +219,37 @@ class ClientQueryExecutor(ExecuteQuery):
 
         if not isinstance(query_text, str):
             raise AssertionError(f'expected str')
-        result_set = self.client.submit(query_text, bindings)
-        return get(result_set)
+        profiler = get_query_profiler()
+        start = time.time()
+        execute_ms = None  # type: Optional[float]
+        try:
+            result_set = self.client.submit(query_text, bindings)
+            execute_ms = (time.time() - start) * 1000
+            result = get(result_set)
+            elapsed_ms = (time.time() - start) * 1000
+        except Exception:
+            elapsed_ms = (time.time() - start) * 1000
+            record_query(backend='gremlin', query=query_text, params=bindings,
+                         execute_ms=execute_ms if execute_ms is not None else elapsed_ms,
+                         consume_ms=elapsed_ms - execute_ms if execute_ms is not None else None,
+                         success=False)
+            raise
+
+        # submit only sends the query, its results are awaited and read by get
+        record_query(backend='gremlin', query=query_text, params=bindings, execute_ms=execute_ms,
+                     consume_ms=elapsed_ms - execute_ms, records=count_records(result))
+        if profiler is not None:
+            profiler.add(ProfiledQuery(query=query_text, elapsed_ms=elapsed_ms,
+                                       plan=self.profile_query(query_text) if self.profile_query else None))
+        return result
 
 
 class RetryingClientQueryExecutor(ClientQueryExecutor):
     def __init__(self, client: Client, traversal_translator: Callable[[Traversal], str],
-                 is_retryable: Callable[[Exception], bool]) -> None:
-        ClientQueryExecutor.__init__(self, client=client, traversal_translator=traversal_translator)
+                 is_retryable: Callable[[Exception], bool],
+                 profile_query: Optional[Callable[[str], Any]] = None) -> None:
+        ClientQueryExecutor.__init__(self, client=client, traversal_translator=traversal_translator,
+                                     profile_query=profile_query)
         self.is_retryable = is_retryable
 
     def __enter__(self) -> Any:
@@ -230,6 +271,54 @@ class RetryingClientQueryExecutor(ClientQueryExecutor):
             raise
 
 
+class PooledClientQueryExecutor(RetryingClientQueryExecutor):
+    """
+    Borrows a client of the pool for each query or, when used as a context manager, for the whole block so that the
+    queries of a write share one connection
+    """
+
+    def __init__(self, *, pool: GremlinClientPool, traversal_translator: Callable[[Traversal], str],
+                 is_retryable: Callable[[Exception], bool],
+                 profile_query: Optional[Callable[[str], Any]] = None) -> None:
+        # the client is set while a lease is held
+        RetryingClientQueryExecutor.__init__(self, client=None,  # type: ignore
+                                             traversal_translator=traversal_translator, is_retryable=is_retryable,
+                                             profile_query=profile_query)
+        self.pool = pool
+        self._lease = None  # type: Optional[ContextManager[Client]]
+        # queries sent since the lease was taken, reported as the round trips of the write when it is returned
+        self.round_trips = 0
+
+    def __enter__(self) -> Any:
+        self._lease = self.pool.lease()
+        self.client = self._lease.__enter__()
+        self.round_trips = 0
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        lease = checkNotNone(self._lease)
+        self._lease, self.client = None, None  # type: ignore
+        lease.__exit__(*args)
+        LOGGER.debug(f'write made {self.round_trips} round trips')
+        # only writes hold a lease, so these are the counts of writes and of their round trips: their ratio is the
+        # mean number of round trips per write
+        incr(prefix=__name__, name='writes')
+        incr(prefix=__name__, name='write_round_trips', count=self.round_trips)
+
+    def __call__(self, query: Union[str, Traversal], get: Callable[[ResultSet], V], *,
+                 bindings: Optional[Mapping[str, Any]] = None) -> V:
+        self.round_trips += 1
+        if self._lease is not None:
+            return RetryingClientQueryExecutor.__call__(self, query, get, bindings=bindings)
+
+        with self.pool.lease() as client:
+            self.client = client
+            try:
+                return RetryingClientQueryExecutor.__call__(self, query, get, bindings=bindings)
+            finally:
+                self.client = None  # type: ignore
+
+
 @no_type_check
 def _safe_get_any(root, *keys):
     """
@@ -724,6 +813,222 @@ def _expire_link(*, executor: ExecuteQuery, g: GraphTraversalSource,
     executor(g, get=FromResultSet.iterate)
 
 
+def _requiring_result(execute: Callable[[ResultSet], TYPE]) -> Callable[[ResultSet], TYPE]:
+    """
+    Wraps execute to raise StopIteration when the traversal returns nothing, as the lookup of a missing vertex does
+    in the writes that read the vertices first
+    """
+    def get(result_set: ResultSet) -> TYPE:
+        parts = [part for part in result_set if part]
+        if not parts:
+            raise StopIteration
+        # FromResultSet only iterates the parts
+        return execute(parts)  # type: ignore
+    return get
+
+
+def _properties_or_drop_unless_present(label: Union[VertexTypes, VertexType],
+                                       properties: Mapping[str, Any]) -> GraphTraversal:
+    """
+    Sets or drops the properties in the traversal without a prior read of the vertex: as in
+    _properties_or_drop_if_changed_except, a value already in a set or list property is not added again, and setting
+    or dropping the other properties leaves them as they were when unchanged.
+    """
+    g = __.start()
+    for name in sorted(properties):
+        value = properties[name]
+        cardinality = get_cardinality_for(label, name)
+        if value is not None and cardinality in (Cardinality.set_, Cardinality.list_):
+            g = g.sideEffect(__.not_(__.has(name, value)).property(cardinality, name, value))
+        else:
+            g = _property_or_drop(g=g, name=name, value=value, cardinality=cardinality)
+    return g
+
+
+def _vertex_id_of(*, name: str, key_property_name: Optional[str],
+                  label: Optional[Union[str, VertexTypes, VertexType]], key: Optional[Any], id: Optional[Any]) -> Any:
+    if (label is not None and key is not None) == (id is not None):
+        raise AssertionError(f'pass either {name}_label and {name}_key or {name}_id, but not both')
+    if id is not None:
+        return id
+    if (key_property_name is None) or (label is None):
+        raise AssertionError(f'expected both key_property_name and {name}_label')
+    return ensure_vertex_type(label).id(**{key_property_name: key})
+
+
+def _upsert_traversal(
+        *, g: Union[GraphTraversalSource, Type[__]], label: Union[VertexTypes, VertexType], key_property_name: str,
+        key: str, traversal_if_exists: Optional[Traversal] = None, traversal_if_add: Optional[Traversal] = None,
+        traversal: Optional[Traversal] = __.id(), **properties: Any) -> GraphTraversal:
+    """
+    The traversal of _upsert_single_traversal, from g or, to chain it in a BatchWrite, anonymous from __
+    """
+    if not isinstance(label, (VertexTypes, VertexType)):
+        raise AssertionError(f'expected label to be a VertexType or VertexTypes: {label}')
+    id = label.value.id(key=key, **properties) if isinstance(label, VertexTypes) else label.id(key=key, **properties)
+    if get_shard():
+        properties.setdefault(WellKnownProperties.TestShard.value.name, get_shard())
+
+    _label = get_label_from(label)
+    get = _append_traversal(__.unfold(), traversal_if_exists)
+    add = _append_traversal(
+        __.addV(_label).property(T.id, id).property(Cardinality.single, key_property_name, key), traversal_if_add)
+    set_properties = _properties_or_drop_unless_present(label, properties) if properties else None
+    return _append_traversal(g.V(id).fold().coalesce(get, add), set_properties, traversal)
+
+
+def _upsert_single_traversal(
+        *, executor: ExecuteQuery, execute: Callable[[ResultSet], TYPE] = FromResultSet.getOnly,
+        g: GraphTraversalSource, label: Union[VertexTypes, VertexType], key_property_name: str, key: str,
+        traversal_if_exists: Optional[Traversal] = None, traversal_if_add: Optional[Traversal] = None,
+        traversal: Optional[Traversal] = __.id(), **properties: Any) -> TYPE:
+    """
+    _upsert in one round trip: the vertex is added unless it exists with fold().coalesce(unfold(), addV()), and the
+    properties are set in the same traversal instead of being compared with a prior read of the vertex.
+    """
+    g = _upsert_traversal(g=g, label=label, key_property_name=key_property_name, key=key,
+                          traversal_if_exists=traversal_if_exists, traversal_if_add=traversal_if_add,
+                          traversal=traversal, **properties)
+    return executor(query=g, get=execute)
+
+
+def _link_traversal(
+        *, g: Union[GraphTraversalSource, Type[__]], edge_label: Union[EdgeTypes, EdgeType],
+        key_property_name: Optional[str] = None,
+        vertex1_label: Optional[Union[str, VertexTypes]] = None, vertex1_key: Optional[str] = None,
+        vertex2_label: Optional[Union[str, VertexTypes]] = None, vertex2_key: Optional[str] = None,
+        vertex1_id: Optional[Any] = None, vertex2_id: Optional[Any] = None,
+        edge_properties: Dict[str, Any] = {}, traversal_if_exists: Optional[Traversal] = None,
+        traversal_if_add: Optional[Traversal] = None, traversal: Optional[Traversal] = None,
+        **properties: Any) -> GraphTraversal:
+    """
+    The traversal of _link_single_traversal, from g or, to chain it in a BatchWrite, anonymous from __
+    """
+    vertex1_id = _vertex_id_of(name='vertex1', key_property_name=key_property_name, label=vertex1_label,
+                               key=vertex1_key, id=vertex1_id)
+    vertex2_id = _vertex_id_of(name='vertex2', key_property_name=key_property_name, label=vertex2_label,
+                               key=vertex2_key, id=vertex2_id)
+
+    _label = get_label_from(edge_label)
+    get = __.select('one').outE(_label).where(__.inV().hasId(vertex2_id))
+    for key, value in edge_properties.items():
+        get = get.has(key, value)
+    get = _append_traversal(get, traversal_if_exists)
+    add = _append_traversal(__.addE(_label).from_('one').property('created', timestamp()), traversal_if_add)
+    link = g.V(vertex1_id).as_('one').V(vertex2_id).coalesce(get, add)
+
+    if properties:
+        link = _append_traversal(link, _properties_or_drop_except(edge_label, properties))
+    if traversal is not None:
+        link = _append_traversal(link, traversal)
+    return link
+
+
+def _link_single_traversal(
+        *, executor: ExecuteQuery, execute: Optional[Callable[[ResultSet], TYPE]] = None,
+        g: GraphTraversalSource, edge_label: Union[EdgeTypes, EdgeType], key_property_name: Optional[str] = None,
+        vertex1_label: Optional[Union[str, VertexTypes]] = None, vertex1_key: Optional[str] = None,
+        vertex2_label: Optional[Union[str, VertexTypes]] = None, vertex2_key: Optional[str] = None,
+        vertex1_id: Optional[Any] = None, vertex2_id: Optional[Any] = None,
+        edge_properties: Dict[str, Any] = {}, traversal_if_exists: Optional[Traversal] = None,
+        traversal_if_add: Optional[Traversal] = None, traversal: Optional[Traversal] = None,
+        **properties: Any) -> Optional[TYPE]:
+    """
+    _link in one round trip: the traversal starts from both vertices, so it returns nothing when one of them is
+    missing, and adds the edge unless it exists with coalesce(). As in _link, a missing vertex raises StopIteration,
+    here when the traversal returns nothing.
+    """
+    g = _link_traversal(g=g, edge_label=edge_label, key_property_name=key_property_name,
+                        vertex1_label=vertex1_label, vertex1_key=vertex1_key,
+                        vertex2_label=vertex2_label, vertex2_key=vertex2_key,
+                        vertex1_id=vertex1_id, vertex2_id=vertex2_id, edge_properties=edge_properties,
+                        traversal_if_exists=traversal_if_exists, traversal_if_add=traversal_if_add,
+                        traversal=traversal, **properties)
+    return executor(query=g, get=_requiring_result(execute if execute is not None else FromResultSet.getOnly))
+
+
+def _expire_link_single_traversal(*, executor: ExecuteQuery, g: GraphTraversalSource,
+                                  key_property_name: str, edge_label: Union[EdgeTypes, EdgeType],
+                                  vertex1_label: Optional[Union[str, VertexTypes, VertexType]] = None,
+                                  vertex1_key: Optional[Union[str, P]] = None,
+                                  vertex1_id: Optional[Union[int, str, P]] = None,
+                                  vertex2_label: Optional[Union[str, VertexTypes, VertexType]] = None,
+                                  vertex2_key: Optional[Union[str, P]] = None,
+                                  vertex2_id: Optional[Union[int, str, P]] = None) -> None:
+    """
+    _expire_link in one round trip: the edges are dropped in a side effect of the traversal from both vertices, which
+    returns nothing, and so raises StopIteration as _expire_link does, when one of them is missing.
+    """
+    vertex1_id = _vertex_id_of(name='vertex1', key_property_name=key_property_name, label=vertex1_label,
+                               key=vertex1_key, id=vertex1_id)
+    vertex2_id = _vertex_id_of(name='vertex2', key_property_name=key_property_name, label=vertex2_label,
+                               key=vertex2_key, id=vertex2_id)
+    if vertex1_id == vertex2_id:
+        raise AssertionError(f'pass either vertex1_label and vertex1_key or vertex1_id, but not both')
+
+    g = g.V(vertex1_id).V(vertex2_id)
+    g = g.sideEffect(__.bothE(get_label_from(edge_label)).where(__.otherV().hasId(vertex1_id)).drop())
+    executor(g.id(), get=_requiring_result(FromResultSet.iterate))
+
+
+class BatchWrite:
+    """
+    Chains the writes of many items, each one or more upserts and links, into one traversal per batch_size items
+    instead of sending the writes of every item on their own:
+
+        g.inject(0).union(<writes of item 1>.constant(1), <writes of item 2>.constant(2), ...)
+
+    The writes of an item run one after the other from the vertex or edge of the previous one, so an item whose
+    vertex is missing stops there and is not in the result. A batch that fails is retried on its own by the
+    executor, and reported along with such items as not written so that the caller can write them one by one and
+    attribute the errors to them.
+    """
+
+    def __init__(self, *, key_property_name: str, batch_size: int) -> None:
+        if batch_size < 1:
+            raise AssertionError(f'expected a positive batch_size: {batch_size}')
+        self.key_property_name = key_property_name
+        self.batch_size = batch_size
+        self._items = []  # type: List[Tuple[int, GraphTraversal]]
+
+    def upsert(self, **kwargs: Any) -> GraphTraversal:
+        """
+        :param kwargs: as for _upsert, without executor and g
+        """
+        return _upsert_traversal(g=__, key_property_name=self.key_property_name, **kwargs)
+
+    def link(self, **kwargs: Any) -> GraphTraversal:
+        """
+        :param kwargs: as for _link, without executor and g
+        """
+        return _link_traversal(g=__, key_property_name=self.key_property_name, **kwargs)
+
+    def add(self, item: int, *writes: GraphTraversal) -> None:
+        """
+        :param item: identifies the item in the result of execute
+        :param writes: from upsert() and link(), in the order to write them
+        """
+        if not writes:
+            raise AssertionError(f'expected writes for item {item}')
+        self._items.append((item, _append_traversal(__.start(), *writes, __.constant(item))))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def execute(self, *, executor: ExecuteQuery, g: GraphTraversalSource) -> Set[int]:
+        """
+        :return: the items written
+        """
+        written = set()  # type: Set[int]
+        for batch in chunks(self._items, self.batch_size):
+            query = g.inject(0).union(*[item_writes for _, item_writes in batch])
+            try:
+                written.update(executor(query=query, get=FromResultSet.toSet))
+            except Exception as e:
+                LOGGER.warning(f'Failed to write a batch of {len(batch)} items', exc_info=e)
+        return written
+
+
 def _edges_between(*, g: Traversal, label: Union[None, str, EdgeTypes, EdgeType], vertex1: Traversal,
                    vertex2: Traversal, **properties: Any) -> GraphTraversal:
     """
@@ -850,7 +1155,8 @@ class AbstractGremlinProxy(BaseProxy):
     """  # noqa: E501
 
     def __init__(self, *, key_property_name: str, driver_remote_connection_options: Mapping[str, Any] = {},
-                 gremlin_client_options: Mapping[str, Any] = {}) -> None:
+                 gremlin_client_options: Mapping[str, Any] = {},
+                 single_traversal_writes: Optional[bool] = None, write_batch_size: Optional[int] = None) -> None:
         # these might vary from datastore type to another, but if you change these while talking to the same instance
         # without migration, it will go poorly
         self.key_property_name: str = key_property_name
@@ -871,6 +1177,30 @@ class AbstractGremlinProxy(BaseProxy):
 
         self._g: GraphTraversalSource = traversal().withRemote(self.remote_connection)
 
+        # clients are created lazily by the pool, so possibly_signed_ws_client_request_or_url is only called once the
+        # subclass is initialized
+        pool_options = {}  # type: Dict[str, Any]
+        if has_app_context():
+            pool_options = {name: current_app.config[key] for name, key in (
+                ('max_size', config.GREMLIN_CLIENT_POOL_SIZE),
+                ('max_age_sec', config.GREMLIN_CLIENT_MAX_AGE_SEC),
+                ('idle_check_sec', config.GREMLIN_CLIENT_IDLE_CHECK_SEC)) if current_app.config.get(key) is not None}
+        self._client_pool = GremlinClientPool(factory=self.client, **pool_options)
+
+        # upsert, link and expire links in one traversal each instead of reading the vertices and edges first,
+        # config.GREMLIN_SINGLE_TRAVERSAL_WRITES unless chosen for this proxy
+        if single_traversal_writes is None:
+            single_traversal_writes = has_app_context() and \
+                bool(current_app.config.get(config.GREMLIN_SINGLE_TRAVERSAL_WRITES))
+        self.single_traversal_writes: bool = single_traversal_writes
+
+        # mutations chained per traversal by apply_mutations, config.GREMLIN_WRITE_BATCH_SIZE unless chosen for this
+        # proxy, 0 to write them one by one
+        if write_batch_size is None:
+            write_batch_size = int(current_app.config.get(config.GREMLIN_WRITE_BATCH_SIZE) or 0) \
+                if has_app_context() else 0
+        self.write_batch_size: int = write_batch_size
+
     def drop(self) -> None:
         LOGGER.warning('DROPPING ALL NODES')
         with self.query_executor() as executor:
@@ -909,9 +1239,15 @@ class AbstractGremlinProxy(BaseProxy):
 
     def query_executor(self, *, method_name: str = "nope") -> \
             RetryingClientQueryExecutor:
-        return RetryingClientQueryExecutor(
-            client=self.client(), is_retryable=self.get_is_retryable(method_name),
-            traversal_translator=self.script_translator().translateT)
+        return PooledClientQueryExecutor(
+            pool=self._client_pool, is_retryable=self.get_is_retryable(method_name),
+            traversal_translator=self.script_translator().translateT, profile_query=self._profile_query)
+
+    def _profile_query(self, query: str) -> Optional[Any]:
+        """
+        override this to return the profile of the query when the backend has a profile API
+        """
+        return None
 
     @classmethod
     def _is_retryable_exception(cls, *, method_name: str, exception: Exception) -> bool:
@@ -920,6 +1256,27 @@ class AbstractGremlinProxy(BaseProxy):
         """
         return False
 
+    def _upsert(self, **kwargs: Any) -> Any:
+        """
+        _upsert, or _upsert_single_traversal when single_traversal_writes
+        """
+        upsert = _upsert_single_traversal if self.single_traversal_writes else _upsert
+        return upsert(g=self.g, key_property_name=self.key_property_name, **kwargs)
+
+    def _link(self, **kwargs: Any) -> Any:
+        """
+        _link, or _link_single_traversal when single_traversal_writes
+        """
+        link = _link_single_traversal if self.single_traversal_writes else _link
+        return link(g=self.g, key_property_name=self.key_property_name, **kwargs)
+
+    def _expire_link(self, **kwargs: Any) -> None:
+        """
+        _expire_link, or _expire_link_single_traversal when single_traversal_writes
+        """
+        expire_link = _expire_link_single_traversal if self.single_traversal_writes else _expire_link
+        expire_link(g=self.g, key_property_name=self.key_property_name, **kwargs)
+
     def _submit(self, *, command: str, bindings: Any = None) -> Any:
         """
         Do not use this.
@@ -1032,19 +1389,80 @@ class AbstractGremlinProxy(BaseProxy):
 
     @timer_with_counter
     @overrides
-    def get_table(self, *, table_uri: str, is_reviewer: bool = False) -> Table:
+    def get_table(self, *, table_uri: str, is_reviewer: bool = False,
+                  projection: Optional[TableProjection] = None) -> Table:
         """
         :param table_uri: Table URI
+        :param projection: Parts of the table to fetch, all of them by default. The columns traversal is paged and
+        leaves the stats out, or is skipped without columns, as is the readers traversal without table readers.
         :return:  A Table object
         """
-
-        result = self._get_table_itself(table_uri=table_uri)
+        if projection is not None and projection.is_full:
+            projection = None
+
+        result, cols, readers = run_concurrently(
+            lambda: self._get_table_itself(table_uri=table_uri),
+            lambda: self._get_table_columns(table_uri=table_uri, projection=projection),
+            lambda: self._get_table_readers(table_uri=table_uri)
+            if projection is None or projection.table_readers else [])
         if not result:
             raise NotFoundException(f'Table URI( {table_uri} ) does not exist')
 
-        cols = self._get_table_columns(table_uri=table_uri)
-        readers = self._get_table_readers(table_uri=table_uri)
+        return self._build_table(result=result, cols=cols, readers=readers)
+
+    @timer_with_counter
+    @overrides
+    def get_tables(self, *, table_uris: List[str]) -> Dict[str, Table]:
+        """
+        Fetches many tables with one traversal per kind of data (table itself, columns, readers) starting from all
+        of their vertices, instead of three traversals per table.
+
+        :param table_uris: Table URIs
+        :return: Table per table URI, tables that don't exist are left out
+        """
+        if not table_uris:
+            return {}
+
+        results, cols_by_table, readers_by_table = run_concurrently(
+            lambda: self._get_tables_itself(table_uris=table_uris),
+            lambda: self._get_tables_columns(table_uris=table_uris),
+            lambda: self._get_tables_readers(table_uris=table_uris))
+
+        tables = {}
+        for result in results:
+            table_uri = _safe_get(result, 'table', self.key_property_name)
+            tables[table_uri] = self._build_table(result=result, cols=cols_by_table.get(table_uri, []),
+                                                  readers=readers_by_table.get(table_uri, []))
+        return tables
 
+    @overrides
+    def iter_tables(self, *, page_size: int) -> Iterator[Table]:
+        """
+        Iterates over all tables in key order, fetching the keys of a page and then their details with get_tables.
+        Pages start after the last key of the previous one rather than at an offset, so that the vertices ordered by
+        key are only read up to the page.
+
+        :param page_size: Number of tables fetched at a time
+        :return:
+        """
+        after = ''
+        while True:
+            g = _V(g=self.g, label=VertexTypes.Table, key=None).has(self.key_property_name, gt(after)). \
+                order().by(self.key_property_name).limit(page_size).values(self.key_property_name)
+            table_uris = self.query_executor()(query=g, get=FromResultSet.toList)
+            if not table_uris:
+                return
+
+            tables = self.get_tables(table_uris=table_uris)
+            for table_uri in table_uris:
+                if table_uri in tables:
+                    yield tables[table_uri]
+
+            if len(table_uris) < page_size:
+                return
+            after = table_uris[-1]
+
+    def _build_table(self, *, result: Mapping[str, Any], cols: List[Column], readers: List[Reader]) -> Table:
         users_by_type: Dict[str, List[User]] = {}
         users_by_type['owner'] = _safe_get_list(result, f'all_owners', transform=self._convert_to_user) or []
 
@@ -1077,8 +1495,16 @@ class AbstractGremlinProxy(BaseProxy):
 
         return table
 
+    @timer_with_counter
     def _get_table_itself(self, *, table_uri: str) -> Mapping[str, Any]:
-        g = _V(g=self.g, label=VertexTypes.Table, key=table_uri).as_('table')
+        return _safe_get(self._get_tables_itself(table_uris=[table_uri]))
+
+    def _table_vertices(self, table_uris: List[str]) -> GraphTraversal:
+        return self.g.V(*[ensure_vertex_type(VertexTypes.Table).id(key=table_uri) for table_uri in table_uris])
+
+    @timer_with_counter
+    def _get_tables_itself(self, *, table_uris: List[str]) -> List[Mapping[str, Any]]:
+        g = self._table_vertices(table_uris).as_('table')
         g = g.coalesce(inE(EdgeTypes.Table.value.label).outV().
                        hasLabel(VertexTypes.Schema.value.label).fold()).as_('schema')
         g = g.coalesce(unfold().inE(EdgeTypes.Schema.value.label).outV().
@@ -1133,25 +1559,44 @@ class AbstractGremlinProxy(BaseProxy):
             by(unfold().dedup().valueMap().fold()). \
             by()
 
-        results = self.query_executor()(query=g, get=FromResultSet.toList)
-        return _safe_get(results)
+        return self.query_executor()(query=g, get=FromResultSet.toList)
+
+    @timer_with_counter
+    def _get_table_columns(self, *, table_uri: str, projection: Optional[TableProjection] = None) -> List[Column]:
+        if projection is not None and not projection.columns:
+            return []
+        return self._get_tables_columns(table_uris=[table_uri], projection=projection).get(table_uri, [])
 
-    def _get_table_columns(self, *, table_uri: str) -> List[Column]:
-        g = _V(g=self.g, label=VertexTypes.Table.value.label, key=table_uri). \
+    @timer_with_counter
+    def _get_tables_columns(self, *, table_uris: List[str],
+                            projection: Optional[TableProjection] = None) -> Dict[str, List[Column]]:
+        g = self._table_vertices(table_uris).as_('table'). \
             outE(EdgeTypes.Column.value.label). \
-            inV().hasLabel(VertexTypes.Column.value.label).as_('column')
+            inV().hasLabel(VertexTypes.Column.value.label)
+        if projection is not None and (projection.column_offset or projection.column_limit is not None):
+            # the page spans the columns of all the tables, so it is only requested for a single table
+            g = g.order().by('sort_order'). \
+                range(projection.column_offset, -1 if projection.column_end is None else projection.column_end)
+        g = g.as_('column')
         g = g.coalesce(
             select('column').out(EdgeTypes.Description.value.label).hasLabel(VertexTypes.Description.value.label).fold()
         ).as_('description')
-        g = g.coalesce(select('column').outE(EdgeTypes.Stat.value.label).inV().
-                       hasLabel(VertexTypes.Stat.value.label).fold()).as_('stats')
-        g = g.select('column', 'description', 'stats'). \
-            by(valueMap()). \
-            by(unfold().valueMap().fold()). \
-            by(unfold().valueMap().fold())
+        if projection is None or projection.column_stats:
+            g = g.coalesce(select('column').outE(EdgeTypes.Stat.value.label).inV().
+                           hasLabel(VertexTypes.Stat.value.label).fold()).as_('stats')
+            g = g.select('table', 'column', 'description', 'stats'). \
+                by(values(self.key_property_name)). \
+                by(valueMap()). \
+                by(unfold().valueMap().fold()). \
+                by(unfold().valueMap().fold())
+        else:
+            g = g.select('table', 'column', 'description'). \
+                by(values(self.key_property_name)). \
+                by(valueMap()). \
+                by(unfold().valueMap().fold())
         results = self.query_executor()(query=g, get=FromResultSet.toList)
 
-        cols = []
+        cols_by_table: Dict[str, List[Column]] = {}
         for result in results:
             col = Column(name=_safe_get(result, 'column', 'name'),
                          key=_safe_get(result, 'column', self.key_property_name),
@@ -1159,10 +1604,30 @@ class AbstractGremlinProxy(BaseProxy):
                          col_type=_safe_get(result, 'column', 'col_type'),
                          sort_order=_safe_get(result, 'column', 'sort_order', transform=int),
                          stats=_safe_get_list(result, 'stats', transform=self._convert_to_statistics) or [])
-            cols.append(col)
-        cols = sorted(cols, key=attrgetter('sort_order'))
-        return cols
+            cols_by_table.setdefault(result['table'], []).append(col)
+        return {table_uri: sorted(cols, key=attrgetter('sort_order')) for table_uri, cols in cols_by_table.items()}
+
+    @timer_with_counter
+    def _get_tables_readers(self, *, table_uris: List[str]) -> Dict[str, List[Reader]]:
+        # the readers traversal is local to each table, so the limit applies per table
+        readers = inE(EdgeTypes.Read.value.label).has('date', gte(date.today() - timedelta(days=5))). \
+            where(outV().hasLabel(VertexTypes.User.value.label)). \
+            order().by(coalesce(__.values('read_count'), constant(0)), Order.decr).limit(5). \
+            project('user', 'read'). \
+            by(outV().project('id', 'email').by(values('user_id')).by(values('email'))). \
+            by(coalesce(values('read_count'), constant(0))). \
+            fold()
+        g = self._table_vertices(table_uris).project('table', 'readers'). \
+            by(values(self.key_property_name)). \
+            by(readers)
+        results = self.query_executor()(query=g, get=FromResultSet.toList)
+
+        return {result['table']: [Reader(user=User(user_id=reader['user']['id'], email=reader['user']['email']),
+                                         read_count=int(reader['read']))
+                                  for reader in result['readers']]
+                for result in results}
 
+    @timer_with_counter
     def _get_table_readers(self, *, table_uri: str) -> List[Reader]:
         g = _edges_to(g=self.g, vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
                       vertex2_label=VertexTypes.User, vertex2_key=None,
@@ -1197,9 +1662,9 @@ class AbstractGremlinProxy(BaseProxy):
         :param owner:
         :return:
         """
-        _expire_link(executor=executor, g=self.g, edge_label=EdgeTypes.Owner,
-                     key_property_name=self.key_property_name, vertex1_label=VertexTypes.Table,
-                     vertex1_key=table_uri, vertex2_label=VertexTypes.User, vertex2_key=owner)
+        self._expire_link(executor=executor, edge_label=EdgeTypes.Owner,
+                          vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
+                          vertex2_label=VertexTypes.User, vertex2_key=owner)
 
     @timer_with_counter
     @overrides
@@ -1217,9 +1682,9 @@ class AbstractGremlinProxy(BaseProxy):
             return self._add_owner(table_uri=table_uri, owner=owner, executor=executor)
 
     def _add_owner(self, *, table_uri: str, owner: str, executor: ExecuteQuery) -> None:
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Owner, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
-              vertex2_label=VertexTypes.User, vertex2_key=owner)
+        self._link(executor=executor, edge_label=EdgeTypes.Owner,
+                   vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
+                   vertex2_label=VertexTypes.User, vertex2_key=owner)
 
     @timer_with_counter
     @overrides
@@ -1255,11 +1720,11 @@ class AbstractGremlinProxy(BaseProxy):
         # default table description is user added
         desc_key = make_description_uri(subject_uri=table_uri, source='description')
 
-        _upsert(executor=executor, g=self.g, label=VertexTypes.Description, key=desc_key,
-                key_property_name=self.key_property_name, description=description, description_source='description')
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Description, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
-              vertex2_label=VertexTypes.Description, vertex2_key=desc_key)
+        self._upsert(executor=executor, label=VertexTypes.Description, key=desc_key,
+                     description=description, description_source='description')
+        self._link(executor=executor, edge_label=EdgeTypes.Description,
+                   vertex1_label=VertexTypes.Table, vertex1_key=table_uri,
+                   vertex2_label=VertexTypes.Description, vertex2_key=desc_key)
 
     @timer_with_counter
     @overrides
@@ -1289,11 +1754,10 @@ class AbstractGremlinProxy(BaseProxy):
                  tag_type: str = 'default',
                  resource_type: ResourceType = ResourceType.Table,
                  executor: ExecuteQuery) -> None:
-        vertex_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Tag, key=tag,
-                                 key_property_name=self.key_property_name, tag_type=tag_type)
+        vertex_id: Any = self._upsert(executor=executor, label=VertexTypes.Tag, key=tag, tag_type=tag_type)
         vertex_type: VertexTypes = self._get_vertex_type_from_resource_type(resource_type=resource_type)
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Tag, key_property_name=self.key_property_name,
-              vertex1_id=vertex_id, vertex2_label=vertex_type, vertex2_key=id)
+        self._link(executor=executor, edge_label=EdgeTypes.Tag,
+                   vertex1_id=vertex_id, vertex2_label=vertex_type, vertex2_key=id)
 
     def add_badge(self, *, id: str, badge_name: str, category: str = '',
                   resource_type: ResourceType) -> None:
@@ -1332,9 +1796,9 @@ class AbstractGremlinProxy(BaseProxy):
                     executor: ExecuteQuery) -> None:
         LOGGER.info(f'Expire {tag} for {id}')
         vertex_type: VertexTypes = self._get_vertex_type_from_resource_type(resource_type=resource_type)
-        _expire_link(executor=executor, g=self.g, edge_label=EdgeTypes.Tag,
-                     key_property_name=self.key_property_name, vertex1_label=VertexTypes.Tag,
-                     vertex1_key=tag, vertex2_label=vertex_type, vertex2_key=id)
+        self._expire_link(executor=executor, edge_label=EdgeTypes.Tag,
+                          vertex1_label=VertexTypes.Tag, vertex1_key=tag,
+                          vertex2_label=vertex_type, vertex2_key=id)
 
     @timer_with_counter
     @overrides
@@ -1357,13 +1821,13 @@ class AbstractGremlinProxy(BaseProxy):
         column_uri = make_column_uri(table_uri=table_uri, column_name=column_name)
         # default table description is user added
         desc_key = make_description_uri(subject_uri=column_uri, source='description')
-        vertex_id: Any = _upsert(
-            executor=executor, g=self.g,
-            label=VertexTypes.Description, key=desc_key, key_property_name=self.key_property_name,
+        vertex_id: Any = self._upsert(
+            executor=executor,
+            label=VertexTypes.Description, key=desc_key,
             description=description, description_source='description'
         )
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Description, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Column, vertex1_key=column_uri, vertex2_id=vertex_id)
+        self._link(executor=executor, edge_label=EdgeTypes.Description,
+                   vertex1_label=VertexTypes.Column, vertex1_key=column_uri, vertex2_id=vertex_id)
 
     @timer_with_counter
     @overrides
@@ -1468,7 +1932,7 @@ class AbstractGremlinProxy(BaseProxy):
 
     @timer_with_counter
     @overrides
-    def get_tags(self) -> List:
+    def get_tags(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List:
         """
         Get all existing tags from graph
 
@@ -1479,7 +1943,8 @@ class AbstractGremlinProxy(BaseProxy):
             hasLabel(VertexTypes.Table.value.label).as_('table').\
             group().by(select('tag').values(self.key_property_name)).by(select('table').dedup().count())
         counts = self.query_executor()(query=g, get=FromResultSet.getOnly)
-        return [TagDetail(tag_name=name, tag_count=value) for name, value in counts.items()]
+        return [TagDetail(tag_name=name, tag_count=value)
+                for name, value in search_tags(counts.items(), prefix=prefix, limit=limit)]
 
     def get_badges(self) -> List:
         pass
@@ -1487,13 +1952,16 @@ class AbstractGremlinProxy(BaseProxy):
     # TODO: switch the base proxy to use user_id instead
     @timer_with_counter
     @overrides
-    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) -> Dict[str, Any]:
+    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve all follow the resources per user based on the relation.
         We start with table resources only, then add dashboard.
 
         :param user_email: the id of the user
         :param relation_type: the relation between the user and the resource
+        :param limit: the maximum number of tables returned, ordered by table key
+        :param cursor: the key of the last table of the previous page
         :return:
         """
 
@@ -1509,7 +1977,8 @@ class AbstractGremlinProxy(BaseProxy):
 
         # for some edge types (like READ), its possible for a user -> table to
         # have more than one that isn't expired (hence, the dedup)
-        g = g.hasLabel(VertexTypes.Table.value.label).dedup().as_('table')
+        g = g.hasLabel(VertexTypes.Table.value.label).dedup()
+        g = self._page_by_key(g, limit=limit, cursor=cursor).as_('table', 'table_key')
         g = g.coalesce(inE(EdgeTypes.Table.value.label).outV().
                        hasLabel(VertexTypes.Schema.value.label).fold()).as_('schema')
         g = g.coalesce(unfold().inE(EdgeTypes.Schema.value.label).outV().
@@ -1521,18 +1990,26 @@ class AbstractGremlinProxy(BaseProxy):
         g = g.coalesce(select('table').outE(EdgeTypes.Description.value.label).
                        inV().has(VertexTypes.Description.value.label, 'source', without('user')).fold()). \
             as_('programmatic_descriptions')
-        g = g.select('database', 'cluster', 'schema', 'table', 'description', 'programmatic_descriptions'). \
+        g = g.select('database', 'cluster', 'schema', 'table', 'table_key', 'description',
+                     'programmatic_descriptions'). \
             by(unfold().values('name').fold()). \
             by(unfold().values('name').fold()). \
             by(unfold().values('name').fold()). \
             by('name'). \
+            by(self.key_property_name). \
             by(unfold().valueMap().fold()). \
             by(unfold().valueMap().fold())
 
         results = self.query_executor()(query=g, get=FromResultSet.toList)
+        paginated = limit is not None or cursor is not None
         if not results:
             # raise NotFoundException(f'User {user_id} does not {relation_type} any resources')
-            return {'table': []}
+            return {'table': [], 'next_cursor': None} if paginated else {'table': []}
+
+        next_cursor = None
+        if limit is not None and len(results) > limit:
+            results = results[:limit]
+            next_cursor = results[-1].get('table_key')
 
         popular_tables = []
         for r in results:
@@ -1542,14 +2019,35 @@ class AbstractGremlinProxy(BaseProxy):
                 description=_safe_get(r, 'description', 'description')))
 
         # this is weird but the convention
+        if paginated:
+            return {'table': popular_tables, 'next_cursor': next_cursor}
         return {'table': popular_tables}
 
+    def _page_by_key(self, g: Traversal, *, limit: Optional[int], cursor: Optional[str]) -> Traversal:
+        """
+        Orders the vertices by key and keeps the ones following the cursor, at most one more than the limit
+        to tell whether there is a next page. The traversal is left as it is when neither limit nor cursor is given.
+        """
+        if cursor is not None:
+            g = g.has(self.key_property_name, gt(cursor))
+        if limit is not None or cursor is not None:
+            g = g.order().by(self.key_property_name)
+        if limit is not None:
+            g = g.limit(limit + 1)
+        return g
+
     @timer_with_counter
     @overrides
-    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) \
-            -> Dict[str, List[DashboardSummary]]:
+    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                       limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Dict[str, Any]:
         pass
 
+    @overrides
+    def iter_dashboards(self, *, page_size: int) -> Iterator[DashboardSummary]:
+        # Not implemented
+        raise NotImplementedError
+
     # TODO: impl
     @timer_with_counter
     @overrides
@@ -1568,9 +2066,9 @@ class AbstractGremlinProxy(BaseProxy):
         edge_type: EdgeTypes = self._get_edge_type_from_user_resource_rel_type(relation=relation_type)
 
         with self.query_executor() as executor:
-            _link(executor=executor, g=self.g, edge_label=edge_type, key_property_name=self.key_property_name,
-                  vertex1_label=VertexTypes.User, vertex1_key=user_id,
-                  vertex2_label=vertex_type, vertex2_key=id)
+            self._link(executor=executor, edge_label=edge_type,
+                       vertex1_label=VertexTypes.User, vertex1_key=user_id,
+                       vertex2_label=vertex_type, vertex2_key=id)
 
     @timer_with_counter
     @overrides
@@ -1584,9 +2082,9 @@ class AbstractGremlinProxy(BaseProxy):
         edge_type: EdgeTypes = self._get_edge_type_from_user_resource_rel_type(relation=relation_type)
 
         with self.query_executor() as executor:
-            _expire_link(executor=executor, g=self.g, edge_label=edge_type, key_property_name=self.key_property_name,
-                         vertex1_label=VertexTypes.User, vertex1_key=user_id,
-                         vertex2_label=vertex_type, vertex2_key=id)
+            self._expire_link(executor=executor, edge_label=edge_type,
+                              vertex1_label=VertexTypes.User, vertex1_key=user_id,
+                              vertex2_label=vertex_type, vertex2_key=id)
 
     @timer_with_counter
     @overrides
@@ -1741,6 +2239,99 @@ class AbstractGremlinProxy(BaseProxy):
                     id: str, resource_type: ResourceType, direction: str, depth: int) -> Lineage:
         pass
 
+    @overrides
+    def apply_usage_deltas(self, *, deltas: List[UsageDelta]) -> None:
+        # Not implemented
+        raise NotImplementedError
+
+    @timer_with_counter
+    @overrides
+    def apply_mutations(self, *, mutations: List[Mutation]) -> List[MutationResult]:
+        """
+        Applies the mutations with the same traversals as the single edit methods, but through one client connection
+        per chunk of PROXY_MUTATION_BATCH_SIZE mutations instead of one per edit. With a write_batch_size, the
+        mutations are first chained write_batch_size at a time into one traversal, and only those not written that
+        way are applied one by one.
+
+        :param mutations:
+        :return: Result per mutation, in the order of the mutations
+        """
+        results = []  # type: List[MutationResult]
+        for chunk in chunks(mutations, get_mutation_batch_size()):
+            with self.query_executor() as executor:
+                written = self._write_mutations_batched(mutations=chunk, executor=executor) \
+                    if self.write_batch_size else set()
+                for index, mutation in enumerate(chunk):
+                    if index in written:
+                        results.append(MutationResult(success=True))
+                        continue
+                    try:
+                        self._apply_mutation(mutation=mutation, executor=executor)
+                        results.append(MutationResult(success=True))
+                    except NotImplementedError:
+                        results.append(MutationResult(
+                            success=False, message=f'{mutation.mutation_type} mutations are not supported'))
+                    except Exception as e:
+                        LOGGER.warning(f'Failed to apply {mutation}', exc_info=e)
+                        results.append(MutationResult(success=False, message=str(e)))
+        return results
+
+    def _write_mutations_batched(self, *, mutations: Sequence[Mutation], executor: ExecuteQuery) -> Set[int]:
+        """
+        :return: the indexes of the mutations written, the others are left to _apply_mutation
+        """
+        batch = BatchWrite(key_property_name=self.key_property_name, batch_size=self.write_batch_size)
+        for index, mutation in enumerate(mutations):
+            writes = self._mutation_writes(mutation=mutation, batch=batch)
+            if writes:
+                batch.add(index, *writes)
+        if not batch:
+            return set()
+        written = batch.execute(executor=executor, g=self.g)
+        LOGGER.info(f'Wrote {len(written)} of {len(mutations)} mutations in batches of {self.write_batch_size}')
+        return written
+
+    def _mutation_writes(self, *, mutation: Mutation, batch: BatchWrite) -> List[GraphTraversal]:
+        """
+        The writes of _apply_mutation for a BatchWrite, none for the mutations it does not support
+        """
+        mutation_type = MutationType(mutation.mutation_type)
+        if mutation_type in (MutationType.TABLE_DESCRIPTION, MutationType.COLUMN_DESCRIPTION):
+            if mutation_type == MutationType.TABLE_DESCRIPTION:
+                subject_label, subject_uri = VertexTypes.Table, mutation.table_uri
+            else:
+                subject_label, subject_uri = VertexTypes.Column, make_column_uri(
+                    table_uri=mutation.table_uri, column_name=checkNotNone(mutation.column_name))
+            desc_key = make_description_uri(subject_uri=subject_uri, source='description')
+            return [batch.upsert(label=VertexTypes.Description, key=desc_key,
+                                 description=mutation.value, description_source='description'),
+                    batch.link(edge_label=EdgeTypes.Description, vertex1_label=subject_label, vertex1_key=subject_uri,
+                               vertex2_label=VertexTypes.Description, vertex2_key=desc_key)]
+        elif mutation_type == MutationType.TAG:
+            return [batch.upsert(label=VertexTypes.Tag, key=mutation.value, tag_type=mutation.tag_type),
+                    batch.link(edge_label=EdgeTypes.Tag, vertex1_label=VertexTypes.Tag, vertex1_key=mutation.value,
+                               vertex2_label=VertexTypes.Table, vertex2_key=mutation.table_uri)]
+        elif mutation_type == MutationType.OWNER:
+            return [batch.link(edge_label=EdgeTypes.Owner, vertex1_label=VertexTypes.Table,
+                               vertex1_key=mutation.table_uri, vertex2_label=VertexTypes.User,
+                               vertex2_key=mutation.value)]
+        return []
+
+    def _apply_mutation(self, *, mutation: Mutation, executor: ExecuteQuery) -> None:
+        mutation_type = MutationType(mutation.mutation_type)
+        if mutation_type == MutationType.TABLE_DESCRIPTION:
+            self._put_table_description(table_uri=mutation.table_uri, description=mutation.value, executor=executor)
+        elif mutation_type == MutationType.COLUMN_DESCRIPTION:
+            self._put_column_description(table_uri=mutation.table_uri, column_name=checkNotNone(mutation.column_name),
+                                         description=mutation.value, executor=executor)
+        elif mutation_type == MutationType.TAG:
+            self._add_tag(id=mutation.table_uri, tag=mutation.value, tag_type=mutation.tag_type, executor=executor)
+        elif mutation_type == MutationType.OWNER:
+            self._add_owner(table_uri=mutation.table_uri, owner=mutation.value, executor=executor)
+        else:
+            # badges are not supported by this proxy yet
+            raise NotImplementedError
+
 
 class GenericGremlinProxy(AbstractGremlinProxy):
     """
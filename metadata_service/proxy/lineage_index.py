@@ -0,0 +1,106 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from array import array
+from typing import Dict, Iterable, List, Tuple  # noqa: F401
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _adjacency(num_nodes: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """
+    Compressed sparse rows of the edges: the targets of node n are targets[offsets[n]:offsets[n + 1]]
+    """
+    offsets = array('l', [0]) * (num_nodes + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for node in range(num_nodes):
+        offsets[node + 1] += offsets[node]
+
+    targets = array('l', [0]) * len(edges)
+    positions = offsets[:-1]
+    for source, target in edges:
+        targets[positions[source]] = target
+        positions[source] += 1
+    return offsets, targets
+
+
+class _LineageGraph:
+    def __init__(self, *,
+                 upstream_edges: Iterable[Tuple[str, str]],
+                 downstream_edges: Iterable[Tuple[str, str]]) -> None:
+        self.keys = []  # type: List[str]
+        self.ids = {}  # type: Dict[str, int]
+        upstream = [(self._id(source), self._id(target)) for source, target in upstream_edges]
+        downstream = [(self._id(source), self._id(target)) for source, target in downstream_edges]
+        self.upstream = _adjacency(len(self.keys), upstream)
+        self.downstream = _adjacency(len(self.keys), downstream)
+        self.num_edges = len(upstream) + len(downstream)
+
+    def _id(self, key: str) -> int:
+        node = self.ids.get(key)
+        if node is None:
+            node = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+        return node
+
+
+class LineageIndex:
+    """
+    In memory index of the HAS_UPSTREAM and HAS_DOWNSTREAM relationships between entities of one resource type, so
+    lineage of any depth is expanded without querying the graph. Keys are mapped to integer ids and the edges of
+    each direction are kept as compressed sparse rows.
+    It is built from the graph with rebuild(), which replaces the whole index at once so readers never see a partial
+    one.
+    """
+
+    def __init__(self) -> None:
+        self._graph = _LineageGraph(upstream_edges=[], downstream_edges=[])
+        self.is_built = False
+
+    def rebuild(self, *,
+                upstream_edges: Iterable[Tuple[str, str]],
+                downstream_edges: Iterable[Tuple[str, str]]) -> None:
+        """
+        :param upstream_edges: (key, upstream key) per HAS_UPSTREAM relationship
+        :param downstream_edges: (key, downstream key) per HAS_DOWNSTREAM relationship
+        """
+        graph = _LineageGraph(upstream_edges=upstream_edges, downstream_edges=downstream_edges)
+        self._graph = graph
+        self.is_built = True
+        LOGGER.info(f'Built lineage index of {len(graph.keys)} entities and {graph.num_edges} relationships')
+
+    def traverse(self, key: str, *, upstream: bool, depth: int, max_nodes: int) -> Tuple[List[List[str]], bool]:
+        """
+        Breadth first expansion of the lineage of one direction. Every entity is returned once, on the first level
+        it is reached, and the entities of a level are ordered by key.
+        :return: the keys of each level up to depth, stopping at the first level without new entities, and whether
+        the last level was cut to stay within max_nodes entities
+        """
+        graph = self._graph
+        offsets, targets = graph.upstream if upstream else graph.downstream
+        source = graph.ids.get(key)
+        if source is None:
+            return [], False
+
+        levels = []  # type: List[List[str]]
+        visited = {source}
+        frontier = [source]
+        remaining = max_nodes
+        for _ in range(depth):
+            level = {target for node in frontier for target in targets[offsets[node]:offsets[node + 1]]} - visited
+            if not level:
+                break
+            if len(level) > remaining:
+                if remaining:
+                    levels.append(sorted(graph.keys[node] for node in level)[:remaining])
+                return levels, True
+            frontier = sorted(level, key=graph.keys.__getitem__)
+            visited.update(frontier)
+            levels.append([graph.keys[node] for node in frontier])
+            remaining -= len(frontier)
+        return levels, False
+
+    def __len__(self) -> int:
+        return len(self._graph.keys)
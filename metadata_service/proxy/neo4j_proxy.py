@@ -4,9 +4,11 @@
 import logging
 import textwrap
 import time
+from functools import partial
 from random import randint
-from typing import (Any, Dict, Iterable, List, Optional, Tuple,  # noqa: F401
-                    Union, no_type_check)
+from threading import Lock
+from typing import (Any, Callable, Dict, Iterable, Iterator,  # noqa: F401
+                    List, Optional, Sequence, Tuple, Union, no_type_check)
 
 import neo4j
 from amundsen_common.models.dashboard import DashboardSummary
@@ -14,42 +16,291 @@ from amundsen_common.models.lineage import Lineage, LineageItem
 from amundsen_common.models.popular_table import PopularTable
 from amundsen_common.models.table import (Application, Badge, Column,
                                           ProgrammaticDescription, Reader,
-                                          Source, Stat, Table, Tag, User,
-                                          Watermark)
+                                          Source, Table, Tag, User, Watermark)
 from amundsen_common.models.user import User as UserEntity
 from amundsen_common.models.user import UserSchema
-from beaker.cache import CacheManager
+from beaker.cache import Cache
 from beaker.util import parse_cache_config_options
-from flask import current_app, has_app_context
-from neo4j import BoltStatementResult, Driver, GraphDatabase  # noqa: F401
+from flask import (Response, after_this_request, current_app, g,
+                   has_app_context, has_request_context, request)
+from neo4j import (BoltStatementResult, Driver, GraphDatabase,  # noqa: F401
+                   Session, Transaction)
 
 from metadata_service import config
+from metadata_service.entity.column_stats import ColumnStats
 from metadata_service.entity.dashboard_detail import \
     DashboardDetail as DashboardDetailEntity
 from metadata_service.entity.dashboard_query import \
     DashboardQuery as DashboardQueryEntity
 from metadata_service.entity.description import Description
+from metadata_service.entity.lineage import BoundedLineage
+from metadata_service.entity.mutation import (Mutation, MutationResult,
+                                              MutationType)
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.entity.tag_detail import TagDetail
+from metadata_service.entity.usage import (UsageDelta, UsageDeltaSchema,
+                                           merge_usage_deltas)
 from metadata_service.exception import NotFoundException
 from metadata_service.proxy.base_proxy import BaseProxy
-from metadata_service.proxy.statsd_utilities import timer_with_counter
+from metadata_service.proxy.cache_utilities import ConfigurableCacheManager
+from metadata_service.proxy.lineage_index import LineageIndex
+from metadata_service.proxy.periodic_task import PeriodicTask
+from metadata_service.proxy.popularity_index import PopularityIndex
+from metadata_service.proxy.query_metrics import record_query
+from metadata_service.proxy.query_profiler import (ProfiledQuery,
+                                                   get_query_profiler)
+from metadata_service.proxy.shared import (chunks, get_lineage_limits,
+                                           get_mutation_batch_size,
+                                           run_concurrently)
+from metadata_service.proxy.statistics_snapshot import (
+    StatisticsSnapshot, create_statistics_snapshot)
+from metadata_service.proxy.statsd_utilities import (incr, timer_with_counter,
+                                                     timing)
+from metadata_service.proxy.tag_index import TagIndex, create_tag_index
 from metadata_service.util import UserResourceRel
 
-_CACHE = CacheManager(**parse_cache_config_options({'cache.type': 'memory'}))
+_CACHE = ConfigurableCacheManager(**parse_cache_config_options({'cache.type': 'memory'}))
 
 # Expire cache every 11 hours + jitter
 _GET_POPULAR_TABLE_CACHE_EXPIRY_SEC = 11 * 60 * 60 + randint(0, 3600)
+_POPULAR_TABLES_CACHE_NAMESPACE = 'popular_tables_uris'
 
 
+# Clients pass the bookmark of their last write in this header to read their own writes from any cluster member
+BOOKMARK_HEADER = 'X-Neo4j-Bookmark'
+_BOOKMARK_ATTRIBUTE = 'neo4j_bookmark'
+
 CREATED_EPOCH_MS = 'publisher_created_epoch_ms'
 LAST_UPDATED_EPOCH_MS = 'publisher_last_updated_epoch_ms'
 PUBLISHED_TAG_PROPERTY_NAME = 'published_tag'
 
+_TABLE_COLUMN_LEVEL_QUERY = textwrap.dedent("""
+MATCH (db:Database)-[:CLUSTER]->(clstr:Cluster)-[:SCHEMA]->(schema:Schema)
+-[:TABLE]->(tbl:Table {key: $tbl_key})-[:COLUMN]->(col:Column)
+OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(tbl_dscrpt:Description)
+OPTIONAL MATCH (col:Column)-[:DESCRIPTION]->(col_dscrpt:Description)
+OPTIONAL MATCH (col:Column)-[:STAT]->(stat:Stat)
+OPTIONAL MATCH (col:Column)-[:HAS_BADGE]->(badge:Badge)
+RETURN db, clstr, schema, tbl, tbl_dscrpt, col, col_dscrpt, collect(distinct stat) as col_stats,
+collect(distinct badge) as col_badges
+ORDER BY col.sort_order;""")
+
+# Column level query of get_table with a projection. The table is matched on its own so that it is found without
+# columns, and only the requested page of columns is expanded, with their stats and badges when requested.
+_PROJECTED_TABLE_LEVEL_QUERY = textwrap.dedent("""\
+MATCH (db:Database)-[:CLUSTER]->(clstr:Cluster)-[:SCHEMA]->(schema:Schema)-[:TABLE]->(tbl:Table {{key: $tbl_key}})
+OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(tbl_dscrpt:Description)
+{columns}""")
+
+_PROJECTED_COLUMN_LEVEL_QUERY = textwrap.dedent("""\
+OPTIONAL MATCH (tbl)-[:COLUMN]->(col:Column)
+WITH db, clstr, schema, tbl, tbl_dscrpt, col
+ORDER BY toInteger(col.sort_order)
+WITH db, clstr, schema, tbl, tbl_dscrpt, collect(col){page} AS cols
+UNWIND CASE WHEN size(cols) = 0 THEN [null] ELSE cols END AS col
+OPTIONAL MATCH (col)-[:DESCRIPTION]->(col_dscrpt:Description)
+{stats}{badges}RETURN db, clstr, schema, tbl, tbl_dscrpt, col, col_dscrpt, {col_stats} as col_stats,
+{col_badges} as col_badges""")
+
+_PROJECTED_NO_COLUMN_QUERY = \
+    'RETURN db, clstr, schema, tbl, tbl_dscrpt, null as col, null as col_dscrpt, [] as col_stats, [] as col_badges'
+
+# One level of the lineage expansion: the entities directly related to the frontier which weren't visited yet
+_LINEAGE_LEVEL_QUERY = textwrap.dedent("""\
+MATCH (source:{resource})-[:{relation}]->(entity:{resource})
+WHERE source.key IN $frontier AND NOT entity.key IN $visited
+WITH DISTINCT entity ORDER BY entity.key LIMIT $limit
+OPTIONAL MATCH (entity)-[:HAS_BADGE]->(badge:Badge)
+WITH entity, [badge IN collect(distinct badge) | {{key: badge.key, category: badge.category}}] AS badges
+OPTIONAL MATCH (entity)-[read:READ_BY]->(:User)
+RETURN entity.key AS key, split(entity.key, '://')[0] AS source, badges, sum(read.read_count) AS usage
+ORDER BY key""")
+
+# Badges and usage of the entities returned from the lineage index
+_LINEAGE_ENTITIES_QUERY = textwrap.dedent("""\
+MATCH (entity:{resource})
+WHERE entity.key IN $keys
+OPTIONAL MATCH (entity)-[:HAS_BADGE]->(badge:Badge)
+WITH entity, [badge IN collect(distinct badge) | {{key: badge.key, category: badge.category}}] AS badges
+OPTIONAL MATCH (entity)-[read:READ_BY]->(:User)
+RETURN entity.key AS key, split(entity.key, '://')[0] AS source, badges, sum(read.read_count) AS usage""")
+
+_TABLE_USAGE_QUERY = textwrap.dedent("""\
+MATCH (user:User)-[read:READ]->(table:Table {key: $tbl_key})
+RETURN user.email as email, read.read_count as read_count, table.name as table_name
+ORDER BY read.read_count DESC LIMIT 5;
+""")
+
+_TABLE_LEVEL_QUERY = textwrap.dedent("""\
+MATCH (tbl:Table {key: $tbl_key})
+OPTIONAL MATCH (wmk:Watermark)-[:BELONG_TO_TABLE]->(tbl)
+OPTIONAL MATCH (application:Application)-[:GENERATES]->(tbl)
+OPTIONAL MATCH (tbl)-[:LAST_UPDATED_AT]->(t:Timestamp)
+OPTIONAL MATCH (owner:User)<-[:OWNER]-(tbl)
+OPTIONAL MATCH (tbl)-[:TAGGED_BY]->(tag:Tag{tag_type: $tag_normal_type})
+OPTIONAL MATCH (tbl)-[:HAS_BADGE]->(badge:Badge)
+OPTIONAL MATCH (tbl)-[:SOURCE]->(src:Source)
+OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(prog_descriptions:Programmatic_Description)
+RETURN collect(distinct wmk) as wmk_records,
+application,
+t.last_updated_timestamp as last_updated_timestamp,
+collect(distinct owner) as owner_records,
+collect(distinct tag) as tag_records,
+collect(distinct badge) as badge_records,
+src,
+collect(distinct prog_descriptions) as prog_descriptions
+""")
+
+
+_TABLES_COLUMN_LEVEL_QUERY = textwrap.dedent("""
+MATCH (db:Database)-[:CLUSTER]->(clstr:Cluster)-[:SCHEMA]->(schema:Schema)
+-[:TABLE]->(tbl:Table)-[:COLUMN]->(col:Column)
+WHERE tbl.key IN $tbl_keys
+OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(tbl_dscrpt:Description)
+OPTIONAL MATCH (col:Column)-[:DESCRIPTION]->(col_dscrpt:Description)
+OPTIONAL MATCH (col:Column)-[:STAT]->(stat:Stat)
+OPTIONAL MATCH (col:Column)-[:HAS_BADGE]->(badge:Badge)
+RETURN db, clstr, schema, tbl, tbl_dscrpt, col, col_dscrpt, collect(distinct stat) as col_stats,
+collect(distinct badge) as col_badges
+ORDER BY tbl.key, col.sort_order;""")
+
+_TABLES_USAGE_QUERY = textwrap.dedent("""\
+MATCH (user:User)-[read:READ]->(table:Table)
+WHERE table.key IN $tbl_keys
+WITH table, user, read
+ORDER BY read.read_count DESC
+WITH table.key as table_key, collect({email: user.email, read_count: read.read_count})[0..5] as readers
+RETURN table_key, readers;
+""")
+
+_TABLES_LEVEL_QUERY = textwrap.dedent("""\
+MATCH (tbl:Table)
+WHERE tbl.key IN $tbl_keys
+OPTIONAL MATCH (wmk:Watermark)-[:BELONG_TO_TABLE]->(tbl)
+OPTIONAL MATCH (application:Application)-[:GENERATES]->(tbl)
+OPTIONAL MATCH (tbl)-[:LAST_UPDATED_AT]->(t:Timestamp)
+OPTIONAL MATCH (owner:User)<-[:OWNER]-(tbl)
+OPTIONAL MATCH (tbl)-[:TAGGED_BY]->(tag:Tag{tag_type: $tag_normal_type})
+OPTIONAL MATCH (tbl)-[:HAS_BADGE]->(badge:Badge)
+OPTIONAL MATCH (tbl)-[:SOURCE]->(src:Source)
+OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(prog_descriptions:Programmatic_Description)
+RETURN tbl.key as tbl_key,
+collect(distinct wmk) as wmk_records,
+application,
+t.last_updated_timestamp as last_updated_timestamp,
+collect(distinct owner) as owner_records,
+collect(distinct tag) as tag_records,
+collect(distinct badge) as badge_records,
+src,
+collect(distinct prog_descriptions) as prog_descriptions
+""")
+
+# Pages of the catalog export are read in key order, starting after the last key of the previous page, so that every
+# page is an index range scan instead of skipping over all the previous pages
+_TABLE_KEYS_PAGE_QUERY = textwrap.dedent("""\
+MATCH (tbl:Table)
+WHERE tbl.key > $after
+RETURN tbl.key AS key
+ORDER BY tbl.key
+LIMIT $page_size
+""")
+
+_DASHBOARDS_PAGE_QUERY = textwrap.dedent("""\
+MATCH (dashboard:Dashboard)
+WHERE dashboard.key > $after
+WITH dashboard
+ORDER BY dashboard.key
+LIMIT $page_size
+OPTIONAL MATCH (dashboard)<-[:DASHBOARD]-(dg:Dashboardgroup)<-[:DASHBOARD_GROUP]-(clstr:Cluster)
+OPTIONAL MATCH (dashboard)-[:DESCRIPTION]->(dscrpt:Description)
+OPTIONAL MATCH (dashboard)-[:EXECUTED]->(last_exec:Execution)
+WHERE split(last_exec.key, '/')[5] = '_last_successful_execution'
+RETURN clstr.name as cluster_name, dg.name as dg_name, dg.dashboard_group_url as dg_url,
+dashboard.key as uri, dashboard.name as name, dashboard.dashboard_url as url,
+split(dashboard.key, '_')[0] as product,
+dscrpt.description as description, last_exec.timestamp as last_successful_run_timestamp
+ORDER BY dashboard.key
+""")
+
+# One UNWIND statement per mutation type, each with the same effect as the matching single edit method. They only
+# return the index of the mutations whose table (or column) exists, the others are reported as failed. The tag
+# mutations also return whether the table was already tagged, for the tag index.
+_MUTATION_QUERIES = {
+    MutationType.TABLE_DESCRIPTION: textwrap.dedent("""\
+    UNWIND $mutations AS mutation
+    MATCH (tbl:Table {key: mutation.table_uri})
+    MERGE (dscrpt:Description {key: mutation.table_uri + '/_description'})
+    SET dscrpt = {description: mutation.value, key: mutation.table_uri + '/_description'}
+    MERGE (tbl)-[:DESCRIPTION]->(dscrpt)
+    RETURN mutation.index AS index
+    """),
+    MutationType.COLUMN_DESCRIPTION: textwrap.dedent("""\
+    UNWIND $mutations AS mutation
+    MATCH (col:Column {key: mutation.table_uri + '/' + mutation.column_name})
+    MERGE (dscrpt:Description {key: col.key + '/_description'})
+    SET dscrpt = {description: mutation.value, key: col.key + '/_description'}
+    MERGE (col)-[:DESCRIPTION]->(dscrpt)
+    RETURN mutation.index AS index
+    """),
+    MutationType.TAG: textwrap.dedent("""\
+    UNWIND $mutations AS mutation
+    MATCH (tbl:Table {key: mutation.table_uri})
+    MERGE (tag:Tag {key: mutation.value})
+    SET tag = {tag_type: mutation.tag_type, key: mutation.value}
+    WITH mutation, tbl, tag, exists((tbl)-[:TAGGED_BY]->(tag)) AS was_tagged
+    MERGE (tag)-[:TAG]->(tbl)-[:TAGGED_BY]->(tag)
+    RETURN mutation.index AS index, was_tagged
+    """),
+    MutationType.OWNER: textwrap.dedent("""\
+    UNWIND $mutations AS mutation
+    MATCH (tbl:Table {key: mutation.table_uri})
+    MERGE (usr:User {key: mutation.value})
+    ON CREATE SET usr = {email: mutation.value, key: mutation.value}
+    MERGE (usr)-[:OWNER_OF]->(tbl)-[:OWNER]->(usr)
+    RETURN mutation.index AS index
+    """),
+    MutationType.BADGE: textwrap.dedent("""\
+    UNWIND $mutations AS mutation
+    MATCH (tbl:Table {key: mutation.table_uri})
+    MERGE (badge:Badge {key: mutation.value})
+    SET badge = {key: mutation.value, category: mutation.category}
+    MERGE (badge)-[:BADGE_FOR]->(tbl)-[:HAS_BADGE]->(badge)
+    RETURN mutation.index AS index
+    """),
+}
+
+# Mutations which may change the catalog statistics
+_STATISTICS_MUTATION_TYPES = {MutationType.TABLE_DESCRIPTION, MutationType.COLUMN_DESCRIPTION, MutationType.OWNER}
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _global_popular_tables_key(num_entries: int) -> str:
+    return f'global {num_entries}'
+
+
+def _personal_popular_tables_key(num_entries: int, user_id: str) -> str:
+    return f'personal {num_entries} {user_id}'
+
+
+def _plan_to_dict(plan: Any) -> Dict[str, Any]:
+    """
+    :param plan: the ProfiledPlan of a PROFILE query
+    :return: the plan as json, operator by operator
+    """
+    return {'operator_type': plan.operator_type,
+            'identifiers': list(plan.identifiers),
+            'arguments': {name: str(value) for name, value in plan.arguments.items()},
+            'db_hits': plan.db_hits,
+            'rows': plan.rows,
+            'children': [_plan_to_dict(child) for child in plan.children]}
+
+
+def _total_db_hits(plan: Dict[str, Any]) -> int:
+    return plan['db_hits'] + sum(_total_db_hits(child) for child in plan['children'])
+
+
 class Neo4jProxy(BaseProxy):
     """
     A proxy to Neo4j (Gateway to Neo4j)
@@ -64,6 +315,7 @@ class Neo4jProxy(BaseProxy):
                  max_connection_lifetime_sec: int = 100,
                  encrypted: bool = False,
                  validate_ssl: bool = False,
+                 max_transaction_retry_time_sec: int = 15,
                  **kwargs: dict) -> None:
         """
         There's currently no request timeout from client side where server
@@ -74,6 +326,7 @@ class Neo4jProxy(BaseProxy):
         :param max_connection_lifetime_sec: max life time the connection can have when it comes to reuse. In other
         words, connection life time longer than this value won't be reused and closed on garbage collection. This
         value needs to be smaller than surrounding network environment's timeout.
+        :param max_transaction_retry_time_sec: how long write transactions are retried on transient errors
         """
         endpoint = f'{host}:{port}'
         LOGGER.info('NEO4J endpoint: {}'.format(endpoint))
@@ -81,31 +334,136 @@ class Neo4jProxy(BaseProxy):
         self._driver = GraphDatabase.driver(endpoint, max_connection_pool_size=num_conns,
                                             connection_timeout=10,
                                             max_connection_lifetime=max_connection_lifetime_sec,
+                                            max_retry_time=max_transaction_retry_time_sec,
                                             auth=(user, password),
                                             encrypted=encrypted,
                                             trust=trust)  # type: Driver
 
+        # (num_entries, user_id) of requested popular tables rankings -> last requested epoch sec
+        self._popular_tables_requests = {}  # type: Dict[Tuple[int, Optional[str]], float]
+        self._popular_tables_requests_lock = Lock()
+        self._popular_tables_refresher = None  # type: Optional[PeriodicTask]
+        self._popularity_index = PopularityIndex()
+        self._popularity_index_lock = Lock()
+        self._popularity_index_rebuilder = None  # type: Optional[PeriodicTask]
+        self._lineage_indexes = {}  # type: Dict[ResourceType, LineageIndex]
+        self._lineage_index_updated_ts = None  # type: Optional[int]
+        self._lineage_index_refresher = None  # type: Optional[PeriodicTask]
+        if has_app_context() and current_app.config.get(config.POPULAR_TABLES_REFRESH_ENABLED):
+            # the configured global rankings are warmed up right away instead of on their first request
+            for num_entries in current_app.config.get(config.POPULAR_TABLES_REFRESH_NUM_ENTRIES) or []:
+                self._record_popular_tables_request(num_entries)
+            self._popular_tables_refresher = PeriodicTask(
+                name='popular_tables_refresher',
+                func=self.refresh_popular_tables,
+                interval_sec=current_app.config[config.POPULAR_TABLES_REFRESH_INTERVAL_SEC],
+                app=current_app._get_current_object(),  # type: ignore
+                run_immediately=True).start()
+        if has_app_context() and current_app.config.get(config.POPULARITY_INDEX_ENABLED) \
+                and current_app.config[config.POPULARITY_INDEX_REBUILD_INTERVAL_SEC]:
+            self._popularity_index_rebuilder = PeriodicTask(
+                name='popularity_index_rebuilder',
+                func=self.rebuild_popularity_index,
+                interval_sec=current_app.config[config.POPULARITY_INDEX_REBUILD_INTERVAL_SEC],
+                app=current_app._get_current_object()).start()  # type: ignore
+        if has_app_context() and current_app.config.get(config.LINEAGE_INDEX_ENABLED):
+            self._lineage_indexes = {ResourceType.Table: LineageIndex(), ResourceType.Column: LineageIndex()}
+            self._lineage_index_refresher = PeriodicTask(
+                name='lineage_index_refresher',
+                func=self.refresh_lineage_index,
+                interval_sec=current_app.config[config.LINEAGE_INDEX_REFRESH_INTERVAL_SEC],
+                app=current_app._get_current_object(),  # type: ignore
+                run_immediately=True).start()
+        self._statistics_snapshot = \
+            create_statistics_snapshot(self._query_statistics)  # type: Optional[StatisticsSnapshot]
+        self._tag_index = create_tag_index(self._query_tag_counts)  # type: Optional[TagIndex]
+
     def is_healthy(self) -> None:
         # throws if cluster unhealthy or can't connect.  An alternative would be to use one of
         # the HTTP status endpoints, which might be more specific, but don't implicitly test
         # our configuration.
-        with self._driver.session() as session:
+        with self._session(access_mode=neo4j.READ_ACCESS) as session:
             session.read_transaction(self._execute_cypher_query,
                                      statement='CALL dbms.cluster.overview()', param_dict={})
 
     @timer_with_counter
-    def get_table(self, *, table_uri: str) -> Table:
+    def get_table(self, *, table_uri: str, projection: Optional[TableProjection] = None) -> Table:
         """
         :param table_uri: Table URI
+        :param projection: Parts of the table to fetch, all of them by default. Columns are paged and their stats
+        and badges left out in the column level query, and the usage query is skipped without table readers.
         :return:  A Table object
         """
+        if projection is not None and projection.is_full:
+            projection = None
+        with_readers = projection is None or projection.table_readers
+
+        # the queries of the single transaction are not profiled, profiling runs the same queries on their own
+        if has_app_context() and current_app.config.get(config.NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION) and \
+                get_query_profiler() is None:
+            (cols, last_neo4j_record), readers, table_level_results = \
+                self._exec_table_detail_query(table_uri, projection)
+        else:
+            (cols, last_neo4j_record), readers, table_level_results = run_concurrently(
+                lambda: self._exec_col_query(table_uri, projection),
+                lambda: self._exec_usage_query(table_uri) if with_readers else [],
+                lambda: self._exec_table_query(table_uri))
 
-        cols, last_neo4j_record = self._exec_col_query(table_uri)
+        return self._build_table(cols, last_neo4j_record, readers, table_level_results)
+
+    @timer_with_counter
+    def get_tables(self, *, table_uris: List[str]) -> Dict[str, Table]:
+        """
+        Fetches many tables with one query per kind of data (columns, usage, table level) for all of them, instead
+        of three queries per table.
+
+        :param table_uris: Table URIs
+        :return: Table per table URI, tables that don't exist are left out
+        """
+        if not table_uris:
+            return {}
+
+        cols_by_table, readers_by_table, table_level_results_by_table = run_concurrently(
+            lambda: self._exec_tables_col_query(table_uris),
+            lambda: self._exec_tables_usage_query(table_uris),
+            lambda: self._exec_tables_table_query(table_uris))
+
+        tables = {}
+        for table_uri, (cols, last_neo4j_record) in cols_by_table.items():
+            if table_uri not in table_level_results_by_table:
+                continue
+            tables[table_uri] = self._build_table(cols, last_neo4j_record, readers_by_table.get(table_uri, []),
+                                                  table_level_results_by_table[table_uri])
+        return tables
+
+    def iter_tables(self, *, page_size: int) -> Iterator[Table]:
+        """
+        Iterates over all tables in key order, fetching the keys of a page and then their details with get_tables.
+
+        :param page_size: Number of tables fetched at a time
+        :return:
+        """
+        after = ''
+        while True:
+            records = self._execute_cypher_query(statement=_TABLE_KEYS_PAGE_QUERY,
+                                                 param_dict={'after': after, 'page_size': page_size})
+            table_uris = [record['key'] for record in records]
+            if not table_uris:
+                return
 
-        readers = self._exec_usage_query(table_uri)
+            tables = self.get_tables(table_uris=table_uris)
+            for table_uri in table_uris:
+                # tables without columns are left out by get_tables, like get_table raises for them
+                if table_uri in tables:
+                    yield tables[table_uri]
 
-        wmk_results, table_writer, timestamp_value, owners, tags, source, badges, prog_descs = \
-            self._exec_table_query(table_uri)
+            if len(table_uris) < page_size:
+                return
+            after = table_uris[-1]
+
+    def _build_table(self, cols: List[Column], last_neo4j_record: Any, readers: List[Reader],
+                     table_level_results: Tuple) -> Table:
+        wmk_results, table_writer, timestamp_value, owners, tags, source, badges, prog_descs = table_level_results
 
         table = Table(database=last_neo4j_record['db']['name'],
                       cluster=last_neo4j_record['clstr']['name'],
@@ -128,39 +486,98 @@ class Neo4jProxy(BaseProxy):
         return table
 
     @timer_with_counter
-    def _exec_col_query(self, table_uri: str) -> Tuple:
+    def _exec_tables_col_query(self, table_uris: List[str]) -> Dict[str, Tuple]:
+        # Return Value: {table uri: (Columns, Last Processed Record)}
+
+        tbl_col_neo4j_records = self._execute_cypher_query(
+            statement=_TABLES_COLUMN_LEVEL_QUERY, param_dict={'tbl_keys': table_uris})
+
+        records_by_table = {}  # type: Dict[str, List]
+        for tbl_col_neo4j_record in tbl_col_neo4j_records:
+            records_by_table.setdefault(tbl_col_neo4j_record['tbl']['key'], []).append(tbl_col_neo4j_record)
+
+        return {table_uri: self._get_columns_from_records(table_uri, records)
+                for table_uri, records in records_by_table.items()}
+
+    @timer_with_counter
+    def _exec_tables_usage_query(self, table_uris: List[str]) -> Dict[str, List[Reader]]:
+        usage_neo4j_records = self._execute_cypher_query(statement=_TABLES_USAGE_QUERY,
+                                                         param_dict={'tbl_keys': table_uris})
+        return {record['table_key']: self._get_readers_from_records(record['readers'])
+                for record in usage_neo4j_records}
+
+    @timer_with_counter
+    def _exec_tables_table_query(self, table_uris: List[str]) -> Dict[str, Tuple]:
+        table_records = self._execute_cypher_query(statement=_TABLES_LEVEL_QUERY,
+                                                   param_dict={'tbl_keys': table_uris,
+                                                               'tag_normal_type': 'default'})
+        return {record['tbl_key']: self._get_table_level_results_from_record(record) for record in table_records}
+
+    @timer_with_counter
+    def _exec_table_detail_query(self, table_uri: str, projection: Optional[TableProjection] = None) -> Tuple:
+        """
+        Runs the column level, usage and table level queries of get_table in a single read transaction. The three
+        statements are pipelined over one pooled connection, so a table detail costs one session checkout and one
+        network round trip instead of three.
+
+        Return Value: ((Columns, Last Processed Record), List[Reader], Table level results)
+        """
+        with self._session(access_mode=neo4j.READ_ACCESS) as session:
+            return session.read_transaction(self._read_table_detail, table_uri, projection)
+
+    def _read_table_detail(self, tx: Transaction, table_uri: str,
+                           projection: Optional[TableProjection] = None) -> Tuple:
+        # statements are only sent when results are consumed, so run all of them before reading any records
+        tbl_col_neo4j_records = tx.run(*self._column_level_query(table_uri, projection))
+        usage_neo4j_records = tx.run(_TABLE_USAGE_QUERY, {'tbl_key': table_uri}) \
+            if projection is None or projection.table_readers else []
+        table_records = tx.run(_TABLE_LEVEL_QUERY, {'tbl_key': table_uri, 'tag_normal_type': 'default'})
+
+        return (self._get_columns_from_records(table_uri, tbl_col_neo4j_records),
+                self._get_readers_from_records(usage_neo4j_records),
+                self._get_table_level_results_from_record(table_records.single()))
+
+    @timer_with_counter
+    def _exec_col_query(self, table_uri: str, projection: Optional[TableProjection] = None) -> Tuple:
         # Return Value: (Columns, Last Processed Record)
+        statement, param_dict = self._column_level_query(table_uri, projection)
+        tbl_col_neo4j_records = self._execute_cypher_query(statement=statement, param_dict=param_dict)
 
-        column_level_query = textwrap.dedent("""
-        MATCH (db:Database)-[:CLUSTER]->(clstr:Cluster)-[:SCHEMA]->(schema:Schema)
-        -[:TABLE]->(tbl:Table {key: $tbl_key})-[:COLUMN]->(col:Column)
-        OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(tbl_dscrpt:Description)
-        OPTIONAL MATCH (col:Column)-[:DESCRIPTION]->(col_dscrpt:Description)
-        OPTIONAL MATCH (col:Column)-[:STAT]->(stat:Stat)
-        OPTIONAL MATCH (col:Column)-[:HAS_BADGE]->(badge:Badge)
-        RETURN db, clstr, schema, tbl, tbl_dscrpt, col, col_dscrpt, collect(distinct stat) as col_stats,
-        collect(distinct badge) as col_badges
-        ORDER BY col.sort_order;""")
+        return self._get_columns_from_records(table_uri, tbl_col_neo4j_records)
 
-        tbl_col_neo4j_records = self._execute_cypher_query(
-            statement=column_level_query, param_dict={'tbl_key': table_uri})
+    def _column_level_query(self, table_uri: str, projection: Optional[TableProjection]) -> Tuple[str, Dict]:
+        """
+        :return: the column level statement of get_table and its parameters
+        """
+        if projection is None:
+            return _TABLE_COLUMN_LEVEL_QUERY, {'tbl_key': table_uri}
+
+        if not projection.columns:
+            return _PROJECTED_TABLE_LEVEL_QUERY.format(columns=_PROJECTED_NO_COLUMN_QUERY), {'tbl_key': table_uri}
+
+        columns = _PROJECTED_COLUMN_LEVEL_QUERY.format(
+            page='[$column_offset..]' if projection.column_limit is None else '[$column_offset..$column_end]',
+            stats='OPTIONAL MATCH (col)-[:STAT]->(stat:Stat)\n' if projection.column_stats else '',
+            badges='OPTIONAL MATCH (col)-[:HAS_BADGE]->(badge:Badge)\n' if projection.column_badges else '',
+            col_stats='collect(distinct stat)' if projection.column_stats else '[]',
+            col_badges='collect(distinct badge)' if projection.column_badges else '[]')
+        params = {'tbl_key': table_uri, 'column_offset': projection.column_offset, 'column_end': projection.column_end}
+        return _PROJECTED_TABLE_LEVEL_QUERY.format(columns=columns), params
+
+    def _get_columns_from_records(self, table_uri: str, tbl_col_neo4j_records: Iterable) -> Tuple:
         cols = []
         last_neo4j_record = None
         for tbl_col_neo4j_record in tbl_col_neo4j_records:
             # Getting last record from this for loop as Neo4j's result's random access is O(n) operation.
-            col_stats = []
-            for stat in tbl_col_neo4j_record['col_stats']:
-                col_stat = Stat(
-                    stat_type=stat['stat_type'],
-                    stat_val=stat['stat_val'],
-                    start_epoch=int(float(stat['start_epoch'])),
-                    end_epoch=int(float(stat['end_epoch']))
-                )
-                col_stats.append(col_stat)
+            last_neo4j_record = tbl_col_neo4j_record
+            # the projected column level query returns the table without col when no column is requested
+            if tbl_col_neo4j_record['col'] is None:
+                continue
+
+            col_stats = ColumnStats.from_records(tbl_col_neo4j_record['col_stats']).as_stats()
 
             column_badges = self._make_badges(tbl_col_neo4j_record['col_badges'])
 
-            last_neo4j_record = tbl_col_neo4j_record
             col = Column(name=tbl_col_neo4j_record['col']['name'],
                          description=self._safe_get(tbl_col_neo4j_record, 'col_dscrpt', 'description'),
                          col_type=tbl_col_neo4j_record['col']['col_type'],
@@ -170,7 +587,7 @@ class Neo4jProxy(BaseProxy):
 
             cols.append(col)
 
-        if not cols:
+        if last_neo4j_record is None:
             raise NotFoundException('Table URI( {table_uri} ) does not exist'.format(table_uri=table_uri))
 
         return sorted(cols, key=lambda item: item.sort_order), last_neo4j_record
@@ -179,14 +596,11 @@ class Neo4jProxy(BaseProxy):
     def _exec_usage_query(self, table_uri: str) -> List[Reader]:
         # Return Value: List[Reader]
 
-        usage_query = textwrap.dedent("""\
-        MATCH (user:User)-[read:READ]->(table:Table {key: $tbl_key})
-        RETURN user.email as email, read.read_count as read_count, table.name as table_name
-        ORDER BY read.read_count DESC LIMIT 5;
-        """)
-
-        usage_neo4j_records = self._execute_cypher_query(statement=usage_query,
+        usage_neo4j_records = self._execute_cypher_query(statement=_TABLE_USAGE_QUERY,
                                                          param_dict={'tbl_key': table_uri})
+        return self._get_readers_from_records(usage_neo4j_records)
+
+    def _get_readers_from_records(self, usage_neo4j_records: Iterable) -> List[Reader]:
         readers = []  # type: List[Reader]
         for usage_neo4j_record in usage_neo4j_records:
             reader = Reader(user=User(email=usage_neo4j_record['email']),
@@ -204,32 +618,13 @@ class Neo4jProxy(BaseProxy):
 
         # Return Value: (Watermark Results, Table Writer, Last Updated Timestamp, owner records, tag records)
 
-        table_level_query = textwrap.dedent("""\
-        MATCH (tbl:Table {key: $tbl_key})
-        OPTIONAL MATCH (wmk:Watermark)-[:BELONG_TO_TABLE]->(tbl)
-        OPTIONAL MATCH (application:Application)-[:GENERATES]->(tbl)
-        OPTIONAL MATCH (tbl)-[:LAST_UPDATED_AT]->(t:Timestamp)
-        OPTIONAL MATCH (owner:User)<-[:OWNER]-(tbl)
-        OPTIONAL MATCH (tbl)-[:TAGGED_BY]->(tag:Tag{tag_type: $tag_normal_type})
-        OPTIONAL MATCH (tbl)-[:HAS_BADGE]->(badge:Badge)
-        OPTIONAL MATCH (tbl)-[:SOURCE]->(src:Source)
-        OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(prog_descriptions:Programmatic_Description)
-        RETURN collect(distinct wmk) as wmk_records,
-        application,
-        t.last_updated_timestamp as last_updated_timestamp,
-        collect(distinct owner) as owner_records,
-        collect(distinct tag) as tag_records,
-        collect(distinct badge) as badge_records,
-        src,
-        collect(distinct prog_descriptions) as prog_descriptions
-        """)
-
-        table_records = self._execute_cypher_query(statement=table_level_query,
+        table_records = self._execute_cypher_query(statement=_TABLE_LEVEL_QUERY,
                                                    param_dict={'tbl_key': table_uri,
                                                                'tag_normal_type': 'default'})
 
-        table_records = table_records.single()
+        return self._get_table_level_results_from_record(table_records.single())
 
+    def _get_table_level_results_from_record(self, table_records: Any) -> Tuple:
         wmk_results = []
         table_writer = None
 
@@ -315,15 +710,104 @@ class Neo4jProxy(BaseProxy):
         if LOGGER.isEnabledFor(logging.DEBUG):
             LOGGER.debug('Executing Cypher query: {statement} with params {params}: '.format(statement=statement,
                                                                                              params=param_dict))
+        profiler = get_query_profiler()
         start = time.time()
+        execute_ms = None  # type: Optional[float]
         try:
-            with self._driver.session() as session:
-                return session.run(statement, **param_dict)
+            with self._session(access_mode=neo4j.READ_ACCESS) as session:
+                result = session.run(('PROFILE ' if profiler is not None else '') + statement, **param_dict)
+                execute_ms = (time.time() - start) * 1000
+                # buffers the records, which are still returned, to time their consumption apart
+                records = result.detach()
+                elapsed_ms = (time.time() - start) * 1000
+                if profiler is not None:
+                    summary = result.summary()
+                    plan = _plan_to_dict(summary.profile) if summary.profile is not None else None
+                    server_ms = (summary.result_available_after or 0) + (summary.result_consumed_after or 0)
+                    profiler.add(ProfiledQuery(query=statement,
+                                               elapsed_ms=elapsed_ms,
+                                               db_hits=_total_db_hits(plan) if plan is not None else None,
+                                               server_ms=server_ms,
+                                               plan=plan))
+        except Exception:
+            elapsed_ms = (time.time() - start) * 1000
+            record_query(backend='neo4j', query=statement, params=param_dict,
+                         execute_ms=execute_ms if execute_ms is not None else elapsed_ms,
+                         consume_ms=elapsed_ms - execute_ms if execute_ms is not None else None,
+                         success=False)
+            raise
+
+        record_query(backend='neo4j', query=statement, params=param_dict,
+                     execute_ms=execute_ms, consume_ms=elapsed_ms - execute_ms, records=records)
+        return result
+
+    def _write_transaction(self, unit_of_work: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs unit_of_work(tx, *args, **kwargs) in a managed write transaction and returns its result.
+        The driver commits when the unit of work returns, rolls back when it raises, and runs it again on transient
+        errors and lost connections for up to max_transaction_retry_time_sec. Hence the unit of work needs to
+        consume its results within the transaction and should not have side effects outside of it.
+        The session is closed in any case so that its connection goes back to the pool.
+
+        Emits the time it took to get a connection and begin the transaction, and the number of retries.
+        """
+        attempts = 0
+        start = time.time()
 
+        def managed_unit_of_work(tx: Transaction, *unit_args: Any, **unit_kwargs: Any) -> Any:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                timing(prefix=__name__, name='write_transaction.acquire', ms=(time.time() - start) * 1000)
+            else:
+                LOGGER.warning(f'Retrying {unit_of_work.__name__}, attempt {attempts}')
+                incr(prefix=__name__, name='write_transaction.retry')
+            return unit_of_work(tx, *unit_args, **unit_kwargs)
+
+        session = self._session(access_mode=neo4j.WRITE_ACCESS)
+        try:
+            result = session.write_transaction(managed_unit_of_work, *args, **kwargs)
+            self._set_last_bookmark(session.last_bookmark())
+            return result
         finally:
-            # TODO: Add support on statsd
-            if LOGGER.isEnabledFor(logging.DEBUG):
-                LOGGER.debug('Cypher query execution elapsed for {} seconds'.format(time.time() - start))
+            session.close()
+
+    def _session(self, *, access_mode: str) -> Session:
+        """
+        Opens a session in the given access mode. When PROXY_HOST uses the bolt+routing scheme, the driver sends
+        READ sessions to the followers and read replicas of the causal cluster and WRITE sessions to the leader.
+
+        READ sessions wait for the bookmarks of the current request, i.e. the bookmark of its last write and the
+        one a client passed in the BOOKMARK_HEADER, so that clients read their own writes.
+        """
+        if access_mode == neo4j.READ_ACCESS:
+            bookmarks = self._get_request_bookmarks()
+            if bookmarks:
+                return self._driver.session(access_mode=access_mode, bookmarks=bookmarks)
+        return self._driver.session(access_mode=access_mode)
+
+    @staticmethod
+    def _get_request_bookmarks() -> List[str]:
+        if not has_request_context():
+            return []
+        return [bookmark for bookmark in [g.get(_BOOKMARK_ATTRIBUTE), request.headers.get(BOOKMARK_HEADER)]
+                if bookmark]
+
+    @staticmethod
+    def _set_last_bookmark(bookmark: Optional[str]) -> None:
+        """
+        Keeps the bookmark of a write for the following reads of the request, and returns it to the client
+        in the BOOKMARK_HEADER of the response so that it can pass it along with its next requests
+        """
+        if not bookmark or not has_request_context():
+            return
+
+        if g.get(_BOOKMARK_ATTRIBUTE) is None:
+            @after_this_request
+            def add_bookmark_header(response: Response) -> Response:
+                response.headers[BOOKMARK_HEADER] = g.get(_BOOKMARK_ATTRIBUTE)
+                return response
+        setattr(g, _BOOKMARK_ATTRIBUTE, bookmark)
 
     # noinspection PyMethodMayBeStatic
     def _make_badges(self, badges: Iterable) -> List[Badge]:
@@ -398,11 +882,7 @@ class Neo4jProxy(BaseProxy):
         RETURN n1.key, n2.key
         """.format(node_label=resource_type.name))
 
-        start = time.time()
-
-        try:
-            tx = self._driver.session().begin_transaction()
-
+        def put_resource_description(tx: Transaction) -> None:
             tx.run(upsert_desc_query, {'description': description,
                                        'desc_key': desc_key})
 
@@ -412,13 +892,14 @@ class Neo4jProxy(BaseProxy):
             if not result.single():
                 raise RuntimeError('Failed to update the resource {uri} description'.format(uri=uri))
 
-            # end neo4j transaction
-            tx.commit()
+        start = time.time()
+
+        try:
+            self._write_transaction(put_resource_description)
+            self._statistics_changed()
 
         except Exception as e:
             LOGGER.exception('Failed to execute update process')
-            if not tx.closed():
-                tx.rollback()
 
             # propagate exception back to api
             raise e
@@ -494,11 +975,7 @@ class Neo4jProxy(BaseProxy):
             RETURN n1.key, n2.key
             """)
 
-        start = time.time()
-
-        try:
-            tx = self._driver.session().begin_transaction()
-
+        def put_column_description(tx: Transaction) -> None:
             tx.run(upsert_desc_query, {'description': description,
                                        'desc_key': desc_key})
 
@@ -510,16 +987,16 @@ class Neo4jProxy(BaseProxy):
                                    'column {col} description'.format(tbl=table_uri,
                                                                      col=column_uri))
 
-            # end neo4j transaction
-            tx.commit()
+        start = time.time()
+
+        try:
+            self._write_transaction(put_column_description)
+            self._statistics_changed()
 
         except Exception as e:
 
             LOGGER.exception('Failed to execute update process')
 
-            if not tx.closed():
-                tx.rollback()
-
             # propagate error to api
             raise e
 
@@ -551,8 +1028,7 @@ class Neo4jProxy(BaseProxy):
         RETURN n1.key, n2.key
         """)
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def add_owner(tx: Transaction) -> None:
             # upsert the node
             tx.run(create_owner_query, {'user_email': owner})
             result = tx.run(upsert_owner_relation_query, {'user_email': owner,
@@ -562,12 +1038,10 @@ class Neo4jProxy(BaseProxy):
                 raise RuntimeError('Failed to create relation between '
                                    'owner {owner} and table {tbl}'.format(owner=owner,
                                                                           tbl=table_uri))
-            tx.commit()
-        except Exception as e:
-            if not tx.closed():
-                tx.rollback()
-            # propagate the exception back to api
-            raise e
+
+        # exceptions propagate back to api
+        self._write_transaction(add_owner)
+        self._statistics_changed()
 
     @timer_with_counter
     def delete_owner(self, *,
@@ -585,17 +1059,14 @@ class Neo4jProxy(BaseProxy):
         OPTIONAL MATCH (n2)-[r2:OWNER]->(n1)
         DELETE r1,r2
         """)
-        try:
-            tx = self._driver.session().begin_transaction()
+
+        def delete_owner(tx: Transaction) -> None:
             tx.run(delete_query, {'user_email': owner,
                                   'tbl_key': table_uri})
-        except Exception as e:
-            # propagate the exception back to api
-            if not tx.closed():
-                tx.rollback()
-            raise e
-        finally:
-            tx.commit()
+
+        # exceptions propagate back to api
+        self._write_transaction(delete_owner)
+        self._statistics_changed()
 
     @timer_with_counter
     def add_badge(self, *,
@@ -623,8 +1094,7 @@ class Neo4jProxy(BaseProxy):
         RETURN n1.key, n2.key
         """.format(resource_type=resource_type.name))
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def add_badge(tx: Transaction) -> None:
             tbl_result = tx.run(validation_query, {'key': id})
             if not tbl_result.single():
                 raise NotFoundException('id {} does not exist'.format(id))
@@ -643,11 +1113,8 @@ class Neo4jProxy(BaseProxy):
                                                                      resource=id,
                                                                      resource_type=resource_type,
                                                                      q=upsert_badge_relation_query))
-            tx.commit()
-        except Exception as e:
-            if not tx.closed():
-                tx.rollback()
-            raise e
+
+        self._write_transaction(add_badge)
 
     @timer_with_counter
     def delete_badge(self, id: str,
@@ -665,17 +1132,13 @@ class Neo4jProxy(BaseProxy):
         [r1:BADGE_FOR]->(n:{resource_type} {{key: $key}})-[r2:HAS_BADGE]->(b) DELETE r1,r2
         """.format(resource_type=resource_type.name))
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def delete_badge(tx: Transaction) -> None:
             tx.run(delete_query, {'badge_name': badge_name,
                                   'key': id,
                                   'category': category})
-            tx.commit()
-        except Exception as e:
-            # propagate the exception back to api
-            if not tx.closed():
-                tx.rollback()
-            raise e
+
+        # exceptions propagate back to api
+        self._write_transaction(delete_badge)
 
     @timer_with_counter
     def get_badges(self) -> List:
@@ -723,12 +1186,12 @@ class Neo4jProxy(BaseProxy):
 
         upsert_tag_relation_query = textwrap.dedent("""
         MATCH (n1:Tag {{key: $tag, tag_type: $tag_type}}), (n2:{resource_type} {{key: $key}})
+        WITH n1, n2, exists((n2)-[:TAGGED_BY]->(n1)) AS tagged
         MERGE (n1)-[r1:TAG]->(n2)-[r2:TAGGED_BY]->(n1)
-        RETURN n1.key, n2.key
+        RETURN n1.key, n2.key, tagged
         """.format(resource_type=resource_type.name))
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def add_tag(tx: Transaction) -> bool:
             tbl_result = tx.run(validation_query, {'key': id})
             if not tbl_result.single():
                 raise NotFoundException('id {} does not exist'.format(id))
@@ -739,18 +1202,19 @@ class Neo4jProxy(BaseProxy):
             result = tx.run(upsert_tag_relation_query, {'tag': tag,
                                                         'key': id,
                                                         'tag_type': tag_type})
-            if not result.single():
+            record = result.single()
+            if not record:
                 raise RuntimeError('Failed to create relation between '
                                    'tag {tag} and resource {resource} of resource type: {resource_type}'
                                    .format(tag=tag,
                                            resource=id,
                                            resource_type=resource_type.name))
-            tx.commit()
-        except Exception as e:
-            if not tx.closed():
-                tx.rollback()
-            # propagate the exception back to api
-            raise e
+            # whether the resource was not tagged yet
+            return not record['tagged']
+
+        # exceptions propagate back to api
+        if self._write_transaction(add_tag):
+            self._tags_changed(tag=tag, tag_type=tag_type, delta=1)
 
     @timer_with_counter
     def delete_tag(self, *,
@@ -775,44 +1239,55 @@ class Neo4jProxy(BaseProxy):
         delete_query = textwrap.dedent("""
         MATCH (n1:Tag{{key: $tag, tag_type: $tag_type}})-
         [r1:TAG]->(n2:{resource_type} {{key: $key}})-[r2:TAGGED_BY]->(n1) DELETE r1,r2
+        RETURN count(r2) AS deleted
         """.format(resource_type=resource_type.name))
 
-        try:
-            tx = self._driver.session().begin_transaction()
-            tx.run(delete_query, {'tag': tag,
-                                  'key': id,
-                                  'tag_type': tag_type})
-            tx.commit()
-        except Exception as e:
-            # propagate the exception back to api
-            if not tx.closed():
-                tx.rollback()
-            raise e
+        def delete_tag(tx: Transaction) -> int:
+            return tx.run(delete_query, {'tag': tag,
+                                         'key': id,
+                                         'tag_type': tag_type}).single()['deleted']
+
+        # exceptions propagate back to api
+        deleted = self._write_transaction(delete_tag)
+        if deleted:
+            self._tags_changed(tag=tag, tag_type=tag_type, delta=-deleted)
 
     @timer_with_counter
-    def get_tags(self) -> List:
+    def get_tags(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List:
         """
-        Get all existing tags from neo4j
+        Get the existing tags starting with prefix from neo4j, or from the tag index when config.TAG_INDEX_ENABLED
 
+        :param prefix: only the tags starting with prefix
+        :param limit: only the limit tags with the most resources, most resources first
         :return:
         """
         LOGGER.info('Get all the tags')
+        if self._tag_index is not None:
+            tag_counts = self._tag_index.search(prefix=prefix, limit=limit)
+        else:
+            tag_counts = self._query_tag_counts(prefix=prefix, limit=limit)
+        return [TagDetail(tag_name=tag_name, tag_count=tag_count) for tag_name, tag_count in tag_counts]
+
+    def _query_tag_counts(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
         # todo: Currently all the tags are default type, we could open it up if we want to include badge
         query = textwrap.dedent("""
         MATCH (t:Tag{tag_type: 'default'})
+        WHERE $prefix IS NULL OR t.key STARTS WITH $prefix
         OPTIONAL MATCH (resource)-[:TAGGED_BY]->(t)
         WITH t as tag_name, count(distinct resource.key) as tag_count
         WHERE tag_count > 0
         RETURN tag_name, tag_count
         """)
+        if limit is not None:
+            query += 'ORDER BY tag_count DESC, tag_name.key LIMIT $limit\n'
 
         records = self._execute_cypher_query(statement=query,
-                                             param_dict={})
-        results = []
-        for record in records:
-            results.append(TagDetail(tag_name=record['tag_name']['key'],
-                                     tag_count=record['tag_count']))
-        return results
+                                             param_dict={'prefix': prefix, 'limit': limit})
+        return [(record['tag_name']['key'], record['tag_count']) for record in records]
+
+    def _tags_changed(self, *, tag: str, tag_type: str, delta: int) -> None:
+        if self._tag_index is not None and tag_type == 'default':
+            self._tag_index.apply(tag=tag, delta=delta)
 
     @timer_with_counter
     def get_latest_updated_ts(self) -> Optional[int]:
@@ -836,9 +1311,19 @@ class Neo4jProxy(BaseProxy):
     @timer_with_counter
     def get_statistics(self) -> Dict[str, Any]:
         """
-        API method to fetch statistics metrics for neo4j
+        API method to fetch statistics metrics for neo4j, from the statistics snapshot when
+        config.STATISTICS_SNAPSHOT_ENABLED
         :return: dictionary of statistics
         """
+        if self._statistics_snapshot is not None:
+            return self._statistics_snapshot.get()
+        return self._query_statistics()
+
+    def _statistics_changed(self) -> None:
+        if self._statistics_snapshot is not None:
+            self._statistics_snapshot.mark_stale()
+
+    def _query_statistics(self) -> Dict[str, Any]:
         query = textwrap.dedent("""
         MATCH (table_node:Table) with count(table_node) as number_of_tables
         MATCH p=(item_node)-[r:DESCRIPTION]->(description_node)
@@ -873,17 +1358,38 @@ class Neo4jProxy(BaseProxy):
             return neo4j_statistics
         return {}
 
-    @_CACHE.cache('_get_global_popular_tables_uris', expire=_GET_POPULAR_TABLE_CACHE_EXPIRY_SEC)
+    def _get_popular_tables_cache(self) -> Cache:
+        return _CACHE.get_cache(_POPULAR_TABLES_CACHE_NAMESPACE, expire=_GET_POPULAR_TABLE_CACHE_EXPIRY_SEC)
+
+    def _record_popular_tables_request(self, num_entries: int, user_id: Optional[str] = None) -> None:
+        # remembered so that the background refresh knows which rankings are actually being requested
+        with self._popular_tables_requests_lock:
+            self._popular_tables_requests[(num_entries, user_id)] = time.time()
+
     def _get_global_popular_tables_uris(self, num_entries: int) -> List[str]:
         """
         Retrieve popular table uris. Will provide tables with top x popularity score.
         Popularity score = number of distinct readers * log(total number of reads)
         The result of this method will be cached based on the key (num_entries), and the cache will be expired based on
-        _GET_POPULAR_TABLE_CACHE_EXPIRY_SEC
+        _GET_POPULAR_TABLE_CACHE_EXPIRY_SEC. With POPULAR_TABLES_REFRESH_ENABLED the cached value is recomputed in the
+        background by refresh_popular_tables before it expires.
+        With POPULARITY_INDEX_ENABLED the ranking is looked up in the incrementally maintained popularity index instead.
 
+        :return: Iterable of table uri
+        """
+        if current_app.config[config.POPULARITY_INDEX_ENABLED]:
+            return self._get_popularity_index().top(
+                num_entries=num_entries, min_readers=current_app.config['POPULAR_TABLE_MINIMUM_READER_COUNT'])
+
+        self._record_popular_tables_request(num_entries)
+        return self._get_popular_tables_cache().get(
+            _global_popular_tables_key(num_entries),
+            createfunc=lambda: self._query_global_popular_tables_uris(num_entries))
+
+    def _query_global_popular_tables_uris(self, num_entries: int) -> List[str]:
+        """
         For score computation, it uses logarithm on total number of reads so that score won't be affected by small
         number of users reading a lot of times.
-        :return: Iterable of table uri
         """
         query = textwrap.dedent("""
         MATCH (tbl:Table)-[r:READ_BY]->(u:User)
@@ -901,7 +1407,6 @@ class Neo4jProxy(BaseProxy):
         return [record['table_key'] for record in records]
 
     @timer_with_counter
-    @_CACHE.cache('_get_personal_popular_tables_uris', _GET_POPULAR_TABLE_CACHE_EXPIRY_SEC)
     def _get_personal_popular_tables_uris(self, num_entries: int,
                                           user_id: str) -> List[str]:
         """
@@ -914,6 +1419,12 @@ class Neo4jProxy(BaseProxy):
 
         :return: Iterable of table uri
         """
+        self._record_popular_tables_request(num_entries, user_id)
+        return self._get_popular_tables_cache().get(
+            _personal_popular_tables_key(num_entries, user_id),
+            createfunc=lambda: self._query_personal_popular_tables_uris(num_entries, user_id))
+
+    def _query_personal_popular_tables_uris(self, num_entries: int, user_id: str) -> List[str]:
         statement = textwrap.dedent("""
         MATCH (:User {key:$user_id})<-[:READ_BY]-(:Table)-[:READ_BY]->
              (coUser:User)<-[coRead:READ_BY]-(table:Table)
@@ -932,6 +1443,187 @@ class Neo4jProxy(BaseProxy):
 
         return [record['table_key'] for record in records]
 
+    @timer_with_counter
+    def refresh_popular_tables(self) -> None:
+        """
+        Recomputes the cached global rankings, and the personal rankings of users who requested them within
+        POPULAR_TABLES_ACTIVE_USER_SEC, so that requests never wait for the full READ_BY aggregation.
+        When the beaker cache is shared between workers, a ranking refreshed by another worker within the last
+        refresh interval is skipped.
+        """
+        now = time.time()
+        active_since = now - current_app.config[config.POPULAR_TABLES_ACTIVE_USER_SEC]
+        with self._popular_tables_requests_lock:
+            for popular_request, requested_at in list(self._popular_tables_requests.items()):
+                if popular_request[1] is not None and requested_at < active_since:
+                    del self._popular_tables_requests[popular_request]
+            requests = list(self._popular_tables_requests)
+
+        refreshed_since = now - current_app.config[config.POPULAR_TABLES_REFRESH_INTERVAL_SEC]
+        for num_entries, user_id in requests:
+            if user_id is None:
+                key = _global_popular_tables_key(num_entries)
+                query = partial(self._query_global_popular_tables_uris, num_entries)
+            else:
+                key = _personal_popular_tables_key(num_entries, user_id)
+                query = partial(self._query_personal_popular_tables_uris, num_entries, user_id)
+            self._refresh_popular_tables_uris(key, query, refreshed_since=refreshed_since)
+
+    def _refresh_popular_tables_uris(self, key: str, query: Callable[[], List[str]], *,
+                                     refreshed_since: float) -> None:
+        cache = self._get_popular_tables_cache()
+        # the creation lock is shared between workers with a shared cache, the one holding it refreshes the ranking
+        creation_lock = cache.namespace.get_creation_lock(key)
+        if not creation_lock.acquire(wait=False):
+            return
+        try:
+            refreshed_key = f'refreshed_at {key}'
+            try:
+                if cache.get(refreshed_key) > refreshed_since:
+                    return
+            except KeyError:
+                pass
+
+            cache.put(key, query())
+            cache.put(refreshed_key, time.time())
+        finally:
+            creation_lock.release()
+
+    def _get_popularity_index(self) -> PopularityIndex:
+        if not self._popularity_index.is_built:
+            with self._popularity_index_lock:
+                if not self._popularity_index.is_built:
+                    self.rebuild_popularity_index()
+        return self._popularity_index
+
+    @timer_with_counter
+    def rebuild_popularity_index(self) -> None:
+        """
+        Rebuilds the popularity index from every READ_BY relationship. Only needed once on start up, and then
+        periodically to pick up usage that was not written through this service (e.g. by databuilder).
+        """
+        query = textwrap.dedent("""
+        MATCH (tbl:Table)-[r:READ_BY]->(u:User)
+        RETURN tbl.key as table_key, count(distinct u) as readers, sum(r.read_count) as total_reads;
+        """)
+        LOGGER.info('Querying usage of all tables for popularity index')
+        records = self._execute_cypher_query(statement=query, param_dict={})
+        self._popularity_index.rebuild((record['table_key'], record['readers'], record['total_reads'])
+                                       for record in records)
+
+    @timer_with_counter
+    def apply_usage_deltas(self, *, deltas: List[UsageDelta]) -> None:
+        """
+        Adds reads of tables by users in a single transaction, creating the READ / READ_BY relations and the user
+        if needed, and applies them to the popularity index. Deltas of tables that don't exist are skipped.
+        Deltas of the same table and user are merged first, so the user is counted once as a new reader.
+
+        :param deltas:
+        :return:
+        """
+        upsert_usage_query = textwrap.dedent("""
+        UNWIND $deltas AS delta
+        MATCH (tbl:Table {key: delta.table_uri})
+        MERGE (usr:User {key: delta.user_email})
+        ON CREATE SET usr.email = delta.user_email
+        WITH tbl, usr, delta, exists((tbl)-[:READ_BY]->(usr)) AS existing_reader
+        MERGE (usr)-[read:READ]->(tbl)
+        MERGE (tbl)-[read_by:READ_BY]->(usr)
+        SET read.read_count = coalesce(read.read_count, 0) + delta.read_count,
+        read_by.read_count = coalesce(read_by.read_count, 0) + delta.read_count
+        RETURN tbl.key AS table_key, NOT existing_reader AS new_reader, delta.read_count AS read_count
+        """)
+
+        def apply_usage_deltas(tx: Transaction) -> List[Any]:
+            return list(tx.run(upsert_usage_query, {'deltas': [UsageDeltaSchema().dump(delta)
+                                                               for delta in merge_usage_deltas(deltas)]}))
+
+        # exceptions propagate back to api
+        records = self._write_transaction(apply_usage_deltas)
+
+        if self._popularity_index.is_built:
+            for record in records:
+                self._popularity_index.apply(table_key=record['table_key'],
+                                             new_reader=record['new_reader'],
+                                             read_count=record['read_count'])
+
+    @timer_with_counter
+    def apply_mutations(self, *, mutations: List[Mutation]) -> List[MutationResult]:
+        """
+        Applies the mutations with one UNWIND statement per mutation type and chunk of PROXY_MUTATION_BATCH_SIZE
+        mutations, each chunk in its own transaction. When a chunk fails, all of its mutations are reported as
+        failed and the other chunks are still applied.
+
+        :param mutations:
+        :return: Result per mutation, in the order of the mutations
+        """
+        results = [None] * len(mutations)  # type: List[Optional[MutationResult]]
+
+        params_by_type = {}  # type: Dict[MutationType, List[Dict[str, Any]]]
+        for index, mutation in enumerate(mutations):
+            params_by_type.setdefault(MutationType(mutation.mutation_type), []).append({
+                'index': index,
+                'table_uri': mutation.table_uri,
+                'column_name': mutation.column_name,
+                'value': mutation.value,
+                'tag_type': mutation.tag_type,
+                'category': mutation.category,
+            })
+
+        batch_size = get_mutation_batch_size()
+        for mutation_type, params in params_by_type.items():
+            for chunk in chunks(params, batch_size):
+                try:
+                    applied = self._write_transaction(self._apply_mutation_chunk, mutation_type, chunk)
+                except Exception as e:
+                    LOGGER.exception(f'Failed to apply {len(chunk)} {mutation_type.value} mutations')
+                    for param in chunk:
+                        results[param['index']] = MutationResult(success=False, message=str(e))
+                    continue
+
+                self._mutations_applied(mutation_type=mutation_type, chunk=chunk, applied=applied)
+                for param in chunk:
+                    if param['index'] in applied:
+                        results[param['index']] = MutationResult(success=True)
+                    else:
+                        results[param['index']] = MutationResult(
+                            success=False, message=self._mutation_not_found_message(mutations[param['index']]))
+
+        return results  # type: ignore
+
+    @staticmethod
+    def _apply_mutation_chunk(tx: Transaction, mutation_type: MutationType,
+                              chunk: List[Dict[str, Any]]) -> Dict[int, bool]:
+        """
+        Applies a chunk of mutations of one type
+
+        :return: the indexes of the mutations that found their table, with whether the table was already tagged by
+        the tag of a tag mutation
+        """
+        return {record['index']: bool(record.get('was_tagged'))
+                for record in tx.run(_MUTATION_QUERIES[mutation_type], {'mutations': chunk})}
+
+    def _mutations_applied(self, *, mutation_type: MutationType, chunk: Sequence[Dict[str, Any]],
+                           applied: Dict[int, bool]) -> None:
+        """
+        Keeps the statistics snapshot and the tag index up to date with a chunk of mutations, as the single edit
+        methods do
+        """
+        if applied and mutation_type in _STATISTICS_MUTATION_TYPES:
+            self._statistics_changed()
+        if mutation_type == MutationType.TAG:
+            # a tag added twice to the same table in a chunk is only counted once
+            added = {(param['table_uri'], param['value'], param['tag_type']) for param in chunk
+                     if param['index'] in applied and not applied[param['index']]}
+            for _, tag, tag_type in added:
+                self._tags_changed(tag=tag, tag_type=tag_type, delta=1)
+
+    @staticmethod
+    def _mutation_not_found_message(mutation: Mutation) -> str:
+        if mutation.mutation_type == MutationType.COLUMN_DESCRIPTION.value:
+            return f'Column {mutation.column_name} of table {mutation.table_uri} does not exist'
+        return f'Table {mutation.table_uri} does not exist'
+
     @timer_with_counter
     def get_popular_tables(self, *,
                            num_entries: int,
@@ -1026,23 +1718,17 @@ class Neo4jProxy(BaseProxy):
         RETURN usr, usr.%s = timestamp() as created
         """ % (user_props, CREATED_EPOCH_MS, user_props, CREATED_EPOCH_MS))
 
-        try:
-            tx = self._driver.session().begin_transaction()
-            result = tx.run(create_update_user_query, user_data)
-
-            user_result = result.single()
+        def create_update_user(tx: Transaction) -> Any:
+            user_result = tx.run(create_update_user_query, user_data).single()
             if not user_result:
                 raise RuntimeError('Failed to create user with data %s' % user_data)
-            tx.commit()
+            return user_result
 
-            new_user = self._build_user_from_record(user_result['usr'])
-            new_user_created = True if user_result['created'] is True else False
+        # exceptions propagate back to api
+        user_result = self._write_transaction(create_update_user)
 
-        except Exception as e:
-            if not tx.closed():
-                tx.rollback()
-            # propagate the exception back to api
-            raise e
+        new_user = self._build_user_from_record(user_result['usr'])
+        new_user_created = True if user_result['created'] is True else False
 
         return new_user, new_user_created
 
@@ -1136,13 +1822,16 @@ class Neo4jProxy(BaseProxy):
         return relation
 
     @timer_with_counter
-    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) \
-            -> Dict[str, List[DashboardSummary]]:
+    def get_dashboard_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                       limit: Optional[int] = None, cursor: Optional[str] = None) \
+            -> Dict[str, Any]:
         """
         Retrieve all follow the Dashboard per user based on the relation.
 
         :param user_email: the email of the user
         :param relation_type: the relation between the user and the resource
+        :param limit: the maximum number of dashboards returned, ordered by dashboard key
+        :param cursor: the key of the last dashboard of the previous page
         :return:
         """
         rel_clause: str = self._get_user_resource_relationship_clause(relation_type=relation_type,
@@ -1155,8 +1844,13 @@ class Neo4jProxy(BaseProxy):
         # https://github.com/amundsen-io/amundsendatabuilder/blob/master/databuilder/models/dashboard/dashboard_execution.py#L18
         # https://github.com/amundsen-io/amundsendatabuilder/blob/master/databuilder/models/dashboard/dashboard_execution.py#L24
 
+        where_clause, page_clause, param_dict = self._get_user_resource_page_clauses(limit=limit, cursor=cursor)
+        param_dict['user_key'] = user_email
+
         query = textwrap.dedent(f"""
         MATCH {rel_clause}<-[:DASHBOARD]-(dg:Dashboardgroup)<-[:DASHBOARD_GROUP]-(clstr:Cluster)
+        {where_clause}
+        WITH clstr, dg, resource {page_clause}
         OPTIONAL MATCH (resource)-[:DESCRIPTION]->(dscrpt:Description)
         OPTIONAL MATCH (resource)-[:EXECUTED]->(last_exec:Execution)
         WHERE split(last_exec.key, '/')[5] = '_last_successful_execution'
@@ -1165,9 +1859,9 @@ class Neo4jProxy(BaseProxy):
         split(resource.key, '_')[0] as product,
         dscrpt.description as description, last_exec.timestamp as last_successful_run_timestamp""")
 
-        records = self._execute_cypher_query(statement=query, param_dict={'user_key': user_email})
+        records = self._execute_cypher_query(statement=query, param_dict=param_dict)
 
-        if not records:
+        if not records and cursor is None:
             raise NotFoundException('User {user_id} does not {relation} on {resource_type} resources'.format(
                 user_id=user_email,
                 relation=relation_type,
@@ -1187,16 +1881,25 @@ class Neo4jProxy(BaseProxy):
                 last_successful_run_timestamp=record['last_successful_run_timestamp'],
             ))
 
-        return {ResourceType.Dashboard.name.lower(): results}
+        if limit is None and cursor is None:
+            return {ResourceType.Dashboard.name.lower(): results}
+
+        next_cursor = None
+        if limit is not None and len(results) > limit:
+            results = results[:limit]
+            next_cursor = results[-1].uri
+        return {ResourceType.Dashboard.name.lower(): results, 'next_cursor': next_cursor}
 
     @timer_with_counter
-    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel) \
-            -> Dict[str, List[PopularTable]]:
+    def get_table_by_user_relation(self, *, user_email: str, relation_type: UserResourceRel,
+                                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrive all follow the Table per user based on the relation.
 
         :param user_email: the email of the user
         :param relation_type: the relation between the user and the resource
+        :param limit: the maximum number of tables returned, ordered by table key
+        :param cursor: the key of the last table of the previous page
         :return:
         """
         rel_clause: str = self._get_user_resource_relationship_clause(relation_type=relation_type,
@@ -1204,26 +1907,62 @@ class Neo4jProxy(BaseProxy):
                                                                       resource_type=ResourceType.Table,
                                                                       user_key=user_email)
 
+        where_clause, page_clause, param_dict = self._get_user_resource_page_clauses(limit=limit, cursor=cursor)
+        param_dict['user_key'] = user_email
+
         query = textwrap.dedent(f"""
             MATCH {rel_clause}<-[:TABLE]-(schema:Schema)<-[:SCHEMA]-(clstr:Cluster)<-[:CLUSTER]-(db:Database)
-            WITH db, clstr, schema, resource
+            {where_clause}
+            WITH db, clstr, schema, resource {page_clause}
             OPTIONAL MATCH (resource)-[:DESCRIPTION]->(tbl_dscrpt:Description)
             RETURN db, clstr, schema, resource, tbl_dscrpt""")
 
-        table_records = self._execute_cypher_query(statement=query, param_dict={'user_key': user_email})
+        table_records = self._execute_cypher_query(statement=query, param_dict=param_dict)
 
-        if not table_records:
+        if not table_records and cursor is None:
             raise NotFoundException('User {user_id} does not {relation} any resources'.format(user_id=user_email,
                                                                                               relation=relation_type))
         results = []
+        table_keys = []
         for record in table_records:
+            table_keys.append(record['resource'].get('key'))
             results.append(PopularTable(
                 database=record['db']['name'],
                 cluster=record['clstr']['name'],
                 schema=record['schema']['name'],
                 name=record['resource']['name'],
                 description=self._safe_get(record, 'tbl_dscrpt', 'description')))
-        return {ResourceType.Table.name.lower(): results}
+
+        if limit is None and cursor is None:
+            return {ResourceType.Table.name.lower(): results}
+
+        next_cursor = None
+        if limit is not None and len(results) > limit:
+            results = results[:limit]
+            next_cursor = table_keys[limit - 1]
+        return {ResourceType.Table.name.lower(): results, 'next_cursor': next_cursor}
+
+    @staticmethod
+    def _get_user_resource_page_clauses(*, limit: Optional[int],
+                                        cursor: Optional[str]) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Returns the WHERE clause and the ORDER BY / LIMIT suffix of a WITH clause that page the resource
+        of a user relation by its key. One row more than the limit is fetched to tell whether there is a next page.
+        Both clauses are empty when neither limit nor cursor is given.
+        """
+        where_clause = ''
+        page_clause = ''
+        param_dict: Dict[str, Any] = {}
+
+        if cursor is not None:
+            where_clause = 'WHERE resource.key > $cursor'
+            param_dict['cursor'] = cursor
+        if limit is not None or cursor is not None:
+            page_clause = 'ORDER BY resource.key'
+        if limit is not None:
+            page_clause += ' LIMIT $limit'
+            param_dict['limit'] = limit + 1
+        return where_clause, page_clause, param_dict
 
     @timer_with_counter
     def get_frequently_used_tables(self, *, user_email: str) -> Dict[str, Any]:
@@ -1290,8 +2029,7 @@ class Neo4jProxy(BaseProxy):
         """.format(resource_type=resource_type.name,
                    rel_clause=rel_clause))
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def add_resource_relation_by_user(tx: Transaction) -> None:
             # upsert the node
             tx.run(upsert_user_query, {'user_email': user_id})
             result = tx.run(upsert_user_relation_query, {'user_key': user_id, 'resource_key': id})
@@ -1300,12 +2038,9 @@ class Neo4jProxy(BaseProxy):
                 raise RuntimeError('Failed to create relation between '
                                    'user {user} and resource {id}'.format(user=user_id,
                                                                           id=id))
-            tx.commit()
-        except Exception as e:
-            if not tx.closed():
-                tx.rollback()
-            # propagate the exception back to api
-            raise e
+
+        # exceptions propagate back to api
+        self._write_transaction(add_resource_relation_by_user)
 
     @timer_with_counter
     def delete_resource_relation_by_user(self, *,
@@ -1332,15 +2067,11 @@ class Neo4jProxy(BaseProxy):
                 DELETE r1, r2
                 """.format(rel_clause=rel_clause))
 
-        try:
-            tx = self._driver.session().begin_transaction()
+        def delete_resource_relation_by_user(tx: Transaction) -> None:
             tx.run(delete_query, {'user_key': user_id, 'resource_key': id})
-            tx.commit()
-        except Exception as e:
-            # propagate the exception back to api
-            if not tx.closed():
-                tx.rollback()
-            raise e
+
+        # exceptions propagate back to api
+        self._write_transaction(delete_resource_relation_by_user)
 
     @timer_with_counter
     def get_dashboard(self,
@@ -1442,6 +2173,34 @@ class Neo4jProxy(BaseProxy):
                                      tables=tables
                                      )
 
+    def iter_dashboards(self, *, page_size: int) -> Iterator[DashboardSummary]:
+        """
+        Iterates over the summaries of all dashboards in key order.
+
+        :param page_size: Number of dashboards fetched at a time
+        :return:
+        """
+        after = ''
+        while True:
+            records = list(self._execute_cypher_query(statement=_DASHBOARDS_PAGE_QUERY,
+                                                      param_dict={'after': after, 'page_size': page_size}))
+            for record in records:
+                yield DashboardSummary(
+                    uri=record['uri'],
+                    cluster=record['cluster_name'],
+                    group_name=record['dg_name'],
+                    group_url=record['dg_url'],
+                    product=record['product'],
+                    name=record['name'],
+                    url=record['url'],
+                    description=record['description'],
+                    last_successful_run_timestamp=record['last_successful_run_timestamp'],
+                )
+
+            if len(records) < page_size:
+                return
+            after = records[-1]['uri']
+
     @timer_with_counter
     def get_dashboard_description(self, *,
                                   id: str) -> Description:
@@ -1517,106 +2276,139 @@ class Neo4jProxy(BaseProxy):
         """
         Retrieves the lineage information for the specified resource type.
 
+        Lineage is expanded level by level, with one query per level and direction, or from the lineage index
+        when config.LINEAGE_INDEX_ENABLED and it was loaded, so an entity reachable through many paths is only
+        visited once. The depth is capped to config.LINEAGE_MAX_DEPTH and at most
+        config.LINEAGE_MAX_NODES entities are returned per direction, the result is flagged as truncated
+        when entities were left out because of either limit.
+
         :param id: key of a table or a column
         :param resource_type: Type of the entity for which lineage is being retrieved
         :param direction: Whether to get the upstream/downstream or both directions
         :param depth: depth or level of lineage information
         :return: The Lineage object with upstream & downstream lineage items
         """
+        max_depth, max_nodes = get_lineage_limits()
+        capped_depth = min(depth, max_depth)
+
+        lineage_index = self._lineage_indexes.get(resource_type)
+        if lineage_index is not None and lineage_index.is_built:
+            return self._get_indexed_lineage(lineage_index, id=id, resource_type=resource_type, direction=direction,
+                                             depth=capped_depth, max_nodes=max_nodes, depth_capped=depth > max_depth)
+
+        upstream_tables = []  # type: List[LineageItem]
+        downstream_tables = []  # type: List[LineageItem]
+        truncated = []  # type: List[bool]
+        if direction != 'downstream':
+            upstream_tables, upstream_truncated = self._traverse_lineage(
+                id=id, resource_type=resource_type, relation='HAS_UPSTREAM', depth=capped_depth,
+                max_nodes=max_nodes, depth_capped=depth > max_depth)
+            truncated.append(upstream_truncated)
+        if direction != 'upstream':
+            downstream_tables, downstream_truncated = self._traverse_lineage(
+                id=id, resource_type=resource_type, relation='HAS_DOWNSTREAM', depth=capped_depth,
+                max_nodes=max_nodes, depth_capped=depth > max_depth)
+            truncated.append(downstream_truncated)
+
+        return BoundedLineage(key=id,
+                              upstream_entities=upstream_tables,
+                              downstream_entities=downstream_tables,
+                              direction=direction, depth=capped_depth,
+                              truncated=any(truncated))
+
+    def _traverse_lineage(self, *, id: str, resource_type: ResourceType, relation: str, depth: int,
+                          max_nodes: int, depth_capped: bool) -> Tuple[List[LineageItem], bool]:
+        """
+        Breadth first expansion of the lineage of one direction.
+        :param relation: HAS_UPSTREAM or HAS_DOWNSTREAM
+        :param depth_capped: whether the requested depth was cut to the maximum depth
+        :return: the lineage items, and whether the expansion stopped before reaching every entity
+        """
+        lineage_level_query = _LINEAGE_LEVEL_QUERY.format(resource=resource_type.name, relation=relation)
+
+        items = []  # type: List[LineageItem]
+        visited = {id}
+        frontier = [id]
+        for level in range(1, depth + 1):
+            remaining = max_nodes - len(items)
+            # one more than the remaining entities tells whether the level had to be cut
+            records = list(self._execute_cypher_query(statement=lineage_level_query,
+                                                      param_dict={'frontier': frontier,
+                                                                  'visited': list(visited),
+                                                                  'limit': remaining + 1}))
+            frontier = [record['key'] for record in records[:remaining]]
+            visited.update(frontier)
+            items.extend(LineageItem(**{"key": record["key"],
+                                        "source": record["source"],
+                                        "level": level,
+                                        "badges": self._make_badges(record["badges"]),
+                                        "usage": record.get("usage") or 0})
+                         for record in records[:remaining])
+            if len(records) > remaining:
+                return items, True
+            if not frontier:
+                return items, False
+
+        # the entities of the last level may have lineage beyond the maximum depth
+        return items, depth_capped
+
+    def _get_indexed_lineage(self, lineage_index: LineageIndex, *, id: str, resource_type: ResourceType,
+                             direction: str, depth: int, max_nodes: int, depth_capped: bool) -> Lineage:
+        """
+        Expands the lineage from the lineage index, and fetches the badges and usage of all the entities of both
+        directions in one query. Entities which were removed from the graph since the index was built are left out.
+        """
+        levels = {}  # type: Dict[str, List[List[str]]]
+        truncated = []  # type: List[bool]
+        for lineage_direction in ('upstream', 'downstream'):
+            if direction in (lineage_direction, 'both'):
+                levels[lineage_direction], cut = lineage_index.traverse(
+                    id, upstream=lineage_direction == 'upstream', depth=depth, max_nodes=max_nodes)
+                # the entities of the last level may have lineage beyond the maximum depth
+                truncated.append(cut or (depth_capped and len(levels[lineage_direction]) == depth))
+
+        keys = list({key for direction_levels in levels.values() for level in direction_levels for key in level})
+        records = self._execute_cypher_query(statement=_LINEAGE_ENTITIES_QUERY.format(resource=resource_type.name),
+                                             param_dict={'keys': keys})
+        entities = {record['key']: record for record in records}
+
+        def lineage_items(lineage_direction: str) -> List[LineageItem]:
+            return [LineageItem(**{"key": key,
+                                   "source": entities[key]["source"],
+                                   "level": level,
+                                   "badges": self._make_badges(entities[key]["badges"]),
+                                   "usage": entities[key].get("usage") or 0})
+                    for level, level_keys in enumerate(levels.get(lineage_direction, []), start=1)
+                    for key in level_keys if key in entities]
+
+        return BoundedLineage(key=id,
+                              upstream_entities=lineage_items('upstream'),
+                              downstream_entities=lineage_items('downstream'),
+                              direction=direction, depth=depth,
+                              truncated=any(truncated))
 
-        get_both_lineage_query = textwrap.dedent(u"""
-        MATCH (source:{resource} {{key: $query_key}})
-        OPTIONAL MATCH (source)-[downstream_len:HAS_DOWNSTREAM*..{depth}]->(downstream_entity:{resource})
-        OPTIONAL MATCH (source)-[upstream_len:HAS_UPSTREAM*..{depth}]->(upstream_entity:{resource})
-        WITH downstream_entity, upstream_entity, downstream_len, upstream_len
-        OPTIONAL MATCH (upstream_entity)-[:HAS_BADGE]->(upstream_badge:Badge)
-        OPTIONAL MATCH (downstream_entity)-[:HAS_BADGE]->(downstream_badge:Badge)
-        WITH CASE WHEN downstream_badge IS NULL THEN []
-        ELSE collect(distinct {{key:downstream_badge.key,category:downstream_badge.category}})
-        END AS downstream_badges, CASE WHEN upstream_badge IS NULL THEN []
-        ELSE collect(distinct {{key:upstream_badge.key,category:upstream_badge.category}})
-        END AS upstream_badges, upstream_entity, downstream_entity, upstream_len, downstream_len
-        OPTIONAL MATCH (downstream_entity:{resource})-[downstream_read:READ_BY]->(:User)
-        WITH upstream_entity, downstream_entity, upstream_len, downstream_len,
-        downstream_badges, upstream_badges, sum(downstream_read.read_count) as downstream_read_count
-        OPTIONAL MATCH (upstream_entity:{resource})-[upstream_read:READ_BY]->(:User)
-        WITH upstream_entity, downstream_entity, upstream_len, downstream_len,
-        downstream_badges, upstream_badges, downstream_read_count,
-        sum(upstream_read.read_count) as upstream_read_count
-        WITH CASE WHEN upstream_len IS NULL THEN []
-        ELSE COLLECT(distinct{{level:SIZE(upstream_len), source:split(upstream_entity.key,'://')[0],
-        key:upstream_entity.key, badges:upstream_badges, usage:upstream_read_count}})
-        END AS upstream_entities, CASE WHEN downstream_len IS NULL THEN []
-        ELSE COLLECT(distinct{{level:SIZE(downstream_len), source:split(downstream_entity.key,'://')[0],
-        key:downstream_entity.key, badges:downstream_badges, usage:downstream_read_count}})
-        END AS downstream_entities RETURN downstream_entities, upstream_entities
-        """).format(depth=depth, resource=resource_type.name)
-
-        get_upstream_lineage_query = textwrap.dedent(u"""
-        MATCH (source:{resource} {{key: $query_key}})
-        OPTIONAL MATCH (source)-[upstream_len:HAS_UPSTREAM*..{depth}]->(upstream_entity:{resource})
-        WITH upstream_entity, upstream_len
-        OPTIONAL MATCH (upstream_entity)-[:HAS_BADGE]->(upstream_badge:Badge)
-        WITH CASE WHEN upstream_badge IS NULL THEN []
-        ELSE collect(distinct {{key:upstream_badge.key,category:upstream_badge.category}})
-        END AS upstream_badges, upstream_entity, upstream_len
-        OPTIONAL MATCH (upstream_entity:{resource})-[upstream_read:READ_BY]->(:User)
-        WITH upstream_entity, upstream_len, upstream_badges,
-        sum(upstream_read.read_count) as upstream_read_count
-        WITH CASE WHEN upstream_len IS NULL THEN []
-        ELSE COLLECT(distinct{{level:SIZE(upstream_len), source:split(upstream_entity.key,'://')[0],
-        key:upstream_entity.key, badges:upstream_badges, usage:upstream_read_count}})
-        END AS upstream_entities RETURN upstream_entities
-        """).format(depth=depth, resource=resource_type.name)
-
-        get_downstream_lineage_query = textwrap.dedent(u"""
-        MATCH (source:{resource} {{key: $query_key}})
-        OPTIONAL MATCH (source)-[downstream_len:HAS_DOWNSTREAM*..{depth}]->(downstream_entity:{resource})
-        WITH downstream_entity, downstream_len
-        OPTIONAL MATCH (downstream_entity)-[:HAS_BADGE]->(downstream_badge:Badge)
-        WITH CASE WHEN downstream_badge IS NULL THEN []
-        ELSE collect(distinct {{key:downstream_badge.key,category:downstream_badge.category}})
-        END AS downstream_badges, downstream_entity, downstream_len
-        OPTIONAL MATCH (downstream_entity:{resource})-[downstream_read:READ_BY]->(:User)
-        WITH downstream_entity, downstream_len, downstream_badges,
-        sum(downstream_read.read_count) as downstream_read_count
-        WITH CASE WHEN downstream_len IS NULL THEN []
-        ELSE COLLECT(distinct{{level:SIZE(downstream_len), source:split(downstream_entity.key,'://')[0],
-        key:downstream_entity.key, badges:downstream_badges, usage:downstream_read_count}})
-        END AS downstream_entities RETURN downstream_entities
-        """).format(depth=depth, resource=resource_type.name)
-
-        if direction == 'upstream':
-            lineage_query = get_upstream_lineage_query
-
-        elif direction == 'downstream':
-            lineage_query = get_downstream_lineage_query
+    @timer_with_counter
+    def refresh_lineage_index(self) -> None:
+        """
+        Loads the lineage indexes from every HAS_UPSTREAM and HAS_DOWNSTREAM relationship, unless they were already
+        loaded and the graph was not published to since then according to get_latest_updated_ts. Relationships
+        carry no timestamp and removed ones leave no trace, hence changes are picked up by reloading the indexes.
+        """
+        latest_updated_ts = self.get_latest_updated_ts()
+        if latest_updated_ts == self._lineage_index_updated_ts and \
+                all(lineage_index.is_built for lineage_index in self._lineage_indexes.values()):
+            return
 
-        else:
-            lineage_query = get_both_lineage_query
+        for resource_type, lineage_index in self._lineage_indexes.items():
+            LOGGER.info(f'Querying lineage of all {resource_type.name} entities for lineage index')
+            lineage_index.rebuild(upstream_edges=self._get_lineage_edges(resource_type, 'HAS_UPSTREAM'),
+                                  downstream_edges=self._get_lineage_edges(resource_type, 'HAS_DOWNSTREAM'))
+        self._lineage_index_updated_ts = latest_updated_ts
 
-        records = self._execute_cypher_query(statement=lineage_query,
-                                             param_dict={'query_key': id})
-        result = records.single()
-
-        downstream_tables = []
-        upstream_tables = []
-
-        for downstream in result.get("downstream_entities") or []:
-            downstream_tables.append(LineageItem(**{"key": downstream["key"],
-                                                    "source": downstream["source"],
-                                                    "level": downstream["level"],
-                                                    "badges": self._make_badges(downstream["badges"]),
-                                                    "usage": downstream.get("usage", 0)}))
-
-        for upstream in result.get("upstream_entities") or []:
-            upstream_tables.append(LineageItem(**{"key": upstream["key"],
-                                                  "source": upstream["source"],
-                                                  "level": upstream["level"],
-                                                  "badges": self._make_badges(upstream["badges"]),
-                                                  "usage": upstream.get("usage", 0)}))
-
-        return Lineage(**{"key": id,
-                          "upstream_entities": upstream_tables,
-                          "downstream_entities": downstream_tables,
-                          "direction": direction, "depth": depth})
+    def _get_lineage_edges(self, resource_type: ResourceType, relation: str) -> Iterator[Tuple[str, str]]:
+        query = textwrap.dedent("""
+        MATCH (source:{resource})-[:{relation}]->(target:{resource})
+        RETURN source.key AS source_key, target.key AS target_key
+        """).format(resource=resource_type.name, relation=relation)
+        records = self._execute_cypher_query(statement=query, param_dict={})
+        return ((record['source_key'], record['target_key']) for record in records)
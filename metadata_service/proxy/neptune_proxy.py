@@ -253,6 +253,10 @@ class NeptuneGremlinProxy(AbstractGremlinProxy):
                           headers=dict(Host=host))
         return response.content.decode('utf-8')
 
+    @overrides
+    def _profile_query(self, query: str) -> Optional[Any]:
+        return self._profile(query)
+
     @overrides
     def drop(self) -> None:
         test_shard = get_shard()
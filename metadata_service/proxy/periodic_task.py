@@ -0,0 +1,56 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from threading import Event, Thread
+from typing import Any, Callable, Optional  # noqa: F401
+
+from flask import Flask
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Calls func every interval_sec on a daemon thread, inside the application context of app, so background jobs
+    can use the same config and statsd setup as the request path. Exceptions are logged and the task keeps running.
+    """
+
+    def __init__(self, *,
+                 name: str,
+                 func: Callable[[], Any],
+                 interval_sec: float,
+                 app: Flask,
+                 run_immediately: bool = False) -> None:
+        self.name = name
+        self._func = func
+        self._interval_sec = interval_sec
+        self._app = app
+        self._run_immediately = run_immediately
+        self._stopped = Event()
+        self._thread = None  # type: Optional[Thread]
+
+    def start(self) -> 'PeriodicTask':
+        if self._thread is None:
+            LOGGER.info(f'Starting periodic task {self.name} every {self._interval_sec} seconds')
+            self._thread = Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout_sec: Optional[float] = None) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout_sec)
+
+    def run_once(self) -> None:
+        with self._app.app_context():
+            try:
+                self._func()
+            except Exception:
+                LOGGER.exception(f'Periodic task {self.name} failed')
+
+    def _run(self) -> None:
+        if self._run_immediately:
+            self.run_once()
+        while not self._stopped.wait(self._interval_sec):
+            self.run_once()
@@ -0,0 +1,76 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+import logging
+import math
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple  # noqa: F401
+
+LOGGER = logging.getLogger(__name__)
+
+
+def popularity_score(readers: int, total_reads: int) -> float:
+    """
+    Same formula as the popular tables Cypher query: number of distinct readers * log(total number of reads).
+    Like Cypher's log, log(0) is negative infinity.
+    """
+    if total_reads <= 0:
+        return -math.inf
+    return readers * math.log(total_reads)
+
+
+class PopularityIndex:
+    """
+    In memory index of the number of distinct readers and total reads per table, so the global popular tables become
+    a top K lookup instead of an aggregation over every READ_BY relationship.
+    It is built once from the graph with rebuild() and then kept up to date with apply() as usage is written.
+    """
+
+    def __init__(self) -> None:
+        # table key -> [distinct readers, total reads]
+        self._tables = {}  # type: Dict[str, List[int]]
+        self._lock = Lock()
+        self.is_built = False
+
+    def rebuild(self, rows: Iterable[Tuple[str, int, int]]) -> None:
+        """
+        :param rows: (table key, distinct readers, total reads) per table
+        """
+        tables = {table_key: [readers, total_reads] for table_key, readers, total_reads in rows}
+        with self._lock:
+            self._tables = tables
+            self.is_built = True
+        LOGGER.info(f'Built popularity index of {len(tables)} tables')
+
+    def apply(self, *, table_key: str, new_reader: bool, read_count: int) -> None:
+        """
+        Applies the usage of one user on one table.
+        :param new_reader: whether the user did not read the table before
+        :param read_count: number of reads added to the total
+        """
+        with self._lock:
+            stats = self._tables.setdefault(table_key, [0, 0])
+            if new_reader:
+                stats[0] += 1
+            stats[1] += read_count
+
+    def score(self, table_key: str) -> float:
+        with self._lock:
+            readers, total_reads = self._tables.get(table_key, (0, 0))
+        return popularity_score(readers, total_reads)
+
+    def top(self, *, num_entries: int, min_readers: int) -> List[str]:
+        """
+        :return: keys of the num_entries tables with the highest score that have at least min_readers readers,
+        highest score first. Ties are broken by table key.
+        """
+        with self._lock:
+            candidates = [(popularity_score(readers, total_reads), table_key)
+                          for table_key, (readers, total_reads) in self._tables.items()
+                          if readers >= min_readers]
+        top = heapq.nsmallest(num_entries, candidates, key=lambda candidate: (-candidate[0], candidate[1]))
+        return [table_key for _, table_key in top]
+
+    def __len__(self) -> int:
+        return len(self._tables)
@@ -0,0 +1,116 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import logging
+import re
+from typing import Any, Mapping, Optional
+
+from flask import current_app, has_app_context
+
+from metadata_service import config
+from metadata_service.proxy.statsd_utilities import count, incr, timing
+
+LOGGER = logging.getLogger(__name__)
+
+# string and number literals, and uuids such as Atlas guids
+_LITERALS = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|"""
+                       r"""\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b|"""
+                       r"""\b\d+(?:\.\d+)?\b""")
+# the ? of consecutive literals, e.g. of within() or of a list
+_PLACEHOLDER_RUNS = re.compile(r'\?(?:\s*,\s*\?)+')
+_WHITESPACE = re.compile(r'\s+')
+
+REDACTED = '<redacted>'
+
+
+def normalize_query(query: str) -> str:
+    """
+    :return: the query with its literals replaced by ?, and runs of them by ?+, so that the runs of a statement
+    with different values, or with a different number of them in a list, share it
+
+    >>> normalize_query("g.V('test_user:Table:x').limit(10)")
+    'g.V(?).limit(?)'
+    >>> normalize_query("g.V('a', 'b').has('key', within('c', 'd', 'e'))")
+    'g.V(?+).has(?, within(?+))'
+    >>> normalize_query('MATCH (t:Table {key: $tbl_key})\\n  RETURN t')
+    'MATCH (t:Table {key: $tbl_key}) RETURN t'
+    """
+    return _WHITESPACE.sub(' ', _PLACEHOLDER_RUNS.sub('?+', _LITERALS.sub('?', query))).strip()
+
+
+def query_fingerprint(query: str) -> str:
+    """
+    :return: a short id of the normalized query, to name its metrics
+    """
+    return hashlib.sha1(normalize_query(query).encode('utf-8')).hexdigest()[:12]
+
+
+def redact_params(params: Any, *, redacted: Optional[str]) -> Any:
+    """
+    :param redacted: regular expression of the names of the parameters to redact, at any depth
+    :return: the params with the values of the redacted parameters replaced
+
+    >>> redact_params({'user_email': 'a@b.c', 'deltas': [{'user_key': 'a', 'count': 1}]}, redacted='email|user')
+    {'user_email': '<redacted>', 'deltas': [{'user_key': '<redacted>', 'count': 1}]}
+    """
+    if not redacted:
+        return params
+    if isinstance(params, Mapping):
+        return {name: REDACTED if re.search(redacted, str(name), re.IGNORECASE)
+                else redact_params(value, redacted=redacted) for name, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [redact_params(value, redacted=redacted) for value in params]
+    return params
+
+
+def count_records(result: Any) -> Optional[int]:
+    """
+    :return: the number of records of a query result that is a collection of them, None for other results
+    """
+    return len(result) if isinstance(result, (list, set, tuple)) else None
+
+
+def record_query(*, backend: str, query: str, params: Optional[Mapping[str, Any]] = None,
+                 execute_ms: float, consume_ms: Optional[float] = None, records: Optional[int] = None,
+                 success: bool = True) -> None:
+    """
+    Emits the metrics of one backend query, under the same names for every backend, and logs it when it is slower
+    than config.SLOW_QUERY_THRESHOLD_MS.
+
+    The metrics of a query are emitted twice, for its fingerprint and for all the queries of the backend:
+      - metadata_service.proxy.query_metrics.<backend>.<fingerprint or all>.execute.timer: time to run the query
+      - ...consume.timer: time to fetch or read its results, when it is measured apart
+      - ...records.count: number of records returned, when known, added up. Divided by the success and fail
+        counts, it is the mean number of records per query, and the Prometheus histogram has their distribution
+      - ...success.count / ...fail.count
+
+    :param backend: e.g. neo4j, gremlin or atlas
+    :param query: the statement, traversal or call, which is normalized
+    :param params: parameters of the query, logged with the ones matching config.SLOW_QUERY_REDACTED_PARAMS
+    redacted
+    """
+    prefix = f'{__name__}.{backend}'
+    normalized = normalize_query(query)
+    fingerprint = query_fingerprint(normalized)
+    for name in (fingerprint, 'all'):
+        timing(prefix=prefix, name=f'{name}.execute', ms=execute_ms)
+        if consume_ms is not None:
+            timing(prefix=prefix, name=f'{name}.consume', ms=consume_ms)
+        if records is not None:
+            count(prefix=prefix, name=f'{name}.records', value=records)
+        incr(prefix=prefix, name=f'{name}.success' if success else f'{name}.fail')
+
+    elapsed_ms = execute_ms + (consume_ms or 0)
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(f'{backend} query {fingerprint} ran in {execute_ms:.1f} ms, consumed in {consume_ms} ms, '
+                     f'{records} records')
+
+    if not has_app_context():
+        return
+    threshold_ms = current_app.config.get(config.SLOW_QUERY_THRESHOLD_MS)
+    if threshold_ms and elapsed_ms >= threshold_ms:
+        redacted_params = redact_params(params, redacted=current_app.config.get(config.SLOW_QUERY_REDACTED_PARAMS))
+        LOGGER.warning(f'Slow {backend} query {fingerprint} took {elapsed_ms:.1f} ms '
+                       f'(execute {execute_ms:.1f} ms, consume {consume_ms} ms), {records} records, '
+                       f'{"succeeded" if success else "failed"}: {normalized} with params {redacted_params}')
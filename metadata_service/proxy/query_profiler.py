@@ -0,0 +1,73 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Iterator, List, Optional  # noqa: F401
+
+import attr
+from flask import g, has_app_context
+
+# the attribute of g with the active profiler, which run_concurrently copies into the sub queries
+_QUERY_PROFILER_ATTRIBUTE = 'query_profiler'
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class ProfiledQuery:
+    """
+    A backend query run while profiling, with the profile of the backend when it has one: the plan with the db hits
+    of its operators (Neo4j PROFILE) or the profile report (Neptune /gremlin/profile)
+    """
+    query: str
+    elapsed_ms: float
+    db_hits: Optional[int] = None
+    server_ms: Optional[float] = None
+    plan: Any = None
+
+
+class QueryProfiler:
+    """
+    Collects the backend queries of a proxy operation. The proxies run their queries with backend profiling on, and
+    report them, while a profiler is active in the current application context, see profiling().
+    """
+
+    def __init__(self) -> None:
+        self._queries = []  # type: List[ProfiledQuery]
+        # sub queries may report from other threads, see run_concurrently
+        self._lock = Lock()
+
+    def add(self, query: ProfiledQuery) -> None:
+        with self._lock:
+            self._queries.append(query)
+
+    @property
+    def queries(self) -> List[ProfiledQuery]:
+        with self._lock:
+            return list(self._queries)
+
+
+def get_query_profiler() -> Optional[QueryProfiler]:
+    """
+    :return: the profiler the proxies report their queries to, None when not profiling
+    """
+    if not has_app_context():
+        return None
+    return g.get(_QUERY_PROFILER_ATTRIBUTE)
+
+
+@contextmanager
+def profiling() -> Iterator[QueryProfiler]:
+    """
+    Profiles the backend queries run in the block, in the current application context and in the sub queries it
+    starts
+    """
+    profiler = QueryProfiler()
+    previous = g.get(_QUERY_PROFILER_ATTRIBUTE)
+    setattr(g, _QUERY_PROFILER_ATTRIBUTE, profiler)
+    try:
+        yield profiler
+    finally:
+        if previous is None:
+            g.pop(_QUERY_PROFILER_ATTRIBUTE, None)
+        else:
+            setattr(g, _QUERY_PROFILER_ATTRIBUTE, previous)
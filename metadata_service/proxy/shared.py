@@ -2,12 +2,27 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from random import randint
+from threading import Lock
 from time import sleep
-from typing import Callable, Optional, TypeVar
+from typing import (Any, Callable, Iterator, List, Optional, Sequence, Tuple,
+                    TypeVar)
+
+from flask import (copy_current_request_context, current_app, g,
+                   has_app_context, has_request_context)
+
+from metadata_service import config
 
 LOGGER = logging.getLogger(__name__)
 
+_SUB_QUERY_EXECUTOR = None  # type: Optional[ThreadPoolExecutor]
+_SUB_QUERY_EXECUTOR_LOCK = Lock()
+
+DEFAULT_MUTATION_BATCH_SIZE = 1000
+DEFAULT_LINEAGE_MAX_DEPTH = 5
+DEFAULT_LINEAGE_MAX_NODES = 500
+
 X = TypeVar('X')
 
 
@@ -73,3 +88,95 @@ def retrying(callable: Callable[[], CallableV], *,
                 LOGGER.warning(f'got exception {e2} while handling original exception {e}')
             raise  # the original exception
     raise RuntimeError(f'we should never get here')
+
+
+def _get_sub_query_executor() -> ThreadPoolExecutor:
+    """
+    Lazily creates the process wide executor shared by all proxies. It is bounded by
+    config.PROXY_SUB_QUERY_MAX_WORKERS so concurrent requests can't exhaust the backend connections.
+    """
+    global _SUB_QUERY_EXECUTOR
+    if _SUB_QUERY_EXECUTOR is None:
+        with _SUB_QUERY_EXECUTOR_LOCK:
+            if _SUB_QUERY_EXECUTOR is None:
+                max_workers = int(current_app.config[config.PROXY_SUB_QUERY_MAX_WORKERS])
+                LOGGER.info(f'Instantiate sub query executor with {max_workers} workers')
+                _SUB_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers,
+                                                         thread_name_prefix='proxy-sub-query')
+    return _SUB_QUERY_EXECUTOR
+
+
+def run_concurrently(*callables: Callable[[], Any]) -> List[Any]:
+    """
+    Runs independent sub queries and returns their results in the order of the callables.
+
+    When config.PROXY_CONCURRENT_SUB_QUERIES is on, the callables are submitted to a bounded executor, each
+    inside the current application context, or a copy of the current request context when there is one, with a
+    copy of the attributes of g, e.g. the Neo4j bookmark of the last write of the request or the query profiler, so
+    the overall latency is the slowest sub query instead of the sum of all of them.
+    Otherwise (or outside of an application context) they are simply called one by one.
+    The first exception, in callable order, is raised to the caller.
+
+    >>> run_concurrently(lambda: 1, lambda: 'a')
+    [1, 'a']
+    """
+    if not has_app_context() or not current_app.config.get(config.PROXY_CONCURRENT_SUB_QUERIES):
+        return [c() for c in callables]
+
+    app = current_app._get_current_object()  # type: ignore
+    g_attributes = dict(g.__dict__)
+
+    def with_g_attributes(c: Callable[[], Any]) -> Callable[[], Any]:
+        # the worker has its own g, the attributes are removed before its context is torn down, so that the
+        # teardown handlers only see the ones of the request once
+        def call() -> Any:
+            g.__dict__.update(g_attributes)
+            try:
+                return c()
+            finally:
+                for name in g_attributes:
+                    g.pop(name, None)
+        return call
+
+    def in_app_context(c: Callable[[], Any]) -> Callable[[], Any]:
+        def call() -> Any:
+            with app.app_context():
+                return c()
+        return call
+
+    # sub queries may depend on the request, e.g. on the headers read by the proxy
+    in_context = copy_current_request_context if has_request_context() else in_app_context
+
+    executor = _get_sub_query_executor()
+    futures = [executor.submit(in_context(with_g_attributes(c))) for c in callables]
+    return [future.result() for future in futures]
+
+
+def chunks(items: Sequence[X], size: int) -> Iterator[Sequence[X]]:
+    """
+    Splits the items into consecutive chunks of at most size items
+
+    >>> list(chunks([1, 2, 3], 2))
+    [[1, 2], [3]]
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def get_mutation_batch_size() -> int:
+    """
+    Number of mutations a proxy applies per transaction or traversal batch in BaseProxy.apply_mutations
+    """
+    if has_app_context():
+        return int(current_app.config.get(config.PROXY_MUTATION_BATCH_SIZE, DEFAULT_MUTATION_BATCH_SIZE))
+    return DEFAULT_MUTATION_BATCH_SIZE
+
+
+def get_lineage_limits() -> Tuple[int, int]:
+    """
+    Largest depth and number of entities per direction a proxy returns from BaseProxy.get_lineage
+    """
+    if has_app_context():
+        return (int(current_app.config.get(config.LINEAGE_MAX_DEPTH, DEFAULT_LINEAGE_MAX_DEPTH)),
+                int(current_app.config.get(config.LINEAGE_MAX_NODES, DEFAULT_LINEAGE_MAX_NODES)))
+    return DEFAULT_LINEAGE_MAX_DEPTH, DEFAULT_LINEAGE_MAX_NODES
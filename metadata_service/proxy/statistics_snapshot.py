@@ -0,0 +1,87 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Optional  # noqa: F401
+
+from flask import current_app, has_app_context
+
+from metadata_service import config
+from metadata_service.proxy.periodic_task import PeriodicTask
+
+LOGGER = logging.getLogger(__name__)
+
+STATISTICS_TIMESTAMP = 'statistics_timestamp'
+
+
+class StatisticsSnapshot:
+    """
+    Catalog statistics computed in the background and served from memory, instead of scanning the whole catalog on
+    every request. The statistics carry the epoch second at which their computation started.
+    They are computed on first use, and then recomputed by refresh() once they are older than max_age_sec or, when
+    refresh_on_write, after a write that may change them was reported with mark_stale().
+    """
+
+    def __init__(self, *,
+                 compute: Callable[[], Dict[str, Any]],
+                 max_age_sec: float,
+                 refresh_on_write: bool = False) -> None:
+        self._compute = compute
+        self._max_age_sec = max_age_sec
+        self._refresh_on_write = refresh_on_write
+        self._statistics = None  # type: Optional[Dict[str, Any]]
+        self._stale = False
+        self._lock = Lock()
+
+    def get(self) -> Dict[str, Any]:
+        if self._statistics is None:
+            with self._lock:
+                if self._statistics is None:
+                    self._recompute()
+        return self._statistics  # type: ignore
+
+    def refresh(self) -> None:
+        if self._needs_refresh():
+            with self._lock:
+                if self._needs_refresh():
+                    self._recompute()
+
+    def _needs_refresh(self) -> bool:
+        statistics = self._statistics
+        return statistics is None or self._stale or \
+            time.time() - statistics[STATISTICS_TIMESTAMP] >= self._max_age_sec
+
+    def mark_stale(self) -> None:
+        if self._refresh_on_write:
+            self._stale = True
+
+    def _recompute(self) -> None:
+        # writes during the computation may not be counted, they mark the snapshot stale again
+        self._stale = False
+        computed_at = int(time.time())
+        statistics = self._compute()
+        self._statistics = dict(statistics, **{STATISTICS_TIMESTAMP: computed_at})
+        LOGGER.info(f'Computed statistics snapshot {self._statistics}')
+
+
+def create_statistics_snapshot(compute: Callable[[], Dict[str, Any]]) -> Optional[StatisticsSnapshot]:
+    """
+    Creates the statistics snapshot of a proxy and starts refreshing it every
+    config.STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC when config.STATISTICS_SNAPSHOT_ENABLED.
+    :param compute: computes the statistics from the catalog
+    :return: the snapshot, or None when statistics are computed on every request
+    """
+    if not has_app_context() or not current_app.config.get(config.STATISTICS_SNAPSHOT_ENABLED):
+        return None
+
+    snapshot = StatisticsSnapshot(compute=compute,
+                                  max_age_sec=current_app.config[config.STATISTICS_SNAPSHOT_MAX_AGE_SEC],
+                                  refresh_on_write=current_app.config[config.STATISTICS_SNAPSHOT_REFRESH_ON_WRITE])
+    PeriodicTask(name='statistics_snapshot_refresher',
+                 func=snapshot.refresh,
+                 interval_sec=current_app.config[config.STATISTICS_SNAPSHOT_REFRESH_INTERVAL_SEC],
+                 app=current_app._get_current_object(),  # type: ignore
+                 run_immediately=True).start()
+    return snapshot
@@ -2,13 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import time
 from threading import Lock
 from typing import Any, Callable, Dict  # noqa: F401
 
 from flask import current_app, has_app_context
 from statsd import StatsClient
 
-from metadata_service import config
+from metadata_service import config, metrics
 
 LOGGER = logging.getLogger(__name__)
 __STATSD_POOL = {}  # type: Dict[str, StatsClient]
@@ -29,28 +30,81 @@ def timer_with_counter(f: Callable) -> Any:
     More information on statsd: https://statsd.readthedocs.io/en/v3.2.1/index.html
     For statsd daemon not following default settings, refer to doc above to configure environment variables
 
+    The call is recorded in the Prometheus metrics as well when config.PROMETHEUS_METRICS_ENABLED is True,
+    see metadata_service.metrics.
+
     :param f:
     :return:
     """
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         statsd_client = _get_statsd_client(prefix=f.__module__)
-        if not statsd_client:
+        if not statsd_client and not metrics.is_enabled():
             return f(*args, **kwargs)
 
-        with statsd_client.timer(f.__name__):
-            if LOGGER.isEnabledFor(logging.DEBUG):
-                LOGGER.debug('Calling function with emitting statsd metrics on prefix {}'.format(f.__name__))
-            try:
-                result = f(*args, **kwargs)
-                statsd_client.incr('{}.success'.format(f.__name__))
-                return result
-            except Exception as e:
-                statsd_client.incr('{}.fail'.format(f.__name__))
-                raise e
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Calling function with emitting statsd metrics on prefix {}'.format(f.__name__))
+        outcome = 'fail'
+        start = time.time()
+        try:
+            result = f(*args, **kwargs)
+            outcome = 'success'
+            return result
+        finally:
+            elapsed_sec = time.time() - start
+            if statsd_client:
+                statsd_client.incr('{}.{}'.format(f.__name__, outcome))
+                statsd_client.timing(f.__name__, elapsed_sec * 1000)
+            metrics.observe_call(module=f.__module__, function=f.__name__, seconds=elapsed_sec, outcome=outcome)
 
     return wrapper
 
 
+def gauge(*, prefix: str, name: str, value: float) -> None:
+    """
+    Sets the statsd gauge prefix.name, e.g. the occupancy of a pool. Like timer_with_counter, it does nothing
+    unless config.IS_STATSD_ON is True, or config.PROMETHEUS_METRICS_ENABLED for the Prometheus gauge
+    """
+    statsd_client = _get_statsd_client(prefix=prefix)
+    if statsd_client:
+        statsd_client.gauge(name, value)
+    metrics.set_gauge(prefix=prefix, name=name, value=value)
+
+
+def incr(*, prefix: str, name: str, count: int = 1) -> None:
+    """
+    Increments the statsd counter prefix.name, e.g. on a retry. It does nothing unless config.IS_STATSD_ON is True,
+    or config.PROMETHEUS_METRICS_ENABLED for the Prometheus counter
+    """
+    statsd_client = _get_statsd_client(prefix=prefix)
+    if statsd_client:
+        statsd_client.incr(name, count)
+    metrics.inc_counter(prefix=prefix, name=name, count=count)
+
+
+def count(*, prefix: str, name: str, value: int) -> None:
+    """
+    Records value, a number of items such as the records returned by a query: it is added to the statsd counter
+    prefix.name, and observed in the Prometheus histogram of counts for its distribution. It does nothing unless
+    config.IS_STATSD_ON is True, or config.PROMETHEUS_METRICS_ENABLED for the Prometheus histogram
+    """
+    statsd_client = _get_statsd_client(prefix=prefix)
+    if statsd_client:
+        statsd_client.incr(name, value)
+    metrics.observe_count(prefix=prefix, name=name, value=value)
+
+
+def timing(*, prefix: str, name: str, ms: float) -> None:
+    """
+    Records ms milliseconds in the statsd timer prefix.name, for durations that are not the duration of a
+    function call. It does nothing unless config.IS_STATSD_ON is True, or config.PROMETHEUS_METRICS_ENABLED for the
+    Prometheus histogram
+    """
+    statsd_client = _get_statsd_client(prefix=prefix)
+    if statsd_client:
+        statsd_client.timing(name, ms)
+    metrics.observe_timing(prefix=prefix, name=name, ms=ms)
+
+
 def _get_statsd_client(*, prefix: str) -> StatsClient:
     """
     Object pool method that reuse already created StatsClient based on prefix
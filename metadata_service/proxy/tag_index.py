@@ -0,0 +1,127 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import bisect
+import heapq
+import logging
+from threading import Lock
+from typing import (Callable, Dict, Iterable, List, Optional,  # noqa: F401
+                    Tuple)
+
+from flask import current_app, has_app_context
+
+from metadata_service import config
+from metadata_service.proxy.periodic_task import PeriodicTask
+
+LOGGER = logging.getLogger(__name__)
+
+
+def search_tags(tag_counts: Iterable[Tuple[str, int]], *,
+                prefix: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """
+    :param tag_counts: (tag name, number of resources) per tag
+    :return: the tags starting with prefix, all of them in the given order when there is no limit, else the limit
+    ones with the most resources first. Ties are broken by tag name.
+
+    >>> search_tags([('fin', 1), ('pii', 3), ('finance', 2)], prefix='fin')
+    [('fin', 1), ('finance', 2)]
+    >>> search_tags([('fin', 1), ('pii', 3), ('finance', 2)], limit=2)
+    [('pii', 3), ('finance', 2)]
+    """
+    if prefix:
+        tag_counts = [(name, count) for name, count in tag_counts if name.startswith(prefix)]
+    if limit is None:
+        return list(tag_counts)
+    return heapq.nsmallest(limit, tag_counts, key=lambda tag_count: (-tag_count[1], tag_count[0]))
+
+
+class TagIndex:
+    """
+    In memory index of the number of resources per tag, so the tags are listed, searched by prefix and ranked
+    without counting the resources of every tag in the backend.
+    It is loaded on first use, kept up to date with apply() as tags are added and removed through this service, and
+    reconciled with the backend by rebuild() to pick up tags written by other means.
+    """
+
+    def __init__(self, *, load: Callable[[], Iterable[Tuple[str, int]]]) -> None:
+        """
+        :param load: returns (tag name, number of resources) per tag from the backend
+        """
+        self._load = load
+        self._counts = {}  # type: Dict[str, int]
+        # tag names in order, for prefix search
+        self._names = []  # type: List[str]
+        self._lock = Lock()
+        self._rebuild_lock = Lock()
+        self.is_built = False
+
+    def rebuild(self) -> None:
+        with self._rebuild_lock:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        counts = {name: count for name, count in self._load() if count > 0}
+        names = sorted(counts)
+        with self._lock:
+            self._counts = counts
+            self._names = names
+            self.is_built = True
+        LOGGER.info(f'Built tag index of {len(counts)} tags')
+
+    def apply(self, *, tag: str, delta: int) -> None:
+        """
+        Applies resources tagged (positive delta) or untagged (negative delta) with the tag.
+        Nothing to do before the index is built, the load will include them.
+        """
+        with self._lock:
+            if not self.is_built:
+                return
+            count = self._counts.get(tag, 0) + delta
+            if count > 0:
+                if tag not in self._counts:
+                    bisect.insort(self._names, tag)
+                self._counts[tag] = count
+            elif tag in self._counts:
+                del self._counts[tag]
+                del self._names[bisect.bisect_left(self._names, tag)]
+
+    def search(self, *, prefix: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        :return: (tag name, number of resources) of the tags starting with prefix, ordered by name when there is no
+        limit, else the limit ones with the most resources first
+        """
+        if not self.is_built:
+            with self._rebuild_lock:
+                if not self.is_built:
+                    self._rebuild()
+
+        with self._lock:
+            start, end = 0, len(self._names)
+            if prefix:
+                start = bisect.bisect_left(self._names, prefix)
+                # the first name after all the names starting with prefix
+                end = bisect.bisect_left(self._names, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+            tag_counts = [(name, self._counts[name]) for name in self._names[start:end]]
+        return search_tags(tag_counts, limit=limit)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+def create_tag_index(load: Callable[[], Iterable[Tuple[str, int]]]) -> Optional[TagIndex]:
+    """
+    Creates the tag index of a proxy when config.TAG_INDEX_ENABLED, and starts rebuilding it every
+    config.TAG_INDEX_REBUILD_INTERVAL_SEC (0 disables it).
+    :param load: returns (tag name, number of resources) per tag from the backend
+    :return: the index, or None when the tags are counted in the backend on every request
+    """
+    if not has_app_context() or not current_app.config.get(config.TAG_INDEX_ENABLED):
+        return None
+
+    tag_index = TagIndex(load=load)
+    if current_app.config[config.TAG_INDEX_REBUILD_INTERVAL_SEC]:
+        PeriodicTask(name='tag_index_rebuilder',
+                     func=tag_index.rebuild,
+                     interval_sec=current_app.config[config.TAG_INDEX_REBUILD_INTERVAL_SEC],
+                     app=current_app._get_current_object()).start()  # type: ignore
+    return tag_index
@@ -25,7 +25,9 @@ setup(
     install_requires=requirements,
     extras_require={
         'oidc': ['flaskoidc==0.1.1'],
-        'atlas': ['apache-atlas==0.0.11']
+        'atlas': ['apache-atlas==0.0.11'],
+        'redis': ['redis>=3.5.0,<4.0'],
+        'gevent': ['gevent>=20.6.0']
     },
     python_requires=">=3.6",
     classifiers=[
@@ -0,0 +1,78 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares building and serializing the column statistics of a wide table one Stat at a time, as Neo4jProxy did
+before ColumnStats, with ColumnStats and dump_table. Neither flask nor neo4j are involved: the records are the
+col_stats of the column query and the serialization is the one of the table detail API.
+
+    python -m tests.benchmark.column_stats_benchmark --columns 5000 --stats 15
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List
+
+from amundsen_common.models.table import Column, Stat, Table, TableSchema
+
+from metadata_service.entity.column_stats import ColumnStats, dump_table
+
+
+def make_records(*, columns: int, stats: int) -> List[List[Dict[str, Any]]]:
+    """
+    :return: the col_stats records of every column, with the epochs as strings and floats as stored in the graph
+    """
+    return [[{'stat_type': f'stat_{s}', 'stat_val': str(c * s), 'start_epoch': '1570581861.0', 'end_epoch': 1570581862}
+             for s in range(stats)] for c in range(columns)]
+
+
+def build_stats(records: List[Dict[str, Any]]) -> List[Stat]:
+    return [Stat(stat_type=stat['stat_type'],
+                 stat_val=stat['stat_val'],
+                 start_epoch=int(float(stat['start_epoch'])),
+                 end_epoch=int(float(stat['end_epoch']))) for stat in records]
+
+
+def build_column_stats(records: List[Dict[str, Any]]) -> List[Stat]:
+    return ColumnStats.from_records(records).as_stats()
+
+
+def build_table(records: List[List[Dict[str, Any]]], build: Callable[[List[Dict[str, Any]]], List[Stat]]) -> Table:
+    return Table(database='hive', cluster='gold', schema='hogwarts', name='wizards',
+                 columns=[Column(name=f'col_{c}', col_type='string', sort_order=c, stats=build(stats))
+                          for c, stats in enumerate(records)])
+
+
+def measure(func: Callable[[], Any], *, repeat: int) -> float:
+    """
+    :return: the fastest run in ms
+    """
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--columns', type=int, default=5000)
+    parser.add_argument('--stats', type=int, default=15)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    records = make_records(columns=args.columns, stats=args.stats)
+    table = build_table(records, build_stats)
+    compact_table = build_table(records, build_column_stats)
+    if dump_table(compact_table) != TableSchema().dump(table):
+        raise AssertionError('expected the same serialization')
+
+    results = [
+        ('build, Stat per statistic', measure(lambda: build_table(records, build_stats), repeat=args.repeat)),
+        ('build, ColumnStats', measure(lambda: build_table(records, build_column_stats), repeat=args.repeat)),
+        ('serialize, TableSchema().dump', measure(lambda: TableSchema().dump(table), repeat=args.repeat)),
+        ('serialize, dump_table', measure(lambda: dump_table(compact_table), repeat=args.repeat)),
+    ]
+    print(f'{args.columns} columns with {args.stats} statistics each, fastest of {args.repeat} runs')
+    for name, ms in results:
+        print(f'{name:32} {ms:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -23,14 +23,17 @@ def pytest_addoption(parser: Parser) -> None:
 
 def pytest_configure(config: Config) -> None:
     config.addinivalue_line("markers", "roundtrip: mark test as roundtrip")
+    config.addinivalue_line("markers", "roundtrip_neptune: mark test as roundtrip against neptune")
+    config.addinivalue_line("markers", "roundtrip_janusgraph: mark test as roundtrip against janusgraph")
 
 
 def pytest_collection_modifyitems(config: Config, items: List[Item]) -> None:
     roundtrip_neptune: bool = config.getoption("--roundtrip-neptune")
     roundtrip_janusgraph: bool = config.getoption("--roundtrip-janusgraph")
     skip_roundtrip = pytest.mark.skip(reason="need the approprirate --roundtrip-[neptune|janus] option to run")
+    # the markers of a roundtrip test class apply to its subclasses too
     for item in items:
-        if "NeptuneGremlinProxyTest" in item.keywords and not roundtrip_neptune:
+        if "roundtrip_neptune" in item.keywords and not roundtrip_neptune:
             item.add_marker(skip_roundtrip)
-        if "JanusGraphGremlinProxyTest" in item.keywords and not roundtrip_janusgraph:
+        if "roundtrip_janusgraph" in item.keywords and not roundtrip_janusgraph:
             item.add_marker(skip_roundtrip)
@@ -0,0 +1,55 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+
+from amundsen_common.models.table import Column, Table
+
+from tests.unit.api.table.table_test_case import TableTestCase
+
+TABLE = Table(database='hive', cluster='gold', schema='hogwarts', name='wizards',
+              columns=[Column(name='wizard_name', col_type='String', sort_order=0)])
+
+
+class TestTableBatchAPI(TableTestCase):
+    def test_should_get_tables(self) -> None:
+        self.mock_proxy.get_tables.return_value = {'hive://gold.hogwarts/wizards': TABLE}
+
+        response = self.app.test_client().post('/tables/batch', data=json.dumps({
+            'table_uris': ['hive://gold.hogwarts/wizards', 'hive://gold.hogwarts/muggles',
+                           'hive://gold.hogwarts/wizards']
+        }))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(list(response.json['tables'].keys()), ['hive://gold.hogwarts/wizards'])
+        self.assertEqual(response.json['tables']['hive://gold.hogwarts/wizards']['name'], 'wizards')
+        self.assertEqual(response.json['not_found'], ['hive://gold.hogwarts/muggles'])
+        self.mock_proxy.get_tables.assert_called_once_with(
+            table_uris=['hive://gold.hogwarts/wizards', 'hive://gold.hogwarts/muggles'])
+
+    def test_should_fail_when_table_uris_are_invalid(self) -> None:
+        response = self.app.test_client().post('/tables/batch', data=json.dumps({'table_uris': 'wizards'}))
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_tables.assert_not_called()
+
+    def test_should_fail_when_there_are_too_many_table_uris(self) -> None:
+        self.app.config['TABLE_BATCH_MAX_SIZE'] = 2
+
+        response = self.app.test_client().post('/tables/batch', data=json.dumps({
+            'table_uris': ['hive://gold.hogwarts/wizards', 'hive://gold.hogwarts/muggles',
+                           'hive://gold.hogwarts/giants']
+        }))
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_tables.assert_not_called()
+
+        # duplicates are counted once
+        self.mock_proxy.get_tables.return_value = {}
+        response = self.app.test_client().post('/tables/batch', data=json.dumps({
+            'table_uris': ['hive://gold.hogwarts/wizards', 'hive://gold.hogwarts/muggles',
+                           'hive://gold.hogwarts/wizards']
+        }))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -4,7 +4,10 @@
 from http import HTTPStatus
 
 import pytest
+from amundsen_common.models.table import Column, Stat, Table, TableSchema
 
+from metadata_service.entity.column_stats import ColumnStats
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.exception import NotFoundException
 from tests.unit.api.table.table_test_case import TableTestCase
 
@@ -73,7 +76,77 @@ class TestTableDetailAPI(TableTestCase):
         response = self.app.test_client().get(f'/table/{TABLE_URI}')
         self.assertEqual(response.json, API_RESPONSE)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.mock_proxy.get_table.assert_called_with(table_uri=TABLE_URI)
+        self.mock_proxy.get_table.assert_called_with(table_uri=TABLE_URI, projection=TableProjection())
+
+    def test_should_get_compact_column_stats(self) -> None:
+        stats = [Stat(stat_type='requests', stat_val='10', start_epoch=1570581861, end_epoch=1570581861),
+                 Stat(stat_type='nulls', stat_val=None, start_epoch=1570581861, end_epoch=1570581862)]
+        columns = [Column(name='wizard_name', col_type='String', sort_order=0, stats=stats),
+                   Column(name='house', col_type='String', sort_order=1)]
+        table = Table(database='postgres', cluster='postgres', schema='hogwarts', name='wizards', columns=columns)
+        compact_stats = ColumnStats.from_records([{'stat_type': 'requests', 'stat_val': '10',
+                                                   'start_epoch': '1570581861.0', 'end_epoch': 1570581861},
+                                                  {'stat_type': 'nulls', 'stat_val': None,
+                                                   'start_epoch': 1570581861, 'end_epoch': '1570581862'}])
+        self.assertEqual(compact_stats, stats)
+        self.assertEqual(compact_stats[1], stats[1])
+        self.assertEqual(repr(compact_stats), repr(stats))
+        self.mock_proxy.get_table.return_value = Table(database='postgres', cluster='postgres', schema='hogwarts',
+                                                       name='wizards',
+                                                       columns=[Column(name='wizard_name', col_type='String',
+                                                                       sort_order=0,
+                                                                       stats=compact_stats.as_stats()),
+                                                                Column(name='house', col_type='String',
+                                                                       sort_order=1)])
+
+        response = self.app.test_client().get(f'/table/{TABLE_URI}')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json, TableSchema().dump(table))
+        # the cached table is left as is
+        self.assertIs(self.mock_proxy.get_table.return_value.columns[0].stats, compact_stats)
+
+    def test_should_get_projected_table(self) -> None:
+        self.mock_proxy.get_table.return_value = Table(
+            database='postgres', cluster='postgres', schema='hogwarts', name='wizards',
+            columns=[Column(name='house', col_type='String', sort_order=1)])
+
+        response = self.app.test_client().get(f'/table/{TABLE_URI}?fields=columns&column_offset=1&column_limit=1')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual([column['name'] for column in response.json['columns']], ['house'])
+        self.assertNotIn('stats', response.json['columns'][0])
+        self.assertNotIn('badges', response.json['columns'][0])
+        self.assertNotIn('table_readers', response.json)
+        self.mock_proxy.get_table.assert_called_with(
+            table_uri=TABLE_URI,
+            projection=TableProjection(column_stats=False, column_badges=False, table_readers=False,
+                                       column_offset=1, column_limit=1))
+
+    def test_should_get_table_without_columns(self) -> None:
+        self.mock_proxy.get_table.return_value = Table(database='postgres', cluster='postgres', schema='hogwarts',
+                                                       name='wizards', columns=[])
+
+        response = self.app.test_client().get(f'/table/{TABLE_URI}?fields=')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json['name'], 'wizards')
+        self.assertNotIn('columns', response.json)
+        self.assertNotIn('table_readers', response.json)
+        self.mock_proxy.get_table.assert_called_with(table_uri=TABLE_URI,
+                                                     projection=TableProjection.from_fields([]))
+
+    def test_should_fail_on_unknown_fields(self) -> None:
+        response = self.app.test_client().get(f'/table/{TABLE_URI}?fields=columns,owners')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_table.assert_not_called()
+
+    def test_should_fail_on_invalid_column_limit(self) -> None:
+        response = self.app.test_client().get(f'/table/{TABLE_URI}?column_limit=0')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_table.assert_not_called()
 
     def test_should_fail_to_get_column_details_when_table_not_foubd(self) -> None:
         self.mock_proxy.get_table.side_effect = NotFoundException(message='table not found')
@@ -81,6 +81,16 @@ class TestTableLineageAPI(TableTestCase):
                                                        depth=1,
                                                        direction="both")
 
+    def test_should_return_truncated_flag(self) -> None:
+        self.mock_proxy.get_lineage.return_value = dict(LINEAGE_RESPONSE, depth=5, truncated=True)
+        response = self.app.test_client().get(f'/table/{TABLE_URI}/lineage?direction=both&depth=10')
+        self.assertEqual(response.json, dict(API_RESPONSE, depth=5, truncated=True))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_proxy.get_lineage.assert_called_with(id=TABLE_URI,
+                                                       resource_type=ResourceType.Table,
+                                                       depth=10,
+                                                       direction="both")
+
     def test_should_fail_when_table_doesnt_exist(self) -> None:
         self.mock_proxy.get_lineage.side_effect = NotFoundException(message='table not found')
 
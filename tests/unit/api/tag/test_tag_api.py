@@ -0,0 +1,47 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+from metadata_service.entity.tag_detail import TagDetail
+from tests.unit.test_basics import BasicTestCase
+
+
+class TestTagAPI(BasicTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_client = patch('metadata_service.api.tag.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = Mock()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.mock_client.stop()
+
+    def test_get_tags(self) -> None:
+        self.mock_proxy.get_tags.return_value = [TagDetail(tag_name='finance', tag_count=3),
+                                                 TagDetail(tag_name='pii', tag_count=1)]
+
+        response = self.app.test_client().get('/tags/')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json, {'tag_usages': [{'tag_name': 'finance', 'tag_count': 3},
+                                                        {'tag_name': 'pii', 'tag_count': 1}]})
+        self.mock_proxy.get_tags.assert_called_with(prefix=None, limit=None)
+
+    def test_get_tags_by_prefix(self) -> None:
+        self.mock_proxy.get_tags.return_value = [TagDetail(tag_name='finance', tag_count=3)]
+
+        response = self.app.test_client().get('/tags/?prefix=fin&limit=5')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json, {'tag_usages': [{'tag_name': 'finance', 'tag_count': 3}]})
+        self.mock_proxy.get_tags.assert_called_with(prefix='fin', limit=5)
+
+    def test_get_tags_invalid_limit(self) -> None:
+        response = self.app.test_client().get('/tags/?limit=0')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_tags.assert_not_called()
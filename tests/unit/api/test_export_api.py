@@ -0,0 +1,63 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+from amundsen_common.models.dashboard import DashboardSummary
+from amundsen_common.models.table import Column, Table
+
+from tests.unit.test_basics import BasicTestCase
+
+TABLES = [Table(database='hive', cluster='gold', schema='hogwarts', name=name,
+                columns=[Column(name='wizard_name', col_type='String', sort_order=0)])
+          for name in ['muggles', 'wizards']]
+
+
+class TestCatalogExportAPI(BasicTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_client = patch('metadata_service.api.export.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = Mock()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.mock_client.stop()
+
+    def test_export_tables(self) -> None:
+        self.mock_proxy.iter_tables.return_value = iter(TABLES)
+
+        response = self.app.test_client().get('/export/table?page_size=10')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([record['name'] for record in records], ['muggles', 'wizards'])
+        self.mock_proxy.iter_tables.assert_called_once_with(page_size=10)
+
+    def test_export_dashboards(self) -> None:
+        self.mock_proxy.iter_dashboards.return_value = iter([
+            DashboardSummary(uri='mode_dashboard://gold.group/dashboard', cluster='gold', group_name='group',
+                             group_url='group_url', product='mode', name='dashboard', url='url')
+        ])
+
+        response = self.app.test_client().get('/export/dashboard')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([record['uri'] for record in records], ['mode_dashboard://gold.group/dashboard'])
+
+    def test_export_not_supported(self) -> None:
+        self.mock_proxy.iter_dashboards.side_effect = NotImplementedError
+
+        response = self.app.test_client().get('/export/dashboard')
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_IMPLEMENTED)
+
+    def test_export_invalid_request(self) -> None:
+        self.assertEqual(self.app.test_client().get('/export/user').status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(self.app.test_client().get('/export/table?page_size=0').status_code,
+                         HTTPStatus.BAD_REQUEST)
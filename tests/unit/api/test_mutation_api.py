@@ -0,0 +1,69 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+from metadata_service.entity.badge import Badge
+from metadata_service.entity.mutation import Mutation, MutationResult
+from tests.unit.test_basics import BasicTestCase
+
+MUTATIONS = [
+    {'mutation_type': 'table_description', 'table_uri': 'hive://gold.schema/table', 'value': 'new description'},
+    {'mutation_type': 'tag', 'table_uri': 'hive://gold.schema/table', 'value': 'pii'},
+    {'mutation_type': 'column_description', 'table_uri': 'hive://gold.schema/table', 'value': 'no column name'},
+    {'mutation_type': 'badge', 'table_uri': 'hive://gold.schema/table', 'value': 'beta', 'category': 'table_status'},
+    {'mutation_type': 'rename', 'table_uri': 'hive://gold.schema/table', 'value': 'other'},
+]
+
+
+class TestMutationAPI(BasicTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['WHITELIST_BADGES'] = [Badge(badge_name='beta', category='table_status')]
+
+        self.mock_client = patch('metadata_service.api.mutation.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = Mock()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.mock_client.stop()
+
+    def test_post_mutations(self) -> None:
+        self.mock_proxy.apply_mutations.return_value = [
+            MutationResult(success=True),
+            MutationResult(success=False, message='Table hive://gold.schema/table does not exist'),
+            MutationResult(success=True),
+        ]
+
+        response = self.app.test_client().post('/mutations', data=json.dumps(MUTATIONS))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_proxy.apply_mutations.assert_called_once_with(mutations=[
+            Mutation(mutation_type='table_description', table_uri='hive://gold.schema/table', value='new description'),
+            Mutation(mutation_type='tag', table_uri='hive://gold.schema/table', value='pii'),
+            Mutation(mutation_type='badge', table_uri='hive://gold.schema/table', value='beta',
+                     category='table_status'),
+        ])
+        self.assertEqual([result['success'] for result in response.json['results']],
+                         [True, False, False, True, False])
+        self.assertEqual(response.json['results'][2]['message'], 'column_name is required for column descriptions')
+
+    def test_post_mutations_badge_not_in_whitelist(self) -> None:
+        self.mock_proxy.apply_mutations.return_value = []
+
+        response = self.app.test_client().post('/mutations', data=json.dumps([
+            {'mutation_type': 'badge', 'table_uri': 'hive://gold.schema/table', 'value': 'beta', 'category': 'other'}
+        ]))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(response.json['results'][0]['success'])
+        self.mock_proxy.apply_mutations.assert_called_once_with(mutations=[])
+
+    def test_post_invalid_mutations(self) -> None:
+        response = self.app.test_client().post('/mutations', data=json.dumps([{'table_uri': 'foo'}]))
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.apply_mutations.assert_not_called()
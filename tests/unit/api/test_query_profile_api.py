@@ -0,0 +1,95 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from typing import Any, Dict
+from unittest.mock import create_autospec, patch
+
+from metadata_service.exception import NotFoundException
+from metadata_service.proxy.base_proxy import BaseProxy
+from metadata_service.proxy.query_profiler import (ProfiledQuery,
+                                                   get_query_profiler)
+from tests.unit.test_basics import BasicTestCase
+
+HEADERS = {'X-Profiling-Token': 'secret'}
+
+
+def _get_statistics() -> Dict[str, Any]:
+    get_query_profiler().add(ProfiledQuery(query='MATCH (t:Table) RETURN count(t)', elapsed_ms=3,  # type: ignore
+                                           db_hits=12, plan={'operator_type': 'ProduceResults'}))
+    return {'number_of_tables': 2}
+
+
+class TestQueryProfileAPI(BasicTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['QUERY_PROFILING_TOKEN'] = 'secret'
+
+        self.mock_client = patch('metadata_service.api.system.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = create_autospec(BaseProxy, instance=True)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.mock_client.stop()
+
+    def test_post_profile(self) -> None:
+        self.mock_proxy.get_statistics.side_effect = _get_statistics
+
+        response = self.app.test_client().post('/system/profile/get_statistics', headers=HEADERS)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json['operation'], 'get_statistics')
+        self.assertEqual(response.json['db_hits'], 12)
+        self.assertEqual(response.json['queries'], [{'query': 'MATCH (t:Table) RETURN count(t)', 'elapsed_ms': 3,
+                                                     'db_hits': 12, 'server_ms': None,
+                                                     'plan': {'operator_type': 'ProduceResults'}}])
+        self.assertGreaterEqual(response.json['operation_ms'], 0)
+        self.assertGreaterEqual(response.json['serialization_ms'], 0)
+
+    def test_post_profile_with_arguments(self) -> None:
+        self.mock_proxy.get_popular_tables.return_value = []
+
+        response = self.app.test_client().post('/system/profile/get_popular_tables', headers=HEADERS,
+                                               data=json.dumps({'num_entries': 5}))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json['queries'], [])
+        self.mock_proxy.get_popular_tables.assert_called_once_with(num_entries=5)
+
+    def test_post_profile_not_found(self) -> None:
+        self.mock_proxy.get_table.side_effect = NotFoundException('Table URI( foo ) does not exist')
+
+        response = self.app.test_client().post('/system/profile/get_table', headers=HEADERS,
+                                               data=json.dumps({'table_uri': 'foo'}))
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.assertIn('does not exist', response.json['message'])
+
+    def test_post_profile_invalid_arguments(self) -> None:
+        response = self.app.test_client().post('/system/profile/get_popular_tables', headers=HEADERS,
+                                               data=json.dumps({'table_uri': 'foo'}))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        response = self.app.test_client().post('/system/profile/get_popular_tables', headers=HEADERS,
+                                               data=json.dumps([5]))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        response = self.app.test_client().post('/system/profile/put_table_description', headers=HEADERS,
+                                               data=json.dumps({'table_uri': 'foo', 'description': 'bar'}))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.put_table_description.assert_not_called()
+
+    def test_post_profile_needs_token(self) -> None:
+        response = self.app.test_client().post('/system/profile/get_statistics')
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        response = self.app.test_client().post('/system/profile/get_statistics',
+                                               headers={'X-Profiling-Token': 'guess'})
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        self.app.config['QUERY_PROFILING_TOKEN'] = None
+        response = self.app.test_client().post('/system/profile/get_statistics', headers=HEADERS)
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.mock_proxy.get_statistics.assert_not_called()
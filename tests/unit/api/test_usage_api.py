@@ -0,0 +1,47 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+from metadata_service.entity.usage import UsageDelta
+from tests.unit.test_basics import BasicTestCase
+
+USAGE_DELTAS = [{'table_uri': 'hive://gold.schema/table', 'user_email': 'test@example.com', 'read_count': 2},
+                {'table_uri': 'hive://gold.schema/other', 'user_email': 'test@example.com', 'read_count': 1}]
+
+
+class TestUsageDeltaAPI(BasicTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_client = patch('metadata_service.api.usage.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = Mock()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.mock_client.stop()
+
+    def test_post_usage_deltas(self) -> None:
+        response = self.app.test_client().post('/usage/delta', data=json.dumps(USAGE_DELTAS))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_proxy.apply_usage_deltas.assert_called_once_with(deltas=[
+            UsageDelta(table_uri='hive://gold.schema/table', user_email='test@example.com', read_count=2),
+            UsageDelta(table_uri='hive://gold.schema/other', user_email='test@example.com', read_count=1)
+        ])
+
+    def test_post_invalid_usage_deltas(self) -> None:
+        response = self.app.test_client().post('/usage/delta', data=json.dumps([{'table_uri': 'foo'}]))
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.apply_usage_deltas.assert_not_called()
+
+    def test_post_usage_deltas_not_supported(self) -> None:
+        self.mock_proxy.apply_usage_deltas.side_effect = NotImplementedError
+
+        response = self.app.test_client().post('/usage/delta', data=json.dumps(USAGE_DELTAS))
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_IMPLEMENTED)
@@ -7,6 +7,8 @@ from http import HTTPStatus
 from unittest import mock
 from unittest.mock import MagicMock
 
+from amundsen_common.models.popular_table import PopularTable
+
 from metadata_service import create_app
 from metadata_service.api.user import (UserDetailAPI, UserFollowAPI,
                                        UserFollowsAPI, UserOwnAPI, UserOwnsAPI,
@@ -69,17 +71,64 @@ class UserFollowsAPITest(unittest.TestCase):
 
     @mock.patch('metadata_service.api.user.get_proxy_client')
     def setUp(self, mock_get_proxy_client: MagicMock) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
         self.mock_client = mock.Mock()
         mock_get_proxy_client.return_value = self.mock_client
         self.api = UserFollowsAPI()
 
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
     def test_get(self) -> None:
         self.mock_client.get_table_by_user_relation.return_value = {'table': []}
         self.mock_client.get_dashboard_by_user_relation.return_value = {'dashboard': []}
 
-        response = self.api.get(user_id='username')
+        with self.app.test_request_context('/user/username/follow/'):
+            response = self.api.get(user_id='username')
         self.assertEqual(list(response)[1], HTTPStatus.OK)
-        self.mock_client.get_table_by_user_relation.assert_called_once()
+        self.assertNotIn('next_cursor', list(response)[0])
+        self.mock_client.get_table_by_user_relation.assert_called_once_with(user_email='username',
+                                                                            relation_type=UserResourceRel.follow)
+
+    def test_get_paginated(self) -> None:
+        self.mock_client.get_table_by_user_relation.return_value = {
+            'table': [PopularTable(database='hive', cluster='gold', schema='core', name='a')],
+            'next_cursor': 'hive://gold.core/a'
+        }
+        self.mock_client.get_dashboard_by_user_relation.return_value = {'dashboard': [], 'next_cursor': None}
+
+        with self.app.test_request_context('/user/username/follow/?limit=1'):
+            result, status = self.api.get(user_id='username')
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertEqual(len(result['table']), 1)
+        self.mock_client.get_table_by_user_relation.assert_called_once_with(user_email='username',
+                                                                            relation_type=UserResourceRel.follow,
+                                                                            limit=1, cursor=None)
+
+        # only the tables are left on the next page
+        self.mock_client.reset_mock()
+        self.mock_client.get_table_by_user_relation.return_value = {'table': [], 'next_cursor': None}
+        with self.app.test_request_context(f'/user/username/follow/?limit=1&cursor={result["next_cursor"]}'):
+            result, status = self.api.get(user_id='username')
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertIsNone(result['next_cursor'])
+        self.mock_client.get_table_by_user_relation.assert_called_once_with(user_email='username',
+                                                                            relation_type=UserResourceRel.follow,
+                                                                            limit=1, cursor='hive://gold.core/a')
+        self.mock_client.get_dashboard_by_user_relation.assert_not_called()
+
+    def test_get_invalid_page(self) -> None:
+        with self.app.test_request_context('/user/username/follow/?limit=0'):
+            _, status = self.api.get(user_id='username')
+        self.assertEqual(status, HTTPStatus.BAD_REQUEST)
+
+        with self.app.test_request_context('/user/username/follow/?cursor=not_a_cursor'):
+            _, status = self.api.get(user_id='username')
+        self.assertEqual(status, HTTPStatus.BAD_REQUEST)
+        self.mock_client.get_table_by_user_relation.assert_not_called()
 
 
 class UserFollowAPITest(unittest.TestCase):
@@ -127,6 +176,10 @@ class UserOwnsAPITest(unittest.TestCase):
 
     @mock.patch('metadata_service.api.user.get_proxy_client')
     def setUp(self, mock_get_proxy_client: MagicMock) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
         self.mock_client = mock.Mock()
         mock_get_proxy_client.return_value = self.mock_client
         self.api = UserOwnsAPI()
@@ -134,11 +187,15 @@ class UserOwnsAPITest(unittest.TestCase):
     def test_get(self) -> None:
         self.mock_client.get_table_by_user_relation.return_value = {'table': []}
         self.mock_client.get_dashboard_by_user_relation.return_value = {'dashboard': []}
-        response = self.api.get(user_id='username')
+        with self.app.test_request_context('/user/username/own/'):
+            response = self.api.get(user_id='username')
         self.assertEqual(list(response)[1], HTTPStatus.OK)
         self.mock_client.get_table_by_user_relation.assert_called_once()
         self.mock_client.get_dashboard_by_user_relation.assert_called_once()
 
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
 
 class UserOwnAPITest(unittest.TestCase):
 
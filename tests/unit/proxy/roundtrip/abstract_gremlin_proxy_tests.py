@@ -16,12 +16,11 @@ from gremlin_python.process.graph_traversal import __
 from gremlin_python.process.traversal import Cardinality, Traversal, within
 
 from metadata_service import create_app
-from metadata_service.proxy.gremlin_proxy import (_V, AbstractGremlinProxy,
-                                                  FromResultSet,
-                                                  _append_traversal,
-                                                  _edges_from, _expire_link,
-                                                  _link, _safe_get,
-                                                  _safe_get_list, _upsert)
+from metadata_service.proxy.gremlin_proxy import (
+    _V, AbstractGremlinProxy, BatchWrite, FromResultSet, _append_traversal,
+    _edges_from, _expire_link, _expire_link_single_traversal,
+    _link_single_traversal, _safe_get, _safe_get_list, _upsert,
+    _upsert_single_traversal)
 
 from .abstract_proxy_tests import abstract_proxy_test_class
 
@@ -65,13 +64,11 @@ class AbstractGremlinProxyTest(abstract_proxy_test_class(), unittest.TestCase):
 
     def _upsert(self, **kwargs: Any) -> None:
         with self.get_proxy().query_executor() as executor:
-            return _upsert(executor=executor, execute=FromResultSet.iterate, g=self.get_proxy().g,
-                           key_property_name=self.get_proxy().key_property_name, **kwargs)
+            return self.get_proxy()._upsert(executor=executor, execute=FromResultSet.iterate, **kwargs)
 
     def _link(self, **kwargs: Any) -> None:
         with self.get_proxy().query_executor() as executor:
-            return _link(executor=executor, execute=FromResultSet.iterate, g=self.get_proxy().g,
-                         key_property_name=self.get_proxy().key_property_name, **kwargs)
+            return self.get_proxy()._link(executor=executor, execute=FromResultSet.iterate, **kwargs)
 
     @overload  # noqa: F811
     def _get(self, extra_traversal: Traversal, **kwargs: Any) -> Any:
@@ -207,6 +204,92 @@ class AbstractGremlinProxyTest(abstract_proxy_test_class(), unittest.TestCase):
         self.assertEqual(set(rel[0].keys()), set(['created']))
         self.assertEqual(rel[0].get('aproperty'), None)
 
+    def test_single_traversal_writes_rt(self) -> None:
+        executor = mock.Mock(wraps=self.get_proxy().query_executor())
+        g = self.get_proxy().g
+        key_property_name = self.get_proxy().key_property_name
+        db_name = Fixtures.next_database()
+        database_uri = f'database://{db_name}'
+        cluster_uri = f'{db_name}://acluster'
+
+        _upsert_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                 label=VertexTypes.Database, key=database_uri, name='test')
+        _upsert_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                 label=VertexTypes.Database, key=database_uri, name='test2')
+        _upsert_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                 label=VertexTypes.Cluster, key=cluster_uri, name='acluster')
+        self.assertEqual(executor.call_count, 3)
+        self.assertEqual(self._get(label=VertexTypes.Database, key=database_uri, extra_traversal=__.count()), 1)
+        self.assertEqual(self._get(label=VertexTypes.Database, key=database_uri, extra_traversal=__.values('name')),
+                         'test2')
+
+        executor.reset_mock()
+        for _ in range(2):
+            _link_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                   vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                                   vertex2_label=VertexTypes.Cluster, vertex2_key=cluster_uri,
+                                   edge_label=EdgeTypes.Cluster)
+        self.assertEqual(executor.call_count, 2)
+        rel = self.get_relationship(node_type1=VertexTypes.Database.value.label, node_key1=database_uri,
+                                    node_type2=VertexTypes.Cluster.value.label, node_key2=cluster_uri)
+        self.assertEqual(len(rel), 1)
+
+        executor.reset_mock()
+        _expire_link_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                      vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                                      vertex2_label=VertexTypes.Cluster, vertex2_key=cluster_uri,
+                                      edge_label=EdgeTypes.Cluster)
+        self.assertEqual(executor.call_count, 1)
+        rel = self.get_relationship(node_type1=VertexTypes.Database.value.label, node_key1=database_uri,
+                                    node_type2=VertexTypes.Cluster.value.label, node_key2=cluster_uri)
+        self.assertEqual(len(rel), 0)
+
+        # like _link and _expire_link, they need both vertices
+        with self.assertRaises(StopIteration):
+            _link_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                   vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                                   vertex2_label=VertexTypes.Cluster, vertex2_key=f'{db_name}://bcluster',
+                                   edge_label=EdgeTypes.Cluster, execute=FromResultSet.iterate)
+        with self.assertRaises(StopIteration):
+            _expire_link_single_traversal(executor=executor, g=g, key_property_name=key_property_name,
+                                          vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                                          vertex2_label=VertexTypes.Cluster, vertex2_key=f'{db_name}://bcluster',
+                                          edge_label=EdgeTypes.Cluster)
+
+    def test_write_round_trips(self) -> None:
+        db_name = Fixtures.next_database()
+        database_uri = f'database://{db_name}'
+        with self.get_proxy().query_executor() as executor:
+            self.get_proxy()._upsert(executor=executor, label=VertexTypes.Database, key=database_uri, name='test')
+            self.assertEqual(executor.round_trips, 1 if self.get_proxy().single_traversal_writes else 2)
+
+    def test_batch_write_rt(self) -> None:
+        executor = mock.Mock(wraps=self.get_proxy().query_executor())
+        db_name = Fixtures.next_database()
+        database_uri = f'database://{db_name}'
+        cluster_uri = f'{db_name}://acluster'
+
+        batch = BatchWrite(key_property_name=self.get_proxy().key_property_name, batch_size=2)
+        batch.add(0, batch.upsert(label=VertexTypes.Database, key=database_uri, name='test'),
+                  batch.upsert(label=VertexTypes.Cluster, key=cluster_uri, name='acluster'),
+                  batch.link(vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                             vertex2_label=VertexTypes.Cluster, vertex2_key=cluster_uri,
+                             edge_label=EdgeTypes.Cluster))
+        # the cluster does not exist
+        batch.add(1, batch.link(vertex1_label=VertexTypes.Database, vertex1_key=database_uri,
+                                vertex2_label=VertexTypes.Cluster, vertex2_key=f'{db_name}://bcluster',
+                                edge_label=EdgeTypes.Cluster))
+        batch.add(2, batch.upsert(label=VertexTypes.Database, key=database_uri, name='test2'))
+        self.assertEqual(batch.execute(executor=executor, g=self.get_proxy().g), {0, 2})
+        self.assertEqual(executor.call_count, 2)
+
+        self.assertEqual(self._get(label=VertexTypes.Database, key=database_uri, extra_traversal=__.count()), 1)
+        self.assertEqual(self._get(label=VertexTypes.Database, key=database_uri, extra_traversal=__.values('name')),
+                         'test2')
+        rel = self.get_relationship(node_type1=VertexTypes.Database.value.label, node_key1=database_uri,
+                                    node_type2=VertexTypes.Cluster.value.label, node_key2=cluster_uri)
+        self.assertEqual(len(rel), 1)
+
     def test_link_dangling_from_rt(self) -> None:
         db_name = Fixtures.next_database()
         database_uri = f'database://{db_name}'
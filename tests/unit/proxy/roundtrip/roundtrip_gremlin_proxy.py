@@ -19,10 +19,9 @@ from overrides import overrides
 from metadata_service.proxy.gremlin_proxy import (_V, AMUNDSEN_TIMESTAMP_KEY,
                                                   ExecuteQuery, FromResultSet,
                                                   GenericGremlinProxy,
-                                                  _expire_other_links, _link,
+                                                  _expire_other_links,
                                                   _properties_except,
-                                                  _properties_of, _upsert,
-                                                  timestamp)
+                                                  _properties_of, timestamp)
 from metadata_service.proxy.statsd_utilities import timer_with_counter
 
 from .roundtrip_base_proxy import RoundtripBaseProxy
@@ -40,8 +39,7 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
     def _put_user(self, *, data: User, executor: ExecuteQuery) -> None:
         if data.user_id is None:
             raise NotImplementedError(f'Must pass some user_id to derive vertex key')
-        _upsert(executor=executor, g=self.g, label=VertexTypes.User, key=data.user_id,
-                key_property_name=self.key_property_name, **_properties_except(data))
+        self._upsert(executor=executor, label=VertexTypes.User, key=data.user_id, **_properties_except(data))
 
     @timer_with_counter
     @overrides
@@ -57,8 +55,7 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
             return self._put_app(data=data, executor=executor)
 
     def _put_app(self, *, data: Application, executor: ExecuteQuery) -> None:
-        _upsert(executor=executor, g=self.g, label=VertexTypes.Application, key=data.id,
-                key_property_name=self.key_property_name, **_properties_except(data))
+        self._upsert(executor=executor, label=VertexTypes.Application, key=data.id, **_properties_except(data))
 
     @timer_with_counter
     @overrides
@@ -69,25 +66,22 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
 
     def _put_database(self, *, database: str, executor: ExecuteQuery) -> None:
         database_uri = make_database_uri(database_name=database)
-        _upsert(executor=executor, g=self.g, label=VertexTypes.Database, key=database_uri,
-                key_property_name=self.key_property_name, name=database)
+        self._upsert(executor=executor, label=VertexTypes.Database, key=database_uri, name=database)
 
     def _put_cluster(self, *, database_uri: str, cluster: str, executor: ExecuteQuery) -> None:
         cluster_uri: str = make_cluster_uri(database_uri=database_uri, cluster_name=cluster)
-        node_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Cluster, key=cluster_uri,
-                               key_property_name=self.key_property_name, name=cluster)
+        node_id: Any = self._upsert(executor=executor, label=VertexTypes.Cluster, key=cluster_uri, name=cluster)
 
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Cluster, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Database, vertex1_key=database_uri, vertex2_id=node_id)
+        self._link(executor=executor, edge_label=EdgeTypes.Cluster,
+                   vertex1_label=VertexTypes.Database, vertex1_key=database_uri, vertex2_id=node_id)
 
     def _put_schema(self, *, cluster_uri: str, schema: str, executor: ExecuteQuery) -> None:
         schema_uri: str = make_schema_uri(cluster_uri=cluster_uri, schema_name=schema)
 
-        node_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Schema, key=schema_uri,
-                               key_property_name=self.key_property_name, name=schema)
+        node_id: Any = self._upsert(executor=executor, label=VertexTypes.Schema, key=schema_uri, name=schema)
 
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Schema, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Cluster, vertex1_key=cluster_uri, vertex2_id=node_id)
+        self._link(executor=executor, edge_label=EdgeTypes.Schema,
+                   vertex1_label=VertexTypes.Cluster, vertex1_key=cluster_uri, vertex2_id=node_id)
 
     @timer_with_counter
     @overrides
@@ -107,11 +101,11 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
         schema_uri: str = make_schema_uri(cluster_uri=cluster_uri, schema_name=table.schema)
 
         table_uri: str = make_table_uri(schema_uri=schema_uri, table_name=table.name)
-        table_vertex_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Table, key=table_uri,
-                                       key_property_name=self.key_property_name, is_view=table.is_view, name=table.name)
+        table_vertex_id: Any = self._upsert(executor=executor, label=VertexTypes.Table, key=table_uri,
+                                            is_view=table.is_view, name=table.name)
 
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Table, key_property_name=self.key_property_name,
-              vertex1_label=VertexTypes.Schema, vertex1_key=schema_uri, vertex2_id=table_vertex_id)
+        self._link(executor=executor, edge_label=EdgeTypes.Table,
+                   vertex1_label=VertexTypes.Schema, vertex1_key=schema_uri, vertex2_id=table_vertex_id)
 
         if table.table_writer:
             self._put_app_table_relation(executor=executor, app_key=table.table_writer.id, table_uri=table_uri)
@@ -139,10 +133,9 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
             count = executor(query=_V(g=self.g, label=VertexTypes.Application, key=key).count(),
                              get=FromResultSet.getOnly)
             if count > 0:
-                _link(executor=executor, g=self.g, edge_label=EdgeTypes.Generates,
-                      key_property_name=self.key_property_name,
-                      vertex1_label=VertexTypes.Application, vertex1_key=key,
-                      vertex2_label=VertexTypes.Table, vertex2_key=table_uri)
+                self._link(executor=executor, edge_label=EdgeTypes.Generates,
+                           vertex1_label=VertexTypes.Application, vertex1_key=key,
+                           vertex2_label=VertexTypes.Table, vertex2_key=table_uri)
 
                 _expire_other_links(executor=executor, g=self.g, edge_label=EdgeTypes.Generates,
                                     key_property_name=self.key_property_name,
@@ -161,8 +154,8 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
 
     def _put_updated_timestamp(self, executor: ExecuteQuery) -> datetime:
         t = timestamp()
-        _upsert(executor=executor, g=self.g, label=VertexTypes.Updatedtimestamp,
-                key=AMUNDSEN_TIMESTAMP_KEY, key_property_name=self.key_property_name, latest_timestamp=t)
+        self._upsert(executor=executor, label=VertexTypes.Updatedtimestamp,
+                     key=AMUNDSEN_TIMESTAMP_KEY, latest_timestamp=t)
         return t
 
     @timer_with_counter
@@ -193,12 +186,11 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
         # TODO: could do these async
         column_uri: str = make_column_uri(table_uri=table_uri, column_name=column.name)
 
-        vertex_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Column, key=column_uri,
-                                 key_property_name=self.key_property_name,
-                                 **_properties_of(column, 'name', 'col_type', 'sort_order'))
+        vertex_id: Any = self._upsert(executor=executor, label=VertexTypes.Column, key=column_uri,
+                                      **_properties_of(column, 'name', 'col_type', 'sort_order'))
 
-        _link(
-            executor=executor, g=self.g, edge_label=EdgeTypes.Column, key_property_name=self.key_property_name,
+        self._link(
+            executor=executor, edge_label=EdgeTypes.Column,
             vertex1_label=VertexTypes.Table, vertex1_key=table_uri, vertex2_id=vertex_id)
 
         # Add the description if present
@@ -232,19 +224,18 @@ class RoundtripGremlinProxy(GenericGremlinProxy, RoundtripBaseProxy):
             return None
 
         desc_key = make_description_uri(subject_uri=table_uri, source=description.source)
-        vertex_id: Any = _upsert(executor=executor, g=self.g, label=VertexTypes.Description, key=desc_key,
-                                 key_property_name=self.key_property_name, description=description.text,
-                                 source=description.source)
+        vertex_id: Any = self._upsert(executor=executor, label=VertexTypes.Description, key=desc_key,
+                                      description=description.text, source=description.source)
 
-        _link(executor=executor, g=self.g, edge_label=EdgeTypes.Description, key_property_name=self.key_property_name,
-              vertex1_id=table_vertex_id, vertex2_id=vertex_id)
+        self._link(executor=executor, edge_label=EdgeTypes.Description,
+                   vertex1_id=table_vertex_id, vertex2_id=vertex_id)
 
     @timer_with_counter
     @overrides
     def add_read_count(self, *, table_uri: str, user_id: str, read_count: int) -> None:
         # TODO: use READ_BY instead of READ edges
         with self.query_executor() as executor:
-            _link(executor=executor, g=self.g, edge_label=EdgeTypes.Read, key_property_name=self.key_property_name,
-                  vertex1_label=VertexTypes.User, vertex1_key=user_id,
-                  vertex2_label=VertexTypes.Table, vertex2_key=table_uri,
-                  read_count=read_count)
+            self._link(executor=executor, edge_label=EdgeTypes.Read,
+                       vertex1_label=VertexTypes.User, vertex1_key=user_id,
+                       vertex2_label=VertexTypes.Table, vertex2_key=table_uri,
+                       read_count=read_count)
@@ -4,12 +4,25 @@
 import unittest
 from typing import Any, Mapping
 
+import pytest
+
 from .abstract_gremlin_proxy_tests import abstract_gremlin_proxy_test_class
 from .roundtrip_janusgraph_proxy import RoundtripJanusGraphProxy
 
 
+@pytest.mark.roundtrip_janusgraph
 class JanusGraphGremlinProxyTest(
         abstract_gremlin_proxy_test_class(), unittest.TestCase):  # type: ignore
     def _create_gremlin_proxy(self, config: Mapping[str, Any]) -> RoundtripJanusGraphProxy:
         # Don't use PROXY_HOST, PROXY_PORT, PROXY_PASSWORD.  They might not be JanusGraph
         return RoundtripJanusGraphProxy(host=config['JANUS_GRAPH_URL'])
+
+
+class JanusGraphSingleTraversalGremlinProxyTest(JanusGraphGremlinProxyTest):
+    """
+    The same round trip tests, with the writes made in one traversal each
+    """
+    def _create_gremlin_proxy(self, config: Mapping[str, Any]) -> RoundtripJanusGraphProxy:
+        proxy = super()._create_gremlin_proxy(config)
+        proxy.single_traversal_writes = True
+        return proxy
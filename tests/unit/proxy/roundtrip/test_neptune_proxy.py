@@ -6,6 +6,7 @@ import unittest
 from typing import Any, Mapping
 
 import gremlin_python.driver.protocol
+import pytest
 from amundsen_gremlin.gremlin_model import VertexTypes
 from amundsen_gremlin.script_translator import ScriptTranslator
 from gremlin_python.process.graph_traversal import __
@@ -17,6 +18,7 @@ from .abstract_gremlin_proxy_tests import abstract_gremlin_proxy_test_class
 from .roundtrip_neptune_proxy import RoundtripNeptuneGremlinProxy
 
 
+@pytest.mark.roundtrip_neptune
 class NeptuneGremlinProxyTest(
         abstract_gremlin_proxy_test_class(), unittest.TestCase):  # type: ignore
     def _create_gremlin_proxy(self, config: Mapping[str, Any]) -> RoundtripNeptuneGremlinProxy:
@@ -70,3 +72,13 @@ class NeptuneGremlinProxyTest(
         # and show it ran
         count = self._get(label=VertexTypes.User, key='jack', extra_traversal=__.count())
         self.assertEqual(count, 1)
+
+
+class NeptuneSingleTraversalGremlinProxyTest(NeptuneGremlinProxyTest):
+    """
+    The same round trip tests, with the writes made in one traversal each
+    """
+    def _create_gremlin_proxy(self, config: Mapping[str, Any]) -> RoundtripNeptuneGremlinProxy:
+        proxy = super()._create_gremlin_proxy(config)
+        proxy.single_traversal_writes = True
+        return proxy
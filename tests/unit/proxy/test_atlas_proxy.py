@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import threading
 import unittest
 from typing import Any, Dict, Optional, cast
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,7 @@ from amundsen_common.models.popular_table import PopularTable
 from amundsen_common.models.table import (Badge, Column,
                                           ProgrammaticDescription, Reader,
                                           ResourceReport, Stat, Table, User)
+from apache_atlas.exceptions import AtlasServiceException
 from apache_atlas.model.instance import AtlasRelatedObjectId
 from apache_atlas.model.relationship import AtlasRelationship
 from apache_atlas.utils import type_coerce
@@ -17,6 +19,7 @@ from werkzeug.exceptions import BadRequest
 
 from metadata_service import create_app
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.entity.tag_detail import TagDetail
 from metadata_service.exception import NotFoundException
 from metadata_service.util import UserResourceRel
@@ -177,11 +180,99 @@ class TestAtlasProxy(unittest.TestCase, Data):
         with patch.object(self.proxy, 'STATISTICS_FORMAT_SPEC', statistics_format_spec):
             self._get_table(custom_stats_format=True)
 
+    def test_get_table_projection(self) -> None:
+        self._mock_get_table_entity()
+        self._create_mocked_report_entities_collection()
+        self.proxy._get_owners = MagicMock(return_value=[])  # type: ignore
+        self.proxy._get_readers = MagicMock(return_value=[])  # type: ignore
+
+        projection = TableProjection.from_fields(['columns'], column_offset=1, column_limit=2)
+        table = self.proxy.get_table(table_uri=self.table_uri, projection=projection)
+
+        self.proxy._get_table_entity.assert_called_with(table_uri=self.table_uri, min_ext_info=False)  # type: ignore
+        self.assertEqual(len(table.columns), 2)
+        self.assertEqual(table.columns[0].stats, [])
+        self.assertEqual(table.columns[0].badges, [])
+        self.proxy._get_readers.assert_not_called()
+
+        table = self.proxy.get_table(table_uri=self.table_uri,
+                                     projection=TableProjection.from_fields(['table_readers']))
+
+        self.proxy._get_table_entity.assert_called_with(table_uri=self.table_uri, min_ext_info=True)  # type: ignore
+        self.assertEqual(table.columns, [])
+        self.proxy._get_readers.assert_called_once()
+
+    def _get_table_sub_queries(self, sub_query: Any) -> Any:
+        """
+        :param sub_query: called by the readers and reports sub queries of get_table, with their name
+        """
+        self._mock_get_table_entity()
+        self.proxy._get_owners = MagicMock(return_value=[])  # type: ignore
+        readers = [Reader(user=User(email='reader@example.com'), read_count=1)]
+        reports = [ResourceReport(name='test_report', url='http://test')]
+
+        def get_readers(*args: Any, **kwargs: Any) -> Any:
+            sub_query('readers')
+            return readers
+
+        def get_reports(*args: Any, **kwargs: Any) -> Any:
+            sub_query('reports')
+            return reports
+
+        self.proxy._get_readers = MagicMock(side_effect=get_readers)  # type: ignore
+        self.proxy._get_reports = MagicMock(side_effect=get_reports)  # type: ignore
+        table = self.proxy.get_table(table_uri=self.table_uri)
+
+        self.assertEqual(table.table_readers, readers)
+        self.assertEqual(table.resource_reports, reports)
+        return table
+
+    def test_get_table_sequential_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = False
+        threads = {}
+
+        def sub_query(name: str) -> None:
+            threads[name] = threading.current_thread()
+
+        self._get_table_sub_queries(sub_query)
+
+        self.assertEqual(threads, {'readers': threading.current_thread(), 'reports': threading.current_thread()})
+
+    def test_get_table_concurrent_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        # both sub queries have to be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        self._get_table_sub_queries(lambda name: barrier.wait())
+
     def test_get_table_not_found(self) -> None:
         with self.assertRaises(NotFoundException):
             self.proxy.client.entity.get_entity_by_attribute = MagicMock(side_effect=Exception('Boom!'))
             self.proxy.get_table(table_uri=self.table_uri)
 
+    @staticmethod
+    def _atlas_service_exception(status_code: int) -> AtlasServiceException:
+        api = DottedDict({'method': 'GET', 'path': 'entity/bulk/uniqueAttribute/type/hive_table'})
+        response = MagicMock(content=b'{}', status_code=status_code, url='http://atlas')
+        response.json.return_value = {'errorCode': 'ATLAS-TEST'}
+        return AtlasServiceException(api, response)
+
+    def test_get_table_entities_not_found(self) -> None:
+        self.proxy.client.call_api = MagicMock(side_effect=self._atlas_service_exception(404))
+
+        bulk_entity = self.proxy._get_table_entities(entity_type='hive_table', table_qns=['db.missing@cluster'])
+
+        self.assertFalse(bulk_entity.entities)
+
+    def test_get_table_entities_raises_other_errors(self) -> None:
+        self.proxy.client.call_api = MagicMock(side_effect=self._atlas_service_exception(500))
+        with self.assertRaises(AtlasServiceException):
+            self.proxy._get_table_entities(entity_type='hive_table', table_qns=['db.table@cluster'])
+
+        self.proxy.client.call_api = MagicMock(side_effect=ConnectionError('boom'))
+        with self.assertRaises(ConnectionError):
+            self.proxy._get_table_entities(entity_type='hive_table', table_qns=['db.table@cluster'])
+
     def test_get_table_missing_info(self) -> None:
         with self.assertRaises(BadRequest):
             local_entity = copy.deepcopy(self.entity1)
@@ -335,6 +426,27 @@ class TestAtlasProxy(unittest.TestCase, Data):
 
         self.assertEqual(res, {'table': expected})
 
+    def test_get_table_by_user_relation_follow_paginated(self) -> None:
+        bookmarks = [self.to_class(copy.deepcopy(self.bookmark_entity1)),
+                     self.to_class(copy.deepcopy(self.bookmark_entity2))]
+        bookmark_collection = MagicMock()
+        bookmark_collection.entities = bookmarks
+
+        self.proxy.client.discovery.faceted_search = MagicMock(return_value=bookmark_collection)
+        res = self.proxy.get_table_by_user_relation(user_email='test_user_id',
+                                                    relation_type=UserResourceRel.follow,
+                                                    limit=1,
+                                                    cursor='a')
+
+        self.assertEqual(len(res['table']), 1)
+        self.assertEqual(res['next_cursor'], self.bookmark_entity1['attributes']['qualifiedName'])  # type: ignore
+
+        params = self.proxy.client.discovery.faceted_search.call_args[1]['search_parameters']
+        self.assertEqual(params['limit'], '2')
+        self.assertEqual(params['sortBy'], 'qualifiedName')
+        self.assertIn({'attributeName': 'qualifiedName', 'operator': 'gt', 'attributeValue': 'a'},
+                      params['entityFilters']['criterion'])
+
     def test_get_table_by_user_relation_own(self) -> None:
         unique_attr_response = MagicMock()
         unique_attr_response.entity = Data.user_entity_2
@@ -365,8 +477,9 @@ class TestAtlasProxy(unittest.TestCase, Data):
         entity_bulk_result.entities = [DottedDict(self.entity1)]
         self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=entity_bulk_result)
 
-        res = self.proxy._get_resources_owned_by_user(user_id='test_user_2',
-                                                      resource_type=ResourceType.Table.name)
+        res, next_cursor = self.proxy._get_resources_owned_by_user(user_id='test_user_2',
+                                                                   resource_type=ResourceType.Table.name)
+        self.assertIsNone(next_cursor)
 
         self.assertEqual(len(res), 1)
 
@@ -405,8 +518,9 @@ class TestAtlasProxy(unittest.TestCase, Data):
         entity_bulk_result.entities = [DottedDict(self.entity1)]
         self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=entity_bulk_result)
 
-        res = self.proxy._get_resources_owned_by_user(user_id='test_user_2',
-                                                      resource_type=ResourceType.Table.name)
+        res, next_cursor = self.proxy._get_resources_owned_by_user(user_id='test_user_2',
+                                                                   resource_type=ResourceType.Table.name)
+        self.assertIsNone(next_cursor)
 
         self.assertEqual(len(res), 1)
 
@@ -468,6 +582,14 @@ class TestAtlasProxy(unittest.TestCase, Data):
         result = self.proxy.get_latest_updated_ts()
         assert result == 0
 
+    def test_get_statistics(self) -> None:
+        self.proxy.client.admin.get_metrics = MagicMock(
+            return_value=DottedDict({'entity': {'entityActive': {'Table': 12, 'Column': 40}}}))
+        self.assertEqual(self.proxy.get_statistics(), {'number_of_tables': 12})
+
+        self.proxy.client.admin.get_metrics = MagicMock(return_value=DottedDict({}))
+        self.assertEqual(self.proxy.get_statistics(), {})
+
     def test_get_user_detail_default(self) -> None:
         user_id = "dummy@email.com"
         user_details = self.proxy._get_user_details(user_id=user_id)
@@ -551,6 +673,26 @@ class TestAtlasProxy(unittest.TestCase, Data):
 
                     assert low.partition_value.startswith(low_date_prefix)
 
+    def test_timed_call_api(self) -> None:
+        from metadata_service.proxy.atlas_proxy import AtlasProxy
+        call_api = MagicMock(return_value=DottedDict({'entities': [self.entity1, self.entity2]}))
+        api = DottedDict({'method': 'GET', 'path': 'api/atlas/v2/search/dsl'})
+
+        with patch('metadata_service.proxy.atlas_proxy.record_query') as mock_record_query:
+            response = AtlasProxy._timed_call_api(call_api)(api, None, {'query': "hive_table where name='a'"})
+
+            self.assertEqual(response, call_api.return_value)
+            call_api.assert_called_once_with(api, None, {'query': "hive_table where name='a'"}, None)
+            _, kwargs = mock_record_query.call_args
+            self.assertEqual((kwargs['backend'], kwargs['query'], kwargs['records']),
+                             ('atlas', "GET api/atlas/v2/search/dsl hive_table where name='a'", 2))
+
+            call_api.side_effect = RuntimeError('boom')
+            with self.assertRaises(RuntimeError):
+                AtlasProxy._timed_call_api(call_api)(api)
+            _, kwargs = mock_record_query.call_args
+            self.assertFalse(kwargs['success'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,130 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional  # noqa: F401
+from unittest.mock import patch
+
+from beaker.util import parse_cache_config_options
+
+from metadata_service import create_app
+from metadata_service.proxy.cache_utilities import ConfigurableCacheManager
+
+try:
+    import redis
+except ImportError:
+    redis = None  # type: ignore
+
+
+class LocalRedis:
+    """
+    In process stand-in for the subset of redis.StrictRedis used by beaker's redis namespace manager
+    """
+
+    def __init__(self) -> None:
+        self._data = {}  # type: Dict[str, Any]
+        self._lock = threading.RLock()
+
+    def get(self, name: str) -> Any:
+        with self._lock:
+            return self._data.get(name)
+
+    def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> bool:
+        with self._lock:
+            if nx and name in self._data:
+                return False
+            self._data[name] = value
+            return True
+
+    def setex(self, name: str, time: int, value: Any) -> bool:
+        return self.set(name, value, ex=time)
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            return name in self._data
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            self._data.pop(name, None)
+
+    def keys(self, pattern: str) -> List[str]:
+        with self._lock:
+            return [key for key in self._data if key.startswith(pattern.rstrip('*'))]
+
+    def transaction(self, func: Callable, *watches: str) -> None:
+        with self._lock:
+            func(self)
+
+
+def _make_cached_function(manager: ConfigurableCacheManager, calls: List[int],
+                          delay_sec: float = 0) -> Callable[[int], int]:
+    # every call simulates a different worker process with its own module level cache manager
+    @manager.cache('popular_tables', expire=60)
+    def popular_tables(num_entries: int) -> int:
+        calls.append(num_entries)
+        time.sleep(delay_sec)
+        return num_entries * 2
+
+    return popular_tables
+
+
+class TestConfigurableCacheManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        # beaker refuses the redis backend without the redis package, even though LocalRedis is passed as the client
+        self.redis_patch = patch('beaker.ext.redisnm.redis', redis or SimpleNamespace(StrictRedis=LocalRedis))
+        self.redis_patch.start()
+
+    def tearDown(self) -> None:
+        self.redis_patch.stop()
+        self.app_context.pop()
+
+    def test_memory_by_default(self) -> None:
+        manager = ConfigurableCacheManager(**parse_cache_config_options({'cache.type': 'memory'}))
+        cache = manager.get_cache('test_memory_by_default', expire=10)
+
+        self.assertEqual(cache.namespace_name, 'test_memory_by_default')
+        self.assertEqual(type(cache.namespace).__name__, 'MemoryNamespaceManager')
+
+    def test_shared_between_workers(self) -> None:
+        self.app.config['BEAKER_CACHE_TYPE'] = 'ext:redis'
+        self.app.config['BEAKER_CACHE_URL'] = LocalRedis()
+        calls = []  # type: List[int]
+
+        worker_1 = _make_cached_function(ConfigurableCacheManager(), calls)
+        worker_2 = _make_cached_function(ConfigurableCacheManager(), calls)
+
+        self.assertEqual(worker_1(10), 20)
+        self.assertEqual(worker_2(10), 20)
+        self.assertEqual(worker_2(5), 10)
+        self.assertEqual(calls, [10, 5])
+
+    def test_only_one_worker_recomputes(self) -> None:
+        self.app.config['BEAKER_CACHE_TYPE'] = 'ext:redis'
+        self.app.config['BEAKER_CACHE_URL'] = LocalRedis()
+        calls = []  # type: List[int]
+        results = []  # type: List[int]
+
+        def run_worker() -> None:
+            with self.app.app_context():
+                popular_tables = _make_cached_function(ConfigurableCacheManager(), calls, delay_sec=0.3)
+                results.append(popular_tables(10))
+
+        workers = [threading.Thread(target=run_worker) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(calls, [10])
+        self.assertEqual(results, [20] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
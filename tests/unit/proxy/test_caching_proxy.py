@@ -0,0 +1,234 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+import metadata_service
+from metadata_service.entity.mutation import Mutation
+from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
+from metadata_service.proxy import get_proxy_client
+from metadata_service.proxy.base_proxy import BaseProxy
+from metadata_service.proxy.caching_proxy import CachingProxy, LRUCache
+from metadata_service.util import UserResourceRel
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LRUCache(max_size=2)
+        cache.put(('get_table', 'a'), 1, ttl_sec=60)
+        cache.put(('get_table', 'b'), 2, ttl_sec=60)
+        # touch a, so b is the least recently used one
+        self.assertEqual(cache.get(('get_table', 'a')), (True, 1))
+        cache.put(('get_table', 'c'), 3, ttl_sec=60)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(('get_table', 'b')), (False, None))
+        self.assertEqual(cache.get(('get_table', 'c')), (True, 3))
+
+    def test_expiry(self) -> None:
+        cache = LRUCache(max_size=2)
+        with patch('metadata_service.proxy.caching_proxy.time') as mock_time:
+            mock_time.monotonic.return_value = 100
+            cache.put(('get_tags', None), ['tag'], ttl_sec=10)
+            mock_time.monotonic.return_value = 105
+            self.assertEqual(cache.get(('get_tags', None)), (True, ['tag']))
+            mock_time.monotonic.return_value = 111
+            self.assertEqual(cache.get(('get_tags', None)), (False, None))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self) -> None:
+        cache = LRUCache(max_size=10)
+        cache.put(('get_table', 'a'), 1, ttl_sec=60)
+        cache.put(('get_table', 'b'), 2, ttl_sec=60)
+        cache.put(('get_dashboard', 'a'), 3, ttl_sec=60)
+
+        cache.invalidate('get_table', 'a')
+        self.assertEqual(cache.get(('get_table', 'a')), (False, None))
+        self.assertEqual(cache.get(('get_table', 'b')), (True, 2))
+        self.assertEqual(cache.get(('get_dashboard', 'a')), (True, 3))
+
+        cache.invalidate('get_table')
+        self.assertEqual(cache.get(('get_table', 'b')), (False, None))
+
+
+class TestCachingProxy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock(spec=BaseProxy)
+        self.proxy = CachingProxy(client=self.client)
+
+    def test_get_table_is_cached(self) -> None:
+        self.client.get_table.side_effect = lambda table_uri: f'table {table_uri}'
+
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'table a')
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'table a')
+        self.assertEqual(self.proxy.get_table(table_uri='b'), 'table b')
+
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    def test_projected_table_is_cached_apart(self) -> None:
+        self.client.get_table.side_effect = ['table a', 'columns of a', 'table a after']
+        projection = TableProjection.from_fields(['columns'], column_limit=50)
+
+        self.assertEqual(self.proxy.get_table(table_uri='a', projection=TableProjection()), 'table a')
+        self.assertEqual(self.proxy.get_table(table_uri='a', projection=projection), 'columns of a')
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'table a')
+        self.assertEqual(self.proxy.get_table(table_uri='a', projection=projection), 'columns of a')
+        self.client.get_table.assert_called_with(table_uri='a', projection=projection)
+
+        self.proxy.put_table_description(table_uri='a', description='new description')
+        self.assertEqual(self.proxy.get_table(table_uri='a', projection=projection), 'table a after')
+        self.assertEqual(self.client.get_table.call_count, 3)
+
+    def test_get_tables_fetches_only_uncached_tables(self) -> None:
+        self.client.get_table.return_value = 'table a'
+        self.client.get_tables.side_effect = lambda table_uris: {uri: f'table {uri}' for uri in table_uris
+                                                                 if uri != 'missing'}
+
+        self.proxy.get_table(table_uri='a')
+        tables = self.proxy.get_tables(table_uris=['a', 'b', 'missing'])
+
+        self.assertEqual(tables, {'a': 'table a', 'b': 'table b'})
+        self.client.get_tables.assert_called_once_with(table_uris=['b', 'missing'])
+        self.assertEqual(self.proxy.get_table(table_uri='b'), 'table b')
+        self.assertEqual(self.client.get_table.call_count, 1)
+
+    def test_exceptions_are_not_cached(self) -> None:
+        self.client.get_table.side_effect = [Exception('boom'), 'table a']
+
+        with self.assertRaises(Exception):
+            self.proxy.get_table(table_uri='a')
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'table a')
+
+    def test_write_invalidates_table(self) -> None:
+        self.client.get_table.side_effect = ['before', 'after', 'after b']
+
+        self.proxy.get_table(table_uri='a')
+        self.proxy.put_table_description(table_uri='a', description='new description')
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'after')
+        self.client.put_table_description.assert_called_once_with(table_uri='a', description='new description')
+
+        self.proxy.add_owner(table_uri='b', owner='test')
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'after')
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    def test_tag_and_badge_writes(self) -> None:
+        self.client.get_tags.return_value = []
+        self.client.get_badges.return_value = []
+        self.client.get_dashboard.return_value = 'dashboard'
+
+        self.proxy.get_tags()
+        self.proxy.get_badges()
+        self.proxy.get_dashboard(id='dashboard_id')
+
+        self.proxy.add_tag(id='dashboard_id', tag='tag', tag_type='default', resource_type=ResourceType.Dashboard)
+        self.proxy.get_tags()
+        self.proxy.get_badges()
+        self.proxy.get_dashboard(id='dashboard_id')
+
+        self.assertEqual(self.client.get_tags.call_count, 2)
+        self.assertEqual(self.client.get_badges.call_count, 1)
+        self.assertEqual(self.client.get_dashboard.call_count, 2)
+
+        self.proxy.delete_badge(id='table_id', badge_name='badge', category='table_status',
+                                resource_type=ResourceType.Table)
+        self.proxy.get_badges()
+        self.assertEqual(self.client.get_badges.call_count, 2)
+
+    def test_column_badge_writes_invalidate_table(self) -> None:
+        self.client.get_table.side_effect = ['before', 'after add', 'after delete']
+        table_uri = 'hive://gold.test_schema/test_table'
+
+        self.proxy.get_table(table_uri=table_uri)
+        self.proxy.add_badge(id=f'{table_uri}/col1', badge_name='pii', category='column',
+                             resource_type=ResourceType.Column)
+        self.assertEqual(self.proxy.get_table(table_uri=table_uri), 'after add')
+
+        self.proxy.delete_badge(id=f'{table_uri}/col1', badge_name='pii', category='column',
+                                resource_type=ResourceType.Column)
+        self.assertEqual(self.proxy.get_table(table_uri=table_uri), 'after delete')
+        self.assertEqual(self.client.get_table.call_count, 3)
+
+    def test_owner_relation_invalidates_table(self) -> None:
+        self.client.get_table.return_value = 'table'
+
+        self.proxy.get_table(table_uri='a')
+        self.proxy.add_resource_relation_by_user(id='a', user_id='user', relation_type=UserResourceRel.follow,
+                                                 resource_type=ResourceType.Table)
+        self.proxy.get_table(table_uri='a')
+        self.assertEqual(self.client.get_table.call_count, 1)
+
+        self.proxy.add_resource_relation_by_user(id='a', user_id='user', relation_type=UserResourceRel.own,
+                                                 resource_type=ResourceType.Table)
+        self.proxy.get_table(table_uri='a')
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    def test_mutations_invalidate_tables(self) -> None:
+        self.client.get_table.side_effect = ['before', 'after']
+        self.client.apply_mutations.return_value = ['result']
+
+        self.proxy.get_table(table_uri='a')
+        mutations = [Mutation(mutation_type='tag', table_uri='a', value='pii')]
+        self.assertEqual(self.proxy.apply_mutations(mutations=mutations), ['result'])
+
+        self.client.apply_mutations.assert_called_once_with(mutations=mutations)
+        self.assertEqual(self.proxy.get_table(table_uri='a'), 'after')
+
+    def test_popular_tables_keyed_by_arguments(self) -> None:
+        self.client.get_popular_tables.return_value = []
+
+        self.proxy.get_popular_tables(num_entries=10)
+        self.proxy.get_popular_tables(num_entries=10)
+        self.proxy.get_popular_tables(num_entries=5)
+        self.proxy.get_popular_tables(num_entries=10, user_id='user')
+
+        self.assertEqual(self.client.get_popular_tables.call_count, 3)
+
+    def test_uncached_method(self) -> None:
+        proxy = CachingProxy(client=self.client, ttl_sec={'get_table': 60})
+        self.client.get_tags.return_value = []
+
+        proxy.get_tags()
+        proxy.get_tags()
+
+        self.assertEqual(self.client.get_tags.call_count, 2)
+
+    def test_delegates_other_attributes(self) -> None:
+        client = MagicMock()
+        proxy = CachingProxy(client=client)
+
+        proxy.get_table_by_user_relation(user_email='test@example.com', relation_type=UserResourceRel.follow)
+        proxy.backend_specific(1)
+
+        client.get_table_by_user_relation.assert_called_once_with(user_email='test@example.com',
+                                                                  relation_type=UserResourceRel.follow,
+                                                                  limit=None, cursor=None)
+        client.backend_specific.assert_called_once_with(1)
+
+
+class TestCreateCachingProxy(unittest.TestCase):
+    @patch('neo4j.GraphDatabase.driver', MagicMock())
+    def test_proxy_client_is_wrapped(self) -> None:
+        config = metadata_service.config.LocalConfig()
+        config.PROXY_CACHE_ENABLED = True
+        config.PROXY_CACHE_TTL_SEC = {'get_table': 10}
+        metadata_service.proxy._proxy_client = None
+
+        app = Flask(__name__)
+        app.config.from_object(config)
+
+        try:
+            with app.app_context():
+                client = get_proxy_client()
+        finally:
+            metadata_service.proxy._proxy_client = None
+
+        self.assertIsInstance(client, CachingProxy)
+        self.assertEqual(client._ttl_sec, {'get_table': 10})  # type: ignore
+
+
+if __name__ == '__main__':
+    unittest.main()
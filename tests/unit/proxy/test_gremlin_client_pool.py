@@ -0,0 +1,93 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from threading import Thread
+from unittest.mock import MagicMock, patch
+
+from gremlin_python.driver.protocol import GremlinServerError
+
+from metadata_service.proxy.gremlin_client_pool import GremlinClientPool
+
+
+class TestGremlinClientPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = MagicMock(side_effect=lambda: MagicMock())
+
+    def test_reuses_clients(self) -> None:
+        pool = GremlinClientPool(factory=self.factory, max_size=2)
+
+        with pool.lease() as client:
+            first = client
+        with pool.lease() as client:
+            self.assertIs(client, first)
+
+        self.assertEqual(self.factory.call_count, 1)
+        first.close.assert_not_called()
+
+    def test_bounded_size(self) -> None:
+        pool = GremlinClientPool(factory=self.factory, max_size=1, acquire_timeout_sec=5)
+        leased = []
+
+        with pool.lease() as client:
+            thread = Thread(target=lambda: leased.append(pool._acquire()))
+            thread.start()
+            thread.join(0.1)
+            # waits for the only client to be released
+            self.assertEqual(leased, [])
+        thread.join(5)
+
+        self.assertEqual([pooled.client for pooled in leased], [client])
+        self.assertEqual(self.factory.call_count, 1)
+
+    def test_acquire_timeout(self) -> None:
+        pool = GremlinClientPool(factory=self.factory, max_size=1, acquire_timeout_sec=0)
+
+        with pool.lease():
+            with self.assertRaises(RuntimeError):
+                pool._acquire()
+
+    def test_recycles_old_clients(self) -> None:
+        pool = GremlinClientPool(factory=self.factory, max_age_sec=600)
+        with patch('metadata_service.proxy.gremlin_client_pool.time') as mock_time:
+            mock_time.monotonic.return_value = 0
+            with pool.lease() as client:
+                first = client
+            mock_time.monotonic.return_value = 601
+            with pool.lease() as client:
+                self.assertIsNot(client, first)
+
+        first.close.assert_called_once()
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_checks_idle_clients(self) -> None:
+        pool = GremlinClientPool(factory=self.factory, max_age_sec=600, idle_check_sec=60)
+        with patch('metadata_service.proxy.gremlin_client_pool.time') as mock_time:
+            mock_time.monotonic.return_value = 0
+            with pool.lease() as client:
+                first = client
+            first.submit.side_effect = OSError('connection reset')
+            mock_time.monotonic.return_value = 61
+            with pool.lease() as client:
+                self.assertIsNot(client, first)
+
+        first.submit.assert_called_once()
+        first.close.assert_called_once()
+
+    def test_discards_clients_after_connection_errors_only(self) -> None:
+        pool = GremlinClientPool(factory=self.factory)
+
+        with self.assertRaises(GremlinServerError):
+            with pool.lease() as client:
+                first = client
+                raise GremlinServerError({'code': 500, 'message': 'boom', 'attributes': {}})
+        with self.assertRaises(OSError):
+            with pool.lease() as client:
+                self.assertIs(client, first)
+                raise OSError('connection reset')
+        with pool.lease() as client:
+            self.assertIsNot(client, first)
+
+        first.close.assert_called_once()
+        self.assertEqual(pool._size, 1)
+        self.assertEqual(pool._in_use, 0)
@@ -0,0 +1,386 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import unittest
+from datetime import datetime
+from typing import Any, List
+from unittest.mock import MagicMock, call, patch
+
+from amundsen_gremlin.gremlin_model import EdgeTypes, VertexTypes
+from amundsen_gremlin.test_and_development_shard import get_shard
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import Cardinality, T, gt
+
+from metadata_service import create_app
+from metadata_service.entity.mutation import (Mutation, MutationResult,
+                                              MutationType)
+from metadata_service.exception import NotFoundException
+from metadata_service.proxy.gremlin_proxy import (
+    BatchWrite, ClientQueryExecutor, FromResultSet, GenericGremlinProxy,
+    PooledClientQueryExecutor, RetryingClientQueryExecutor,
+    _expire_link_single_traversal, _link_single_traversal, _requiring_result,
+    _upsert_single_traversal)
+
+
+class TestGremlinProxy(unittest.TestCase):
+    """
+    Tests of the gremlin proxy that don't need a server, see tests/unit/proxy/roundtrip for the ones against one
+    """
+
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        with patch('metadata_service.proxy.gremlin_proxy.DriverRemoteConnection'):
+            self.proxy = GenericGremlinProxy(host='ws://DOES_NOT_MATTER:8182/gremlin')
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _get_table(self, sub_query: Any) -> Any:
+        """
+        :param sub_query: called by each sub query of get_table, with its name
+        """
+        def get_table_itself(*, table_uri: str) -> Any:
+            sub_query('itself')
+            return {'table': table_uri}
+
+        def get_table_columns(*, table_uri: str, projection: Any) -> Any:
+            sub_query('columns')
+            return ['col']
+
+        def get_table_readers(*, table_uri: str) -> Any:
+            sub_query('readers')
+            return ['reader']
+
+        with patch.object(self.proxy, '_get_table_itself', side_effect=get_table_itself), \
+                patch.object(self.proxy, '_get_table_columns', side_effect=get_table_columns), \
+                patch.object(self.proxy, '_get_table_readers', side_effect=get_table_readers), \
+                patch.object(self.proxy, '_build_table') as mock_build_table:
+            table = self.proxy.get_table(table_uri='dummy_uri')
+
+        mock_build_table.assert_called_once_with(result={'table': 'dummy_uri'}, cols=['col'], readers=['reader'])
+        return table
+
+    def test_get_table_sequential_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = False
+        threads = {}
+
+        def sub_query(name: str) -> None:
+            threads[name] = threading.current_thread()
+
+        self._get_table(sub_query)
+
+        self.assertEqual(threads, {name: threading.current_thread() for name in ('itself', 'columns', 'readers')})
+
+    def test_get_table_concurrent_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        # the three sub queries have to be running at the same time to pass the barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        self._get_table(lambda name: barrier.wait())
+
+    def test_get_table_concurrent_not_found(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+
+        with patch.object(self.proxy, '_get_table_itself', return_value={}), \
+                patch.object(self.proxy, '_get_table_columns', return_value=[]), \
+                patch.object(self.proxy, '_get_table_readers', return_value=[]):
+            with self.assertRaises(NotFoundException):
+                self.proxy.get_table(table_uri='dummy_uri')
+
+    def test_get_table_concurrent_raises_sub_query_exception(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+
+        with patch.object(self.proxy, '_get_table_itself', return_value={'table': 'dummy_uri'}), \
+                patch.object(self.proxy, '_get_table_columns', side_effect=ValueError('columns failed')), \
+                patch.object(self.proxy, '_get_table_readers', return_value=MagicMock()):
+            with self.assertRaises(ValueError):
+                self.proxy.get_table(table_uri='dummy_uri')
+
+    def test_iter_tables_pages_by_key(self) -> None:
+        executor = MagicMock(side_effect=[['a', 'b'], ['c']])
+        with patch.object(self.proxy, 'query_executor', return_value=executor), \
+                patch.object(self.proxy, 'get_tables') as mock_get_tables:
+            mock_get_tables.side_effect = lambda table_uris: {table_uri: table_uri for table_uri in table_uris}
+
+            self.assertEqual(list(self.proxy.iter_tables(page_size=2)), ['a', 'b', 'c'])
+
+        self.assertEqual(executor.call_count, 2)
+        # the vertices after the last key of the previous page, ordered by key and limited before reading the keys
+        steps = executor.call_args[1]['query'].bytecode.step_instructions
+        self.assertEqual(steps[-5:], [['has', 'key', gt('b')], ['order'], ['by', 'key'], ['limit', 2],
+                                      ['values', 'key']])
+
+
+class TestClientQueryExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.executor = ClientQueryExecutor(client=self.client, traversal_translator=lambda t: 'g.V(?).out()')
+
+    def test_records_query(self) -> None:
+        with patch('metadata_service.proxy.gremlin_proxy.record_query') as mock_record_query:
+            result = self.executor("g.V('a').out()", lambda result_set: ['b', 'c'], bindings={'x': 1})
+
+        self.assertEqual(result, ['b', 'c'])
+        self.client.submit.assert_called_once_with("g.V('a').out()", {'x': 1})
+        mock_record_query.assert_called_once()
+        _, kwargs = mock_record_query.call_args
+        self.assertEqual({name: kwargs[name] for name in ('backend', 'query', 'params', 'records')},
+                         {'backend': 'gremlin', 'query': "g.V('a').out()", 'params': {'x': 1}, 'records': 2})
+        self.assertGreaterEqual(kwargs['execute_ms'], 0)
+        self.assertGreaterEqual(kwargs['consume_ms'], 0)
+        self.assertNotIn('success', kwargs)
+
+    def test_records_translated_traversal(self) -> None:
+        with patch('metadata_service.proxy.gremlin_proxy.record_query') as mock_record_query:
+            self.executor(__.V('a').out(), lambda result_set: 'b')
+
+        self.client.submit.assert_called_once_with('g.V(?).out()', None)
+        _, kwargs = mock_record_query.call_args
+        # a value, not records
+        self.assertEqual((kwargs['query'], kwargs['records']), ('g.V(?).out()', None))
+
+    def test_records_failed_submit(self) -> None:
+        self.client.submit.side_effect = RuntimeError('connection closed')
+        with patch('metadata_service.proxy.gremlin_proxy.record_query') as mock_record_query:
+            with self.assertRaises(RuntimeError):
+                self.executor('g.V()', FromResultSet.toList)
+
+        _, kwargs = mock_record_query.call_args
+        self.assertFalse(kwargs['success'])
+        self.assertIsNone(kwargs['consume_ms'])
+
+    def test_records_failed_get(self) -> None:
+        def get(result_set: Any) -> Any:
+            raise RuntimeError('timed out')
+
+        with patch('metadata_service.proxy.gremlin_proxy.record_query') as mock_record_query:
+            with self.assertRaises(RuntimeError):
+                self.executor('g.V()', get)
+
+        # the query was sent, so the time of the failure is the one of reading its results
+        _, kwargs = mock_record_query.call_args
+        self.assertFalse(kwargs['success'])
+        self.assertGreaterEqual(kwargs['consume_ms'], 0)
+
+
+class TestPooledClientQueryExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = MagicMock()
+        self.executor = PooledClientQueryExecutor(pool=self.pool, traversal_translator=MagicMock(),
+                                                  is_retryable=lambda e: False)
+
+    def test_write_round_trips(self) -> None:
+        with patch.object(RetryingClientQueryExecutor, '__call__', return_value='result'), \
+                patch('metadata_service.proxy.gremlin_proxy.incr') as mock_incr:
+            with self.executor as executor:
+                executor('g.V(1)', FromResultSet.iterate)
+                executor('g.V(2)', FromResultSet.iterate)
+            # a query outside of a write borrows its own client, and is not counted
+            self.executor('g.V(3)', FromResultSet.iterate)
+
+        self.assertEqual(mock_incr.call_args_list,
+                         [call(prefix='metadata_service.proxy.gremlin_proxy', name='writes'),
+                          call(prefix='metadata_service.proxy.gremlin_proxy', name='write_round_trips', count=2)])
+        self.assertEqual(self.pool.lease.call_count, 2)
+
+
+class TestSingleTraversalWrites(unittest.TestCase):
+    """
+    The traversals of the writes in one round trip, see test_write_round_trips in
+    tests/unit/proxy/roundtrip/abstract_gremlin_proxy_tests.py for what they do against a server
+    """
+
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        with patch('metadata_service.proxy.gremlin_proxy.DriverRemoteConnection'):
+            self.proxy = GenericGremlinProxy(host='ws://DOES_NOT_MATTER:8182/gremlin')
+        self.executor = MagicMock()
+        self.table_id = VertexTypes.Table.value.id(key='hive://gold.schema/table')
+        self.user_id = VertexTypes.User.value.id(key='roald.amundsen')
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _sent(self) -> Any:
+        self.executor.assert_called_once()
+        _, kwargs = self.executor.call_args
+        return kwargs
+
+    def test_upsert_single_traversal(self) -> None:
+        _upsert_single_traversal(executor=self.executor, g=self.proxy.g, label=VertexTypes.Database,
+                                 key_property_name='key', key='database://hive', name='hive')
+
+        database_id = VertexTypes.Database.value.id(key='database://hive')
+        expected = __.V(database_id).fold().coalesce(
+            __.unfold(),
+            __.addV('Database').property(T.id, database_id).property(Cardinality.single, 'key', 'database://hive'))
+        expected = expected.property(Cardinality.single, 'name', 'hive')
+        if get_shard():
+            expected = expected.property(Cardinality.single, 'shard', get_shard())
+        sent = self._sent()
+        self.assertEqual(sent['query'].bytecode.step_instructions, expected.id().bytecode.step_instructions)
+        self.assertEqual(sent['get'], FromResultSet.getOnly)
+
+    def test_link_single_traversal(self) -> None:
+        created = datetime(2020, 1, 1)
+        with patch('metadata_service.proxy.gremlin_proxy.timestamp', return_value=created):
+            _link_single_traversal(executor=self.executor, g=self.proxy.g, edge_label=EdgeTypes.Owner,
+                                   key_property_name='key',
+                                   vertex1_label=VertexTypes.Table, vertex1_key='hive://gold.schema/table',
+                                   vertex2_label=VertexTypes.User, vertex2_key='roald.amundsen')
+
+        # both vertices are looked up in the traversal, which adds the edge unless there is one
+        expected = __.V(self.table_id).as_('one').V(self.user_id).coalesce(
+            __.select('one').outE('OWNER').where(__.inV().hasId(self.user_id)),
+            __.addE('OWNER').from_('one').property('created', created))
+        sent = self._sent()
+        self.assertEqual(sent['query'].bytecode.step_instructions, expected.bytecode.step_instructions)
+        # a missing vertex returns nothing
+        with self.assertRaises(StopIteration):
+            sent['get']([])
+
+    def test_expire_link_single_traversal(self) -> None:
+        _expire_link_single_traversal(executor=self.executor, g=self.proxy.g, edge_label=EdgeTypes.Owner,
+                                      key_property_name='key',
+                                      vertex1_label=VertexTypes.Table, vertex1_key='hive://gold.schema/table',
+                                      vertex2_label=VertexTypes.User, vertex2_key='roald.amundsen')
+
+        expected = __.V(self.table_id).V(self.user_id).sideEffect(
+            __.bothE('OWNER').where(__.otherV().hasId(self.table_id)).drop()).id()
+        self.executor.assert_called_once()
+        (query,), kwargs = self.executor.call_args
+        self.assertEqual(query.bytecode.step_instructions, expected.bytecode.step_instructions)
+        self.assertIsNone(kwargs['get']([[self.user_id]]))
+        with self.assertRaises(StopIteration):
+            kwargs['get']([])
+
+    def test_expire_link_single_traversal_same_vertex(self) -> None:
+        with self.assertRaises(AssertionError):
+            _expire_link_single_traversal(executor=self.executor, g=self.proxy.g, edge_label=EdgeTypes.Owner,
+                                          key_property_name='key', vertex1_id=self.table_id,
+                                          vertex2_id=self.table_id)
+        self.executor.assert_not_called()
+
+    def test_requiring_result(self) -> None:
+        get = _requiring_result(FromResultSet.getOnly)
+
+        # the empty parts of the result set are skipped
+        self.assertEqual(get([[], ['id']]), 'id')
+        with self.assertRaises(StopIteration):
+            get([])
+        with self.assertRaises(StopIteration):
+            get([[], []])
+
+
+class TestBatchWrite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        self.app.config['GREMLIN_WRITE_BATCH_SIZE'] = 2
+        with patch('metadata_service.proxy.gremlin_proxy.DriverRemoteConnection'):
+            self.proxy = GenericGremlinProxy(host='ws://DOES_NOT_MATTER:8182/gremlin')
+        self.batch = BatchWrite(key_property_name='key', batch_size=2)
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _add_tags(self, count: int) -> None:
+        for item in range(count):
+            self.batch.add(item, self.batch.upsert(label=VertexTypes.Tag, key=f'tag{item}', tag_type='default'),
+                           self.batch.link(edge_label=EdgeTypes.Tag, vertex1_label=VertexTypes.Tag,
+                                           vertex1_key=f'tag{item}', vertex2_label=VertexTypes.Table,
+                                           vertex2_key='hive://gold.schema/table'))
+
+    def test_union_of_the_items_per_batch(self) -> None:
+        self._add_tags(3)
+        executor = MagicMock(side_effect=[{0, 1}, {2}])
+
+        self.assertEqual(self.batch.execute(executor=executor, g=self.proxy.g), {0, 1, 2})
+
+        # batch_size items per traversal
+        self.assertEqual(executor.call_count, 2)
+        for (_, kwargs), items in zip(executor.call_args_list, [[0, 1], [2]]):
+            self.assertEqual(kwargs['get'], FromResultSet.toSet)
+            inject, union = kwargs['query'].bytecode.step_instructions
+            self.assertEqual(inject, ['inject', 0])
+            self.assertEqual(union[0], 'union')
+            self.assertEqual(len(union[1:]), len(items))
+            for item, item_writes in zip(items, union[1:]):
+                steps = item_writes.step_instructions
+                # the upsert then the link, and the item at the end
+                properties = ['property', 'property'] if get_shard() else ['property']
+                self.assertEqual([step[0] for step in steps],
+                                 ['V', 'fold', 'coalesce'] + properties + ['id', 'V', 'as', 'V', 'coalesce',
+                                                                           'constant'])
+                self.assertEqual(steps[0], ['V', VertexTypes.Tag.value.id(key=f'tag{item}')])
+                self.assertEqual(steps[-1], ['constant', item])
+
+    def test_failed_batch_is_not_written(self) -> None:
+        self._add_tags(3)
+        executor = MagicMock(side_effect=[RuntimeError('timed out'), {2}])
+
+        with self.assertLogs('metadata_service.proxy.gremlin_proxy', level='WARNING'):
+            self.assertEqual(self.batch.execute(executor=executor, g=self.proxy.g), {2})
+        self.assertEqual(executor.call_count, 2)
+
+    def test_no_writes(self) -> None:
+        with self.assertRaises(AssertionError):
+            self.batch.add(0)
+        with self.assertRaises(AssertionError):
+            BatchWrite(key_property_name='key', batch_size=0)
+
+    def test_apply_mutations_falls_back_to_one_by_one(self) -> None:
+        mutations = [Mutation(mutation_type=MutationType.TAG.value, table_uri='hive://gold.schema/table',
+                              value=f'tag{item}') for item in range(3)] + \
+            [Mutation(mutation_type=MutationType.BADGE.value, table_uri='hive://gold.schema/table', value='beta')]
+        self.proxy._client_pool = MagicMock()
+        # the first batch fails and the second writes nothing, as when the table is missing
+        batches = [RuntimeError('timed out'), set()]
+        applied = []  # type: List[Mutation]
+
+        def apply_mutation(*, mutation: Mutation, executor: Any) -> None:
+            applied.append(mutation)
+            if mutation.mutation_type == MutationType.BADGE.value:
+                raise NotImplementedError
+
+        with patch.object(RetryingClientQueryExecutor, '__call__', side_effect=batches) as mock_call, \
+                patch.object(self.proxy, '_apply_mutation', side_effect=apply_mutation), \
+                patch('metadata_service.proxy.gremlin_proxy.incr') as mock_incr:
+            results = self.proxy.apply_mutations(mutations=mutations)
+
+        self.assertEqual(results, [MutationResult(success=True)] * 3
+                         + [MutationResult(success=False, message='badge mutations are not supported')])
+        # only the mutations the batches did not write are applied one by one
+        self.assertEqual(applied, mutations)
+        self.assertEqual(mock_call.call_count, 2)
+        # one lease, with a round trip per batch since _apply_mutation is patched
+        self.proxy._client_pool.lease.assert_called_once_with()
+        mock_incr.assert_any_call(prefix='metadata_service.proxy.gremlin_proxy', name='write_round_trips', count=2)
+
+    def test_apply_mutations_written_in_batches(self) -> None:
+        mutations = [Mutation(mutation_type=MutationType.OWNER.value, table_uri='hive://gold.schema/table',
+                              value=f'user{item}') for item in range(3)]
+        self.proxy._client_pool = MagicMock()
+
+        with patch.object(RetryingClientQueryExecutor, '__call__', side_effect=[{0, 1}, {2}]), \
+                patch.object(self.proxy, '_apply_mutation') as mock_apply_mutation, \
+                patch('metadata_service.proxy.gremlin_proxy.incr') as mock_incr:
+            results = self.proxy.apply_mutations(mutations=mutations)
+
+        self.assertEqual(results, [MutationResult(success=True)] * 3)
+        mock_apply_mutation.assert_not_called()
+        # two round trips for three writes instead of one per write
+        mock_incr.assert_any_call(prefix='metadata_service.proxy.gremlin_proxy', name='write_round_trips', count=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
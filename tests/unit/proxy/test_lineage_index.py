@@ -0,0 +1,51 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from metadata_service.proxy.lineage_index import LineageIndex
+
+UPSTREAM_EDGES = [('alpha', 'gamma'), ('alpha', 'beta'), ('beta', 'delta'), ('gamma', 'delta'), ('delta', 'alpha'),
+                  ('delta', 'epsilon')]
+DOWNSTREAM_EDGES = [(target, source) for source, target in UPSTREAM_EDGES]
+
+
+class TestLineageIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = LineageIndex()
+        self.index.rebuild(upstream_edges=UPSTREAM_EDGES, downstream_edges=DOWNSTREAM_EDGES)
+
+    def test_rebuild(self) -> None:
+        index = LineageIndex()
+        self.assertFalse(index.is_built)
+        self.assertEqual(index.traverse('alpha', upstream=True, depth=1, max_nodes=10), ([], False))
+
+        index.rebuild(upstream_edges=iter(UPSTREAM_EDGES), downstream_edges=iter(DOWNSTREAM_EDGES))
+        self.assertTrue(index.is_built)
+        self.assertEqual(len(index), 5)
+
+        index.rebuild(upstream_edges=[('alpha', 'beta')], downstream_edges=[])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.traverse('alpha', upstream=True, depth=2, max_nodes=10), ([['beta']], False))
+
+    def test_traverse(self) -> None:
+        # every entity once, on the first level it is reached, ordered by key
+        self.assertEqual(self.index.traverse('alpha', upstream=True, depth=5, max_nodes=10),
+                         ([['beta', 'gamma'], ['delta'], ['epsilon']], False))
+        self.assertEqual(self.index.traverse('alpha', upstream=True, depth=2, max_nodes=10),
+                         ([['beta', 'gamma'], ['delta']], False))
+        self.assertEqual(self.index.traverse('delta', upstream=False, depth=5, max_nodes=10),
+                         ([['beta', 'gamma'], ['alpha']], False))
+        self.assertEqual(self.index.traverse('epsilon', upstream=True, depth=5, max_nodes=10), ([], False))
+        self.assertEqual(self.index.traverse('unknown', upstream=True, depth=5, max_nodes=10), ([], False))
+
+    def test_traverse_max_nodes(self) -> None:
+        self.assertEqual(self.index.traverse('alpha', upstream=True, depth=5, max_nodes=1), ([['beta']], True))
+        self.assertEqual(self.index.traverse('alpha', upstream=True, depth=5, max_nodes=2),
+                         ([['beta', 'gamma']], True))
+        self.assertEqual(self.index.traverse('alpha', upstream=True, depth=5, max_nodes=4),
+                         ([['beta', 'gamma'], ['delta'], ['epsilon']], False))
+
+
+if __name__ == '__main__':
+    unittest.main()
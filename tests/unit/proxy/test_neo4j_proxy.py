@@ -4,28 +4,53 @@
 import copy
 import textwrap
 import unittest
-from typing import Any, Dict  # noqa: F401
-from unittest.mock import MagicMock, patch
+from typing import Any, Callable, Dict  # noqa: F401
+from unittest.mock import MagicMock, call, patch
 
 from amundsen_common.models.dashboard import DashboardSummary
-from amundsen_common.models.lineage import Lineage, LineageItem
+from amundsen_common.models.lineage import LineageItem
 from amundsen_common.models.popular_table import PopularTable
 from amundsen_common.models.table import (Application, Badge, Column,
-                                          ProgrammaticDescription, Source,
-                                          Stat, Table, Tag, User, Watermark)
+                                          ProgrammaticDescription, Reader,
+                                          Source, Stat, Table, Tag, User,
+                                          Watermark)
 from amundsen_common.models.user import User as UserModel
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, ProfiledPlan
 
 from metadata_service import create_app
 from metadata_service.entity.dashboard_detail import DashboardDetail
 from metadata_service.entity.dashboard_query import DashboardQuery
+from metadata_service.entity.lineage import BoundedLineage
+from metadata_service.entity.mutation import Mutation, MutationResult
 from metadata_service.entity.resource_type import ResourceType
+from metadata_service.entity.table_projection import TableProjection
 from metadata_service.entity.tag_detail import TagDetail
+from metadata_service.entity.usage import UsageDelta
 from metadata_service.exception import NotFoundException
-from metadata_service.proxy.neo4j_proxy import Neo4jProxy
+from metadata_service.proxy.lineage_index import LineageIndex
+from metadata_service.proxy.neo4j_proxy import BOOKMARK_HEADER, Neo4jProxy
+from metadata_service.proxy.query_profiler import profiling
+from metadata_service.proxy.shared import run_concurrently
+from metadata_service.proxy.statistics_snapshot import StatisticsSnapshot
+from metadata_service.proxy.tag_index import TagIndex
 from metadata_service.util import UserResourceRel
 
 
+def _managed_transaction(tx: MagicMock) -> Callable[..., Any]:
+    """
+    Stands in for Session.write_transaction, which commits when the unit of work returns and rolls back when it raises
+    """
+    def write_transaction(unit_of_work: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        try:
+            result = unit_of_work(tx, *args, **kwargs)
+        except Exception:
+            tx.rollback()
+            raise
+        tx.commit()
+        return result
+    return write_transaction
+
+
 class TestNeo4jProxy(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -240,6 +265,196 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(str(expected), str(table))
 
+    def test_get_table_single_transaction(self) -> None:
+        self.app.config['NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION'] = True
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_tx = MagicMock()
+            mock_tx.run.side_effect = [self.col_usage_return_value, [], self.table_level_return_value]
+            mock_session = mock_driver.return_value.session.return_value.__enter__.return_value
+            mock_session.read_transaction.side_effect = lambda fn, *args, **kwargs: fn(mock_tx, *args, **kwargs)
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            table = neo4j_proxy.get_table(table_uri='dummy_uri')
+
+            self.assertEqual(mock_session.read_transaction.call_count, 1)
+            self.assertEqual(mock_tx.run.call_count, 3)
+            mock_execute.assert_not_called()
+            self.assertEqual(table.name, 'foo_table')
+            self.assertEqual([col.name for col in table.columns], ['bar_id_1', 'bar_id_2'])
+            self.assertEqual(table.owners, [User(email='tester@example.com')])
+            self.assertEqual(table.last_updated_timestamp, 1)
+
+    def test_get_table_single_transaction_not_found(self) -> None:
+        self.app.config['NEO4J_TABLE_DETAIL_SINGLE_TRANSACTION'] = True
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_tx = MagicMock()
+            mock_tx.run.side_effect = [[], [], self.table_level_return_value]
+            mock_session = mock_driver.return_value.session.return_value.__enter__.return_value
+            mock_session.read_transaction.side_effect = lambda fn, *args, **kwargs: fn(mock_tx, *args, **kwargs)
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            with self.assertRaises(NotFoundException):
+                neo4j_proxy.get_table(table_uri='dummy_uri')
+
+    def test_execute_cypher_query_profiling(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = mock_driver.return_value.session.return_value.__enter__.return_value
+            mock_result = mock_session.run.return_value
+            mock_result.summary.return_value = MagicMock(
+                result_available_after=2, result_consumed_after=3,
+                profile=ProfiledPlan('ProduceResults', ['t'], {'runtime': 'SLOTTED'}, [
+                    ProfiledPlan('NodeIndexSeek', ['t'], {}, [], 2, 1)
+                ], 0, 1))
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            self.assertEqual(neo4j_proxy._execute_cypher_query(statement='MATCH (t) RETURN t', param_dict={'a': 1}),
+                             mock_result)
+            mock_session.run.assert_called_with('MATCH (t) RETURN t', a=1)
+
+            with profiling() as profiler:
+                self.assertEqual(neo4j_proxy._execute_cypher_query(statement='MATCH (t) RETURN t',
+                                                                   param_dict={'a': 1}),
+                                 mock_result)
+            mock_session.run.assert_called_with('PROFILE MATCH (t) RETURN t', a=1)
+            query, = profiler.queries
+            self.assertEqual(query.query, 'MATCH (t) RETURN t')
+            self.assertEqual(query.db_hits, 2)
+            self.assertEqual(query.server_ms, 5)
+            self.assertEqual(query.plan['operator_type'], 'ProduceResults')
+            self.assertEqual(query.plan['arguments'], {'runtime': 'SLOTTED'})
+            self.assertEqual(query.plan['children'][0]['operator_type'], 'NodeIndexSeek')
+
+    def test_execute_cypher_query_metrics(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch('metadata_service.proxy.neo4j_proxy.record_query') as mock_record_query:
+            mock_session = mock_driver.return_value.session.return_value.__enter__.return_value
+            mock_session.run.return_value.detach.return_value = 4
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._execute_cypher_query(statement='MATCH (t) RETURN t', param_dict={'a': 1})
+
+            _, kwargs = mock_record_query.call_args
+            self.assertEqual((kwargs['backend'], kwargs['query'], kwargs['params'], kwargs['records']),
+                             ('neo4j', 'MATCH (t) RETURN t', {'a': 1}, 4))
+            self.assertGreaterEqual(kwargs['consume_ms'], 0)
+
+            mock_session.run.side_effect = RuntimeError('boom')
+            with self.assertRaises(RuntimeError):
+                neo4j_proxy._execute_cypher_query(statement='MATCH (t) RETURN t', param_dict={'a': 1})
+            _, kwargs = mock_record_query.call_args
+            self.assertFalse(kwargs['success'])
+            self.assertIsNone(kwargs['consume_ms'])
+
+    def test_get_table_concurrent_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jProxy, '_exec_col_query') as mock_col_query, \
+                patch.object(Neo4jProxy, '_exec_usage_query') as mock_usage_query, \
+                patch.object(Neo4jProxy, '_exec_table_query') as mock_table_query:
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            cols, last_neo4j_record = neo4j_proxy._get_columns_from_records('dummy_uri', self.col_usage_return_value)
+            mock_col_query.return_value = (cols, last_neo4j_record)
+            mock_usage_query.return_value = []
+            mock_table_query.return_value = neo4j_proxy._get_table_level_results_from_record(
+                self.table_level_return_value.single())
+
+            table = neo4j_proxy.get_table(table_uri='dummy_uri')
+
+            mock_col_query.assert_called_once_with('dummy_uri', None)
+            mock_usage_query.assert_called_once_with('dummy_uri')
+            mock_table_query.assert_called_once_with('dummy_uri')
+            self.assertEqual(table.name, 'foo_table')
+            self.assertEqual(table.columns, cols)
+            self.assertEqual(table.owners, [User(email='tester@example.com')])
+
+    def test_get_table_projection(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            table_record = dict(self.col_usage_return_value[0], col=None, col_dscrpt=None, col_stats=[], col_badges=[])
+            mock_execute.side_effect = [[table_record], self.table_level_return_value]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            table = neo4j_proxy.get_table(table_uri='dummy_uri', projection=TableProjection.from_fields([]))
+
+            # no usage query without table readers
+            self.assertEqual(mock_execute.call_count, 2)
+            self.assertNotIn(':COLUMN]', mock_execute.call_args_list[0][1]['statement'])
+            self.assertEqual(table.name, 'foo_table')
+            self.assertEqual(table.description, 'foo description')
+            self.assertEqual(table.columns, [])
+            self.assertEqual(table.owners, [User(email='tester@example.com')])
+
+    def test_get_table_column_page(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            col_record = dict(self.col_usage_return_value[1], col_stats=[], col_badges=[])
+            mock_execute.side_effect = [[col_record], [], self.table_level_return_value]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            projection = TableProjection.from_fields(['columns', 'table_readers'], column_offset=1, column_limit=1)
+            table = neo4j_proxy.get_table(table_uri='dummy_uri', projection=projection)
+
+            statement = mock_execute.call_args_list[0][1]['statement']
+            self.assertIn('collect(col)[$column_offset..$column_end] AS cols', statement)
+            self.assertNotIn(':STAT]', statement)
+            self.assertNotIn(':HAS_BADGE]', statement)
+            self.assertEqual(mock_execute.call_args_list[0][1]['param_dict'],
+                             {'tbl_key': 'dummy_uri', 'column_offset': 1, 'column_end': 2})
+            self.assertEqual([col.name for col in table.columns], ['bar_id_2'])
+            self.assertEqual(list(table.columns[0].stats), [])
+
+    def test_get_table_projection_not_found(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [[], [], self.table_level_return_value]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            with self.assertRaises(NotFoundException):
+                neo4j_proxy.get_table(table_uri='dummy_uri', projection=TableProjection(column_limit=10))
+
+    def test_get_tables(self) -> None:
+        col_usage_return_value = copy.deepcopy(self.col_usage_return_value)
+        for col in col_usage_return_value:
+            col['tbl']['key'] = 'dummy_uri'
+        table_level_return_value = [{**self.table_level_return_value.single(), 'tbl_key': 'dummy_uri'}]
+        usage_return_value = [{'table_key': 'dummy_uri',
+                               'readers': [{'email': 'reader@example.com', 'read_count': 3}]}]
+
+        def execute_cypher_query(statement: str, param_dict: Dict[str, Any]) -> Any:
+            self.assertEqual(param_dict['tbl_keys'], ['dummy_uri', 'missing_uri'])
+            if 'COLUMN' in statement:
+                return col_usage_return_value
+            if 'READ' in statement:
+                return usage_return_value
+            return table_level_return_value
+
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = execute_cypher_query
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            tables = neo4j_proxy.get_tables(table_uris=['dummy_uri', 'missing_uri'])
+
+            self.assertEqual(mock_execute.call_count, 3)
+            self.assertEqual(list(tables.keys()), ['dummy_uri'])
+            table = tables['dummy_uri']
+            self.assertEqual(table.name, 'foo_table')
+            self.assertEqual([col.name for col in table.columns], ['bar_id_1', 'bar_id_2'])
+            self.assertEqual(table.table_readers, [Reader(user=User(email='reader@example.com'), read_count=3)])
+            self.assertEqual(table.owners, [User(email='tester@example.com')])
+
+    def test_iter_tables(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute, \
+                patch.object(Neo4jProxy, 'get_tables') as mock_get_tables:
+            mock_execute.side_effect = [[{'key': 'a'}, {'key': 'b'}], [{'key': 'c'}]]
+            mock_get_tables.side_effect = lambda table_uris: {uri: f'table {uri}' for uri in table_uris if uri != 'b'}
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            tables = list(neo4j_proxy.iter_tables(page_size=2))
+
+            self.assertEqual(tables, ['table a', 'table c'])
+            self.assertEqual([call[1]['param_dict'] for call in mock_execute.call_args_list],
+                             [{'after': '', 'page_size': 2}, {'after': 'b', 'page_size': 2}])
+            self.assertEqual(mock_get_tables.call_count, 2)
+
     def test_get_table_with_valid_description(self) -> None:
         """
         Test description is returned for table
@@ -290,7 +505,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -358,7 +573,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -379,7 +594,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -393,13 +608,97 @@ class TestNeo4jProxy(unittest.TestCase):
             self.assertEqual(mock_run.call_count, 2)
             self.assertEqual(mock_commit.call_count, 1)
 
+    def test_write_transaction_closes_session(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = mock_driver.return_value.session.return_value
+            mock_transaction = MagicMock()
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+            mock_transaction.run.return_value.single.return_value = None
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            with self.assertRaises(RuntimeError):
+                neo4j_proxy.add_owner(table_uri='dummy_uri', owner='tester')
+
+            mock_driver.return_value.session.assert_called_with(access_mode=WRITE_ACCESS)
+            self.assertEqual(mock_transaction.rollback.call_count, 1)
+            self.assertEqual(mock_transaction.commit.call_count, 0)
+            self.assertEqual(mock_session.close.call_count, 1)
+
+    def test_write_transaction_retry(self) -> None:
+        def write_transaction(unit_of_work: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+            # the driver runs the unit of work again after a transient error
+            unit_of_work(MagicMock(), *args, **kwargs)
+            return unit_of_work(MagicMock(), *args, **kwargs)
+
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch('metadata_service.proxy.neo4j_proxy.incr') as mock_incr, \
+                patch('metadata_service.proxy.neo4j_proxy.timing') as mock_timing:
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = write_transaction
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            result = neo4j_proxy._write_transaction(lambda tx, value: value, 'foo')
+
+            self.assertEqual(result, 'foo')
+            self.assertEqual(mock_timing.call_count, 1)
+            mock_incr.assert_called_once_with(prefix='metadata_service.proxy.neo4j_proxy',
+                                              name='write_transaction.retry')
+            self.assertEqual(mock_session.close.call_count, 1)
+
+    def test_read_your_writes(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(MagicMock())
+            mock_session.last_bookmark.return_value = 'bookmark:2'
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+
+            # reads without bookmark go to any member of the cluster
+            neo4j_proxy._execute_cypher_query(statement='MATCH (n) RETURN n', param_dict={})
+            mock_driver.return_value.session.assert_called_with(access_mode=READ_ACCESS)
+
+            # reads wait for the bookmark the client passed, and then for the bookmark of its own write
+            with self.app.test_request_context('/table/foo', headers={BOOKMARK_HEADER: 'bookmark:1'}):
+                neo4j_proxy._execute_cypher_query(statement='MATCH (n) RETURN n', param_dict={})
+                mock_driver.return_value.session.assert_called_with(access_mode=READ_ACCESS,
+                                                                    bookmarks=['bookmark:1'])
+
+                neo4j_proxy.add_owner(table_uri='dummy_uri', owner='tester')
+                mock_driver.return_value.session.assert_called_with(access_mode=WRITE_ACCESS)
+
+                neo4j_proxy._execute_cypher_query(statement='MATCH (n) RETURN n', param_dict={})
+                mock_driver.return_value.session.assert_called_with(access_mode=READ_ACCESS,
+                                                                    bookmarks=['bookmark:2', 'bookmark:1'])
+
+                response = self.app.process_response(self.app.response_class())
+                self.assertEqual(response.headers[BOOKMARK_HEADER], 'bookmark:2')
+
+    def test_read_your_writes_in_concurrent_sub_queries(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(MagicMock())
+            mock_session.last_bookmark.return_value = 'bookmark:2'
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+
+            with self.app.test_request_context('/table/foo'):
+                neo4j_proxy.add_owner(table_uri='dummy_uri', owner='tester')
+                mock_driver.return_value.session.reset_mock()
+
+                run_concurrently(
+                    lambda: neo4j_proxy._execute_cypher_query(statement='MATCH (n) RETURN n', param_dict={}),
+                    lambda: neo4j_proxy._execute_cypher_query(statement='MATCH (m) RETURN m', param_dict={}))
+
+            # the sub queries wait for the write of the request as well
+            self.assertEqual(mock_driver.return_value.session.call_args_list,
+                             [call(access_mode=READ_ACCESS, bookmarks=['bookmark:2'])] * 2)
+
     def test_delete_owner(self) -> None:
         with patch.object(GraphDatabase, 'driver') as mock_driver:
             mock_session = MagicMock()
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -419,7 +718,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -440,7 +739,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -461,7 +760,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -481,7 +780,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -512,6 +811,50 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(actual.__repr__(), expected.__repr__())
 
+    def test_get_tags_by_prefix(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [
+                {'tag_name': {'key': 'finance'}, 'tag_count': 3}
+            ]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            actual = neo4j_proxy.get_tags(prefix='fin', limit=1)
+
+            self.assertEqual(actual.__repr__(), [TagDetail(tag_name='finance', tag_count=3)].__repr__())
+            self.assertEqual(mock_execute.call_args[1]['param_dict'], {'prefix': 'fin', 'limit': 1})
+            self.assertIn('LIMIT $limit', mock_execute.call_args[1]['statement'])
+
+    def test_get_tags_from_tag_index(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_session = MagicMock()
+            mock_driver.return_value.session.return_value = mock_session
+            mock_transaction = MagicMock()
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._tag_index = TagIndex(load=lambda: [('finance', 3), ('pii', 1)])
+            mock_transaction.run.return_value.single.return_value = {'tagged': False, 'deleted': 1}
+
+            # before the index is built, the load includes it
+            neo4j_proxy.add_tag(id='dummy_uri', tag='fin')
+            self.assertEqual(neo4j_proxy.get_tags(prefix='fin').__repr__(),
+                             [TagDetail(tag_name='finance', tag_count=3)].__repr__())
+
+            neo4j_proxy.add_tag(id='dummy_uri', tag='fin')
+            neo4j_proxy.delete_tag(id='dummy_uri', tag='pii')
+            self.assertEqual(neo4j_proxy.get_tags().__repr__(),
+                             [TagDetail(tag_name='fin', tag_count=1),
+                              TagDetail(tag_name='finance', tag_count=3)].__repr__())
+
+            # already tagged
+            mock_transaction.run.return_value.single.return_value = {'tagged': True, 'deleted': 0}
+            neo4j_proxy.add_tag(id='dummy_uri', tag='fin')
+            neo4j_proxy.delete_tag(id='dummy_uri', tag='finance')
+            self.assertEqual(neo4j_proxy.get_tags(limit=1).__repr__(),
+                             [TagDetail(tag_name='finance', tag_count=3)].__repr__())
+            mock_execute.assert_not_called()
+
     def test_get_neo4j_latest_updated_ts(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
             mock_execute.return_value.single.return_value = {
@@ -550,6 +893,31 @@ class TestNeo4jProxy(unittest.TestCase):
                                                 'number_of_tables_with_owners': '1',
                                                 'number_of_documented_and_owned_tables': '1'})
 
+    def test_get_statistics_from_snapshot(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(MagicMock())
+            mock_execute.return_value = [
+                {'number_of_tables': 2, 'number_of_documented_tables': 1, 'number_of_documented_cols': 1,
+                 'number_of_owners': 1, 'number_of_tables_with_owners': 1,
+                 'number_of_documented_and_owned_tables': 1}]
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._statistics_snapshot = StatisticsSnapshot(compute=neo4j_proxy._query_statistics,
+                                                                  max_age_sec=60, refresh_on_write=True)
+
+            neo4j_statistics = neo4j_proxy.get_statistics()
+            self.assertEqual(neo4j_statistics['number_of_tables'], 2)
+            self.assertIn('statistics_timestamp', neo4j_statistics)
+            neo4j_proxy.get_statistics()
+            neo4j_proxy._statistics_snapshot.refresh()
+            self.assertEqual(mock_execute.call_count, 1)
+
+            # changed owners are picked up by the next refresh
+            neo4j_proxy.add_owner(table_uri='dummy_uri', owner='tester')
+            neo4j_proxy._statistics_snapshot.refresh()
+            self.assertEqual(mock_execute.call_count, 2)
+
     def test_get_popular_tables(self) -> None:
         # Test cache hit for global popular tables
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
@@ -590,6 +958,183 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(actual.__repr__(), expected.__repr__())
 
+    def test_refresh_popular_tables(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'table_key': 'foo'}]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(7), ['foo'])
+            self.assertEqual(neo4j_proxy._get_personal_popular_tables_uris(7, 'active_user'), ['foo'])
+            self.assertEqual(neo4j_proxy._get_personal_popular_tables_uris(7, 'inactive_user'), ['foo'])
+            neo4j_proxy._popular_tables_requests[(7, 'inactive_user')] = 0
+            self.assertEqual(mock_execute.call_count, 3)
+
+            mock_execute.return_value = [{'table_key': 'bar'}]
+            neo4j_proxy.refresh_popular_tables()
+
+            # global and active user rankings got recomputed, the inactive user is not tracked anymore
+            self.assertEqual(mock_execute.call_count, 5)
+            self.assertEqual(set(neo4j_proxy._popular_tables_requests), {(7, None), (7, 'active_user')})
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(7), ['bar'])
+            self.assertEqual(neo4j_proxy._get_personal_popular_tables_uris(7, 'active_user'), ['bar'])
+            self.assertEqual(neo4j_proxy._get_personal_popular_tables_uris(7, 'inactive_user'), ['foo'])
+            self.assertEqual(mock_execute.call_count, 5)
+
+            # rankings refreshed within the refresh interval, e.g. by another worker, are skipped
+            other_neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            other_neo4j_proxy._get_global_popular_tables_uris(7)
+            other_neo4j_proxy.refresh_popular_tables()
+            self.assertEqual(mock_execute.call_count, 5)
+
+    def test_refresh_popular_tables_warms_up_configured_rankings(self) -> None:
+        self.app.config['POPULAR_TABLES_REFRESH_ENABLED'] = True
+        self.app.config['POPULAR_TABLES_REFRESH_NUM_ENTRIES'] = [10, 25]
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute, \
+                patch('metadata_service.proxy.neo4j_proxy.PeriodicTask') as mock_periodic_task:
+            mock_execute.return_value = [{'table_key': 'foo'}]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+
+            # the refresher starts with the configured global rankings, before any request
+            self.assertEqual(set(neo4j_proxy._popular_tables_requests), {(10, None), (25, None)})
+            self.assertTrue(mock_periodic_task.call_args[1]['run_immediately'])
+            mock_periodic_task.return_value.start.assert_called_once()
+
+            neo4j_proxy.refresh_popular_tables()
+            self.assertEqual(mock_execute.call_count, 2)
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(10), ['foo'])
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(25), ['foo'])
+            self.assertEqual(mock_execute.call_count, 2)
+
+    def test_get_popular_tables_from_popularity_index(self) -> None:
+        self.app.config['POPULARITY_INDEX_ENABLED'] = True
+        self.app.config['POPULAR_TABLE_MINIMUM_READER_COUNT'] = 2
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'table_key': 'foo', 'readers': 2, 'total_reads': 10},
+                                         {'table_key': 'bar', 'readers': 3, 'total_reads': 10},
+                                         {'table_key': 'baz', 'readers': 1, 'total_reads': 1000}]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(2), ['bar', 'foo'])
+            self.assertEqual(neo4j_proxy._get_global_popular_tables_uris(1), ['bar'])
+
+            # the index is built once
+            self.assertEqual(mock_execute.call_count, 1)
+
+    def test_apply_usage_deltas(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_transaction = MagicMock()
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+            mock_transaction.run.return_value = [{'table_key': 'foo', 'new_reader': True, 'read_count': 5},
+                                                 {'table_key': 'bar', 'new_reader': False, 'read_count': 20}]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._popularity_index.rebuild([('foo', 1, 10), ('bar', 1, 10)])
+            neo4j_proxy.apply_usage_deltas(deltas=[
+                UsageDelta(table_uri='foo', user_email='test@example.com', read_count=5),
+                UsageDelta(table_uri='bar', user_email='test@example.com', read_count=20)
+            ])
+
+            self.assertEqual(mock_transaction.run.call_count, 1)
+            self.assertEqual(mock_transaction.run.call_args[0][1], {'deltas': [
+                {'table_uri': 'foo', 'user_email': 'test@example.com', 'read_count': 5},
+                {'table_uri': 'bar', 'user_email': 'test@example.com', 'read_count': 20}
+            ]})
+            self.assertEqual(mock_transaction.commit.call_count, 1)
+            self.assertEqual(neo4j_proxy._popularity_index.top(num_entries=2, min_readers=2), ['foo'])
+            self.assertEqual(neo4j_proxy._popularity_index.top(num_entries=2, min_readers=1), ['foo', 'bar'])
+
+    def test_apply_usage_deltas_merges_duplicates(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_transaction = MagicMock()
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+            mock_transaction.run.return_value = [{'table_key': 'foo', 'new_reader': True, 'read_count': 7},
+                                                 {'table_key': 'bar', 'new_reader': True, 'read_count': 1}]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._popularity_index.rebuild([('foo', 1, 10), ('bar', 1, 10)])
+            neo4j_proxy.apply_usage_deltas(deltas=[
+                UsageDelta(table_uri='foo', user_email='test@example.com', read_count=5),
+                UsageDelta(table_uri='bar', user_email='test@example.com', read_count=1),
+                UsageDelta(table_uri='foo', user_email='test@example.com', read_count=2)
+            ])
+
+            # one row per table and user, so the user is a new reader of foo once
+            self.assertEqual(mock_transaction.run.call_args[0][1], {'deltas': [
+                {'table_uri': 'foo', 'user_email': 'test@example.com', 'read_count': 7},
+                {'table_uri': 'bar', 'user_email': 'test@example.com', 'read_count': 1}
+            ]})
+            self.assertEqual(neo4j_proxy._popularity_index.top(num_entries=2, min_readers=2), ['foo', 'bar'])
+            self.assertEqual(neo4j_proxy._popularity_index.top(num_entries=2, min_readers=3), [])
+
+    def test_apply_mutations(self) -> None:
+        self.app.config['PROXY_MUTATION_BATCH_SIZE'] = 2
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_transaction = MagicMock()
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+            # tags in two chunks, the second one fails, then table descriptions with one missing table
+            mock_transaction.run.side_effect = [[{'index': 0}, {'index': 2}], Exception('boom'), [{'index': 1}]]
+            mock_transaction.closed.return_value = False
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            results = neo4j_proxy.apply_mutations(mutations=[
+                Mutation(mutation_type='tag', table_uri='foo', value='pii'),
+                Mutation(mutation_type='table_description', table_uri='foo', value='description'),
+                Mutation(mutation_type='tag', table_uri='bar', value='pii'),
+                Mutation(mutation_type='tag', table_uri='baz', value='pii'),
+                Mutation(mutation_type='table_description', table_uri='missing', value='description'),
+            ])
+
+            self.assertEqual(mock_transaction.run.call_count, 3)
+            first_chunk = mock_transaction.run.call_args_list[0][0][1]['mutations']
+            self.assertEqual([param['table_uri'] for param in first_chunk], ['foo', 'bar'])
+            self.assertEqual(mock_transaction.commit.call_count, 2)
+            self.assertEqual(mock_transaction.rollback.call_count, 1)
+            self.assertEqual(results, [
+                MutationResult(success=True),
+                MutationResult(success=True),
+                MutationResult(success=True),
+                MutationResult(success=False, message='boom'),
+                MutationResult(success=False, message='Table missing does not exist'),
+            ])
+
+    def test_apply_tag_mutations_updates_tag_index(self) -> None:
+        self.app.config['TAG_INDEX_ENABLED'] = True
+        self.app.config['TAG_INDEX_REBUILD_INTERVAL_SEC'] = 0
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'tag_name': {'key': 'pii'}, 'tag_count': 1}]
+            mock_transaction = MagicMock()
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
+            # bar was already tagged with pii, and baz does not exist
+            mock_transaction.run.return_value = [{'index': 0, 'was_tagged': False}, {'index': 1, 'was_tagged': True},
+                                                 {'index': 3, 'was_tagged': False},
+                                                 {'index': 4, 'was_tagged': False}]
+            mock_transaction.closed.return_value = False
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            # builds the index
+            self.assertEqual(neo4j_proxy.get_tags().__repr__(), [TagDetail(tag_name='pii', tag_count=1)].__repr__())
+            results = neo4j_proxy.apply_mutations(mutations=[
+                Mutation(mutation_type='tag', table_uri='foo', value='pii'),
+                Mutation(mutation_type='tag', table_uri='bar', value='pii'),
+                Mutation(mutation_type='tag', table_uri='baz', value='pii'),
+                Mutation(mutation_type='tag', table_uri='foo', value='finance'),
+                Mutation(mutation_type='tag', table_uri='foo', value='finance'),
+            ])
+
+            self.assertIn('was_tagged', mock_transaction.run.call_args[0][0])
+            self.assertEqual([result.success for result in results], [True, True, False, True, True])
+            # the tags added through the mutations are served without rebuilding the index, once per table
+            self.assertEqual(neo4j_proxy.get_tags().__repr__(),
+                             [TagDetail(tag_name='finance', tag_count=1),
+                              TagDetail(tag_name='pii', tag_count=2)].__repr__())
+            self.assertEqual(mock_execute.call_count, 1)
+
     def test_get_user(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
             mock_execute.return_value.single.return_value = {
@@ -642,7 +1187,9 @@ class TestNeo4jProxy(unittest.TestCase):
         :return:
         """
         with patch.object(GraphDatabase, 'driver') as mock_driver:
-            mock_transaction = mock_driver.return_value.session.return_value.begin_transaction.return_value
+            mock_transaction = MagicMock()
+            mock_session = mock_driver.return_value.session.return_value
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
             mock_run = mock_transaction.run
             mock_commit = mock_transaction.commit
 
@@ -725,6 +1272,41 @@ class TestNeo4jProxy(unittest.TestCase):
             self.assertEqual(result['table'][0].cluster, 'cluster')
             self.assertEqual(result['table'][0].schema, 'schema')
 
+    def test_get_table_by_user_relation_paginated(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [
+                {
+                    'resource': {'name': name, 'key': f'hive://gold.schema/{name}'},
+                    'db': {'name': 'hive'},
+                    'clstr': {'name': 'gold'},
+                    'schema': {'name': 'schema'},
+                } for name in ['table_a', 'table_b', 'table_c']
+            ]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            result = neo4j_proxy.get_table_by_user_relation(user_email='test_user',
+                                                            relation_type=UserResourceRel.own,
+                                                            limit=2,
+                                                            cursor='hive://gold.schema/table')
+
+            self.assertEqual([table.name for table in result['table']], ['table_a', 'table_b'])
+            self.assertEqual(result['next_cursor'], 'hive://gold.schema/table_b')
+
+            _, kwargs = mock_execute.call_args
+            self.assertIn('WHERE resource.key > $cursor', kwargs['statement'])
+            self.assertIn('ORDER BY resource.key LIMIT $limit', kwargs['statement'])
+            self.assertEqual(kwargs['param_dict'], {'user_key': 'test_user',
+                                                    'cursor': 'hive://gold.schema/table',
+                                                    'limit': 3})
+
+            # the last page has no next cursor, and running past the end is not an error
+            mock_execute.return_value = []
+            result = neo4j_proxy.get_table_by_user_relation(user_email='test_user',
+                                                            relation_type=UserResourceRel.own,
+                                                            limit=2,
+                                                            cursor='hive://gold.schema/table_c')
+            self.assertEqual(result, {'table': [], 'next_cursor': None})
+
     def test_get_dashboard_by_user_relation(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
             mock_execute.return_value = [
@@ -764,7 +1346,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -785,7 +1367,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -1015,7 +1597,7 @@ class TestNeo4jProxy(unittest.TestCase):
             mock_driver.return_value.session.return_value = mock_session
 
             mock_transaction = MagicMock()
-            mock_session.begin_transaction.return_value = mock_transaction
+            mock_session.write_transaction.side_effect = _managed_transaction(mock_transaction)
 
             mock_run = MagicMock()
             mock_transaction.run = mock_run
@@ -1075,9 +1657,9 @@ class TestNeo4jProxy(unittest.TestCase):
     def test_get_lineage_no_lineage_information(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
             key = "alpha"
-            mock_execute.return_value.single.side_effect = [{}]
+            mock_execute.side_effect = [[], []]
 
-            expected = Lineage(
+            expected = BoundedLineage(
                 key=key,
                 upstream_entities=[],
                 downstream_entities=[],
@@ -1092,10 +1674,10 @@ class TestNeo4jProxy(unittest.TestCase):
     def test_get_lineage_success(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
             key = "alpha"
-            mock_execute.return_value.single.side_effect = [{
-                "upstream_entities": [
-                    {"key": "beta", "source": "gold", "level": 1, "badges": [], "usage":100},
-                    {"key": "gamma", "source": "dyno", "level": 1,
+            mock_execute.side_effect = [
+                [
+                    {"key": "beta", "source": "gold", "badges": [], "usage": 100},
+                    {"key": "gamma", "source": "dyno",
                      "badges":
                         [
                             {"key": "badge1", "category": "default"},
@@ -1103,12 +1685,12 @@ class TestNeo4jProxy(unittest.TestCase):
                         ],
                      "usage": 200},
                 ],
-                "downstream_entities": [
-                    {"key": "delta", "source": "gold", "level": 1, "badges": [], "usage": 50},
+                [
+                    {"key": "delta", "source": "gold", "badges": [], "usage": 50},
                 ]
-            }]
+            ]
 
-            expected = Lineage(
+            expected = BoundedLineage(
                 key=key,
                 upstream_entities=[
                     LineageItem(**{"key": "beta", "source": "gold", "level": 1, "badges": [], "usage":100}),
@@ -1131,6 +1713,112 @@ class TestNeo4jProxy(unittest.TestCase):
             actual = neo4j_proxy.get_lineage(id=key, resource_type=ResourceType.Table, direction="both", depth=1)
             self.assertEqual(expected.__repr__(), actual.__repr__())
 
+    def test_get_lineage_expands_level_by_level(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [
+                [{"key": "beta", "source": "gold", "badges": [], "usage": 1},
+                 {"key": "gamma", "source": "gold", "badges": [], "usage": 2}],
+                [{"key": "delta", "source": "gold", "badges": [], "usage": None}],
+                [],
+            ]
+
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            actual = neo4j_proxy.get_lineage(id='alpha', resource_type=ResourceType.Table, direction="upstream",
+                                             depth=5)
+
+            self.assertEqual([(item.key, item.level, item.usage) for item in actual.upstream_entities],
+                             [('beta', 1, 1), ('gamma', 1, 2), ('delta', 2, 0)])
+            self.assertEqual(actual.downstream_entities, [])
+            self.assertFalse(actual.truncated)
+            # one query per level, stopping at the first level without new entities
+            self.assertEqual(mock_execute.call_count, 3)
+            second_level = mock_execute.call_args_list[1][1]
+            self.assertIn('HAS_UPSTREAM', second_level['statement'])
+            self.assertEqual(second_level['param_dict']['frontier'], ['beta', 'gamma'])
+            self.assertEqual(set(second_level['param_dict']['visited']), {'alpha', 'beta', 'gamma'})
+
+    def test_get_lineage_truncated(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute, \
+                patch('metadata_service.proxy.neo4j_proxy.get_lineage_limits', return_value=(2, 2)):
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+
+            with self.subTest('entity limit'):
+                mock_execute.side_effect = [
+                    [{"key": "beta", "source": "gold", "badges": [], "usage": 0},
+                     {"key": "gamma", "source": "gold", "badges": [], "usage": 0},
+                     {"key": "delta", "source": "gold", "badges": [], "usage": 0}],
+                ]
+                actual = neo4j_proxy.get_lineage(id='alpha', resource_type=ResourceType.Column,
+                                                 direction="downstream", depth=2)
+                self.assertEqual([item.key for item in actual.downstream_entities], ['beta', 'gamma'])
+                self.assertTrue(actual.truncated)
+                self.assertEqual(mock_execute.call_args[1]['param_dict']['limit'], 3)
+
+            with self.subTest('depth limit'):
+                mock_execute.side_effect = [
+                    [{"key": "beta", "source": "gold", "badges": [], "usage": 0}],
+                    [{"key": "gamma", "source": "gold", "badges": [], "usage": 0}],
+                ]
+                actual = neo4j_proxy.get_lineage(id='alpha', resource_type=ResourceType.Column,
+                                                 direction="downstream", depth=10)
+                self.assertEqual([item.key for item in actual.downstream_entities], ['beta', 'gamma'])
+                self.assertEqual(actual.depth, 2)
+                self.assertTrue(actual.truncated)
+
+    def test_get_lineage_from_lineage_index(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute, \
+                patch.object(Neo4jProxy, 'get_latest_updated_ts') as mock_latest_updated_ts:
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            neo4j_proxy._lineage_indexes = {ResourceType.Table: LineageIndex()}
+
+            mock_latest_updated_ts.return_value = 1
+            mock_execute.side_effect = [
+                [{'source_key': 'alpha', 'target_key': 'beta'}, {'source_key': 'beta', 'target_key': 'gamma'}],
+                [{'source_key': 'alpha', 'target_key': 'delta'}],
+            ]
+            neo4j_proxy.refresh_lineage_index()
+            self.assertIn('HAS_UPSTREAM', mock_execute.call_args_list[0][1]['statement'])
+            self.assertIn('HAS_DOWNSTREAM', mock_execute.call_args_list[1][1]['statement'])
+
+            # not reloaded until the graph is published to again
+            neo4j_proxy.refresh_lineage_index()
+            self.assertEqual(mock_execute.call_count, 2)
+
+            # badges and usage of both directions in one query, removed entities are left out
+            mock_execute.side_effect = [[
+                {'key': 'beta', 'source': 'hive', 'badges': [{'key': 'badge1', 'category': 'default'}], 'usage': 5},
+                {'key': 'delta', 'source': 'hive', 'badges': [], 'usage': None},
+            ]]
+            actual = neo4j_proxy.get_lineage(id='alpha', resource_type=ResourceType.Table, direction='both',
+                                             depth=3)
+            self.assertEqual(mock_execute.call_count, 3)
+            self.assertEqual(set(mock_execute.call_args[1]['param_dict']['keys']), {'beta', 'gamma', 'delta'})
+            expected = BoundedLineage(
+                key='alpha',
+                upstream_entities=[
+                    LineageItem(key='beta', source='hive', level=1, usage=5,
+                                badges=[Badge(badge_name='badge1', category='default')]),
+                ],
+                downstream_entities=[
+                    LineageItem(key='delta', source='hive', level=1, usage=0, badges=[]),
+                ],
+                direction='both',
+                depth=3
+            )
+            self.assertEqual(expected.__repr__(), actual.__repr__())
+
+            # columns are not indexed
+            mock_execute.side_effect = [[], []]
+            neo4j_proxy.get_lineage(id='alpha/col', resource_type=ResourceType.Column, direction='both', depth=1)
+            self.assertIn('HAS_DOWNSTREAM', mock_execute.call_args[1]['statement'])
+
+            mock_latest_updated_ts.return_value = 2
+            mock_execute.side_effect = [[], []]
+            neo4j_proxy.refresh_lineage_index()
+            self.assertEqual(mock_execute.call_count, 7)
+
 
 if __name__ == '__main__':
     unittest.main()
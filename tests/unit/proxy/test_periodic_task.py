@@ -0,0 +1,47 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import unittest
+from typing import List  # noqa: F401
+
+from flask import current_app
+
+from metadata_service import create_app
+from metadata_service.proxy.periodic_task import PeriodicTask
+
+
+class TestPeriodicTask(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+
+    def test_runs_in_app_context_and_survives_failures(self) -> None:
+        calls = []  # type: List[str]
+        done = threading.Event()
+
+        def job() -> None:
+            calls.append(current_app.config['PROXY_CLIENT'])
+            if len(calls) == 1:
+                raise RuntimeError('first run fails')
+            done.set()
+
+        task = PeriodicTask(name='test_task', func=job, interval_sec=0.01, app=self.app, run_immediately=True).start()
+        try:
+            self.assertTrue(done.wait(5))
+        finally:
+            task.stop(timeout_sec=5)
+
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertEqual(calls[0], self.app.config['PROXY_CLIENT'])
+
+    def test_stop(self) -> None:
+        calls = []  # type: List[int]
+        task = PeriodicTask(name='test_task', func=lambda: calls.append(1), interval_sec=60, app=self.app).start()
+
+        task.stop(timeout_sec=5)
+
+        self.assertEqual(calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
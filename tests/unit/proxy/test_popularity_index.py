@@ -0,0 +1,82 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import random
+import unittest
+from collections import defaultdict
+from typing import Dict, List, Tuple  # noqa: F401
+
+from metadata_service.proxy.popularity_index import (PopularityIndex,
+                                                     popularity_score)
+
+
+def _aggregate(edges: Dict[Tuple[str, str], int]) -> List[Tuple[str, int, int]]:
+    # MATCH (tbl:Table)-[r:READ_BY]->(u:User)
+    # RETURN tbl.key as table_key, count(distinct u) as readers, sum(r.read_count) as total_reads
+    readers = defaultdict(int)  # type: Dict[str, int]
+    total_reads = defaultdict(int)  # type: Dict[str, int]
+    for (table_key, _), read_count in edges.items():
+        readers[table_key] += 1
+        total_reads[table_key] += read_count
+    return [(table_key, readers[table_key], total_reads[table_key]) for table_key in readers]
+
+
+def _cypher_popular_tables(edges: Dict[Tuple[str, str], int], *,
+                           num_entries: int, min_readers: int) -> List[Tuple[str, float]]:
+    # WHERE readers >= $num_readers
+    # RETURN table_key, (readers * log(total_reads)) as score ORDER BY score DESC LIMIT $num_entries
+    scores = [(table_key, readers * math.log(total_reads))
+              for table_key, readers, total_reads in _aggregate(edges) if readers >= min_readers]
+    return sorted(scores, key=lambda item: (-item[1], item[0]))[:num_entries]
+
+
+class TestPopularityIndex(unittest.TestCase):
+    def test_popularity_score(self) -> None:
+        self.assertEqual(popularity_score(3, 1), 0)
+        self.assertAlmostEqual(popularity_score(2, 100), 2 * math.log(100))
+        self.assertEqual(popularity_score(0, 0), -math.inf)
+
+    def test_top(self) -> None:
+        index = PopularityIndex()
+        index.rebuild([('a', 10, 100), ('b', 20, 100), ('c', 5, 1000), ('d', 20, 100)])
+
+        self.assertEqual(index.top(num_entries=2, min_readers=1), ['b', 'd'])
+        self.assertEqual(index.top(num_entries=10, min_readers=10), ['b', 'd', 'a'])
+
+        index.apply(table_key='a', new_reader=True, read_count=1000)
+        index.apply(table_key='e', new_reader=True, read_count=1)
+        self.assertEqual(index.top(num_entries=10, min_readers=10), ['b', 'd', 'a'])
+        self.assertEqual(index.top(num_entries=10, min_readers=11), ['b', 'd', 'a'])
+        self.assertAlmostEqual(index.score('a'), 11 * math.log(1100))
+
+    def test_matches_cypher_formula_on_seeded_graph(self) -> None:
+        rng = random.Random(31337)
+        tables = [f'hive://gold.schema/table_{i}' for i in range(200)]
+        users = [f'user_{i}@example.com' for i in range(100)]
+
+        edges = {}  # type: Dict[Tuple[str, str], int]
+        for _ in range(3000):
+            edges[(rng.choice(tables), rng.choice(users))] = rng.randint(1, 50)
+
+        index = PopularityIndex()
+        index.rebuild(_aggregate(edges))
+
+        # usage deltas on both existing and new reader relations
+        for _ in range(2000):
+            edge = (rng.choice(tables), rng.choice(users))
+            read_count = rng.randint(1, 20)
+            index.apply(table_key=edge[0], new_reader=edge not in edges, read_count=read_count)
+            edges[edge] = edges.get(edge, 0) + read_count
+
+        for num_entries, min_readers in [(10, 1), (50, 10), (500, 20)]:
+            expected = _cypher_popular_tables(edges, num_entries=num_entries, min_readers=min_readers)
+            actual = index.top(num_entries=num_entries, min_readers=min_readers)
+
+            self.assertEqual(actual, [table_key for table_key, _ in expected])
+            for table_key, score in expected:
+                self.assertAlmostEqual(index.score(table_key), score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import call, patch
+
+from metadata_service import create_app
+from metadata_service.proxy.query_metrics import (normalize_query,
+                                                  query_fingerprint,
+                                                  record_query, redact_params)
+
+
+class TestQueryMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def test_fingerprint_ignores_literals(self) -> None:
+        self.assertEqual(normalize_query('GET /api/atlas/v2/entity/guid/0e8ab4b1-4c56-4b52-9c1a-3c9e5f0ab7de'),
+                         'GET /api/atlas/v2/entity/guid/?')
+        self.assertEqual(query_fingerprint("g.V('a').has(\"b\", 1.5).limit(10)"),
+                         query_fingerprint("g.V('c').has('d',\n  2).limit(20)"))
+        self.assertNotEqual(query_fingerprint("g.V('a').out()"), query_fingerprint("g.V('a').in()"))
+
+    def test_fingerprint_ignores_the_number_of_literals(self) -> None:
+        self.assertEqual(normalize_query("g.V('a','b', 'c').has('key', within(1, 2))"),
+                         'g.V(?+).has(?, within(?+))')
+        self.assertEqual(query_fingerprint("g.V().has('key', within('a', 'b'))"),
+                         query_fingerprint("g.V().has('key', within('a', 'b', 'c', 'd'))"))
+        # a single literal is not a run
+        self.assertNotEqual(query_fingerprint("g.V().has('key', within('a'))"),
+                            query_fingerprint("g.V().has('key', within('a', 'b'))"))
+
+    def test_redact_params(self) -> None:
+        self.assertEqual(redact_params({'User_Key': 'a', 'tbl_key': 'b', 'owners': [{'email': 'c'}], 'x': None},
+                                       redacted='user|email'),
+                         {'User_Key': '<redacted>', 'tbl_key': 'b', 'owners': [{'email': '<redacted>'}], 'x': None})
+        self.assertEqual(redact_params({'user_key': 'a'}, redacted=None), {'user_key': 'a'})
+        self.assertIsNone(redact_params(None, redacted='user'))
+
+    def test_record_query(self) -> None:
+        prefix = 'metadata_service.proxy.query_metrics.neo4j'
+        fingerprint = query_fingerprint('MATCH (t) RETURN t')
+        with patch('metadata_service.proxy.query_metrics.timing') as mock_timing, \
+                patch('metadata_service.proxy.query_metrics.count') as mock_count, \
+                patch('metadata_service.proxy.query_metrics.incr') as mock_incr:
+            record_query(backend='neo4j', query='MATCH (t) RETURN t', execute_ms=3, consume_ms=2, records=5)
+
+        self.assertEqual(mock_timing.call_args_list, [call(prefix=prefix, name=f'{fingerprint}.execute', ms=3),
+                                                      call(prefix=prefix, name=f'{fingerprint}.consume', ms=2),
+                                                      call(prefix=prefix, name='all.execute', ms=3),
+                                                      call(prefix=prefix, name='all.consume', ms=2)])
+        # the records are a count, not a timing
+        self.assertEqual(mock_count.call_args_list, [call(prefix=prefix, name=f'{fingerprint}.records', value=5),
+                                                     call(prefix=prefix, name='all.records', value=5)])
+        mock_incr.assert_has_calls([call(prefix=prefix, name=f'{fingerprint}.success'),
+                                    call(prefix=prefix, name='all.success')])
+
+    def test_slow_query_log(self) -> None:
+        self.app.config['SLOW_QUERY_THRESHOLD_MS'] = 100
+        self.app.config['SLOW_QUERY_REDACTED_PARAMS'] = 'email'
+
+        with self.assertLogs('metadata_service.proxy.query_metrics', level='WARNING') as logs:
+            record_query(backend='gremlin', query="g.V('a@b.c')", params={'email': 'a@b.c', 'limit': 3},
+                         execute_ms=60, consume_ms=40)
+            record_query(backend='gremlin', query="g.V('a@b.c')", execute_ms=99, success=False)
+            record_query(backend='gremlin', query="g.V('a@b.c')", execute_ms=101, success=False)
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("g.V(?) with params {'email': '<redacted>', 'limit': 3}", logs.output[0])
+        self.assertNotIn('a@b.c', logs.output[0])
+        self.assertIn('failed', logs.output[1])
+
+        self.app.config['SLOW_QUERY_THRESHOLD_MS'] = 0
+        with patch('metadata_service.proxy.query_metrics.LOGGER') as mock_logger:
+            record_query(backend='gremlin', query="g.V('a')", execute_ms=10000)
+        mock_logger.warning.assert_not_called()
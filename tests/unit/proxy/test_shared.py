@@ -0,0 +1,103 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import unittest
+from typing import List, Optional
+
+from flask import current_app, g, request
+
+from metadata_service import create_app
+from metadata_service.proxy.query_profiler import (ProfiledQuery,
+                                                   get_query_profiler,
+                                                   profiling)
+from metadata_service.proxy.shared import run_concurrently
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def test_sequential_when_disabled(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = False
+        main_thread = threading.current_thread()
+
+        results = run_concurrently(lambda: threading.current_thread(), lambda: 'b')
+
+        self.assertEqual(results, [main_thread, 'b'])
+
+    def test_concurrent_keeps_order_and_app_context(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        # both callables have to be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def sub_query(value: str) -> str:
+            barrier.wait()
+            return value + current_app.config['PROXY_CLIENT']
+
+        results = run_concurrently(lambda: sub_query('a:'), lambda: sub_query('b:'))
+
+        proxy_client = self.app.config['PROXY_CLIENT']
+        self.assertEqual(results, ['a:' + proxy_client, 'b:' + proxy_client])
+
+    def test_concurrent_raises_first_exception(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+
+        def fail() -> None:
+            raise ValueError('sub query failed')
+
+        with self.assertRaises(ValueError):
+            run_concurrently(lambda: 1, fail)
+
+    def test_concurrent_keeps_request_context(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+
+        with self.app.test_request_context('/table/foo', headers={'X-Neo4j-Bookmark': 'bookmark:1'}):
+            results = run_concurrently(lambda: request.headers.get('X-Neo4j-Bookmark'), lambda: request.path)
+
+        self.assertEqual(results, ['bookmark:1', '/table/foo'])
+
+    def test_concurrent_keeps_g(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+        teardown_bookmarks = []  # type: List[Optional[str]]
+        self.app.teardown_request(lambda exception: teardown_bookmarks.append(g.get('neo4j_bookmark')))
+
+        with self.app.test_request_context('/table/foo'):
+            g.neo4j_bookmark = 'bookmark:2'
+            results = run_concurrently(lambda: g.get('neo4j_bookmark'), lambda: g.get('neo4j_bookmark'))
+            self.assertEqual(g.neo4j_bookmark, 'bookmark:2')
+
+        self.assertEqual(results, ['bookmark:2', 'bookmark:2'])
+        # the teardown of the copies of the request context doesn't see the attributes of the request
+        self.assertEqual(teardown_bookmarks, [None, None, 'bookmark:2'])
+
+        g.neo4j_bookmark = 'bookmark:3'
+        self.assertEqual(run_concurrently(lambda: g.get('neo4j_bookmark')), ['bookmark:3'])
+
+    def test_concurrent_keeps_query_profiler(self) -> None:
+        self.app.config['PROXY_CONCURRENT_SUB_QUERIES'] = True
+
+        def sub_query(query: str) -> None:
+            get_query_profiler().add(ProfiledQuery(query=query, elapsed_ms=1))  # type: ignore
+
+        with profiling() as profiler:
+            run_concurrently(lambda: sub_query('a'), lambda: sub_query('b'))
+
+        self.assertEqual(sorted(query.query for query in profiler.queries), ['a', 'b'])
+        self.assertIsNone(get_query_profiler())
+
+    def test_nested_profiling(self) -> None:
+        with profiling() as outer:
+            with profiling() as inner:
+                self.assertIs(get_query_profiler(), inner)
+            self.assertIs(get_query_profiler(), outer)
+        self.assertIsNone(get_query_profiler())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import current_app
+
+from metadata_service import create_app
+from metadata_service.proxy.statistics_snapshot import (
+    StatisticsSnapshot, create_statistics_snapshot)
+
+
+class TestStatisticsSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.compute = MagicMock(return_value={'number_of_tables': 2})
+
+    def test_get(self) -> None:
+        snapshot = StatisticsSnapshot(compute=self.compute, max_age_sec=60)
+        with patch('metadata_service.proxy.statistics_snapshot.time.time', return_value=1000):
+            self.assertEqual(snapshot.get(), {'number_of_tables': 2, 'statistics_timestamp': 1000})
+            self.assertEqual(snapshot.get(), {'number_of_tables': 2, 'statistics_timestamp': 1000})
+        self.assertEqual(self.compute.call_count, 1)
+
+    def test_refresh(self) -> None:
+        snapshot = StatisticsSnapshot(compute=self.compute, max_age_sec=60)
+        with patch('metadata_service.proxy.statistics_snapshot.time.time') as mock_time:
+            mock_time.return_value = 1000
+            snapshot.refresh()
+            self.assertEqual(self.compute.call_count, 1)
+
+            mock_time.return_value = 1059
+            snapshot.refresh()
+            self.assertEqual(self.compute.call_count, 1)
+
+            mock_time.return_value = 1060
+            self.compute.return_value = {'number_of_tables': 3}
+            snapshot.refresh()
+            self.assertEqual(self.compute.call_count, 2)
+            self.assertEqual(snapshot.get(), {'number_of_tables': 3, 'statistics_timestamp': 1060})
+
+    def test_mark_stale(self) -> None:
+        snapshot = StatisticsSnapshot(compute=self.compute, max_age_sec=60)
+        snapshot.get()
+        snapshot.mark_stale()
+        snapshot.refresh()
+        self.assertEqual(self.compute.call_count, 1)
+
+        snapshot = StatisticsSnapshot(compute=self.compute, max_age_sec=60, refresh_on_write=True)
+        snapshot.get()
+        snapshot.mark_stale()
+        snapshot.refresh()
+        snapshot.refresh()
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_create_statistics_snapshot(self) -> None:
+        self.assertIsNone(create_statistics_snapshot(self.compute))
+
+        app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        with app.app_context():
+            self.assertIsNone(create_statistics_snapshot(self.compute))
+
+            current_app.config['STATISTICS_SNAPSHOT_ENABLED'] = True
+            with patch('metadata_service.proxy.statistics_snapshot.PeriodicTask') as mock_periodic_task:
+                snapshot = create_statistics_snapshot(self.compute)
+                self.assertIsNotNone(snapshot)
+                self.assertEqual(mock_periodic_task.call_args[1]['func'], snapshot.refresh)  # type: ignore
+                mock_periodic_task.return_value.start.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
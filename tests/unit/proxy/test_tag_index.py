@@ -0,0 +1,74 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import current_app
+
+from metadata_service import create_app
+from metadata_service.proxy.tag_index import (TagIndex, create_tag_index,
+                                              search_tags)
+
+TAG_COUNTS = [('pii', 3), ('finance', 2), ('fin', 1), ('fio', 2), ('unused', 0)]
+
+
+class TestTagIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.load = MagicMock(return_value=TAG_COUNTS)
+        self.tag_index = TagIndex(load=self.load)
+
+    def test_search_tags(self) -> None:
+        self.assertEqual(search_tags(TAG_COUNTS, prefix='fin'), [('finance', 2), ('fin', 1)])
+        self.assertEqual(search_tags(TAG_COUNTS, limit=3), [('pii', 3), ('finance', 2), ('fio', 2)])
+        self.assertEqual(search_tags(TAG_COUNTS, prefix='f', limit=1), [('finance', 2)])
+
+    def test_search(self) -> None:
+        # loaded on first use, ordered by name without limit, tags without resources are left out
+        self.assertEqual(self.tag_index.search(), [('fin', 1), ('finance', 2), ('fio', 2), ('pii', 3)])
+        self.assertEqual(self.tag_index.search(prefix='fi'), [('fin', 1), ('finance', 2), ('fio', 2)])
+        self.assertEqual(self.tag_index.search(prefix='fin'), [('fin', 1), ('finance', 2)])
+        self.assertEqual(self.tag_index.search(prefix='fin', limit=1), [('finance', 2)])
+        self.assertEqual(self.tag_index.search(prefix='x'), [])
+        self.assertEqual(self.tag_index.search(limit=2), [('pii', 3), ('finance', 2)])
+        self.assertEqual(self.load.call_count, 1)
+        self.assertEqual(len(self.tag_index), 4)
+
+    def test_apply(self) -> None:
+        # not built yet, the load includes it
+        self.tag_index.apply(tag='new', delta=1)
+        self.assertFalse(self.tag_index.is_built)
+
+        self.tag_index.rebuild()
+        self.tag_index.apply(tag='fia', delta=1)
+        self.tag_index.apply(tag='fin', delta=-1)
+        self.tag_index.apply(tag='pii', delta=2)
+        self.tag_index.apply(tag='unknown', delta=-1)
+        self.assertEqual(self.tag_index.search(prefix='fi'), [('fia', 1), ('finance', 2), ('fio', 2)])
+        self.assertEqual(self.tag_index.search(limit=1), [('pii', 5)])
+
+        # reconciled with the backend
+        self.tag_index.rebuild()
+        self.assertEqual(self.tag_index.search(limit=1), [('pii', 3)])
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_create_tag_index(self) -> None:
+        self.assertIsNone(create_tag_index(self.load))
+
+        app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        with app.app_context():
+            self.assertIsNone(create_tag_index(self.load))
+
+            current_app.config['TAG_INDEX_ENABLED'] = True
+            with patch('metadata_service.proxy.tag_index.PeriodicTask') as mock_periodic_task:
+                tag_index = create_tag_index(self.load)
+                self.assertIsNotNone(tag_index)
+                self.assertEqual(mock_periodic_task.call_args[1]['func'], tag_index.rebuild)  # type: ignore
+
+                current_app.config['TAG_INDEX_REBUILD_INTERVAL_SEC'] = 0
+                self.assertIsNotNone(create_tag_index(self.load))
+                self.assertEqual(mock_periodic_task.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
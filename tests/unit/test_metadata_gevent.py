@@ -0,0 +1,71 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import runpy
+import sys
+import unittest
+from types import ModuleType
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+from metadata_service import create_app
+
+
+class TestMetadataGevent(unittest.TestCase):
+    """
+    Runs metadata_gevent with stand-ins for the gevent modules, so that the test process is not monkey patched and
+    gevent doesn't need to be installed
+    """
+
+    def setUp(self) -> None:
+        self.gevent = MagicMock()
+        modules = {}  # type: Dict[str, Any]
+        for name in ('gevent', 'gevent.monkey', 'gevent.pool', 'gevent.pywsgi'):
+            modules[name] = ModuleType(name)
+        modules['gevent.monkey'].patch_all = self.gevent.patch_all
+        modules['gevent.pool'].Pool = self.gevent.Pool
+        modules['gevent.pywsgi'].WSGIServer = self.gevent.WSGIServer
+        modules['gevent'].monkey = modules['gevent.monkey']
+        self.modules_patch = patch.dict(sys.modules, modules)
+        self.modules_patch.start()
+        sys.modules.pop('metadata_service.metadata_gevent', None)
+
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app.config['GEVENT_MAX_CONCURRENT_REQUESTS'] = 25
+        self.create_app_patch = patch('metadata_service.create_app', return_value=self.app)
+        self.gevent.attach_mock(self.create_app_patch.start(), 'create_app')
+
+    def tearDown(self) -> None:
+        self.create_app_patch.stop()
+        self.modules_patch.stop()
+        sys.modules.pop('metadata_service.metadata_gevent', None)
+
+    def test_patches_before_creating_the_app(self) -> None:
+        with patch.dict(os.environ, {'METADATA_SVC_CONFIG_MODULE_CLASS': 'metadata_service.config.ProdConfig'}):
+            module = runpy.run_module('metadata_service.metadata_gevent')
+
+        self.assertIs(module['application'], self.app)
+        self.assertEqual(self.gevent.mock_calls[:2],
+                         [('patch_all', (), {}),
+                          ('create_app', (), {'config_module_class': 'metadata_service.config.ProdConfig'})])
+        # imported, e.g. by gunicorn, it doesn't serve the app itself
+        self.gevent.WSGIServer.assert_not_called()
+
+    def test_local_config_by_default(self) -> None:
+        with patch.dict(os.environ, clear=True):
+            runpy.run_module('metadata_service.metadata_gevent')
+
+        self.gevent.create_app.assert_called_once_with(config_module_class='metadata_service.config.LocalConfig')
+
+    def test_serves_at_most_max_concurrent_requests(self) -> None:
+        runpy.run_module('metadata_service.metadata_gevent', run_name='__main__')
+
+        # every request is spawned in the pool, bounded by GEVENT_MAX_CONCURRENT_REQUESTS
+        self.gevent.Pool.assert_called_once_with(25)
+        self.gevent.WSGIServer.assert_called_once_with(('0.0.0.0', 5002), self.app, spawn=self.gevent.Pool.return_value)
+        self.gevent.WSGIServer.return_value.serve_forever.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+from typing import Optional
+from unittest.mock import Mock, patch
+
+from prometheus_client import REGISTRY, Counter, Gauge, values
+
+from metadata_service import create_app, metrics
+from metadata_service.config import LocalConfig
+from metadata_service.proxy.statsd_utilities import (count, incr,
+                                                     timer_with_counter,
+                                                     timing)
+
+
+def _sample(metric: str, **labels: str) -> float:
+    value = REGISTRY.get_sample_value(metric, labels)  # type: Optional[float]
+    return value or 0
+
+
+class MetricsConfig(LocalConfig):
+    PROMETHEUS_METRICS_ENABLED = True
+
+
+@timer_with_counter
+def _instrumented(fail: bool) -> str:
+    if fail:
+        raise RuntimeError('fail')
+    return 'done'
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='tests.unit.test_metrics.MetricsConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def test_metrics_disabled(self) -> None:
+        self.app.config['PROMETHEUS_METRICS_ENABLED'] = False
+        count = _sample('metadata_service_counter_total', prefix='foo', name='bar')
+
+        incr(prefix='foo', name='bar')
+
+        self.assertEqual(_sample('metadata_service_counter_total', prefix='foo', name='bar'), count)
+        app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.assertEqual(app.test_client().get('/metrics').status_code, 404)
+
+    def test_request_metrics(self) -> None:
+        labels = {'method': 'GET', 'route': '/healthcheck', 'status': '200'}
+        count = _sample('metadata_service_http_request_duration_seconds_count', **labels)
+        not_found_count = _sample('metadata_service_http_request_duration_seconds_count',
+                                  method='GET', route='unmatched', status='404')
+
+        self.app.test_client().get('/healthcheck')
+        self.app.test_client().get('/does_not_exist')
+
+        self.assertEqual(_sample('metadata_service_http_request_duration_seconds_count', **labels), count + 1)
+        self.assertEqual(_sample('metadata_service_http_request_duration_seconds_count',
+                                 method='GET', route='unmatched', status='404'), not_found_count + 1)
+        self.assertEqual(_sample('metadata_service_http_requests_in_progress'), 0)
+
+        response = self.app.test_client().get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('metadata_service_http_request_duration_seconds_bucket{le="0.005",method="GET",'
+                      'route="/healthcheck",status="200"}', response.data.decode('utf-8'))
+
+    def test_statsd_utilities_metrics(self) -> None:
+        module = __name__
+        success = _sample('metadata_service_function_calls_total', module=module, function='_instrumented',
+                          outcome='success')
+        fail = _sample('metadata_service_function_calls_total', module=module, function='_instrumented',
+                       outcome='fail')
+        calls = _sample('metadata_service_function_duration_seconds_count', module=module, function='_instrumented')
+        timings = _sample('metadata_service_timing_sum', prefix='foo', name='bar')
+
+        self.assertEqual(_instrumented(False), 'done')
+        with self.assertRaises(RuntimeError):
+            _instrumented(True)
+        timing(prefix='foo', name='bar', ms=7)
+
+        self.assertEqual(_sample('metadata_service_function_calls_total', module=module, function='_instrumented',
+                                 outcome='success'), success + 1)
+        self.assertEqual(_sample('metadata_service_function_calls_total', module=module, function='_instrumented',
+                                 outcome='fail'), fail + 1)
+        self.assertEqual(_sample('metadata_service_function_duration_seconds_count', module=module,
+                                 function='_instrumented'), calls + 2)
+        self.assertEqual(_sample('metadata_service_timing_sum', prefix='foo', name='bar'), timings + 7)
+
+    def test_count(self) -> None:
+        counts = _sample('metadata_service_count_count', prefix='foo', name='records')
+        empty = _sample('metadata_service_count_bucket', prefix='foo', name='records', le='0.0')
+        timings = _sample('metadata_service_timing_count', prefix='foo', name='records')
+
+        count(prefix='foo', name='records', value=0)
+        count(prefix='foo', name='records', value=3)
+
+        self.assertEqual(_sample('metadata_service_count_count', prefix='foo', name='records'), counts + 2)
+        self.assertEqual(_sample('metadata_service_count_bucket', prefix='foo', name='records', le='0.0'), empty + 1)
+        self.assertEqual(_sample('metadata_service_timing_count', prefix='foo', name='records'), timings)
+
+    def test_bounded_statsd_names(self) -> None:
+        self.app.config['PROMETHEUS_MAX_STATSD_NAMES'] = 2
+        counts = {name: _sample('metadata_service_counter_total', prefix='bounded', name=name)
+                  for name in ('a', 'b', 'c', 'other')}
+
+        with patch.object(metrics, '_statsd_names', set()):
+            for name in ('a', 'b', 'c', 'd', 'a'):
+                incr(prefix='bounded', name=name)
+
+        self.assertEqual(_sample('metadata_service_counter_total', prefix='bounded', name='a'), counts['a'] + 2)
+        self.assertEqual(_sample('metadata_service_counter_total', prefix='bounded', name='b'), counts['b'] + 1)
+        # the names past the first two are recorded as other
+        self.assertEqual(_sample('metadata_service_counter_total', prefix='bounded', name='c'), counts['c'])
+        self.assertEqual(_sample('metadata_service_counter_total', prefix='bounded', name='other'),
+                         counts['other'] + 2)
+
+    def test_metrics_in_swagger(self) -> None:
+        response = self.app.test_client().get('/apispec_1.json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('200', response.json['paths']['/metrics']['get']['responses'])
+
+
+class TestMultiprocessMetrics(unittest.TestCase):
+    """
+    The metrics of several worker processes, each simulated by the metrics it writes to PROMETHEUS_MULTIPROC_DIR
+    under its pid
+    """
+
+    def setUp(self) -> None:
+        self.multiproc_dir = tempfile.TemporaryDirectory()
+        self.environ_patch = patch.dict(os.environ, {'PROMETHEUS_MULTIPROC_DIR': self.multiproc_dir.name})
+        self.environ_patch.start()
+        self.app = create_app(config_module_class='tests.unit.test_metrics.MetricsConfig')
+
+    def tearDown(self) -> None:
+        self.environ_patch.stop()
+        self.multiproc_dir.cleanup()
+
+    def _worker(self, pid: int, *, requests: int, in_progress: int) -> None:
+        with patch.object(values, 'ValueClass', values.MultiProcessValue(process_identifier=lambda: pid)):
+            Counter('test_worker_requests', 'Requests', registry=None).inc(requests)
+            Gauge('test_worker_in_progress', 'In progress', multiprocess_mode='livesum',
+                  registry=None).set(in_progress)
+
+    def test_aggregates_the_processes(self) -> None:
+        self._worker(101, requests=2, in_progress=1)
+        self._worker(102, requests=3, in_progress=4)
+
+        registry = metrics._get_registry()
+        self.assertIsNot(registry, REGISTRY)
+        self.assertEqual(registry.get_sample_value('test_worker_requests_total'), 5)
+        self.assertEqual(registry.get_sample_value('test_worker_in_progress'), 5)
+
+        response = self.app.test_client().get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('test_worker_requests_total 5.0', response.data.decode('utf-8'))
+
+    def test_child_exit(self) -> None:
+        self._worker(101, requests=2, in_progress=1)
+        self._worker(102, requests=3, in_progress=4)
+
+        metrics.child_exit(None, Mock(pid=101))
+
+        # the live gauges of the worker that exited are dropped, its counts are kept
+        registry = metrics._get_registry()
+        self.assertEqual(registry.get_sample_value('test_worker_in_progress'), 4)
+        self.assertEqual(registry.get_sample_value('test_worker_requests_total'), 5)
+
+    def test_single_process(self) -> None:
+        with patch.dict(os.environ), \
+                patch('metadata_service.metrics.multiprocess.mark_process_dead') as mock_mark_process_dead:
+            del os.environ['PROMETHEUS_MULTIPROC_DIR']
+
+            metrics.child_exit(None, Mock(pid=101))
+            self.assertIs(metrics._get_registry(), REGISTRY)
+
+        mock_mark_process_dead.assert_not_called()